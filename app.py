@@ -1,7 +1,4 @@
 import streamlit as st
-import pandas as pd
-import isodate
-from datetime import datetime
 import os
 from logo import display_logo
 
@@ -12,21 +9,56 @@ if os.path.exists('.env'):
         load_dotenv()
     except ImportError:
         pass
-YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY") or st.secrets.get("YOUTUBE_API_KEY")
-print("[DEBUG] YOUTUBE_API_KEY loaded:", YOUTUBE_API_KEY)
 
-from utils.youtube_api import search_videos, get_video_details
+from utils.metrics import configure_logging, metrics, start_exporters
+from utils.pipeline import rankings, compute_ranking
+from utils.refresher import BackgroundRefresher
+from utils.thumbnails import thumbnail_sources
+from utils.typeahead import TopicIndex, canonical_topic
+import time
+
+# Ranked results per topic are kept for reruns and other sessions
+RESULTS_TTL = int(os.getenv("LEARNYT_RESULTS_TTL", 30 * 60))
+RESULTS_MAX_ENTRIES = int(os.getenv("LEARNYT_RESULTS_MAX_ENTRIES", 256))
+# Precomputed rankings older than this are recomputed live instead of served
+PRECOMPUTED_MAX_AGE = int(os.getenv("LEARNYT_PRECOMPUTED_MAX_AGE", 6 * 60 * 60))
+# Past topics offered in the search box, most requested first
+TYPEAHEAD_OPTIONS = int(os.getenv("LEARNYT_TYPEAHEAD_OPTIONS", 500))
+
+configure_logging()
+
+# Metrics endpoint / JSON log, started once per server process (see utils/metrics.py)
+@st.cache_resource
+def start_metrics_exporters():
+    start_exporters()
+    return True
+
+start_metrics_exporters()
+
+# Opt-in in-process refresher; `python refresh.py` does the same as a separate process
+@st.cache_resource
+def start_background_refresher():
+    refresher = BackgroundRefresher()
+    refresher.start()
+    return refresher
+
+if os.getenv("LEARNYT_BACKGROUND_REFRESH") == "1":
+    start_background_refresher()
+
+# Shared by all sessions; rebuilt from the persisted request counts when the server starts
+@st.cache_resource
+def load_topic_index():
+    return TopicIndex.from_store(rankings)
+
+def format_age(seconds):
+    if seconds < 60:
+        return "just now"
+    if seconds < 3600:
+        return f"{int(seconds // 60)} min ago"
+    if seconds < 86400:
+        return f"{int(seconds // 3600)} h ago"
+    return f"{int(seconds // 86400)} days ago"
 
-def parse_duration(duration_str):
-    duration = isodate.parse_duration(duration_str)
-    total_seconds = duration.total_seconds()
-    if total_seconds >= 3600:
-        hours = int(total_seconds // 3600)
-        minutes = int((total_seconds % 3600) // 60)
-        seconds = int(total_seconds % 60)
-        return f"{hours}:{minutes:02}:{seconds:02}", total_seconds / 60
-    else:
-        return f"{int(total_seconds // 60)}:{int(total_seconds % 60):02}", total_seconds / 60
 
 st.set_page_config(page_title="YouTube Video Finder", layout="centered")
 
@@ -52,7 +84,6 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
-from logo import display_logo
 display_logo()
 
 # --- Friendly CTA above input ---
@@ -84,11 +115,25 @@ body, .stApp {
     border: 2px solid #f3a683;
     outline: none;
 }
+.stSelectbox div[data-baseweb="select"] > div {
+    border-radius: 14px;
+    border: 1.5px solid #ffe066;
+    font-size: 1.1em;
+    box-shadow: 0 2px 8px rgba(0,0,0,0.07);
+    background: #fff !important;
+    color: #111;
+}
 </style>
 """, unsafe_allow_html=True)
 
-topic = st.text_input("", "", key="topic_search", label_visibility="collapsed", placeholder="Type a topic and press Enter...")
-if not topic.strip():
+# Suggestions filter in the browser as the user types, so no keystroke waits on a rerun.
+# Picking one (or typing a rephrasing of one) lands on the same canonical topic key,
+# which is what the results cache, stored rankings and search cache are keyed by.
+topic_index = load_topic_index()
+topic = st.selectbox("Topic", topic_index.top(TYPEAHEAD_OPTIONS), index=None, key="topic_search",
+                     label_visibility="collapsed", placeholder="Type a topic and press Enter...",
+                     accept_new_options=True, filter_mode="contains")
+if not topic or not topic.strip():
     st.stop()
 
 # (Removed duplicate st.text_input for 'Enter a topic to search for educational videos:')
@@ -189,131 +234,90 @@ body, .stApp {
 
 # Removed duplicate topic input (was: st.text_input('Enter a topic to search for educational videos:', ''))
 
-if topic:
-    with st.spinner("Fetching and analyzing videos..."):
-        video_ids = search_videos(topic)
-        video_data = get_video_details(video_ids)
-        print("[DEBUG] video_data:", video_data)
-
-        records = []
-        for item in video_data:
-            stats = item.get('statistics', {})
-            snippet = item['snippet']
-            duration_str, duration_minutes = parse_duration(item['contentDetails']['duration'])
+def build_podium_html(top3, thumbnails):
+    # Podium layout for top 3 cards: 2nd place left, 1st center, 3rd right
+    podium_html = '<div class="podium-container">'
+    top3_list = top3.to_dict(orient="records")
+    for place in (2, 1, 3):
+        if len(top3_list) < place:
+            continue
+        video = top3_list[place - 1]
+        podium_html += (
+            f'<div class="podium-card podium-{place}">'
+            f'<div class="podium-rank">{place}</div>'
+            f'<img class="podium-thumb" src="{thumbnails[video["video_id"]]}" />'
+            f'<div class="podium-title" title="{video["title"]}">#{place} &mdash; {video["title"]}</div>'
+            f'<div class="podium-author">{video["channel"]}</div>'
+            f'<div class="podium-score">Score: {round(video["final_score"],2)}</div>'
+            f'<div class="podium-watch">⏱️ {video["duration_str"]}<br>🔗 <a href="{video["url"]}" target="_blank">Watch</a></div>'
+            f'</div>'
+        )
+    podium_html += "</div>"
+    return podium_html
 
-            records.append({
-                'title': snippet['title'],
-                'channel': snippet['channelTitle'],
-                'published': snippet['publishedAt'],
-                'views': int(stats.get('viewCount', 0)),
-                'likes': int(stats.get('likeCount', 0)),
-                'comments': int(stats.get('commentCount', 0)),
-                'duration_minutes': round(duration_minutes, 2),
-                'duration_str': duration_str,
-                'video_id': item['id'],
-                'url': f"https://www.youtube.com/watch?v={item['id']}",
-            })
-
-        df = pd.DataFrame(records)
-        print("[DEBUG] df.columns:", df.columns)
-        if 'published' in df.columns:
-            df['published'] = pd.to_datetime(df['published']).dt.tz_localize(None)
-        else:
-            st.error("❌ The 'published' column is missing. Please ensure the API response includes it.")
-            st.stop()
-
-        df['likes_per_view'] = df['likes'] / df['views']
-        df['comments_per_minute'] = df['comments'] / (df['duration_minutes'] + 0.1)
-        now = pd.Timestamp.now(tz=None)
-        df['views_per_day'] = df['views'] / ((now - df['published']).dt.days + 1)
-
-        for col in ['likes_per_view', 'comments_per_minute', 'views_per_day', 'views']:
-            min_val = df[col].min()
-            max_val = df[col].max()
-            df[f'norm_{col}'] = (df[col] - min_val) / (max_val - min_val + 1e-9)
-
-        df['final_score'] = (
-            df['norm_likes_per_view'] * 0.3 +
-            df['norm_comments_per_minute'] * 0.2 +
-            df['norm_views_per_day'] * 0.3 +
-            df['norm_views'] * 0.2
-        ) * 10
-
-        df['rank'] = df['final_score'].rank(ascending=False, method='min').astype(int)
-
-        # Remove shorts (videos under 1 minute)
-        df = df[df['duration_minutes'] >= 1.01].copy()
-
-        # Re-rank remaining videos
-        df = df.sort_values("final_score", ascending=False).reset_index(drop=True)
-        df["rank"] = df.index + 1
-
-        top3 = df.sort_values("rank").head(3)
-        top_score = top3['final_score'].max()
-        st.markdown('<h3 style="text-align:center; color: #D3D3D3;">🏆 Top 3 Recommendations</h3>', unsafe_allow_html=True)
-
-        # Podium layout for top 3 cards (improved structure)
-        podium_html = '<div class="podium-container">'
-        top3_list = top3.to_dict(orient="records")
-        # Render 2nd place (left) if exists
-        if len(top3_list) > 1:
-            podium_html += (
-                f'<div class="podium-card podium-2">'
-                f'<div class="podium-rank">2</div>'
-                f'<img class="podium-thumb" src="https://img.youtube.com/vi/{top3_list[1]["video_id"]}/0.jpg" />'
-                f'<div class="podium-title" title="{top3_list[1]["title"]}">#2 &mdash; {top3_list[1]["title"]}</div>'
-                f'<div class="podium-author">{top3_list[1]["channel"]}</div>'
-                f'<div class="podium-score">Score: {round(top3_list[1]["final_score"],2)}</div>'
-                f'<div class="podium-watch">⏱️ {top3_list[1]["duration_str"]}<br>🔗 <a href="{top3_list[1]["url"]}" target="_blank">Watch</a></div>'
-                f'</div>'
-            )
-        # Render 1st place (center) if exists
-        if len(top3_list) > 0:
-            podium_html += (
-                f'<div class="podium-card podium-1">'
-                f'<div class="podium-rank">1</div>'
-                f'<img class="podium-thumb" src="https://img.youtube.com/vi/{top3_list[0]["video_id"]}/0.jpg" />'
-                f'<div class="podium-title" title="{top3_list[0]["title"]}">#1 &mdash; {top3_list[0]["title"]}</div>'
-                f'<div class="podium-author">{top3_list[0]["channel"]}</div>'
-                f'<div class="podium-score">Score: {round(top3_list[0]["final_score"],2)}</div>'
-                f'<div class="podium-watch">⏱️ {top3_list[0]["duration_str"]}<br>🔗 <a href="{top3_list[0]["url"]}" target="_blank">Watch</a></div>'
-                f'</div>'
-            )
-        # Render 3rd place (right) if exists
-        if len(top3_list) > 2:
-            podium_html += (
-                f'<div class="podium-card podium-3">'
-                f'<div class="podium-rank">3</div>'
-                f'<img class="podium-thumb" src="https://img.youtube.com/vi/{top3_list[2]["video_id"]}/0.jpg" />'
-                f'<div class="podium-title" title="{top3_list[2]["title"]}">#3 &mdash; {top3_list[2]["title"]}</div>'
-                f'<div class="podium-author">{top3_list[2]["channel"]}</div>'
-                f'<div class="podium-score">Score: {round(top3_list[2]["final_score"],2)}</div>'
-                f'<div class="podium-watch">⏱️ {top3_list[2]["duration_str"]}<br>🔗 <a href="{top3_list[2]["url"]}" target="_blank">Watch</a></div>'
-                f'</div>'
-            )
-        podium_html += "</div>"
-        st.markdown(podium_html, unsafe_allow_html=True)
-
-
-        # Show videos 4 and 5 only inside a native Streamlit expander, side by side
-        # Use only the native Streamlit expander with a styled label and custom HTML styling
-        with st.expander("Show More Suggestions", expanded=False):
-            next2 = df.sort_values("rank").iloc[3:5]
-            cols = st.columns(2)
-            for idx, (i, row) in enumerate(next2.iterrows()):
-                with cols[idx]:
-                    st.markdown(f'''
+def build_suggestion_html(rows, thumbnails):
+    return [f'''
                     <div style="background:#fff; border-radius:14px; box-shadow:0 4px 16px rgba(0,0,0,0.10); padding:1.2em 1em 1em 1em; margin:0.8em 0; display:flex; flex-direction:column; align-items:center;">
-                        <img src="https://img.youtube.com/vi/{row['video_id']}/0.jpg" style="width:95%;border-radius:10px;margin-bottom:0.7em;object-fit:cover;" />
+                        <img src="{thumbnails[row['video_id']]}" style="width:95%;border-radius:10px;margin-bottom:0.7em;object-fit:cover;" />
                         <div style="font-size:1.08em;font-weight:600;text-align:center;margin:0.2em 0 0.1em 0;overflow-wrap:break-word;word-break:break-word;display:-webkit-box;-webkit-line-clamp:3;-webkit-box-orient:vertical;overflow:hidden;max-height:4em;">#{row['rank']} — {row['title']}</div>
                         <div style="font-size:0.95em;color:#555;margin-bottom:0.3em;text-align:center;">{row['channel']}</div>
                         <div style="font-size:1em;color:#222;margin-bottom:0.2em;font-weight:500;">Score: {round(row['final_score'],2)}</div>
                         <div style="font-size:0.95em;color:#888;margin-bottom:0;">⏱️ {row['duration_str']}<br>🔗 <a href="{row['url']}" target="_blank">Watch</a></div>
                     </div>
-                    ''', unsafe_allow_html=True)
+                    ''' for row in rows.to_dict(orient="records")]
+
+class NoResults(Exception):
+    """Raised instead of returning an empty ranking, so st.cache_data doesn't memoize it."""
+
+# Every widget interaction reruns this script; memoizing per topic means reruns only
+# re-render the cached markup instead of re-hitting the API and re-scoring.
+@st.cache_data(ttl=RESULTS_TTL, max_entries=RESULTS_MAX_ENTRIES, show_spinner=False)
+def get_ranked_results(topic_key, _query):
+    # Cached per topic key only (Streamlit doesn't hash _-prefixed arguments); _query is what gets searched
+    # Popular topics have a podium precomputed by the refresher; others are ranked live
+    stored = rankings.get(topic_key, max_age=PRECOMPUTED_MAX_AGE)
+    if stored is not None:
+        df, ranked_at = stored['videos'], stored['ranked_at']
+    else:
+        df, ranked_at = compute_ranking(_query, topic_key=topic_key), time.time()
+    metrics.inc("rankings_served_total", source="precomputed" if stored is not None else "live")
+    if df.empty:
+        # Quota-shed searches and failed detail fetches come back empty; raising keeps that out
+        # of the cache, so the topic is retried on the next request instead of for RESULTS_TTL
+        raise NoResults(topic_key)
+    # Shorts (videos under 1 minute) are already dropped; only the podium and two extra suggestions are shown
+    df = df.head(5)
+    # Card-sized WebP thumbnails inlined as data URIs instead of five full-size JPEGs per page
+    thumbnails = thumbnail_sources(df['video_id'])
+    with metrics.timer("render"):
+        podium_html = build_podium_html(df.head(3), thumbnails)
+        suggestion_html = build_suggestion_html(df.iloc[3:5], thumbnails)
+    return df, podium_html, suggestion_html, ranked_at
+
+if topic:
+    topic_key = canonical_topic(topic)
+    # Count each submitted topic once per session, not on every rerun
+    if st.session_state.get("last_topic") != topic_key:
+        st.session_state["last_topic"] = topic_key
+        rankings.record_request(topic_key, topic)
+        topic_index.add(topic_key)
+    try:
+        with st.spinner("Fetching and analyzing videos..."):
+            # Search with the topic's first phrasing; the canonical key is lossy (stopwords dropped)
+            query = rankings.topic(topic_key) or topic
+            df, podium_html, suggestion_html, ranked_at = get_ranked_results(topic_key, query)
+    except NoResults:
+        st.error("❌ No videos found for this topic. Please try another search.")
+        st.stop()
+
+    st.markdown('<h3 style="text-align:center; color: #D3D3D3;">🏆 Top 3 Recommendations</h3>', unsafe_allow_html=True)
+    st.markdown(podium_html, unsafe_allow_html=True)
+    st.markdown(f'<div style="text-align:center; font-size:0.85em; color:#999;">🕒 Rankings updated {format_age(time.time() - ranked_at)}</div>', unsafe_allow_html=True)
 
-        # Only build markdown_summary for top3
-        markdown_summary = f"# Top 3 YouTube Videos for '{topic}'\n\n"
-        for i, row in top3.iterrows():
-            if row['duration_minutes'] < 1.01:
-                continue
\ No newline at end of file
+    # Show videos 4 and 5 only inside a native Streamlit expander, side by side
+    # Use only the native Streamlit expander with a styled label and custom HTML styling
+    with st.expander("Show More Suggestions", expanded=False):
+        cols = st.columns(2)
+        for idx, card_html in enumerate(suggestion_html):
+            with cols[idx]:
+                st.markdown(card_html, unsafe_allow_html=True)
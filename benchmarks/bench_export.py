@@ -0,0 +1,96 @@
+"""Wall time and peak RSS of exporting scored rows, per format.
+
+    python -m benchmarks.bench_export
+    python -m benchmarks.bench_export --sizes 1000,100000 --formats csv,parquet
+
+Every (format, size) pair runs in its own subprocess, so ru_maxrss is that export's peak.
+The streaming writers get rows in 10k-row chunks, the way main.py feeds them.
+"to_excel" is the old path: materialize the full frame, then df.to_excel (openpyxl, normal mode).
+"base RSS" is the process before exporting; the old path includes the full frame in it.
+"""
+import argparse
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+from benchmarks.synthetic import synthetic_video_items
+from utils.export import CHUNK_ROWS, export_chunks
+from utils.ingest import items_to_frame
+from utils.scoring import score_frame
+
+MODES = ("csv", "jsonl", "parquet", "xlsx", "to_excel")
+SEED_ROWS = 10_000
+
+
+def scored_chunks(seed, n, chunk_rows=CHUNK_ROWS):
+    # Tile one realistic scored frame instead of generating a million synthetic API items
+    for start in range(0, n, chunk_rows):
+        rows = min(chunk_rows, n - start)
+        offset = start % len(seed)
+        chunk = seed.iloc[offset:offset + rows]
+        while len(chunk) < rows:
+            chunk = pd.concat([chunk, seed.iloc[:rows - len(chunk)]], ignore_index=True)
+        yield chunk
+
+
+def _rss_mb():
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+
+def run_one(mode, n, workdir):
+    path = os.path.join(workdir, "export." + {"to_excel": "xlsx"}.get(mode, mode))
+    seed = score_frame(items_to_frame(synthetic_video_items(min(n, SEED_ROWS))))
+    if mode == "to_excel":
+        chunks = pd.concat(scored_chunks(seed, n), ignore_index=True)
+    else:
+        chunks = scored_chunks(seed, n)
+    base = _rss_mb()
+    start = time.perf_counter()
+    if mode == "to_excel":
+        chunks.to_excel(path, index=False)
+    else:
+        export_chunks(chunks, path, mode)
+    wall = time.perf_counter() - start
+    if os.path.isdir(path):
+        size = sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path))
+    else:
+        size = os.path.getsize(path)
+    print(f"{wall} {base} {_rss_mb()} {size}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1000,100000,1000000")
+    parser.add_argument("--formats", default=",".join(MODES))
+    parser.add_argument("--one", nargs=3, metavar=("MODE", "ROWS", "DIR"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.one:
+        mode, n, workdir = args.one
+        run_one(mode, int(n), workdir)
+        return
+
+    print(f"{'rows':>8} {'format':<9} {'wall s':>8} {'base RSS MB':>12} {'peak RSS MB':>12} {'file MB':>8}")
+    for n in map(int, args.sizes.split(",")):
+        for mode in args.formats.split(","):
+            workdir = tempfile.mkdtemp()
+            try:
+                out = subprocess.run(
+                    [sys.executable, "-m", "benchmarks.bench_export", "--one", mode, str(n), workdir],
+                    check=True, capture_output=True, text=True,
+                ).stdout.split()
+            finally:
+                shutil.rmtree(workdir, ignore_errors=True)
+            wall, base, peak, size = map(float, out[-4:])
+            print(f"{n:>8} {mode:<9} {wall:>8.2f} {base:>12.0f} {peak:>12.0f} {size / 1e6:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
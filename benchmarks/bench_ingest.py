@@ -0,0 +1,70 @@
+"""Compare the per-row ingestion path with the columnar one.
+
+Run from the repository root: python -m benchmarks.bench_ingest
+"""
+import time
+import isodate
+import pandas as pd
+
+from benchmarks.synthetic import synthetic_video_items
+from utils.ingest import items_to_frame
+
+
+def parse_duration(duration_str):
+    # The per-row parser app.py used before utils.ingest
+    total_seconds = isodate.parse_duration(duration_str).total_seconds()
+    if total_seconds >= 3600:
+        hours = int(total_seconds // 3600)
+        minutes = int((total_seconds % 3600) // 60)
+        seconds = int(total_seconds % 60)
+        return f"{hours}:{minutes:02}:{seconds:02}", total_seconds / 60
+    return f"{int(total_seconds // 60)}:{int(total_seconds % 60):02}", total_seconds / 60
+
+
+def per_row_frame(items):
+    records = []
+    for item in items:
+        stats = item.get('statistics', {})
+        snippet = item['snippet']
+        duration_str, duration_minutes = parse_duration(item['contentDetails']['duration'])
+        records.append({
+            'title': snippet['title'],
+            'channel': snippet['channelTitle'],
+            'published': snippet['publishedAt'],
+            'views': int(stats.get('viewCount', 0)),
+            'likes': int(stats.get('likeCount', 0)),
+            'comments': int(stats.get('commentCount', 0)),
+            'duration_minutes': round(duration_minutes, 2),
+            'duration_str': duration_str,
+            'video_id': item['id'],
+            'url': f"https://www.youtube.com/watch?v={item['id']}",
+        })
+    df = pd.DataFrame(records)
+    df['published'] = pd.to_datetime(df['published']).dt.tz_localize(None)
+    return df
+
+
+def best_of(fn, items, repeat=5):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(items)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    print(f"{'videos':>8} {'per-row ms':>12} {'columnar ms':>12} {'speedup':>8}")
+    for n in (100, 1_000, 10_000, 100_000):
+        items = synthetic_video_items(n)
+        # Both paths must agree before their timings mean anything
+        expected, actual = per_row_frame(items), items_to_frame(items)
+        assert (expected['duration_str'] == actual['duration_str']).all()
+        assert (expected['published'] == actual['published']).all()
+        row = best_of(per_row_frame, items)
+        col = best_of(items_to_frame, items)
+        print(f"{n:>8} {row * 1000:>12.1f} {col * 1000:>12.1f} {row / col:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
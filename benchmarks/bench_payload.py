@@ -0,0 +1,100 @@
+"""Bytes on the wire and parse time of videos().list before/after field masks, gzip and ETags.
+
+    python -m benchmarks.bench_payload --videos 2000
+
+Modes, each fetching the same IDs in 50-ID chunks from the fake API:
+  full             all of snippet,contentDetails,statistics, uncompressed (the old request)
+  full+gzip        the old request as the client actually sends it (gzip accepted)
+  fields+gzip      partial-response field mask, gzip (what get_video_details sends now)
+  revalidate       stats refresh of held videos through get_video_details: If-None-Match -> 304
+  revalidate+drift same, after 0.5% of the catalog's view counts changed
+
+The revalidate rows go through get_video_details, so their wall time includes cache writes.
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+import urllib.request
+from urllib.parse import urlencode
+
+from benchmarks.fake_youtube import FakeYouTube
+from benchmarks.synthetic import synthetic_video_items
+
+FULL_PARTS = "snippet,contentDetails,statistics"
+
+
+def _raw_fetch(root_url, chunk, fields=None, gzip=True):
+    params = {"part": FULL_PARTS, "id": ",".join(chunk), "key": "benchmark"}
+    if fields:
+        params["fields"] = fields
+    request = urllib.request.Request(f"{root_url}youtube/v3/videos?{urlencode(params)}")
+    request.add_header("Accept-Encoding", "gzip" if gzip else "identity")
+    with urllib.request.urlopen(request) as response:
+        raw = response.read()
+        encoding = response.headers.get("Content-Encoding")
+    start = time.perf_counter()
+    if encoding == "gzip":
+        import gzip as gzip_module
+        raw = gzip_module.decompress(raw)
+    json.loads(raw)
+    return time.perf_counter() - start
+
+
+def run_raw(fake, chunks, fields, gzip):
+    fake.reset_counters()
+    start = time.perf_counter()
+    parse = sum(_raw_fetch(fake.root_url, chunk, fields, gzip) for chunk in chunks)
+    wall = time.perf_counter() - start
+    return fake.snapshot(), wall, parse
+
+
+def run_refresh(fake, api, ids):
+    # Expire every held video so the refresh has to go to the API, then revalidate
+    api.cache._conn.execute("UPDATE entries SET expires_at = 0 WHERE namespace = 'video'")
+    api.cache._conn.commit()
+    fake.reset_counters()
+    start = time.perf_counter()
+    api.get_video_details(ids)
+    return fake.snapshot(), time.perf_counter() - start, float("nan")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--videos", type=int, default=2000)
+    args = parser.parse_args()
+
+    items = synthetic_video_items(args.videos)
+    ids = [item['id'] for item in items]
+    chunks = [ids[i:i + 50] for i in range(0, len(ids), 50)]
+    with FakeYouTube(items) as fake:
+        os.environ["YOUTUBE_API_ROOT_URL"] = fake.root_url
+        os.environ.setdefault("YOUTUBE_API_KEY", "benchmark")
+        workdir = tempfile.mkdtemp()
+        os.environ["LEARNYT_CACHE_PATH"] = os.path.join(workdir, "bench_cache.sqlite3")
+        os.environ["LEARNYT_CORPUS_PATH"] = os.path.join(workdir, "bench_corpus.sqlite3")
+        # The fake API has no quota, so the daily budget shouldn't shed any of these calls
+        os.environ["LEARNYT_DAILY_QUOTA"] = str(10 ** 12)
+        os.environ["LEARNYT_SEARCH_RESERVE"] = "0"
+        from utils import youtube_api as api
+
+        rows = [
+            ("full", run_raw(fake, chunks, None, gzip=False)),
+            ("full+gzip", run_raw(fake, chunks, None, gzip=True)),
+            ("fields+gzip", run_raw(fake, chunks, api.VIDEO_FIELDS, gzip=True)),
+        ]
+        api.get_video_details(ids)  # hold every video, with its chunk ETag
+        rows.append(("revalidate", run_refresh(fake, api, ids)))
+        fake.drift(0.005, seed=1)
+        rows.append(("revalidate+drift", run_refresh(fake, api, ids)))
+
+    print(f"{len(ids)} videos in {len(chunks)} videos().list calls\n")
+    print(f"{'mode':<17} {'KB on wire':>11} {'B/video':>8} {'304s':>5} {'wall ms':>8} {'parse ms':>9}")
+    for name, (snapshot, wall, parse) in rows:
+        print(f"{name:<17} {snapshot['bytes_sent'] / 1024:>11.1f} {snapshot['bytes_sent'] / len(ids):>8.0f} "
+              f"{snapshot['not_modified']:>5} {wall * 1000:>8.1f} {'-' if parse != parse else f'{parse * 1000:.1f}':>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""End-to-end latency/throughput benchmark of the fetch/score pipeline against the fake API.
+
+Runs the main.py path (score every candidate) and the app path (drop shorts, keep the
+top 5) across candidate-pool sizes and details-fetch concurrency levels, and reports
+p50/p95 latency, API calls and quota units per query, and peak traced memory.
+
+    python -m benchmarks.bench_pipeline --latency 0.05 --pools 50 200 500 --workers 1 4 8
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from benchmarks.fake_youtube import FakeYouTube, load_fixture_items
+from benchmarks.synthetic import synthetic_video_items
+
+QUERIES = [
+    "what is private equity", "intro to economics", "python for beginners", "calculus crash course",
+    "history of rome", "quantum physics explained", "how investing works", "linear algebra",
+]
+
+
+def _percentile(values, q):
+    return float(np.percentile(values, q)) * 1000 if values else float("nan")
+
+
+def _run_query(api, pipeline, path, query, pool, warm):
+    if not warm:
+        api.cache.clear()
+    if path == "app":
+        # What compute_ranking does: shorts dropped per page, paging stops once the top-N settles
+        df = pipeline.fetch_videos_frame(query, max_results=pool, min_duration_minutes=pipeline.SHORTS_MAX_MINUTES,
+                                         top_n=pipeline.RANKING_TOP_N)
+        pipeline.rank_videos(df, top_n=pipeline.RANKING_TOP_N)
+    else:
+        df = pipeline.fetch_videos_frame(query, max_results=pool)
+        pipeline.rank_videos(df)
+
+
+def run_case(fake, api, pipeline, path, pool, workers, queries, warm):
+    api.MAX_WORKERS = workers
+    latencies = []
+    calls = 0
+    units = 0
+    for query in queries:
+        fake.reset_counters()
+        start = time.perf_counter()
+        _run_query(api, pipeline, path, query, pool, warm)
+        latencies.append(time.perf_counter() - start)
+        snapshot = fake.snapshot()
+        calls += sum(snapshot["calls"].values())
+        units += snapshot["units"]
+
+    # tracemalloc slows allocation-heavy code a lot, so memory gets its own untimed pass
+    tracemalloc.start()
+    for query in queries[:2]:
+        _run_query(api, pipeline, path, query, pool, warm)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "p50_ms": _percentile(latencies, 50),
+        "p95_ms": _percentile(latencies, 95),
+        "qps": len(latencies) / sum(latencies),
+        "calls_per_query": calls / len(queries),
+        "units_per_query": units / len(queries),
+        "peak_mb": peak / 1e6,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--catalog", type=int, default=5000, help="synthetic catalog size")
+    parser.add_argument("--fixture", action="store_true", help="replay top_videos.xlsx instead of a synthetic catalog")
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--pools", type=int, nargs="+", default=[50, 200, 500])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--paths", nargs="+", default=["main", "app"], choices=["main", "app"])
+    parser.add_argument("--repeat", type=int, default=2, help="passes over the query list per case")
+    parser.add_argument("--warm", action="store_true", help="keep the response cache between queries")
+    parser.add_argument("--local", action="store_true", help="allow answers from the local corpus")
+    args = parser.parse_args()
+
+    items = load_fixture_items() if args.fixture else synthetic_video_items(args.catalog)
+    with FakeYouTube(items, latency=args.latency, jitter=args.jitter, error_rate=args.error_rate) as fake:
+        # The client and cache read their configuration at import time
+        os.environ["YOUTUBE_API_ROOT_URL"] = fake.root_url
+        os.environ.setdefault("YOUTUBE_API_KEY", "benchmark")
+        workdir = tempfile.mkdtemp()
+        os.environ["LEARNYT_CACHE_PATH"] = os.path.join(workdir, "bench_cache.sqlite3")
+        os.environ["LEARNYT_CORPUS_PATH"] = os.path.join(workdir, "bench_corpus.sqlite3")
+        # The fake API has no quota; a real-sized budget would shed every case after the first few
+        os.environ["LEARNYT_DAILY_QUOTA"] = str(10 ** 12)
+        os.environ["LEARNYT_SEARCH_RESERVE"] = "0"
+        # Measure the API path; --local lets warm runs answer from the corpus instead
+        os.environ["LEARNYT_LOCAL_MIN_MATCHES"] = "30" if args.local else "0"
+        from utils import pipeline, youtube_api as api
+
+        queries = QUERIES * args.repeat
+        print(f"catalog={len(items)} latency={args.latency}s jitter={args.jitter}s "
+              f"error_rate={args.error_rate} warm_cache={args.warm} queries={len(queries)}\n")
+        header = f"{'path':<5} {'pool':>5} {'workers':>7} {'p50 ms':>9} {'p95 ms':>9} {'qps':>7} {'calls/q':>8} {'units/q':>8} {'peak MB':>8}"
+        print(header)
+        print("-" * len(header))
+        for path in args.paths:
+            for pool in args.pools:
+                for workers in args.workers:
+                    r = run_case(fake, api, pipeline, path, pool, workers, queries, args.warm)
+                    print(f"{path:<5} {pool:>5} {workers:>7} {r['p50_ms']:>9.1f} {r['p95_ms']:>9.1f} {r['qps']:>7.2f} "
+                          f"{r['calls_per_query']:>8.1f} {r['units_per_query']:>8.1f} {r['peak_mb']:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Measure cold-start import cost of the CLI/app modules against the old eager startup path.
+
+Every case runs in a fresh interpreter. Run from the repository root:
+python -m benchmarks.bench_startup
+"""
+import base64
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _old_logo_module(directory):
+    # Recreates the former logo.py: the PNG inlined as a ~125 KB base64 literal
+    with open(os.path.join(ROOT, "static", "MyLogo.png"), "rb") as f:
+        encoded = base64.b64encode(f.read()).decode()
+    with open(os.path.join(directory, "old_logo.py"), "w") as f:
+        f.write(f'import streamlit as st\n\ndef display_logo():\n    logo_url = "data:image/png;base64,{encoded}"\n')
+
+
+CASES = {
+    # What importing utils/youtube_api.py used to do
+    "old api module (streamlit + build)": (
+        "import streamlit\n"
+        "from googleapiclient.discovery import build\n"
+        "build('youtube', 'v3', developerKey='x')\n"
+    ),
+    "new api module (lazy client)": "import utils.youtube_api\n",
+    "new api module + first get_client()": "import utils.youtube_api as api\napi.get_client()\n",
+    "main.py pipeline imports": "import utils.pipeline, utils.scoring\n",
+    "old logo module": "import old_logo\n",
+    "new logo module": "import logo\n",
+}
+
+
+def _time_case(code, cwd, pythonpath, runs):
+    timings = []
+    script = (
+        "import time\n_start = time.perf_counter()\n"
+        + code
+        + "import sys\nprint(time.perf_counter() - _start, 'streamlit' in sys.modules)\n"
+    )
+    env = dict(os.environ, PYTHONPATH=pythonpath, PYTHONDONTWRITEBYTECODE="1", YOUTUBE_API_KEY="x")
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", script], cwd=cwd, env=env,
+                             capture_output=True, text=True, check=True).stdout.split()
+        timings.append(float(out[0]))
+    return statistics.median(timings), out[1] == "True"
+
+
+def main(runs=5):
+    with tempfile.TemporaryDirectory() as tmp:
+        _old_logo_module(tmp)
+        pythonpath = os.pathsep.join([ROOT, tmp])
+        print(f"{'case':<40} {'median ms':>10} {'streamlit loaded':>17}")
+        for name, code in CASES.items():
+            median, streamlit_loaded = _time_case(code, ROOT, pythonpath, runs)
+            print(f"{name:<40} {median * 1000:>10.1f} {str(streamlit_loaded):>17}")
+
+
+if __name__ == "__main__":
+    main()
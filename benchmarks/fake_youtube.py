@@ -0,0 +1,377 @@
+"""Local stand-in for the YouTube Data API search.list, videos.list and channels.list endpoints (and img.youtube.com).
+
+Serves recorded fixtures (top_videos.xlsx) or a synthetic catalog of any size, with
+configurable latency, error injection and pagination, so the pipeline can be measured
+without spending quota. Like the real API it honours partial-response `fields` masks,
+gzip and ETag/If-None-Match revalidation, and counts response bytes on the wire.
+Point the client at it with YOUTUBE_API_ROOT_URL, and thumbnails with LEARNYT_THUMBNAIL_BASE_URL.
+
+    python -m benchmarks.fake_youtube --catalog 10000 --latency 0.05 --port 8765
+"""
+import argparse
+import gzip
+import hashlib
+import io
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from benchmarks.synthetic import channel_id, synthetic_video_items
+from utils.ingest import parse_durations
+
+SEARCH_COST = 100
+VIDEOS_COST = 1
+CHANNELS_COST = 1
+MAX_SEARCH_RESULTS = 500  # search.list stops paging after roughly 500 results
+THUMBNAIL_SIZE = (480, 360)  # img.youtube.com/vi/<id>/0.jpg
+
+
+def _iso_duration(minutes):
+    seconds = int(round(float(minutes) * 60))
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    return "PT" + (f"{hours}H" if hours else "") + (f"{minutes}M" if minutes else "") + f"{seconds}S"
+
+
+def load_fixture_items(path="top_videos.xlsx"):
+    """videos().list items rebuilt from an exported results table."""
+    import pandas as pd
+
+    df = pd.read_excel(path)
+    items = []
+    for row in df.to_dict(orient="records"):
+        published = pd.Timestamp(row["published"]).strftime("%Y-%m-%dT%H:%M:%SZ")
+        items.append({
+            'kind': 'youtube#video',
+            'id': row["video_id"],
+            'snippet': {
+                'publishedAt': published,
+                'title': row["title"],
+                'description': "",
+                'channelId': channel_id(row["channel"]),
+                'channelTitle': row["channel"],
+            },
+            'contentDetails': {'duration': _iso_duration(row["duration_minutes"])},
+            'statistics': {
+                'viewCount': str(int(row["views"])),
+                'likeCount': str(int(row["likes"])),
+                'commentCount': str(int(row["comments"])),
+            },
+        })
+    return items
+
+
+def parse_fields(mask):
+    """Parse a partial-response mask like 'etag,items(id,snippet(title),contentDetails/duration)'."""
+    pos = 0
+
+    def parse_list():
+        nonlocal pos
+        tree = {}
+        while pos < len(mask):
+            start = pos
+            while pos < len(mask) and mask[pos] not in ",()/":
+                pos += 1
+            name = mask[start:pos].strip()
+            if pos < len(mask) and mask[pos] == "/":
+                pos += 1
+                sub = parse_list_single()
+            elif pos < len(mask) and mask[pos] == "(":
+                pos += 1
+                sub = parse_list()
+                pos += 1  # closing ')'
+            else:
+                sub = None
+            if name:
+                tree[name] = _merge(tree.get(name, {}), sub)
+            if pos < len(mask) and mask[pos] == ",":
+                pos += 1
+                continue
+            break
+        return tree
+
+    def parse_list_single():
+        # 'a/b/c' selects one nested path
+        nonlocal pos
+        start = pos
+        while pos < len(mask) and mask[pos] not in ",()/":
+            pos += 1
+        name = mask[start:pos].strip()
+        if pos < len(mask) and mask[pos] == "/":
+            pos += 1
+            return {name: parse_list_single()}
+        if pos < len(mask) and mask[pos] == "(":
+            pos += 1
+            sub = parse_list()
+            pos += 1
+            return {name: sub}
+        return {name: None}
+
+    return parse_list()
+
+
+def _merge(existing, sub):
+    if sub is None or existing is None:
+        return None
+    return {**existing, **sub}
+
+
+def apply_fields(value, tree):
+    if tree is None:
+        return value
+    if isinstance(value, list):
+        return [apply_fields(v, tree) for v in value]
+    if isinstance(value, dict):
+        return {k: apply_fields(value[k], sub) for k, sub in tree.items() if k in value}
+    return value
+
+
+class FakeYouTube:
+    def __init__(self, items, latency=0.0, jitter=0.0, error_rate=0.0, quota_error_rate=0.0,
+                 max_search_results=MAX_SEARCH_RESULTS, seed=0, host="127.0.0.1", port=0):
+        self.items = {item['id']: item for item in items}
+        self.ids = list(self.items)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.quota_error_rate = quota_error_rate
+        self.max_search_results = max_search_results
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = {"search": 0, "videos": 0, "channels": 0}
+        self.errors = 0
+        self.units = 0
+        self.bytes_sent = 0
+        self.not_modified = 0
+        self.thumbnails_served = 0
+        self._thumbnails = {}
+        self.server = ThreadingHTTPServer((host, port), self._handler())
+        self.server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def root_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def reset_counters(self):
+        with self._lock:
+            self.calls = {"search": 0, "videos": 0, "channels": 0}
+            self.errors = 0
+            self.units = 0
+            self.bytes_sent = 0
+            self.not_modified = 0
+            self.thumbnails_served = 0
+
+    def snapshot(self):
+        with self._lock:
+            return {"calls": dict(self.calls), "errors": self.errors, "units": self.units,
+                    "bytes_sent": self.bytes_sent, "not_modified": self.not_modified,
+                    "thumbnails_served": self.thumbnails_served}
+
+    def drift(self, fraction=0.1, seed=None):
+        """Bump the view counts of a random fraction of the catalog, as real stats drift."""
+        rng = random.Random(seed)
+        for video_id in rng.sample(self.ids, int(len(self.ids) * fraction)):
+            stats = self.items[video_id]['statistics']
+            stats['viewCount'] = str(int(stats['viewCount']) + rng.randint(1, 1000))
+
+    def _matches(self, video_id, params):
+        # videoDuration and publishedAfter as search.list applies them; relevanceLanguage is ignored
+        item = self.items[video_id]
+        duration = params.get("videoDuration", "any")
+        if duration != "any":
+            minutes = parse_durations([item['contentDetails']['duration']])[0] / 60
+            if not {"short": minutes < 4, "medium": 4 <= minutes <= 20, "long": minutes > 20}[duration]:
+                return False
+        published_after = params.get("publishedAfter")
+        return not published_after or item['snippet']['publishedAt'] >= published_after
+
+    def _ranked_ids(self, query, params=None):
+        # Every query gets its own stable ordering of the catalog, like a relevance ranking
+        seed = int.from_bytes(hashlib.sha1(query.lower().encode()).digest()[:8], "big")
+        ids = list(self.ids)
+        random.Random(seed).shuffle(ids)
+        if params:
+            ids = [video_id for video_id in ids if self._matches(video_id, params)]
+        return ids[:self.max_search_results]
+
+    def search(self, params):
+        query = params.get("q", "")
+        page_size = min(int(params.get("maxResults", 5)), 50)
+        offset = int(params.get("pageToken") or 0)
+        ranked = self._ranked_ids(query, params)
+        page = ranked[offset:offset + page_size]
+        body = {
+            'kind': 'youtube#searchListResponse',
+            'pageInfo': {'totalResults': len(ranked), 'resultsPerPage': page_size},
+            'items': [{'kind': 'youtube#searchResult', 'id': {'kind': 'youtube#video', 'videoId': v}} for v in page],
+        }
+        if offset + page_size < len(ranked):
+            body['nextPageToken'] = str(offset + page_size)
+        return body
+
+    def videos(self, params):
+        ids = [v for v in params.get("id", "").split(",") if v]
+        if len(ids) > 50:
+            return 400, {'error': {'code': 400, 'message': 'Too many IDs', 'errors': [{'reason': 'badRequest'}]}}
+        items = [self.items[v] for v in ids if v in self.items]
+        return 200, {'kind': 'youtube#videoListResponse', 'items': items,
+                     'pageInfo': {'totalResults': len(items), 'resultsPerPage': len(items)}}
+
+    def channels(self, params):
+        ids = [c for c in params.get("id", "").split(",") if c]
+        if len(ids) > 50:
+            return 400, {'error': {'code': 400, 'message': 'Too many IDs', 'errors': [{'reason': 'badRequest'}]}}
+        items = []
+        for cid in ids:
+            # Any channel ID exists; its stats are stable per ID
+            rng = random.Random(cid)
+            items.append({'kind': 'youtube#channel', 'id': cid, 'statistics': {
+                'viewCount': str(int(rng.lognormvariate(16, 2))),
+                'subscriberCount': str(int(rng.lognormvariate(11, 2))),
+                'hiddenSubscriberCount': False,
+                'videoCount': str(int(rng.lognormvariate(5, 1.5))),
+            }})
+        return 200, {'kind': 'youtube#channelListResponse', 'items': items,
+                     'pageInfo': {'totalResults': len(items), 'resultsPerPage': len(items)}}
+
+    def thumbnail(self, video_id):
+        """A full-size JPEG thumbnail: a noisy gradient seeded by the video ID, so it compresses like a photo."""
+        if video_id not in self._thumbnails:
+            from PIL import Image
+            rng = random.Random(video_id)
+            width, height = THUMBNAIL_SIZE
+            base = Image.linear_gradient("L").resize(THUMBNAIL_SIZE)
+            noise = Image.effect_noise(THUMBNAIL_SIZE, 40)
+            channels = [Image.blend(base, noise, rng.uniform(0.2, 0.6)).rotate(rng.choice((0, 90, 180, 270)))
+                        for _ in range(3)]
+            out = io.BytesIO()
+            Image.merge("RGB", channels).save(out, "JPEG", quality=90)
+            self._thumbnails[video_id] = out.getvalue()
+        return self._thumbnails[video_id]
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, status, body, params=None):
+                if status == 200:
+                    payload = json.dumps(body, sort_keys=True).encode()
+                    etag = '"' + hashlib.sha1(payload).hexdigest()[:27] + '"'
+                    if self.headers.get("If-None-Match") == etag:
+                        with fake._lock:
+                            fake.not_modified += 1
+                        return self._send_bytes(304, b"", {"ETag": etag})
+                    body = dict(body, etag=etag)
+                    if params and params.get("fields"):
+                        body = apply_fields(body, parse_fields(params["fields"]))
+                    headers = {"ETag": etag}
+                else:
+                    headers = {}
+                payload = json.dumps(body).encode()
+                if "gzip" in self.headers.get("Accept-Encoding", ""):
+                    payload = gzip.compress(payload, compresslevel=6)
+                    headers["Content-Encoding"] = "gzip"
+                headers["Content-Type"] = "application/json; charset=UTF-8"
+                self._send_bytes(status, payload, headers)
+
+            def _send_bytes(self, status, payload, headers):
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+                with fake._lock:
+                    fake.bytes_sent += len(payload)
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                if url.path.startswith("/vi/"):
+                    video_id = url.path.split("/")[2]
+                    if video_id not in fake.items:
+                        return self._send_bytes(404, b"", {})
+                    with fake._lock:
+                        fake.thumbnails_served += 1
+                    return self._send_bytes(200, fake.thumbnail(video_id), {"Content-Type": "image/jpeg"})
+                params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+                endpoint = url.path.rstrip("/").rsplit("/", 1)[-1]
+                if endpoint not in fake.calls:
+                    return self._send(404, {'error': {'code': 404, 'message': 'Not Found'}})
+
+                with fake._lock:
+                    fake.calls[endpoint] += 1
+                    fake.units += {"search": SEARCH_COST, "videos": VIDEOS_COST, "channels": CHANNELS_COST}[endpoint]
+                    roll = fake._rng.random()
+                    delay = fake.latency + fake._rng.uniform(0, fake.jitter)
+                if delay:
+                    time.sleep(delay)
+
+                if roll < fake.quota_error_rate:
+                    with fake._lock:
+                        fake.errors += 1
+                    return self._send(403, {'error': {'code': 403, 'message': 'quota exceeded',
+                                                      'errors': [{'reason': 'quotaExceeded', 'domain': 'youtube.quota'}]}})
+                if roll < fake.quota_error_rate + fake.error_rate:
+                    with fake._lock:
+                        fake.errors += 1
+                    return self._send(500, {'error': {'code': 500, 'message': 'Backend Error'}})
+
+                if endpoint == "search":
+                    return self._send(200, fake.search(params), params)
+                if endpoint == "channels":
+                    return self._send(*fake.channels(params), params)
+                return self._send(*fake.videos(params), params)
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--catalog", type=int, default=0, help="synthetic catalog size (default: replay --fixture)")
+    parser.add_argument("--fixture", default="top_videos.xlsx")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random latency, up to this many seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 500")
+    parser.add_argument("--quota-error-rate", type=float, default=0.0, help="fraction answered with 403 quotaExceeded")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    items = synthetic_video_items(args.catalog) if args.catalog else load_fixture_items(args.fixture)
+    fake = FakeYouTube(items, latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                       quota_error_rate=args.quota_error_rate, port=args.port)
+    print(f"🎭 Fake YouTube API with {len(items)} videos at {fake.root_url}")
+    print(f"   export YOUTUBE_API_ROOT_URL={fake.root_url}")
+    try:
+        fake.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
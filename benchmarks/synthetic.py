@@ -0,0 +1,59 @@
+import hashlib
+import random
+from datetime import datetime, timedelta
+
+_WORDS = [
+    "private", "equity", "economics", "finance", "python", "calculus", "history", "physics",
+    "investing", "explained", "beginner", "guide", "crash", "course", "lecture", "intro",
+]
+_CHANNELS = [
+    "CrashCourse", "Khan Academy", "Peak Frameworks", "How Money Works", "Alux.com",
+    "rareliquid careers", "Principles by Ray Dalio", "Good Work", "MIT OpenCourseWare", "3Blue1Brown",
+]
+
+
+def _video_id(rng):
+    alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+    return "".join(rng.choice(alphabet) for _ in range(11))
+
+
+def channel_id(channel_title):
+    # Stable per channel name, so videos of one channel share an ID like on YouTube
+    return "UC" + hashlib.sha1(channel_title.encode()).hexdigest()[:22]
+
+
+def _duration(rng):
+    seconds = int(rng.lognormvariate(6.3, 1.0))
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    return "PT" + (f"{hours}H" if hours else "") + (f"{minutes}M" if minutes else "") + f"{seconds}S"
+
+
+def synthetic_video_items(n, seed=0):
+    """videos().list-shaped items with plausible, reproducible values."""
+    rng = random.Random(seed)
+    epoch = datetime(2010, 1, 1)
+    items = []
+    for _ in range(n):
+        views = int(rng.lognormvariate(10, 2))
+        published = epoch + timedelta(seconds=rng.randrange(15 * 365 * 86400))
+        channel = rng.choice(_CHANNELS)
+        items.append({
+            'kind': 'youtube#video',
+            'id': _video_id(rng),
+            'snippet': {
+                'publishedAt': published.strftime('%Y-%m-%dT%H:%M:%SZ'),
+                'title': " ".join(rng.choice(_WORDS) for _ in range(rng.randint(3, 9))).title(),
+                'description': " ".join(rng.choice(_WORDS) for _ in range(rng.randint(20, 120))),
+                'channelId': channel_id(channel),
+                'channelTitle': channel,
+                'tags': rng.sample(_WORDS, 5),
+            },
+            'contentDetails': {'duration': _duration(rng)},
+            'statistics': {
+                'viewCount': str(views),
+                'likeCount': str(int(views * rng.uniform(0.001, 0.05))),
+                'commentCount': str(int(views * rng.uniform(0.0, 0.005))),
+            },
+        })
+    return items
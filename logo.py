@@ -1,14 +1,16 @@
 import streamlit as st
 
+# Served by Streamlit static file serving (see .streamlit/config.toml), so browsers cache it
+LOGO_URL = "app/static/MyLogo.png"
+
 def display_logo():
-    logo_url = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAO4AAAERCAYAAAB8XZtaAAAAAXNSR0IArs4c6QAAIABJREFUeF7cvQe0bNlZHvidVPHWzffl16+7X+duZXWShIQlxNgzhjUzjNd4eXkNQ1ZEGC8zBg3YJkkYjAfMYNIQhmCEAINoqSUUEEooNZJASKJb6vDife/dHCqcOPP9++yqfU6dc6rufa9l7FrrvnpVdcI+e+/vz8HCf4HXgw8+ONtOnBc32jP/ZKsXPxgkOBJFUSuOY8ey4ABWLY5jhGGIKIpQq9XgeR4sy0KSJDJivvOvO+jL767rDr/Tx/Fc3/fhOI782bYtx/Da+sXf9fn6njxfn8PveG1+x+vxfF6HL37mGM1r8zj+bo6hXq/LNXg8r6d/4//7/T7M33mM+XxBEKDZbMo5/L8eux5jEIRyPueHY+N4+M7f9ZjN8ejf9D18f5CZWz2Pehy8Hq9tfm8+42AwkN/4x3nQ86vniufr3/V49Bzw86AfyvxzjPyef3p++X9eh8/H7/j8fPF6/I335v3M6+v783j+8Rg9V/o8jkleDmR/WJ4Nz1FrnI4hiuOYB4XRwA9d1/Udxw5s20mQwLJdJ2l6tU3Hsz6QWP1f+dD73vfXX20YWc/2De+8886O3Wy/dvX8xZdtrm8stNvtxAnRabcaxyzHPeo2W5aCIhcuhGU5sOQb9TlJCATAtrlYIYg5fuZxkUVwE1g2HMeT33kez+dxUcSFVp95PsCNQdATHOp7nu84vMfo+vr++nj+zuP19fiZ4+Jn3lfheDRenqc/uy6JCu/lIAz94fj173yv1bhpHLkex2c+Pz/zfH1/Hsfx8/4ECjeaJhx642viJqNKiYgmNHzXoNZrz+vzPpw/Pg+vr2hbnN4nOz/8Xs8nx2HOFz/r+dXzoNeP30cRCa6afyGkEWT8GtTmmDVwTcKpQcjjNAD188uIU/Br4qIJnUkM9HeJbSEhm7ASOImNOAkRR0AC/mPDdgDPrcMx1jcISKzVOgJxsH5t9fNIor5l2xv33nnHFxbnFn/zQ3/xoWcdyM8KcO+5557a5Y3VH9tc23wQtrPoLR65Y7Y54/Fhm24DJ5ZWsLu5DdtOYDux/HGiOGFJbMGyEyjGq77nZ34fxcHwd9ty5Xv5XSafm3gEXG4gTrDn1WUDcqPoDWkC19x4/J7X0RtWA5MLy+M0YdFA5e+8Pn83AWXej0DQhITj0YRIH89xmYRB/67HqwHCDS8bLCVQmoBxU2vuaXJjvYnz3F9LDHoj8zM3Pq/P5zEJnCZ4fF79/Hq+9Dzx+fPzqp/fBLh+HhPYWvIwpRNhhCmQTc5sSko8Xj+zPtaUUkypQgNYE678HCWCSkWg9HPoeeZzE6iexTGNCPSQMFsOAtsFCUBvbxfd7U3srK19Luj1ukeWlz969/Pu/eX3v//9jz8bzPGGAve+2247+/T5p39hbxCeXT5+7JbZ5WV49RYGvuIQDa+BuuWgu7uHpldDu+nBD3uwLEWBuXHyQNKc0QQUJ059VtwDpJyp6Ky5iUmt9cTxu/xxmjspJm+RD6vrRTGiJEbdqyGxIJ9jJHAsEgobiBOEsRKVtQSgF1QDWQNeb4g88EUMJ1lPRf8i7kAxVT8LwWaK3ML5OTbhwEp10BxJb3Rzk+vn12KkApMiBhRJ+aeBkN/8eowmEEyxP8/J9Xj0eebm1WNSIFVrZ3JKU+TWUoV5/nDNUnXAHFseJJowmRzaJGaUuEDViNzfOFnvI61eJcbeGRIJ2PBjF0ECNJt1IAqwt7ONTquB1dVLezs7m59zG+3HHnr4wV98/6OPfuFGAviGAPeee+656Ykn/vZ34yg6ffLoiVNHVk4AiYueHwhH1AtBjtmsO+h1d9D0bOzu7sKqKf0tL8JqCm+Kulok0xwzSkdv6r2miJSnrkUTx7Hx5YJikw0nAXhd/R77AUICNv3es2zEtgUriuHHkeh/I0Iyotxa5NeiJ59DHzcS5UnNlb5cRFDy+p4GnNaVeW8/Vjqc5lq8lslNzc8mcPVcRJESuU3d0OSEGpwmMPVm5jjMY01Q6+uZADbF9hHHHAFX30Pru/nrm4DTz6WfyTzXnE+TGGm9Xa+5OtcS4Nq0n6TrYBIbrVfrZ9O2DyGQcNButGHFFnp+D4MkgNeuw7eBAQL0BwPYfhJvXFr9pBda7371K//+7/zBI7/zxI0A8HUDt7Oy8IHd7v4Lbj1183zDraPuNdDd7WK+NY+wHwpncuIIdStGd3sdUW8PDTeCFfTgug68ehtWMhL3RtxA6StDipdyE5O6EkAK8CNaaVJzHmuCN6/bCRUe+DKP5uaPoxgWuS8NHKlYlt8YvG6QUCcfGcz0//V4zGfR5+vxay6qJYciTmFex/y/Nvx4ntJ3ybRtm6qC4rz5OeBv2vCS4Vwx9USqKh4nERH1ZSU+gByG77JBjI2tP/N3Hu/RUERuTxCI0KIAMASC8X0GINRFEZHniyTDfUIMmRIPJRpKJIKtVCLiuz5eS0j53/mZ1zOP0+fp68j9UmlDicm0O6mXnj+TEIkOTpUoShDQBuDT3hIjCBK4rRbq8x1YszO40t9F1KgjSGh7qcGDjUZio7exs3fu/FOfvenkzb/9xMUnfuF6wXto4N5993Ne/sy5p399ZmHxlk6ngzCMRFKUzZrEaDgNeLTCdvtw9vaw4tpY8SycrNdw81IHc3aCW06dgB2ODCh605mU2SKHq9iQEUUdWz2GCaKyz/lNLRvDEDNNDqF0P2XlNRfUpMjCHUSHHi24KbIWna/vEdFE6bnp2ePj1/fR1lBNyDQIXYKM4q2oDll1weQ6RVZlGUNMo5kNy3OAMEaIGB6NXzTGhbG8O9zU6Tt/t0koHUocyXAj6w0tz0NA2ORGFkCjmnGdmEZGGg1TAPAzJY7IDuV6+j7D61kJajQapufx/jyOn/keWgnqxu/6e308r8f7meM2P9Myxec311P2hxgTR1Z5vbZ8PkQxgjhCHEToWTaeWtvAZ89fwOcunsNOq4ZgpgN7bgFOo40wiJEMFDngGvYDH+tbmxc2tzZ+5+v+4Tf8x3f/0e8+fVgAHwq4J47d/HtOzflHke3Ccmtipm/XPLhJjLZnA/0e3CCA2+vhiFvHc86cwvNPnsKiFWPFslDr7qDuD1CLYiR0R9DdQu5JPTJ1l8hmSwEpHJBU3xm5WYacJXYAbiTDYJG5hrGhiwBI4IroGZHzpIsY0+avOG6em+f1K8uFnKtfpm7puA6SlLLngc/rc4PHBIa67XADmQQsDEK4BDc5XBiB19SipJXEwqFIOvLERBM8fk+Oq35XOv5wrmjwoxogBi8196axh9eIIurwaoBaLM1LLsLR+TzyrKN72CR8oZJKNED0ONRn7frKjsvczHl1QURUN5UguH8MacskwOb+4bzxN03ARiKzKyoQ10C/YrEZKG6sn1mePwW4rCNVJbqyXBsbHhDMzuNKGOCvLq7io1/6Cp7a2ITTInhbcJsdxI6DXhRhkETwmg2sbW32Ll9e/dhNp0/8/DNPfukPDwPeAwO3Vpv/ZGdx8f7OwiyCxEY/stDyXDRDHzPhANb6KhYTH7ctzOP+W27GHSvLaAx8eP0+XD+A0w9h+wHcOIJFKzAtubTBmyKK4cJQG08BSEQbAwyWuDEUwEYbiyBXrgZzMxeBNg8mvShVE5nn2ErvHnHl/H3MTaDvZ14jMYxTRaK8uTGLnkGrAvln0ffgptUET8+RPjZPmMqeOzPedENrENA4l5+Tsrk2r6/PMVWZ/LOa81E0D9Os7yRQ0HEh1zGIZ+aclJjnr0Osh46FTbuH+twc3PocQmsGe0kdT6xv4SOPP4HPnDuPHddB89gKUG9hx/dRb7exH0XY9yNsb29+ubdx5VfDsP+WSePM/34w4FqzX+oszN956ubT6Pb34fcDLLbngL19+Ncu46gLPH9lAQ/cegqnPQvzkQ9ndw8NP4QbJrBj/inXjXBQofBAIlZl9dI6paJqyulOvUv0KHG2K+4RRSowIqY4TlEvdpDQjDR0J7mAHSGJLFhCVqkIUpxX76JXG5/zv+vPNlwZH9/BcYrjL4KVfk4S5czn+PLPYIJJczrNeeT5yDHI3eVUPheNPdT3OR/qcyI7avTZPI4/CYeYsIoiDg8lD3JWch8SPKUmmM+ln0+/6/k0PycWOT2lJJGbs/Oh5NXh/MS09Bnzlrl+zs+cB6Kpl5cBt4xImBJYFSjU1IncUThOqhOx7E+1HuZ75IQIa4GI+HGXATYNuDOLiNpzWHNdXLMsPPrZTwuA9xwL7eMnsUd/vdvEbhij1Wpha/XchYsXnvkTIH7dQcB7AOB2VhdOnjh69MgK4thHOOhihkC6uIalBDjVaeKFZ8/g7uUOlu0Q7taGcGG714cTBLBjR9yylu3CFmMURWEgSvpjHIvgNQ0EjkTKKHBrsY+fbc8VUYwiGTd8HI8CLoomuggYRcdZQoZHC1X9mcAZicomWM2FGAE3K9bb9CWIGCs2IFgiKfA7ZSAyP+vvh79btnAK0b1KXkPxX0ecxYYhL1VFTL+rtn6bVvCi38UaS/MPKUfqJxe/emo9n3S++n2kZmi1iIRsCMZUXdGf82qLnJ9GwRVx/bzNoxwYys+ff06uq37Oot+BQPavJ8E7JIJ1uN4MoloTvueiW29gw7VwLgrwux/9CL60vYtkfgX27BIipwXPrSGK9nHp0oWrO9vbf/yN/+P/8Ia3v/3tylo64TUVcJsrZy7OzsyeIGiD7i76u1uoIcJCv4+T63t4yZkzuPvsaSx5gLu7C7u3Da+/j1YSoenWFZeNtCyi3x3ENo0dEWI7EmDr98SJ4SQ0Sqjv4fF86mMhPLuGiBSdlNzFELijxVWisgLD6P9VlJmbP431GL7bWvek0YTGkfSzeZzebCnLzEx1nuLrsRRtsPyGnLThzGsY+7xwqUnURO9MDxyOmfNDbk9hpXDbqu8ZgxpRPxRxUhmdiFUaocI4Ro2hnEhAzPJ79bsFm1bq1FjF7/Xv2ePUupJJ0whGoxT3imlcKvpe/853hNHwfvq+fJdxpEatyvcklnHnx6c/l6kBwkSSCE7swyUXTVxElGxQE6MUWUjcqCFenMNep40rNQ9/9OnP4S8vrWHT9hB5s6jNzaPn7wuPWF9fu7q+sflO39//1kmgFeYw6aDawvG/6swtPGdpYQH+7jZmkxDNKEDD9+FduojXPvwAzroemq6Nwe4OrMGAOEPDseFShEg5ihKR6V6I4A7D5NQAhL+QYhGoCSNRlGjKd4S0eiZIAhpxIjiWJ+/8LN8bscOmOMrNaho2FCccV2TEKFa2sVLrpf5dWyn1RhARsOSVX3DTKDQ0ugEIvNRtkV6n6LzSeySAG1qwxDqaXcqy62i9URELWuTjobtFu1XMd9CKSyuwQrEEoJjuFhr38m4XsfJrd4wmfJQgUreO+U7CLISRQBOgK31T34/3V9qCetff6+PM76sIcJ4wT/u5dO6F2sVikOUr9OnOUgbUmAZDz4HTquPa1jYwOwssrqA7u4C/OH8Jb/vgx7HdbCNemIc1O4tu4KPRaODLTzxxbXN787fiOPjeSbisBK43t/inbnvu1UeOHIHt+2gFPpbpw7pyDZ1BD9/6da/EPWEfzvoaEhqfAMy02gh7XYk0sgVkI7AoQw7XXxl0REUSUSvL8eBa6QLRtUSAikwtCysbhSGIQQy7lupoQ+ukspgq3W0cuEXgFapd8RoDxFC8VCeJuwQ0so10JFP3G+mGI93PYohnzFjrEIEnEdHDEeQNQVWAtBjcEsRjwC0yJpmPOFJDFOGjhMMlKQOuCRgCTB8nQNN+VUMyIcA14DXQzesT2Ppz7MfKK2AAlteV+5ATQwG7CGg8L6G7qeT3MknJPH4SQPK/m1qRBOmKqsZNxHlxlfoWhQijPqhitdpt7PYH6MFFvLiM/bllfHFnF2//6MfxxH4f4cpR2PPzw2SYK6tXLqyvXfupIB78TOW+LPuxs7LyjsSrf4M300Hdc9EYRDjJDJDLq7jJtvGN978IZ2oOrIsXMe/E8JIY3Y0tdGp11FPRMtjtoTbbQULfIA0ppPF8J2LTKBWGQHJzU7TKiDqMphJAc2EdWBS9qFPbtrzL9xI3kOqIhig4tFgaLp6ijcsz6QvUryKOPPotS+No3NHAFaeKUABlvBDgGjpyIjHUqfFJkh0M45OlXBVF9zGlCSE6OaIhc5iTlfPHiDicnpd3TWkx2pz3/DrwMyPKTBFWi7Z8dxmqavhl+XnoZ039vqaoSkJXJLrq77WfNu8vzovQ+rN5/FSisSGK83gxShkvFT5S/kq3bnpALASFno4gcRCATMYB6TLiPlyGovo+7LoHn1bodgdrloPGydP4yvo2fvPPP47HEsA+fhq+r7Lcut0u1q5d+8LR40ff+Ld/+4UPlI2kkOMeO3bs5tW1zU8u3nzzSlSrYyaJsNwPML+3g6P7PXzTQw/i3oUF9M+dk98sv4ca7xCGmHFcDLa3UXM81JoNDIJIiVaOCsYWCxw3Eqm86L7KSZ6ZPM2lU2uk7SZIItK3UHFxsR7b4Pdi0UmJAC3NDjeZ4R4yuU+RvhKXmPsrF88AkBUWL7QGS0bXNaytmhMLR0rCjI7FeaIOWaV7aR2MXIfAK3tR8lDGO+0nH7ne+P2k1zjwdbAJs2dSNx3HSvde6q/VPl0xIKY+3tLxGYTFJER5XTy7P0bPq9fa/H2SBdo8NmZWkDF9Yl8reJUBmsD0ak2EloWQF0qDNxw/gI0AbpIg8HvwFmaw0w/Qc12EjTZqnQVc/P9VzJ9434fw+CDEwsmbsBsBPpmNC3z5qS//2X13Pe9bPvOZjz1TPJ7CYbqP33T23tv9mouteIATVoLT6+tYvHYN//gVD+HOmQ68tS04u12q4hQSUvBF4s6hDsuXCRTapkbGnJF8akqqpiVZDWvkDtFuElqlh5zNijPBD3mwqDFUy8Laf1cGcDOYQ/tkTWd+6g1KLZLZZ5aNmLl93q1ghNflRFUtklIUJDiHOqAR+sckCGZYTfuaxLHN3/W80d02mtfxuSRhyM9zkSsmb/nW1zR99CaRyPjmC6QpWYtCC7majSp3kLnWIefQ8GLk55JhnfzdHCddf/IdLTSMGOQ6O2nYbmo2UkBngFEoBkDmBsYM9rFsAbnj1uHPtnGhVcNbf++P8bS7BOvYTeg7NfSsCDvdNX/j8rl/Bz/+gamAe+TI0Z9u1Dv/rDG7jL1BH3HTxmJ3G3dcXcc/uPkUnn98Ce39PczHNpLtrugy4g9NX+PgG912uFglYMqeO0ooz4DK5HZGnPD4/Scor8ZsVOmRRUEBWequyXU27FEfMwJuNshkdI1irjcU943E8qHxbRilRJ0+J67kVrkIrNMCPX9cIRHUUWOG5FJkFRextMCybR5r/m4Cr+r7wzyfud6ip+ckFr3m5tiKCIHWskyJUdtM8jjQvnYyglCi0RyEjRr25ht4PHLxs+//HNY7RxHOLeFafxd2M8T62upXPN9+0+ba6jvH1mJsES3nybvufcEtYWSD1RHqVojOxhpe6tbwv97/HMwP9jC4fBEr7gzivR7oY9XANQeb98uZE2wXWXdzwfxF0UhCSUuAm+WYhwdtngAINc2lDI7C+7TfkkepsMz8Swwh8n2ZBboauHmwmnOgQkEPB1zTZVYGZJMD5rnq8JwC4BZdr8wIOElHHyceozk2LfV5AltEJMqec5IxzzxvWk5eOqeppMD5CGse9pouguM34R2fv4S3f+oLiI+dRL9dRz/uwnYtPPGFL7zr/he/4Ns+9alPrWbGkbmBW/uJE6du+b75uUUMBiHa9NttXMVZJPim227GPa0GGt1tRFsbmLEbsAZpCZCU4xYBt+gB8sAt5ngFYYQFxpkioE0Sj4sWomicGapvlIMpAq62mI9dR6pn8HV44Jox1CZw1eYsd0nlCV32uUe+7rJNVnT82LETgKu5VhFwtd5dNc5Ja3UQfbbqOcsAqceviRg/y7iZ9cQItAk2EjOOXcc462v6joNBw8VVq47kxJ34j+/+IP5yaxetM2dwrbuFmYVZXLx6ZWP13Or/AXR/pQq4nz192z3Ps+GgDhve7g6O7uzgH95+K151cgXe2mV4/S7c0IczsFFzHARSiiErKg8BXAC0SaBVlL2YQ00Si4o43iQQF51jTpAZ8cTvTTFKAVhz9xIA3UDg6mSLrDRzOODqZ6zWE2l8GtdhMwAQrq8iuKpeVRy3yDYxCZBVnG8aQmQ+f9W+ul7gDu+Teg7McTPEIXAJ3g78uaP4sg/8+0ffh+25WaAzj77noO/E5LqPvOjWu77lsccfWxsyKv2fpdOn79/3k7efPXPbGTuMEff30by6hufGwD994IVY2d/ETG8L0f6emLmtgZsmkQORc+OAOwJSqhNWcNkqLjnixNU7alrgigU1zfQZGqemAO6NEpVNopHlwM8OcPOidBEBFIt1ithJwC0zTpni+DQia17f1RwtD75pgS3GN0Y8TbnP8tctVI8K3HvamDbkukyLhIV+GKO5sozVzR7cs7fhVz7xGbzrS09g7uyd2GQBu7kmrlxd3QyuXv0/N7ubPz8GXDQ7bz1+8sy/aHot2wsjdJwEzdVVfMsdd+GhpXng6lOYc2P4e9vwEg9OLA4geUVFxqkpuO2Iu44geFDgTgLe9XLcEQEYuZ2y49Y6ajGArtc4ZepxZmkbLa4fRFTO65MZ0atSDSm3Jk8CrubYVS6rKlE5744arkeaWjeJMxcR96J5yNtk8mMqJQTaR645at7IHzA7a5RWyevSMKW8BAwntWE3PPQGIQbLy/i81cAvvO/DuNJeRLC0iD07RDjYw7kvfekDL7rvRf/kE5//xBUZ2/DBnNajt95139+Pez6OttvYu/gM7rIt/MDXfA0aF8/DjTbh+ntIAh8ztRlYYR1hECBhfGP6MkXkIgPUJA6ZBeF0HHekV09vkMps2AofqAZolXFKuamEfBU9niFCFv8+Oj97urlRhuKakVI3Onoyxz0sYEfremOAO1Hszs3giDgpo6TO95XNn/qm9SkHMU5VGcTKQF3kthJdNxewoS3N+jqMmdbnSkEI0YsZcET/O6MBPVE1Y78Hf2kFm8un8Ct/8Vm85/w1uGdugu8xxDTAtaeeuWo79vde3bz620PgHjt228rVve333H3bnS8YbO6gQ47b38Grz5zAN64so3ntCoJoHa4docbIIFat8D14lodYwkQM8KYUSANXJy1z4vV3eZFIK/zZdRsBd1iWJTUG6EVynFHWUB41GV10gvupEHE5YjSM0DIS0dVzVHNcifMVg8bI6qwJgSIMGvjFo9CgzRObEYcIM5FRQ7ClaZGjkLysO0YS7Q0fLc/Liq3FxitTgpHnpzuwKp91SNam9zfLvBjRXuYzmfOQF5u1ODpM6EjBbl4vP8vm/OYt0QLMtIyRqevq6xGQ9KXL57LADaPIgojkacz+cM6cOsKQAZEDdL06tpdO4anmIr7vbX+M5ORpBDUHnbk2Ll04H166eOl3YgTfPATu3OKx/6U1M//r8+3ZdsOP0Ojuor22ite9+pW4e28HtZ1rGGBHQgy92IYbAE5Qg8cMHgO4k1w+aqNmXSZ5489oYkecRKf1aSueXiB+r6l4NfiKufEkMVuPt0ocm8RxTeDmr6ee/fqAG0dBeSJ7unHLXHN5d0/VHA7BkyOCExPRDwjcvK45ya1T9AwHdTFN89xV4xjWvCq40FhUoMHnJAyYEYVRANfqom+52Js7jvMzS/jx930ET7Gc8fIK7GYdg2CAv/n85z/+3Nvu/kd/9eW/upCiqPFvjp2+5YeOzC3A7e1j8PSTuH9mBt/5qpdg4eIl1Lvb6Hl9cI85sQUvsOD6jiosZryKgDsNOIoAbYqeGqDKKJQmEDC8sQC4eZ22KLVvtAknJkdln88IrxxdYzpRucjfehjgmvPJ+SZw8/Nn6sX8rSi1TxvaTPWmaAMXzWdmzY0KElX2hLKc4UlGoWmISxl4dbhn0XOZomw10U+rUKbSic4H5zmMuhoGFVW708duIUkwDJOUQnwJ3GQffuJiMLOMzaXj+K0nz+GRLz6BueM3o2fF8F0bTz315GrHaXzHlc2Lj6SR8jO/dOfd931H1O2iFYdY7u7g5Z02/ud77kTt/Hl4/h78BoP6HbiBAyeKBbyMCy5yJ5j67TRWuDLgqo1JgI5qD5vAzfvQxsQ4SbRWVsPiTTk9cIskBTXuwwNXjWlyvHAVoWHxAK1qmDphEUHVYDUt5HLusNjeaJ6mkWTk+XOlX4YVPnJE7rDAza9bkZEoLzLzHO6bMuCae5ZJFGods3tEP7+uEmLq59NarKsIggZuJK1SADvYh09jVWMBvaMn8fEY+LlH34to/giimVlsRz72e/vR+oUrPzsId7/Xuuee+489+eSTv332rrtfaUe+gNR9+km8/oUvwIOdGbgXL8ANQoRNO80SsWFHCdw0GFqKEKevIfUpAEosMaFqckYGJUXNiriyyrBRC3C9wC1amGklgXJRXvl0v1rALRsvExRM8PFZzY2sfb/yvQ4iMfTHItDq9dQJ+OOuFmOTpzrcKObbTOMcla49LHCn5bh6zGbFD+rwRYkUBwFufu/kATzJqm0SwDxxEN82UwFZWikIMAgjhF4LveVlnJ+dx1v/4B3YmjuCvUYLcauJvj/Ak1/8/B8mCL/Juv3WF3zTzt7ur8wfWZ6Pwi4cfxun97fwpntegLuCUHJt3TgAs4QYLa1ldoc5qMx2YYWKXCiiyXEJWPPF34qNUVn6pIHLSb5eUfl6gJvhXIUW6OndQcXgm8xxy0E7ilU2wWVu9jxw+Tz5apYjjj4umXDz5wlzZgNWANecu+sBbn5/5TlZkdQ3JD657COTsMlcTOC4eu+MLPtGdhSLGDIJpMI4l5dczLmTFFfpjcVUwARxaEl+9v5MB5tLK/j5D34YH9vYx/JzX4Br23tSq/nJv/3Ce8Oo+/XWA/d2UjTrAAAgAElEQVS+/DfWdjb+t7jhYXapif7mBZzYuoafesU/wOK583C3d+CyPYVVB/ONaD2TXj52oNLs0mLmZYapUqvoJDeMraywiuMq6/FhjFMjjpnTx3PV//OboexzXiecJnJKUeXxRAx1j8MBd2Q1L1au9HpUAdf8LUOgDJ/uJI43yTilN+q0wM0blvI2irw6kCdYJpHR+ydPeEzw0l1TphZMFQOQWtXHiEmOBpb5s9m4jlVAaklTdZOoJ9ire9hbXMK7njqPt335PPYWjsBtdTCIQjzz1ONfOXZk4R9b9975wDN9f3BTfa6BMNiH1d3A3YjxA/c+H8fW1mDv7ElicCT1LZw0ZS9C5IaIrXHg5v23ZpnUrIumWr8kx9Wgvx53kKKY2bq+o+9GolwVUPPikCmaVvlIFS71PZ594Jrj1GPMc1/97LJ5c90hRpw3TcucIppIB2DEJckO0wK3bB6n8f2aVvOhbpq2VWWsQcb2kXsmLUGWcUa9B7XrTFfMHM5fiVGqKJJM67XqXHWiVMzwY9SjutTwQjNG1/UQzM/hL3sB3vrRv0Rw+lb0Ywtus4X1jStotxtvsU6eff4+rKg12/bgDnpodH2c9X18/wPPw+ylC0j296WNgsjidCYz7I9/HtP5yOtT0SHnv9UbpEyHFeqSsOWF2i5l1k0zPlcDUD90mX6Rsbzm3RclKVxVHNe8nkl8pL6QiIrjKXsmxzOfT/6f4WjFlnmdBlYmJutrsG6yqXrkXT/D7ge5Khi61rK2ShdxJX6nC8Wb1TU1MeB39BNnnykrQYxz7KyxkGF/+vwiN06VGCznRWmiS24Bi7Kfilw6qltf+avMDTT8XqqsqEIFyj8/EqWF4+eMo1r1kHVyHTZGECnWZXH6yJdSwwMaqzoLeKLexj9/z4ewdewU7NaMVNignhsh+htr4db7kqZjYb7loDkYoLbl4x5Y+J4H7sbM6jnEewN4dMOwi4Ck3qYV3lkniBUEc078vEXZ3Ojm9ORFvTLg6nPyC2hW568G3fjCFAExz22G9y0IDjeNa5NCDoueP2vsKRaVTeAWcXw9Pp3oX60Hj0s3ZgCHOX9FflR+ZwJBg1EHcXy1gJsnegcFbtE+oUumyiU1Cbh5HTkvIZif81xdEQ3+xXBZ7ZKGRsdFHwm8uVl8pTmL73n0Q7h29CTcmVn0kwR9P8D+oL9tdW66K+nUPcw1bcyw8NVaFy9sNvG6550V4CZdH16q4BO4Ot4idqUIME2YmfkoA26e64xOynKrcQtmSsnG6u1m4z/LwFukp0xrUeY1x8RPg2MraaLcgZc/t5irjQNXqLeBtSLJQj9DGWHMz0feoizPVpAWeJgAiIMCV+0FRVA1xy0ilEXurbH9MYHjjq6bi/Ab3r+oznR1BY0MoTMio8znUnsnzZzKYUSyqVI/riWdLFizTTXWpgGYwK0vzOPp9jze8M4/w+rSMTTmF9GNIgRRjGubG4nVPnVHMt9qYKFuoYMEyaVtPLywgG+/8xSaV87B7oVwDEezGzGpIK0IKHVkzQr+02fijDZeKmqlgKjaOEWichEIJxkVykFerHfndXO9oZQYWh3KV6QqHJTjlnF/k7BUidTaf8vjTd/3QYBbRHSKxdhJxrZsbHWc9jmeFrh5rlsmKudBpIGU/74saylPGMv2jBS1S+tWa8nEFJtN+4ya/9H8qHsrjjsErq2A21hcwLnOIl73J+/HpYUjaC0uC3Ap8F68sgpr7tSdyUyrjsWGjRkO4NI2Xra8jG++9SiaV8/D7bOMaqpH2RZM4MpADA40KbEgq3vqbJvJwFUTkhXXirihuSjTTnzZggw3aq6NpulKUWJqcWlVvcGKjC5VOu5wPGke70Gkg6Jn0URGEx8TuEUVNMoIZxVwpyFEo7FdP3DNsbCNTVWwiEnEiwxdZcCdtC/07yZwNTAPClz64r3EURzXtsHeHgTu+dklAe7F+RW0l1bQY+O3BLiwehnW0s33Jk3PwWLTRpuGjiu7eNmRFfzTM8toXj0Hb8BCcAq4JlApyrFaYy1tJXFQLjYtxzUBaBo6TGOJCbIiSlu1CFUhkepaWS48rh8XW4vzRqL8GEa/F0sp2ippVjEsE72LuFXVM2dF0CyQDiMqP1vAnQY87BhlctOxeTa6Wpi/lVm7y/TdIsOZ7A/txzb8xVoU1nuxyGKtRWX2JqaBkMYpZuiy2bEWlQnc1z/yAVxePCqiMnVcP4xwZX0N1onbnp8gCbHcdtH0A3jrPbxkeUmA27jyDOoBLclsE6LaSwzTlqYEblVHOEWZqjmuDnHM63kmcKu40o0Wm00iwUUeJnJP8EuXA7dE1B5WzhidWeiWyunceSJmcqdi7p/V/cokhDLj1Di3O5ioLD16c35jLa1MA1xdMmjaEM0yYJeB3wRh0bn5DKs8cZhknLLZjoQVZchK2YLF9dCNI9Tm50RUfuO7Pogry8fFOOVbFnoDH1t7u7BO3/miJPH7WJhRwG1s+XhocUGA2149B49tLAW4yhWkReOEcZVsPDyB4+bbXZo63zTAHVkwi0XlPGjNza2jriZtgCrgjwI4Ro2jRfJgjOnQHTTpDpN/H+N0JcapPNfVbUfVxhsvrJ43SpmERt0zy3HHAyCUR6HMHaSbsY2ecATc4uANFUhjHl8knVRZerPgqOa45rFFFuIiUXooweSKyWfumwsb1QA376G/y0RLpZFo2h1E4LLuMovIUDigVbmXxGJVfmZmAW985wfFqizuINtGtz+gVRnW0TP3JXYSYrHjYZZzsLojHJc67szVC9Ie00kd9eKn0jemks3iz2ld2aJcW72ZTD9j3g9KalPlCpqk41VZVfMiS5XeO+k+2c1S7nvMQzTvrslvyKLoJRFlU+CW+arLOOs4VxhV7jCJkLYb5P24ZZJBGenJb1gdCTa6/iiDRs3xSCdVwK5OazQJt95PWQBWFxKYTDKVhTuvAkn7VunHPBpfUaKBJlxFfuMqoiCuNHHKKKmTOi7jicMwRlTzgGYTFxdW8Po/+QDWj58W4JLjhnFCq7ICrmvFwnE7pISrO3jpyjK+5ewxtK6chz2IwLZOeoGcMBGrMn24Igbr9pe5BIIh1cr5Qc0Np0TNUT5pEZWdBKiiCTO5j2nUqlrESfc5LHDzhGWS8UeLiZN63k6zIeVaJbWnR1yuJIBhiqipIm5mArd4jHmgVYvWxVzbvPKNAa6eK713MoESuQepMniVJRUU6bmqgB6DeIIx4Fqt1hC45LhotAS4lKjXt7dgLd90T8JeP+S4NE4RuF9z9IgAt3H5GTh+XApc2ew6dGsCcDOANVK+MlbZgs0yCVCTgGvmTxZxo2n9oEXAnRY8VVyszOhxo4A7adx5G4MmHAd9ttFzjCedZK91cOCWjclUtQ463tF+LC/LUxZ8UXSvw3LcIuDG9TqsVspxH/kArq6cQFxrCHATy8bGzjasxVN3JQ3HGgH38g5efvwo/vdbj6J+8Sl40ttHtaHIR07RdK39uGWi8pCCpWl95NKmi2IScE3AjwPPHvasyW7QEkttLhwtz5mnXfxJxGTa6xRuAK07TZ8qPNXtysas0wIz83dAbqvPVRudTc+MVE+D42u/sf5dSXHVD5ovSZvfD5rwTDUJBQeVEf7sM6kw1apjq4BbZjjTkVN5jquBe2nxiFiVrx05iaTeFOCywJxw3KXTd2eBu7oj7iACt3bxKdRjG47hDtKRU5leQOLPzebamhOsYjh17SUVYqaDAjRwpzFGjLtmRnV/ny3gloma026UrOsle5b5W5Vxatp7VR1n2hE0J5kU+XU47pvrfvffAHBN0A4BXRANpRiB6dcvrts1vEYa8lgF3Nf+8ftEx7Wa7aGOu7a1Cev42eexFziW2q6KnLqwJTruN99yBK3Vc6j5LAWp/LgELavTyQDZQoGF0HLJBUV+z7GwQaOI1zBAf0oqb16/yNVTlf84zrFH2UFlHKnMoDUt1zXBmbGoT3jeGy0qF42X42ESd5ELaEh4p1yX0dwezB00Ka2xSly9EaLyQYhi1X4r47hVbioVJ+2M6bimqPyaP3ovNk7cNDROMeRRgHvq7hcnCH0sNO0hcOkOoo7bWbsEt8cOfLGAVgw9RqkSLrzELFdw3HHRRpcKybbmKBOvisAmnKCkHE3RRE3jyz08cCdtVPUE+agdbXUtE/VulFVZzVV5KOdhew+Vb/hJ85EL+EgLMZRdryhk1Dw2MWp6HwSEw315wFpReclOpzPeSODSqqyNU697x/uxduxUhuOKqHzrfQ8l/qCL+TrEqhxe3sLDc/P4ltuPY2HzCmw/ghNFQ+BKa0Fl1J+K45b5QUcuomz95LxZPm9VHIp8EyJi8iKNafKvCtovIxRFwQ/ZY7MbVjeI5sYStwLjx6UznHI9kODJexyovK4UqarvbZpAQduf4Zst2ph6PkYtPrLAYMNokxvmO8/fKOOUSUwVkVKNvFWAhfqcD5bg2tqS513+MvePIoBK7dIE6XqBSzPtJOmpar/kS/bkReVJgSFc6yp30Bvf9SGsHzmOMDVOUccV49Sp25+fWOEAKwtN1PsBotVtPDg/h2+7+zTal59BPbSGwBXOmm6EMC2EPrkXUFkCuVosdhTPc4WR8aKYU5gTHUrf+vRamY5/I/3CBK3pd9P6Kw1m0sSJ+cEsl0lJIm3KnA8Y0ZtHvYeAm6hosthT9afSlXQlaCXGDrrozM8iurYh9oK61cAgChA0HDh1Ot/3UPNYvqQGFmyMgwSW68Jyawh85ZV3PVfIJX3eMh42+mbDZKaDOTXl8nGY35xI2Bz7K9OF57IXq5/AZSVBrltiwREDB+c99SOyeXhBosQYATVtFMPc02zUV0aNIXDZv5iNv3UX7vQ+I6INREFxl0PZE0Z52aIIpqqopiHhLmjtaZKJ4kSJkURX1R9YEd7J7qi8xGdKXzxdEoSkhpsFn/HILGXTnsPFWWYH/TmuLh2TgIxukmAQRSpy6pY7XpiEQQ/Ls3XUBgNE1/bx0MI8vuOu02hq41QUSXKBBi73ZuSA/EM2gvkap17VwB3vRp8GN2RcRuX3KALuNKKxOeYq4BY924gCc9ZVeVQ79qQqfQLVXoLATawY/U6CwWAf85GNGaeBqBuiGycYzNTh1B1Y8QC9nW202rOMPJUIJW72mGVwawyHIy2I2Dk55Vy8m7I5MNOECy+EhjUNyN2lAHusPAA8NIhlPE5aYkg3r9Bd2IUOHxC4Q1DkpIEi+4Zum1K2R5J0e+Sjp8zPZYbLaYBbxsun3SNV+bWKeE8na5cTHkpeCawgglWzBbhsBFZrzePCzCK++90fFOC6sx3sx7EAd3N3B9bZu16c+IN9LM54qPs+4rUuHl5cEOA2LjyprMoHAG6ee5bXWlJTyvjn/GskDqt2huPXHOltBO4kg1XZ4unvpwXu+HUIXNYMEugOgSsVDRh5YwfYtntozc3A2eiCwSv9MMHc6ZtwJejBrtcw79bR3d2D67rwBz34vR5oNphrd7C3uYFmu4MwGCB0Hbi60gIXmdVy7dpQdJRIH0e3fYwUk4tZWkhHeaUSiMSYp4KBRm/BBJlgKeNKsnEncLQ859OfpwXmtLHAk9ZY7aFyn23R+aOorYOXrS0bz3hI5Ai48BTHDT1XgHuxs4TXPvI+XEs5bg+Q34ccN/C7WOrUDgVc6m3V4nI1x9XALdNlywIkNFgZLz3cDCVlapRelNb4EblE60oqIkwDV+DHaDBDVK7eEBEszTJiFwnFbCZiIIEbErgxBk1KqBG8/QSuV0Pf8RDNz+GLa1dgMf50aw+z7Q6C7W3cdPw4ljtt7K1dgxuGqBFkrLCZUHxi9SBbOGfCRlKB8qtbrqd0vigt0yoBrxyX4syK6qX1u9IE/ShVKzkjdgl4y4ArlztAMTkT3HnQ6t+Kosm0C+ZGAtdcS9OYNMmqXhW6OIlg5M81iYEStUlQFMfVwCXHrbcXBLiv+ZP3CnCZdKCBu72/B+vMbc9PorAvonIjCBBe3ROOK4n0U4jK3KQqQDovzmoqVQ3cogcvF43GReYq4GpOPQ1wtdHDBK7Wd6sWx0qUqIzYKQRu34ukIFjdt+DbHnYbdZwL+li1EvxP3/pt8I4exzOf+2t88c8+jNraDhqbu7jl+BLaroWgu4eETREdcvUEUcyK9y4cSwGYix6l4ipVFivV0zlLbqIoucA3tbxSxaEorYAbgTFxk4Bbtqmn8bsXgVYDX29o1qwSnTfjIkzpTa6Fil4Hc/NPElXLItPK1jTPlc0icWXpeVX7QxdUV8wi6+OdBrhveNcHxnRcEZVvOvs8Ae7KXONQwHW1cekGAjdP1UccdVyszjdMnlZ3MSfb7MRW9P+yhaGITB83xWTqtpGeAzsSjstX2LDQ7w/QclroeTU83u9iZ2kO3/B//weg2QAaM0Cvz3J/wMc/jU//6m8gWVtDfdDHzceX0Nvbg0dfXBIi6flgAXrXa4Cl+6gmRMwH9QhkMUGr/NBItWoRQNCyK4BV1u2YMrSkDHJ8Dk3YhY9XpHPmReZpdMyitEczoEEDt4yA50XxaUVzE+SlIJ2iKVhVrPQ0z19lmNLA5VrYNOKlorLWcclxCdxry8fFOEWOOzROkePSOEVRmRyXOu5LlhaF406j42rgFoFNDXqCVXmKrmxZESe70co6nY/AXl1Oh8dVAVdRyuKcWRHzUx18CFxbGY4UcGO4cy1sbm1jvr2Ey4MIn4328E2/9v8AN58B/ACoNcWiKK9BD9jexu6fvg8fedvvobaxgzOzs2hZCersqUqxPC3ALQW0LepDlgCTOq8UxtfuDRqzNHCHmUa0fqlnGQbSFNgYzLXMb9yitLUqjlPEsc2Qx3ww/ySgXi9wi8TyovHrNdcVQ0yQTk58GF2xav6URKLcZWXAfd0734+15eMiKvctpQMLx6VVmcaphbYrwMVGHy9bXsK33XkK9fNfmWicqgKubICMDlpgiCqJzNE67CT/6STgqjGM0rbK3EF5UVmiitKmZnoMeX07D1zGntICbMXK703gDsQibGP5xK348F//DVb++1firjf/Cykuj9l55b9liiR9Qf4AqNeAnW1gbRMXf/dt+Ov3fBALMbDU9LBQY4fEBNGgL8czFzewyXdj3krAqxqxjfR4iznD2oDEZ2L4KuWD1G1FhlsUpVVmPDoocMs430GMU3lCUiaRVRGQUq5r2EW0KGsSG7NGlK4tlWEkEyLL8rHW44RMeQsIXG1V9h17aFX+nj/90FBU1hxX/Lgnb74vsRCKVZnApTuIOu5r770Z3rkvo0bRLI4loV4mjFKb4Q4qE5VHCxYOC2QpfUEZg7LxyqP8VgW0EcB13WCzJ4w+huJgoHvnpODMA72ozpB5jzLjlx6/rotbREiod7IFi2xCh42KtQiqgEvjlB+FqLc6cJ02Pru+hof/5ZuA/+5VgNdA2GoJw6aXVsLHlW8HiH2A9YrJkde38LF//zPY+uwXMOv7uO/USXhxiN7eDpK4j/7uHo4eXcbuxi7anQ563X2wHAobtPUGffHt2jUXruWp3qwMBmFATaQ2DMNWJ9Vwrtqo0/hBKzlyQdqnyRXLKozkDWTmumudOc8lpwFclU58GFVhsmVaBabY7MPr0R2UwHcseM05cQe96T1/jtWFI0OOS1FZBWDc8pwESSActxmGIirTj0vgus88IRz3eoBLVpDf9HlONnT/5LJKTDG1KLqF32njVN56lw9By+sa+TGVRc/kgZsXnW2KOhIAoURyEWcZ1CCvWPm77Rpq7jz+encLD//Q9wJf+wrEbg39RkNKlrCqCPs+6XPo/6WhyWZUlR9KQyh85Rm8/yfeiv6T57CQALecPIY6iUIUoL+9g2a9ge7eHprttqitOzu7WDhxBN1eX9w/FKRFjI4SOEEiRe5JDBnEQf13UvSQHl2VqFlkoCzLa9UgMANciu5RJWqbQORxeSI8jWX8oMarg0oceeCOJyFw/ySyzsylH9CDQGNmalUmx708vwKnMzMUlYfATWJfgNuiL3C9J8B9zT1n4Dz1OBpsO3IdHFdM3blIGx05UzXRelGKalbp6wk0qN8ViDvD0MIJbTYncdyijZUJuRtGFLnSQMpipUxGUpADs42K7WIQJ2jVl/C53V289C3fD7z0AQxYssStoU7BVkCr3FApxJR0Q/k38uHvbqDWaQPXVoEvPIH3/dKvwn/6PM40WjjZmUM9iBAM2NWcnRRDBVQHwnGdmYb0cY1Tg5UdWQJeN3altCwJnykqF1l38xxzWh9vFac1JbLrub7mqmWEYJL1+3qAO83zVR2j9q0qz0p3UB64l2aXQeBemluGPdMW41SQJMqPe+LMvcJxKSq3GW51bV9CHl9z782onfvyRI6bdweNc75iw04hBy3QF0zDkQb8cLHSiKE8d5VNr2OCp+yPOwnAZTq37jjP5mcErpQL5Z+XIHJiRAw7jGx0Zpbx2NYWXv7WNwMPvxiBVUNguWiy929Ciy9THbWKoIMlYoSMkrJj1JKBEAX0A+DqNQQf+gv86a//No6EFurdPk6dPCbW6Wh3Fw1XicFJEiGm+MVyQ44NzyWfdZGQuoeMvLKF2+Y5XZVfc9KxZT7Zog2s7lNdZXJacBzWbZUvHWSOn3uoyB10EONUfvx5jh2FKkNL67gBma9jZSKnriweFY6bAe7xm+4R4NKqTODSj/vA3Cxe95xbxarsMRy3guNOTqRXbggFpmw4o7gFaAbPOfXNhzW5qwlcHkOxgxzjRgI3P848d80shGMhYEcXWpHpX6UPPUjjiGsxYvmdXLeBzswS/mLtKr72Ld8P66UvAewa/MRCzaNLRjILlH6rJgNhWkUzIvdm3HTQR73eVIYrGqCaNeDqOp74xd/A0594TIJnjs3M4Gijgf3Ll9DxauDdozhATJ2ZnRZdFw7dVpzzKK2uaMScTsNtpwHSJI6cBdk44ZjmHiOOPc4YJnFZ8/pfTeAW6chcC4aoSvadEfJIHZfuIFqV11dOiI6biVWmjktRmRyXojI57v2zHbz2vlskAGMa4FZVv5AMEQO4JqcVg1OQbRpWLVqojBrzZQJXg/l6OO4k4GaIEIFpq5pNXuzCDQEvVMD1azECj8W9ItRrM2jNLOLj167hpf/mn8P92pcBSUOJSdpbNUwzERkZiU39nd6mGLWaC/R9JIyOcmtAfx+o14E4BLa6wOYmPvCTP421Lz2OlTjCXStH0I4CRNtbcB3qtaFwfrE+p/dRWTmqQFkhNyypFXYQUE1zrO6DPM2x5Vxb07vqahqTzq9iIHlCcRDiYN533JiXZk3RluFaGR2XovLrHnkf1o+clJYkjFXuBYFyB91654sShjyydxA5Lo1T5Ljfdc+ZoTtoEsetAi6piY43No1SQ8vfBI47Uu6LY5onGaf0pJmc2yyCXiQCm5LBuJXakB5S4HIR3dAR4NZ9pTdq4EaxBadWR7Mxh8/s7OChH/oeuK94CRDWAJcpVilydaA/1YXUhaYlZyZPR0GAVnMGcDz4e/siWtcbbDYeAbtbQC8ALl7Eu37oh9HY2kBnZw/3nD6BcHcbXmrtpoWbhmvHUZlM4gJLp3Va99thAVZm1JoE3IOI7VXAnNZ/OwmQhzVOlUkI4gEgQc0Bl7HKBC4DMAhcBmAQuP0wVDru7c99OAm6u5ipWWhRrFvbw4PzKsnAffIJNO2RcUol0TupO4jNG1RcbhVwKb/nTfqmc3uSqMyJyvS74WbTTchSq7ISoVPrbkmwxI0Abt7lQPkmsFUVEA1cNw5Vyp1rSXwxU7QYw+zWOvjiYB8PvvmfwX35y4ABAIq+2rA2BG6anqefg3powriLGI1GGxsbm1iYX4IVWwjiAP1gHzNM+6P7aDAA1jex++5H8dgjjwLX1nF6poM5x0GdIY6DvnRQ96gDs9RnECJ28vmwSnQdrhFdd0Np1Bnz+Rpu+sLfTAlp1DOWqYeq2ZXudldGECYBtwxok4xOJgDLOGKeA98Id9C4L1jZIySAJk3rCxnS2lbuIBqnGDmls4MYgLHb68I6+9wHEqaVLc20hOP6axt4eGEO33n7LWg89RQaNVuc9vUgTH24zTSFjFE47AA24oTFvYNy3fhyom5ZWp/JKauofFEARllQuBmIoTfnJI5rpqWNG9RUOKEscOyJ1Gk5vkq7iz35jfHAdKg35hfw2NYGvvYHvx/WK17ONA+gRo4pcZPDVz4CUd9TqcC0WqduJ1rqeSfW5GXtX0ZdMVpL4mEtYGMLn/mlX8O5P/8Ylgcxzi4uYNYBwt092ME+7DCE26xjl21n3BpoBnMdC37Qh+u4iBIfNerF3FDi/yVo6atm0w9H9gC/pxVbJ+cnue4Laj5orEtjplkaic9BtT4tvibHRDSkpTXJcn18J7upRgUMsoYlNallUW/jklhKsIwi6Jl9l1KoomAcjlEbUSNddzyhu41pl2mhxbRD34hg0Kpvi3QWDwbw2IrE6B3kzszj8tyKZAdtsObUTBuJ62Gn20W324V16/MfTPa3trDSbouO29+4ipcuzOONd9yB+rln4Nq0lIaoBwMJNoitBmImntu+LIoGblmGkFlFsGgR/i4Atyo6a4zLGqtJNWDImeKGpNUlDls2xXCDtIIh3UG2DW9pHo9treOVb/4hWK/4GoDZIA1mEMRl4cLDO1VtXkZGUYzu+QM02i2JaEx6XTiNNnDlGrC+gw+85ScRXbyIuW4ft67MoxlF8IIedra2UGvNwGHer4jRgSTiO/WaSElx0Ifj1oflihRLTbkuQyoZY5vSHaklkIsulbU1rNZClOh+Yr2y9FiH16kAriltFRPww9dlzlqHRx0WCrm4IVpU7YnhbykFJnjNiKzRtdPoNroNS4DLguhveuefSemapNVE5LrY293HHjnuzc+9P+lub+PIzMwQuC9bXMAbbr8djfPnYHMhE3LcceByUZxc6Z/8gegAACAASURBVJEirlTFPZ9t4Cqqm+0SXkaJiwCS7yietYxHor8Lxc0B1/ElQ12sudcDXNOPnB+f7CXGOTs29kMfzRS4wf6+WLfRcBVH398DPvd5/KcfeyuW9wc44dawUHcxZ7vwtzfh8BnSiv1RYiNMQqkEQo488ClV6AANWj9VNhjfRf1gUXspHugUFp3TaY95kZmg0f2oysRhPvthgDtJTC7WN8et24VJBKZuYBScHxotjZY8HAc7IXAPjevGqu+UVXMqgfvdLM969KQAN/a8EXBP3/vCpL+7i2OzsyIqk+O+ZH4Orz97G7xnnkLN5aYccdzEpqisOK4J3EK/rNHUS8TJgqJl/6WBqw1V+bGNRCKVs2sSn9Gx1wncuiccqCKffcwin9XVE5UzUK/Bp/6asEyNDcerYdDrwmb2C3zUWEaDIlwQo/tHj+Dd/+/vYDGxsOI4uLnZQLSzjTBQsdmNVhtxaIEiXxAGiGu0aTAFkGJvKIB1+UcRW2wMrlIJjD63TDXUM0Y1iy9dq2wImtQwdr0uqGlamOR1VSHcmf5F/CYL3CIXo9KJsjWqxkRxI5pF2WcUxx3XqVNC59mVwH3jn7x/CNykVsP+Xhe73X1YRcB9eG5WgFs79/ShgTvSHbPd+PLizlcDuJrrmjquWFQNTpwnLFXAHR2bBS5Lx8BlXagQbkBRSKX7+a5TLCofArjmxifgI9dGEkZosFqi5SD2B7AbdQziEB4TFqg3BQPY9Bdv75B6Svzzx3/ul3D1M5/Bsd4+TrU76DTbiLsDDLb2EPsx6q4H1/MQubFEgPFelhOk3iMCM93osTsUkXXYJ2mJVts5x1xjLZkNq4SmxjczAKRYFJ70ba6Ocy6IZ1oj1OguSidVa1xRtzt9kGFvqDSxwwzxNAM4Rlw+rT+e9nyWkkMTRGXNcQnc3Z09bNOqfNN9LxKOq0Xl3voV0XHfcNvtaF48D4fO4SlE5SqOW6WjfbWAmxfXNXCLYpjLDBpVagBFZan55NBcHN0w4JrbNm9IY5CGT44dhph1aKFmsGsgonMQRxgkqil5a7aNwd4edwjqjQbQHwB7PWBtA3/0/f8Src0d1P0IZ+aXsBC5qNN00euJ/3gQMtaZtaxUTSv1MoMeRpY1rePKhh/tVMVxYybtDz1dQ/exCs8c+ZIJtIx6MDH7Zjyox5yzcb9pEbc1zxgBt5JkaJcdY8qZOJO613SzMN3hMAwCEfdHoZkj4E4yTmkd9+qRE0C7BQKXOq4AV3Pco52O6LgauG+8/Q40LpybaJzighRtrhFQqotp/V0DbtWzjC+kIV5F9SFwabQix7XIARM7w3H/3g/8IGwap5hXOwXHzeiGhquLm1u4IDmulK5JYPms+lgXX68k5ge+CoSW3/l/lcUU9ffhtBvA3j5bUGDnkffio2/7QzSvbWK5G+PWhXlE25sSeQVPJd9r67mq1KOsyvK/oWioeijrl/6/dhmyQggzk+zIkaQKte7pOYY1+qDAnRTqeHDgjp5Bcd7xKo5FOnRZ9F6+xYppEOPaTuK41HGvrBwX4FqNhgB3h6Vrjt/53MTf38eJ+XnMJIkAl6IyOW79/DPMDivQcblwA3EH5YGrRIwRFZ5UcPvvEnCLjFhFVHfEkaOhG8CK6ogsRr8od1AtUsEVpcDVVuUJOq6ZZKGkhGyIH3kbDUvUK0XH9ZqItvfhMLiDIA5UwoOIzGIvY+maBPtxiHatBmevC3h14CtPYfuDH8Enfvf3Mdfdw2IEnD6yAL+3jSQtgTsyElM/U/5dZTzSm1u9s+a2vLPyhiPVpIfeB5fphAbghYuXAPd69d9Kjpn+aOYFFx2fDxDRoDVjEUQGGcYWZAvLsf+tlP41iuppO4V8N0HH/d53fwiry8fEOJURlY/d8Zwk8X2Q47I8K41TYlU2RGVtnGIgvTJOMaiA8a+R7AfWN1KATcWATJf08TaOQ8ts2tGdnyVu2SjJqidDrpsTl8wILBXymL1/RlQq6OVSxsWmWuhMvPUonDMvKnshAxsYxO+ghwS15UV8evMaXv3DPw48+IDyubZZSU7VQT7MS4gejU5EkOcikjaMdN9ZsNMyscppqjiy+N05fieGnxZk9/pSExaIBkB3DwgDfPzH3oK1T30ay36Em+cXMVtnBUofYTyQGGdKtk23iQHFbeaO1pgokcAfDDA7N4Oe3xeLaeLRQk0dmYvIOGkCmHEBoz1DYlfVboWbPp8GOszNHjMwHWYW1TkmkciK6kpiLLNUTwoQmdRixU8iKQrIwBi3TgkNGBAPzRlcXDiC73mXamxNPy6VMH8QYJ0tSCgqh70elppNAe5g8xpevrwkftzmhfOwknDIcU3gkuPSj0vGqx88ry+qX8ZFDRO4GepjzLteHG4AM4leQJ5GStHMfhjgHmR588REESiNtNGzlQGX7iBmddSWF/Cpjat49Y+8BXjgfuXGaTWuD7ipiCwhc44jvlGCVwhBwmhkB56Am0kMVGkIUku8VCoAwpIqkdH+Lpx2HfC7QK+rKnFcvISP/fTPYvfxr+B0syNJDMudWVgUvwcR/H4fM622FAoQcTliJ5seGtShEWEQsiwPy7InEBpmucptFirgiktXirMX9+fVa/TVBG4eoKaoPK2LaXxvVfuZSdhc+rbDGA65bwpcu9XBpcWjAlwtKhNqgR9igy1IaJyiqKyBG2yvC3BpVaZxitZDk+MyAIMhfFpUVv7KLFfMAvj6gGtSPz0puuetzg7S3xcTjoPAdPzYMjeR+n464LJWkALuNXzdD/8Y8BA5LtlW/bqAKyXpJZoqFVEZ+eS4CBnOmJanaVFSpuQqSmrK/XTNKctCwKbKDQ+RH4jEGkU+HOluYEv4JL5yHn/wo2/B0R0fRyNgwfMwU3ex7e/CcZhrxKitEA23hrDfQxIFqNVqCIIBap0m+v5AFRNIRWYnToGb1sSaBFxz/YvE0+tbXc6LCv8UaaSgTvS4jjzyyeb3vRrLpN5J6YhT21DsRFJHm/Nvc45YV4rGrtYsLi8dlQAMAjduqv64YRAp4FJUjvp9sSqzAoa/tSZW5dfdelbcQXWPE638uOS4k4A7Dp5q4Jo1eYpE5bwIrTmuTHKaj1sGXDOZ4LALXCRWH5TjauB+cv2KEpUfflABd8rIqaqxMx+Y7iebIYlUPWwLIUtYSQ0qVrpQ1TUYKkn+RkcO38U2wcivtDj6/s4emjNt2LU6uoOuuMo6jSaw3we2dpE8+l6899d/C51d1uCuY3mxg0G3Cze2Mej1sdCaQbQ/kJas9EQMBl1YriPisgYun2NkXdb9kcb3h/m8eeBWeSgOtcZ/h4CrOa4JXBqnaFWmjquBK6Lyytl7RMc9PjcnVmWKyg/NdgS4tCqbARgauAzASJxAqJSbxq6Vc7vrA64sdloWZkhxjSJuReVZx8uDqCUtWvRJsaz5zTDSpxXHNUMeTXeQqeMycooc9xNrq/h6AvehBxWyCNwJxqlq0IqQjFB8ikr0pb3BFUNyzNEJkCk6s6ojzUSsIaayBlg6JEHg9+A16ogdT9RuIpnPRMAH3R7qTCnsdlUSU28fX/ylX8YTH/wIFvcDnFlaQr3hYW97HTNeA9H2HmY8T+KXa3SBuDb2g54kWwxL+9C6zGocqad3mnaiw6ikkq6DhwKsPok2AGNvJKnoru0qZr5u1pCl1n4U2XUwTqtvH9mhcNw4CAtFZQKXIY92Z0aASx13bXNDWZXJcRk5pd1B2qrcvnxxTMfNxyoTuNUi6vWJynkdNzPJtKTmAtvHgZaNesr//l8/cGkAUwBmxm2NAJUYRAb0xwjo/hHgKr2ylnrn5M2KYDM7KI7RHQQYBDEWFpYR0RfMLo0ei84R6JIJAGysqxtdWMWH3vp/oXfhAhabQDOJMV9rwh0EaDJJaX0NtXoNDuNwPSWlJ8PoMwVcKaKfukMmgTcP3BsJZLGOmwQhja2eZG0et90UA3cs7jnnPg2tQHTcWOaba2mJcUrruIycYmNrAjewbQz6vgLuqXtekATd7jAAQ3Nc6rgEbpGOa4Y8eulADstxJxmnCnWclOOKmf0AwD0MZdbjG4njWVfXNByXBa69pQV8/NplxXFf8tDUftzqMdtS7kaMPrL5WKZVwv2HoUsUpUWtSP1uJGPCKQyvkniKmu00LJKE1pYwyjDw4fs+ErqOmk0V3CGXT9H/hb/CIz/8r3E8ieBv7uLk/ALmnTpqoS8+ZXKvQThIgZvaQlIjuKoyaYEpbMXFjdSTF7WHyQDXSGI4zPrGrMGVGjy1+iVAZgG9gu4Ko3vkGdIE4Jb0ASbHpQlPA5fLx2wyAvfy0jHokEfNcWmcGlqVaZxidpCk9W2tiaj8mptvEVE5q+NS7GqP0vrSJAOWKS17mXWV85ufEzONjltWFTKv4xZxU9OQlded1MaoFnHKXEd5PVe69YlIqCKnPCbKS+5ypJo4LSzhY1ev4ut/5EeAl75UVW6k+X9CZJDuUFk8v7Q/iH02/RNWq/50MPzwnYYP1fWPgKJOnNmoNKqkXRDoWgqlWqUlSfd0WVnUyekb7vUUwDstoLcLbK0Bjz2Gd//ir6G218Vi6OD0/Byc/R7ifg+Oq8KlhiqGFH+3JdOMrjKZswrE5YHLQzON4G4QcMckNSn0xzpgo9FlOf10wB1eN53vsT3qMvHTQjQYSD6uBi7T+q4sHJVEehqnqOOSyEnTr60tWKfufEEC38dcs4FWFAx13DfcfReaaeSUI8apviRvJ0kWuDR6mCl9eQ7FHEOJlDFqKesNw/ds4+Vxn+3IsZ3Nr9RUclJ4YpFVekRAVD7ktK8iHVlcG6keKfWm01I2tcAV7MRWiIGToLm0gk+tb+GV2jgV9BA2vKGPUo9hrOMlN7pUxVDPP2yPqQMupA8tHYEqAF4wrIM0+J4RA9MG2kYjbX3N4X21Lz0VLFTkDxPe0xHqd7kP87H7Sozej/D4b/wnfPb334UjgwT3Li2hFQ8w2NtAu+Vhf2cdi8vL2Ly6iWajjcRrYEDiRbdUKg3k19LcS4exT+jzD3Nu0Z4wrzMSpcvcWeUMQc6lrk+/O2tcM9eEhRqjUGyWcb0Gq9nEtaUTUrpm4+gpqfJIIycrYEh51pvuflGSDAaYbzUFuP31NTw018br77oTjXPPkPgiA1w0EbN+UcpZWFvBfOUtw2bklEmxRLwzak4NwTSBA01rVTTHUXYOxftpgVt2DR35RZGdII3SHV4PVR5rbPcR2gzAOIpPXtvEq370LcDDFJV7iBr0bWaTWMcAMiLZIuKKbckQ7Qpa205Lh+Q4GrDykhA/59ex6KIUw91aHf29LTRiF9gfAOeu4JO/+IvY+JsvYjmOcGKmAae/jyNzM7j69Dk0mk002zPY6O6jOcOewH7pvW4UcM3n0c9xENtG9Z4rs4pPBq6WHmw3gcMELu4ftidgRZNmE2vLJ/Gad/ypANdpqwCMbpz2xyXHtYJAgNuOQwHug7OtIXBZbMxh4e2wp1wOaEruZewqkdCOKRKqV5FYydq9epIOA1xTByalEs6dZm3ozIwq6ljEcfV30wK3auE0cCXmVICr9L960BDLKUVnAtdbOpIFbtRHzHzZXO+ecc6mqz+qeTSBKwC+zughE7hFG3wSFRBRnj5IFrHzfaBmA5trwPnz+M//9icxu7aNxX6IM6022raNbm+PYVOSBMEXOyyI1JLW3s4zgUmGqCoAVgF/GuBWrftoXGWx+NMBl89L1YXGuoTlfBNLGlsTuOsrp/Bdf/wexXFbrSxwj9/2XAHuQruFmSTCYGNdgEtRuf7M01IlkMBtREykp0NBcdzEUzG5ZcCVAYnIpvI25c/QGfSDTxKV8wtqcptJizYawzgH0YsyScecxOHLgNuImrDpWnEUxyVwP3F1Y8Rxoz6SJnvbZqExBlzVQHUoLqumfArE/HOpo5uisUKfpqSj30oQWMZxJwGWv3OsQT+A15kFtrakSiFmXGCP6YMxsNsFPvwJ/Okv/yaa61s40WhjbsbDoLeDVtOVaCHb5wSMNnmeuBeJz+bYJu0B8/dpReZJa57dVwcHrixRWoBCxOXYF+CSoMWwxTiFRgObR28S4LJYnOa4+1GoqjwWAZei8uvuvONAonLZw+rSNZmCb0a7iEnAreICRVQ6z/3zFDv/+XqBqxtzEwBiiJJ2HjYoKueB+8m1TbySIY8SgDElcDUoUz3XBC6flb1yrwe4ZXHS04jKNDLZ7DboB4j9Puymi8FgV1pq1Fot1ftopwdc28QH/tWPwbm8iiNWgiW6htdXcWR5CX6PO3Z64Jatb5nUVQTsIsmwSGosIvzj9zm4qCzX0N0UJwD32//zo9g6dlqASz8ugatakKTGKXJcisrkuA90mgfWccv1SCPXMuUSJgfWVR6HE1eQCK3yGVPjTOqKEB2ZInsqcuUnNL/xyj5fD3C5KTThKdJxNXADK1Y67to6XvkjPzEE7kFFZT6jrs03nMPrFJVN4B6cI9mSfMRXrVVDMNiXxoMMe5SoqQHDKKlKWcDaFtZ+9+34qz/8fdzkOVhhpOTWBmqNzlcduCYzmJajl3PhwwNXpBYWjEs5LkVlclyKyuS41HG/84/fI8B1Z1QAxpiOS+Bq45TWcessXcOmyaZVucQ4VfZgLM8qBCblsiP9Ms0ISusqlwG3jONO4gjPNnD1guumX6wSQY6rjVM1v5bRcTPAZaxy3EXMouYH0HGfbeBOIx5nNj1DPhi3LoZnX1wazSbdRGwDasnm8xlPHQbwaHLf3sbVX/pFPP7Iu3BPpymJCyH3hVH2pkqnNe0Vk9Zfj7PIvlIG3GlE5LyYXp62OiGSyozYYnpskCBMArEfRTUPSb2Oq4vHpcrj5tFT48A9ecfzxR2kOa42TlHHpVV5WuNUFUXS+q1+aA1iEfVyYTNFKXxmiVTTODVJv+H1h6VFcimDevEOw3EzelPqwJcKj6moLBzIr48B91PrG4rjpsCN6hS0mbc7eo3puJNEZXEDGTqtku/UBfPuoAJkFonKVXqhuc48tx8nqNc9BIM+mgyPpGXZVj5sabOS1nC2ujsSIYSnnsJ7XvsanN7t4sxMCyHtJkZa4yTg6nW7EcDVcQRlzEG+L2i8np2f6XXczLMZfl3JsgtosPOV4bdeE+Cuzh/Fd7/7g8XGqZWb70nYLPnoAhPpI+xdWcULm54Yp2ZXL0mbCzeJ0Ix9yfFM0BDLV2SzOFkAG3WlWBsPma1rHGbcF+be0cYqM4VPxIc0NnlYSH1YAyhbpkQDc8itDTeJWgw2ddbGMVU/KGv8sKWplj62jBJXLSw5roxDgvVjRGmWSc1vSNYO3UEMsifHfWxzC1/7o/8WeOELEMf7sGYaSHIRNZXANfy4CpfZwmUFuDzwV3kCbG7SPKAJXD8K0Gw2EfW7UqhOIgg8RlnRqNaAz04O9RqC/g4adRu4dgkfe/Ob4X3uC7irPY+QecBTvIoYQ5WNo+qSVTpufq1J+NlAXNZYgkeyhs5JHFfv8aGElu5t+nG1gZF+bDdmRlcgXS+67NXVmZXeQQzAYEH02uysWJV7SdqR/sw9L05YzpMBGARuuL0lVmUapygqey6D1lmeta+MLVZT5HDtDnLDLMcwQaAmTwNjRFbzG64MqKpKXq5Y7wEXeSSajwp/md9N68fNL6heCNYFrgIukzHYtY9W5U9vbOLv/dhPAPe/EHHQTYErWebDpzoIcKeYikMdUgXe7AUT2HUPMfN4WWqUaWeM+XDqsNnG022rwhsunzFAvHYZdrCHT/3kv8PgI5/A3e15IApUT+GS10HF12keeBJwzbW+XuDq8eSBmzDzQoefpn5cAtf2augxyaMzKy1I3vjon0lHegK3zwo1GrgMwIj7fcw26kPjFK3K5LhtFotjQfQoEOAKBq3W0B0ktZUktK/qlXK8AleQnqC8OGJ+Pgxw86Mp2ojKuDM5AKOso72+h8siYWmN4NiijquelxyXQf8EbsgsqsVFPLa5q4D74IuR+PtIWqzCSOBXAFet7vAQ7cedZoPeiGOKNrn+TnopWCHCfh9uZ4Z2dfR8FlV3pbZUzarDcWoIunsgP5FWSTsb+INv/y7c1u3jKEtaMXIorf5fNF5pBZrzmRXVkboRz1q0b0ybTCbUcnjwdMapvH6epEW8YsaNu8lQx3Xq9QxwKSoTuF6ngx6TQeIo7Y97+/MStqNYnGEnAxU5RatyUcjj9QDXnJS8HlNYOT49IVttfrxVZ5Wea96zjHLnOa4u4aqPZxhaVfaTBq40iDZE5XrQHAPupze28Mof/yngofsBf0eSo6cCrqLN8q8J3MOKigfZ5EW6ZAa4bOHJ8kCNGvpRLKmBM/W2FNsAM48YlDHoS4UOaRH62c/gfT/7M1jY2MXpRhNOEFQCt2hvfLWAq+epingVVXhR5xW7uEZzn8aKk2ynOi6NU3ZNcdza7NyQ47I/LoFLjjsE7um7XighjxSVOywksrWJB+faeM3tt8F98suo15yhqMwADNhsDVYsKhfVnIpj1T+2DDhmUEbZIpnfTyM6VYlC+fMnAbeYyprTrwqnSe2kCuA6Cwv49PoWXvWWnwIefuC/GuCWgVzWlMSErT49FwN2FOR3YSyxyP7WjqT2SSAG/bnhAHjqPB793u9DbW0dz7v1Jnj9PuL93qjFyRQUpYrIT3H6oQ8pJ2DVHLfc2JaqWAbHpXFKc1wN3Ne/8/1DUTmj49KqTI6r3UG9tWsSqyxW5fPPqLrKaeRUXsdlupfWcfWE5sFbBdwyEbmI0imJsTghIA/GKh1tDNT0N5ZcdxqOzawgxQnHgauMUwMwjJei8ieubeDVGrjB7vQc91kUlafR94p2uz7P9weoN5sI6dN2PET9ARyWimX3QJaAJZcNB/jyz/0ynv7wR3BkEOEEa22FA/iMV3Zr1wXcScXaJgE9L9FVIVtLONnEl4MBdwRk1SWRojKNUzTwFnFcGqcoKtfn5rIhj0dvvS+hlro8y4JgfbEq0zj1pvvuxcylC1LWcxJw85MzrVWZAy9K7ZNUP6Pqo57MIl1nkg48nGzdDS5TgTIBUothnjAU6bZFBMGR2SsHboQ+kpolwP341XV8/Y//JPASRk7tTQdc0x2Usyofmn0YJ1ZJMJMIpTTfZtglE9Mow1NOFmMiOxF6wMVzwNY2/uRf/QhmL67iqJ/gFCOA9rYQuxZq9frQUnsjnqWQwBQkrRSBfRp1Tc+Vti5nS9Pm7z6yRJt72QSuGPMiFjNQhQUIXFPHpVX5Te/586GOm0kyYMij4rhM62NC9IbUVX7tnWfhfuXLaDQoKsdp0y/6aigqA7EbyEh16ZpykWrcZWFuCD68ORF8GBO4kzbPJI4xCbh04+SlhJHTftQsrOz5lDuI5WplVhC6kZQvtQNmB7EKZR+o2ylwN/D1NE695EEkYa/aOCWUxPDJphvQ9Lsqg0fhdpUvqzKH9HXyuc7CBdKKGdn3rHVf5pUHe66UuKnRrcXAi86MKvN69TLe8XP/Ab2/fRzHej7uarTR2u3CGfhw6zYGcUQ7M1h3uJLLGcCbxF2vB7iaiRRdI59a+mwAV1JAIw3cEMzHvTS3gO95z0exurSC2sxc1ji1fMu9iWfFOD7fht3dR//aFl6xchRvuOMmeM88CY8V54z+uFJT2aW9VL3YAEq/qtp5jImzQ8d22luoJJ2vqPfLNHquuQBKx9bm91EvVtmkE9IIKzeVoCbtVxvTzsRSOtTnLDgRfbShiMrkuPb8Eh7b2cEr3/yvYb3spUiCLtBmX1q2Lh35p02wTUzZk3pVFNVUcvrwlThSYyqToW429JFdmgJ0WO5cfRbCmdao4lUddu9jrSpHNZxq1huQLuqMdWzW0etvw2WlSGYHbe8D6+u4+o534NOPPor6/h5unp9HK4rRkKoYgepmwDA/CVdVDZ1lOAUUyJTGMuupiVjqV82fb3LPSWDPWHsncOdJYnd+z+lxjRhBNoVSSg5ZDqIkQNP2EPh9qRYSWDZqc/O4OL8kkVNrKyfgznTgOx76Ax/7/R6so7c9N6G+cWyugXrgo39tDy9bXMTrbzuNxsWn4Frs+RKhPpB69EiYpZ+2Vrwe4GoKx809DbUrmpRKUm38+NUELuxAdGYnaAlwE2uAoGGjNr+ET29v41U/+KPAy14C+HsC3CitzqiHq8E69BPnQiJH4NQslQXVx4FLZMq1iswCKWj5oyp5k+bhy/8VcGmA5Iula1qtDva3t1H3anAbM0j2u9IOA/vbkGreJBzrm9j7wJ/jz37rt7HSD9HZ38OZxUUE+ztiXZeieGw3ycQEKT00Am6V4dIs1jZkEAZwD0rEp9kzI3uNkv6q9udkwm7Q07FUMLYpdRHGPhqWi5CtbG1VntWb7eDC3CLe9OiHcfXIcTjtGWnX2u35qj/uiTtfkAS9PRydraOdxPDXu3h4bg6vO3sKrdVzEpJ4I4BbRFWVRbkauEUTc9DF0sAdNhg2Io6ul+OyQgSvz/Q+xisTuHwRuCpNfQD//+PuTeBsu6sy0W/Pe5+xTs1Vd8x0MxGmkAQIARSQIDyHZ/tQn/3ez5+iPARCYytit1NLEASH1kZbpRVksEEFgQAyJWGWkITwGDPfqW7dqlvjmfbZ8+Nb/71PnTr31JALdPfvlT+8uXVrOGfv/f3XWt/61rccDU5jEl/e2MBzfuvWLeCWLK7APu8tDiuU+AU7Rt9i+VT+UxToBvrC+ef1/KEpUuQiDabokguqVVuKgGLtwL2+hur+0VnQ78DltA/bOvzRzbayruH6zo0m8Mhx/P3v/CfUggTTuo5JZmKtDqYaVQSttrQ7RMvNIRMKQTUzX0uvyovvBrh7bTXYSV02HD2HdxYNioIeS6Tdb4CRa8FraViIkoD6QyRxKCqtyDCkL36yOrYNuKFhCHAl4s4de2KWBF0Bbokb3lY6AlxGXO/M8W0Rl6czS5kLibijT2tOAAAAIABJREFUgKveZK6s2mfK+lhBu/PvVb/9fwRwe2YKb3IGX1pbxfN+lzUuHTC6avE0cpH+EHyH2wg7Ape5VY5T8kN0dhTnqaHaN69It/0W/kyq4lQtTQsc6jb5mgwhmSS75v3m9oLQB7kQxCFkoRTbOysb+OhrfwvG8iqMdg9XHD4Ms92BQ3tWWv1220K88GfJa5IgrtJ4dij4wSXa6mDd/oILsHy3EXcUcPfbGy74kf1E6b2+ZhSxKdXMUMQlcBlxCdxTtQZe+ZHP9CNuZJrwe5GKuNOXXJPpaSSpsh0G8Jdbkiq//LLD/VTZIDkV0jFfbbK4UOCOBtH+gXshoO2nV0MPRr/uuABJ5eDPLLaxFRGXy5+HI65vJChNzeJfV1fwQ7/3JrU7KPXFLI7AlY+h17effULy8AsACDoSYXIUyZ8CYPm7cnQsYKFAo36lQFPkhpzFk6cI4Bge/1tlzQjjAHbJAsKOWs7V7ciUz52/fSvSE2dQa3ZxsFRB2TaRdkMYUYIkChAFPryKiwixZADyoxlp+dto6SvzqHR8iLbWoQxcg4KJTfIF2tsi2R6p8l417qh/v9Couhdgd3v+hmvcIlWmPatdr0mq/Kp/+ZwAVy+Vt6fKUxc/LjOyGPONEsyej+5SEzdNTPSBa+mmSpX/JwH3uwFrcVCMSj2/X8CFFkmdwlSZDyY3wnf1SID7hXPLuPn1fwRc9xQg6ymbF22AVR14cPcDXBlkz/vIyoY1FcAmOeOj8KdQSrD2QcswKp8eWFhbpMrb3Ahz4otyV4qOW+tYeN/7cdcHbkOjF2Iq1TClGfC46X6jhUqpBEPnbl6u9KTDpez4Eoks/2Rta8ZsHaUiiWQKLaNs+eE5eK/3C9xRwNgLuKPANip1ludnl0yweL370QGM+p2yckkYgBglw0bMLAZAj9Nl9ZqQU0WNS+AWqbJE3NnLnpBlUU8irhtHQk49fWxMUmXWuKY8HN874J4fdXePuN9P4PKCF+2Q/Z6c205+0TqrWNavcYeASyB3tBDl6Tl8fnkJN//+HwNPuRZgO51m48VY36gHRFasbE8htw2+S7RV/1OlruwdyVnmPNoWL7hgmSX05cCVGot1pwI3HTvVSCApcm63TlVdy/89dBwfef3rUW224QQ+Dk+NQ+v24KQB4mYLkzPz6Gw20W21MT4zg3a3I7O6Atw8LWY9zX6lzgVXsbr2ocFl4CN7Wtt6/BcacYfv627Lu0Z1MHZ6LvZqQ+71PEkanrPKJKcGgcuIy1R5MOKSnNpW4x644slZ2G1humqjqkFq3BuqVSGnKsun/38D3EGxuDzSuRvH9xu4mh4LcCsz8/js2UXc/IY/Aa598hZwxSFiaJ5+gH3cC7hJ3uaS/UBio0rQKdBu+7lS9A6AVmpalj6JjDZKKcrWHr+ftSyJJ7Z81jZw+++8DskjC6gGPRxp1GEnIde6wu81YWtJ3xubZoIUVbRaHbhsX9Cama3D3LWEY396zAXciVrVK2VX3obKh1CGs6PdatRiy8VuLZ/h9TXDPsmsKeVZyNua/eckFwCNiqajgsleUXdYX10AlzUuySmyyiSn+HoJXKNSFnLq126/C0tTs/1UudMN0Op2VI3LVLkgp5gqX1+p4JWXH5Uat58q79EO2u+mvPOLdEVO9FOeIcUUa5xhddSgaGBQrDGKTNgrYg+SQNsVXzsNSG8/S7m5UHCXMDoy4m2lykK8aRF8IxZy6q71dTz3P3Gs7ymqxvVoNl7UuKPP6GEzt6LXWnw1fXgZIQ2e0vLfecM2H7BPw1DWVyBUe2i5+YA4Mi0HURxIWs1B+CDwYcu1BtAJgcWzWHjv+3Dfhz6OadPGtOegalCLzPUkPdmjy751bKbS12eg11k1M7qmBnS5j6b4BqsPdT3NlAaDKoVXDUYF3v7934GL2E8EG5bQyn0ZMQi/2+f3/D3DGVC+BnYwbS7GUaVfvcvkU0FO0eWRDiGFPJhDBs5YHScq9X6NyzG/bpYhijMFXLLKWhJismwKq0xyihH3VVddDHfh+L7bQRcK3MHpip3qieFaYvDvo9g6uTEDooa9bsZ38+8ErqTcRTtoP8CV/bjdfQF3uNY9/+9KmSYLA/hGuAu36N3yIbNtAaXYp+oaej77siV02z6qtYpiidMo31yvA6cXgK98De//wz/FWDvE0XoNZZZKsuYkUQcUzQliarOBnkPzAAIyP4BkzlQtv1btvuLF5Achxx63+YSdb/Gy12E7eL+G2fftv/O7B+5epFWhqiJIiyxu8HOD7i3Dz9luwHUbYwLcX/nEFyXiErgtbtOMUjQ7bdXHZY07UTKkj8sa96m1Gm658iI4px7ZtwDjQoFbuNif96byGz5a55mLBgZq1OKiDZ7cwxF41AMxqKiSeDXUJN/rIdoLuEyVSU659FVeX8PzyCrLftyuYpUHyamBi7AXOcXXSUKKBBhfo9qB21dWqNyb1jJ5y4ttF4seVylgUf2WRIh8HyWHgwBNgNvlTyzgtt+5FfVuD2MaMFv1oFHxFEXQ40i28HFjoxyMNFXgeLyZIDE0mLT5YCrOg0N4kSKe5v1KcOBiu0sIf45BR/+h5Gava74bcHc6hHcin/Y6tLe5k+5jyGVQsLFXO2kQuHTAoOSRv48Rl8BlqkxWuQBuJ00l4gpwGXHT0JeIO1jjsh1knXpYFhbvR4BxocDdeZ5RXVKJZkMtm1H62uIGbE99uTJlu8xs+EYV5urDoN3vw0MJKD8GIy7/biZl5SmdA9cZnxLg/tDrONZ3AxB1FKss/kznf+wF3PzqiJk27VBVX5Sb9/JUmdFOZ09QdXviOIaWcS9ujLjdRWWsDrTaKtKuN/HlP/tLnP7yVzCf6Jj3XJR1LltoCfMr6TEPiIRb7i1RWxG4nGwRvOY+wYU5u2xCkWVk+UGoJXKm0AlEMc3q7+o6nQ/cwcN3L2DtJLA47z6PcA/d62fL+3oM+oJ+p4KH1i41cv9Zzfu4vIcFcPl9PGy98YYA9+W33SntII75FalyXzlFAUYB3Gi1i+sqFWkH2acfgWPQaX5vyeP3EriDF2twzWbxhvdb4z6WmncUwAdBvdNNfizApQDj+QRuIcAgq6zb/X1Ao35H8bpys8zzdgEVvtX9fjCjF722uAmP4OMpHfiolRxkPV/teWJdTvVTEGDl7e/C3R/9OLQgxMGxBiYcF731VTRsF2mn3RfIyGtjjZvvt5U2U8I6VW3dG/6QyEyAFqRP0Vvma6JwKufjJKXehU7Y7wH6WEC4E5m1Uz086mcPf+2oa3AhEXcYuIMRt50kWxH38NXXieRx3NO3RdxXXnEU3pkTEkm+n8DdevC2Ls/wRditxi2UNYPey4On8F5s38ib8hgWKO8F3IKcYqr8xZVzuJnAvfFpkipnDj28dp+OKVwqRwNX1ONbb0HCGEftFGgZ8jTuLSKwOk2gx/6qDqxu4OQHbsPdt30Ek5stTFkapmdm0NrYhMV+bxIj60SocPE2mSyDDvs5E6+rCCmtHfZsQ7X7R5z5GVnF+SEfy8wXbPcjDHnvXDOSWy7B3GlnVv5NjwW4w9F3uN7dDdw7pdI7ZWy7EWESqUe4ig7//v2kyq/++Bf6qTKByxp3s92CNgxc1rhklW+54iKUl06p7eH/gyPu4Bvcq8YdHrna9r2PkaEc1Zvb68HZC7jUKgd2Bnd8WgkwWOMSuInfB+5gWjwsbRy5wrTYzqeekDxXVd5VacamUMYBJUmhjTSBycZ+QIuZBPjG/bj9j/8Lug+fwpxr4uKJCpLuJoJOF7VyXTajI+JCNkv6uFKzMXLmF1aYc0befANjxokfRngBbKJ8gXOnS1PyY34nB1X6+dI2FjnjCs/HcFCelwLvYLtbpLl7TQf10/ILTKX3Ssl3Oyz2Q04NApc1bp+c4iaDsNfBVMVCjTXRchPXeiW87OqjqC6c2JOcEg6ROf3Q1rmdXvDwTeqvWBxy5B886fZb4w6fjrv124Zr4cHXO0h07dbnZTpK0bxkkcLq8sHNBSWxLSkkB+kjW0dpbAafP7eM5956K4xnMOKG4tMkcolCxDFikmdwraYCda6EEoJIFBSKFCpkgOKWoUQY8vU9KrQs4OQp/PNr/wO8lQ2YK5u4Zv4QHK76DDZg6CEyBmPNQtgL4XgVNVwQJbBNpvKkzDncx4jJaaRMmGSCws7FFfkfiOm9lZ8lXHomY8p8rWwRyX9vn+tNNHoJbx/r49dufezm8klijmRZMpLLGI6K/bIj94OSMcx8yMUANycq4o1ZIOtOebncwlhorHlmUdottb26z6z65XsGyNTite/lrlEAV0tjtUomoSG6JuSUM9bAyXId//52xSpzrK+dZAijWEXci664ToA7UbNR0zW0jy/j6ZMTeMkVB1FdPAWbLzZOYTLy5n03adUVo31ZCoPpEwcQ0hTp0N9HtWX2J0k73xKk+L6tn6kj5o7VwfbPsAeznPij5z13+7z6ty1L11EHUWJyBEtdFy80YNLFYHDfrq4h0Ogj5MGzarirtYHr3/haeDc9TYCi2WzRFL0+Ld8DJDvjZa4o4YhXHMEpOdIP5IRPlkbI4gSWzWTVRhLosEoVRL0OLIvMZAg9i4DAV2KKM8s4/t734esf/iRqfg+Xjk2hRDbap092oRVW6BKeeAA0vMeUJ1KSyCmxwX5rAVS+FnVyKYDx3hRpsPxdtMa6yC0lSvdDN7XUMSJbHXaqzqWiy4QhpxXVGcXE0tae7m3tH2lPcdqocExhbV+ASIFZ0nh5H1tL1E3dVq8TMbppE+VyGegYSIIUNu12kCDsbSIzUwROAljcOOFCDzVUuhmoR+947IFnsMQwYXhJuCK19qpx+Y6pKqOTKhfjmjbLHAowUujlCs7U6YDxOaxRq1ypITYMbPR8tCh5vPjK67Net4XxKiOuBv/UqgD3Fy4/gNLiSXg0tM6ByxfDgCIZEOdy1VGzDbh7g2G0vO18YJCR3ftrd2vxyM8cIVIfBcLic48lbRsEbikwpF7rRyN5DjP0dMCyXFSNKr7UWsW1b34NvJuejizQoRm2MiXIlUVqgZioJNSgACO2PMPK2J3MsGvZAl752oRLxV31gKYcVOcGRfZlE8A2sfj2d+DLH7hN2juiKzbIFmugOSAHAiQBthSRtdMHRyEL58t+JBkYi+wzqUNRswBvEXGFyOKzIgDm69YkTekZgURy5i5sDTH8KiDkkXZgVUe/T5ovVuPzkYaZiE8k6koKr6tF2fKeEvR6PRiGITaxWySY0ktHegS7asL3u/DiirS6ekEPpqWj7OkIky66VorUtJClNozIRKVFO9UY7Sptd2MYoS3668GP/Ty3xdfTAYQHT9oLwYDPwXoqp6xaBWcbs+KrvDI5B5RKSEwTzTBAm2N9BXDHyoYAt3d6Dc+YnhLguqePo8Rm+j6AKxjOWy/DteJocO2sT1VvameT7G0XaUR9NJgyD6842Q20O/3bTmDmAx+asUTcclflI1HOmAoYjBQh46JB1dGYAPeGP3gNrGdykJ7sro3UNBFlqdgDqd9DplYxNjLVY9rodVpwq3Wk1PbGKbI4g2dYyIIQmp2P2JEpDljLRsDd9+IDb3gTyt0QXuBjul5FnVE79hF3O/K7KlBRJw45K/vYDsiR5F+uNy6uVZF5jAKuvDfataqGmWKmZQhCRdY+wMTdg1imwFmXCMlIHwtTx4PdhBk5uWftgEKLe2aL6sHcWknK2l+BX4PB62VmiFNfVoVWjDF4VhW9NEJCH/E4QI+SzmoFKTObzIMeaPB6OjQzgV9Oc+CyJNmu/Bt8jvZKl4eBy4jLNZsFcMVzanwGGQ35DAPtOFLAZaoc+G00KqqPy4h708z0voFbVCA7Mb+jwDAIhJ1Pp/ymDVrjnLeKREWi3T6+F8DdKRpLjZuneVagbh5bHamlakCe+nxQTMNBWR/DVzbW8ZQ/+DVYN+XAtT0RL7CiyidWVSRlRKE6ST3h6sE0LYTdQE5kx/GgSU4YqSkjLotmSbC2gTt/701ITi6i4Uc4MlaHy7YQI0fYEU2szs2Bhgkr5sCPmNPs6ywbxZJuSwWHBgWKiDuYKksSQqDKAjj1u6nVHRRsFL1go7/dgCbzef/X5KyxWu5NlBO4WmrCSLgaJ97ax6zza3gdYykxRBKi6zBY6+f7pMSNg+m9ZcCyPKTtDKEfI/NsIAlhJxHGKhVErS4y2ajnQUtM2BGnmjL03EgOEJ1LvfOTZq8ScNSzTmtfmVkOY+gsdfKIa1RKEnEJ3HMTsxJxCdxWFCrgHrrsyVkS+pIqE7idE+cEuKxx2Q7aK1XeC7h7pZ7fLXALVwvekFEEGVOi3T5GMcn7/XoVFhMBDbkKlmYR6xSe8gOciqV5OXBX8dQ3/Dq0Zz0diCzAceQhpF5YhCbIYEmqnB9GzGD4P8MBml3AcoFSVUQWfmsT3ngZaC4D7RYeftt/x1dv+yQarRgXVWs4MNHAxuIiMnl4QxFSWJYO02R/NRNuIAoT2AZrur0/dmpvFKn04PvdFnHyVLuISgXYeV9YI2oDAhSh+oo1qjkJR6KouLdkzAV4ef2YWKzRCWrlXSVpMi9XxiwoJw0NA0mSgZp3+Tni8aXUXbGuYZ097sYkzNRGxHtoG0jCHsxuBzXbgOWrAzTWHCGvzMwEM+PYipDwgKW+e5/Ald9/ntZZnc1alAhw6cXFLM2slrE4NiOp8jnxnKoIcDeDnqpxD176pCyNepisO+ASCQKXqfIvXkkHjBNw6bi5S6o8yPkN39wLmbzZemP7S5UHH5JtkTxnuR8LcIuftVvv9zxWnCk9fYS5hsTUEFgaMjZDc6aTdZOlu/D0Kr6ysYGnv/G1wLNuQpYYSG1XgKUURkwRJWnM69wctPyrxX5qBvRioN1Rd7rkAX4TZz/0fnzmPe/BeC9DrZvgquk5YKOD7voKXMcRPyOrxD0+mfRckziCQfCythZMXHjE5Xf3D84RhgT8N+4wlo+8xi1AuEV2Dd3nrb6RfFuWLwQ2MmrCiwwhJ0OZ6loBMgIoT7N1bk/kf8soMd03TamhI5qyMbhbNnTbkUwnovSzUkGz48OCDZPLydj3NjI4PR/Z6hoaQQKTAxqUeBqG7P0VxRh71jwwhvYe7dU7Pj9QKUMB7hJmjUvgcj+uXalgsTGLl33oE1jN12wWwG1yyKAALlllRtzuyRXcNDuNXzh2AM6pR/escUcBN+EECAkIMQW70I/9kVN7qWB2S5X3K5cbfgfbwJuPhMmha6YIHe6MZQTlaByliCYcw4NtjeGezXXc9PrXAs++ERFMZJYLA9T/EvgiLcr9nkxJCbOEZA7nYrk5ixsBfIDDAu0W8O1H8bE/+zPEDx/HlGHg0NwMEpq4dX0YUQqPgwemhsQPYXgKPFESCtFsWrmJu/xc8zHVuKpGVITVqI/hyNu/VkPAFYaZY+QSYQmCvNEl+5fUgSJ/ErAisVQssyHUNgkoElEZMpNrPWPokS6EkyohLOiZjVS3ZG2HNlaDVquibepoaSmaWYrNKMBaGOJrjx7HyZNn4Xd8lDwXbr2EI3MTePKhAzhWqaC6vAav3RG9tpxNrJ95FOQlGvvWTHcfy8cgeBnFB4Eba3mNWy4LcF/BbX1T87KRvgDuyFQ5WFgX4P78ZfOwTjyEsmbuGnHJ6A0CVXpcA8DdS7m0cyq9v3bQYKqsIsD2ZuhOwB1FpI36/p1e37bsQuZY6dOUIhI1FKMwo4DaWG/oLmy3oYB7qwJuwNrO9mCSIS5Ay5YLxQz5qCD7eiYfbPGF6gH0flrfwKde/wYED55AabWJKycnUdZ1bDY3oZsGXMdEt93EbG0CG6eXUal6khbz/aYWiZU8VUyUN8Z+iCkVJbcGO3Yzi++3ifL7UIB8kMApwM8tfXx+VP9bAVdwl4OXVutSFUt6KcPDuWcVW0CMVEAUDazppOuG4UCzPWR2CbFlI3Rs9EwLZ/wevrV4Gg8uncWZ5iZWuh1sRhF61OLbDiyYwiZHaQC918HVkw08//JjuL7eQHVzA7bfhUnGPj+UeTgSdCxuWJfuZLK+V2Ah6OV2hwkMR0OUaejx/PY8LNan8e8+8VkxROffA9NANwzRCXrQZo48LrP0DPWSLqkygXvj1CReevUROKcfhRNl4p3M7E/mDMUJVJOHgC72o86arT7rdpF/cSrtVvcOp8qP1XX+vFSWaewA8ywPzYAI/LGclKMibzHIrstDlUcLbhjPa9bYD+GVGoBTxtf8Dq555c+j/JM/BiquCF5PaFJGaI7gGdLJIVllWay1unwsVLRdXELz45/Ep9/+TlR6ARqOjvnKGKzNrtr0ZpPlVK+QQLDjDPSsN4Otgyy1TWG9E947IYa4KY/RI/++ESqkvTiE/fz7YDuJ9eUg8NMwltQ9ifkn+5gJbM+Wv7NNlqS046GSSzlPDkY3XXeQhDacah0hybHv7Lw6G/SQNSpY8H0shSHufeRRHF9dxZm1dfR4rb0SLNuFaTvIbAfNOEalMQ6/3UGaxqiUqNVeQbnbxEzXx6++8AW4VMvgbK7BDNuI0EXZpY7bR9xLYFjcuLVzucHnbXBYv9g+SEUaP59KKZDAopsK/bcMM7euqeNUuYFX/Mud2Jg9hMxzkdg2OkGADZnHvejxGY04a54mqXJ4ZgPPmJnCSy4/CPvkI0JO7QRcCthVD23rYy8yavD03gk0CrxbrPJj6YvtB7j7OUCKr9ktY2DfUGlzlX6XuFHiIKaAirSolSo4d66Jyswc7tlcxdU//39i/Kd/EnAdoFIXBxt+U8L/p2cw+N7DQEVXtnpam8C3voX3/dGfwFpcxqQf4KoDBxG2N6FFIax8PCeWmotBSd0P9pQpOTSCfHCdKbEBqevIfDOll4Q04f6nvYG7Y2osdefg/d9+lBeLxdV910WFVQBZWjaiWFIHPLOTQlBDjytmB16tIpakfhQIcWQ7HuCQYOPPKkErTaGTaFiPQ9y/dAZfPX0CDyyfxbqpo2PqaDJQOy6sUhmGW5Y+cUw2nWk1+7OWjZWNTUyONaTnW/IcGIGPShoiffQR/PBFh/ETT3gCahvLqKY+wqgNxzah9zjWYSGWrseFA1et20zEaSYtgMszvKaA+/KP3tEHbmxZ0sdttjmPe/ETBLhVF9LHJXBvnJ4U4JrHH0SZKcQOEZfAFSawIIL2qTndC9yDwN0R3DuIuPcCbpEO7/Ua9gvcWMgXJb7Qc32iSkLJRiZSY5o0URuv42srq7Ce8nhc+/rfBmgobrmIaF1jMFVLkAZdZT3D1IlDAWsb+NZ/fSse+cIXZSvAVUeOwGZd2upAa3VhGjpi2qhS/CC4V9GV7QvWXlJHMqUTIKuHi6+XwA3EzDGV/bTfS+AWAN26fgrYfT7BYJpLm191wDCiMssgocSDRlaSyBC+Je2abhghskwxj9crHmLbBMX2fhqjbTr4+DdP4KGVdax12/JQw/PQSSK4Y2OAayF1PKlJwzRTrSEKikSQYcDSNUTdCOP1MbHbCYIAjmlJa47lh72xirG1s3jtT/w4ZjobqDLiBm0hEJlhOZqDlNLVwYNrhEPGrhGXgpMcuFxsDd2UVHkQuOszB/sRl6zyNuAyVSZwmSo/bWJc2kH2yYdRygxJkwnewVSZqiGmygVwR6XHO5E/+wPN/m1bt5/42zOAIZJyp3Pggj7PB4ssJJFDYBC4eSWYA5cmFyZafgBvdgLHWy2cdgz80B+9EZieAsoVZE4ZWqmsImynowiodgvpZz+DD/7lX2OsG+CAV8KRg7NYfPQ4kiCSJeSV3Kuqk4sSCuASADJPb1pC7mxphTncLjFWPk/wEiG0ktltrG63xd78t524glE2QPK5fEBBtM6su3MzBAI2kn4MDeYsqVMTywH7mb5pSPTcTGMcX1vG148/gkdPncJinKI9No2VJINt26g16sIah2kiP5cpNo9PkeLyvZoGSp4n93p9fR3r51YQtlrCOtvc0mDaODR3RKIf2fgqvbUWTuLVL7oZV+kpSpvnZJ8vBSxZrAg+k79hgFk+v92jUuKiRBtOlRPxIkrEuoaOlyx4lcvj9lQ5dR1JlfvAnT16TWZqqQgwCsnjU8cb+KWrDks7iDXu/0zgDiNqr7R5+FD4fgNXrf9gy4zpskqZFUGTi9DNDH7XF0awdGgeX37wUWiH5/G83/oN4PJLVFuHHxucfdWAT34Wn/tvf4NsZRUzVRfjYxXRH3fX1jA5OYW0FSHqBbAME4Hfk1aPMr5Q3sWFVLAAI1N5AWnO8EtkizNYeXZAa9D9SB6H70N/K0RRVw9kzCJpzIUzIlLJ0+kCuBL5uZKEfkxxBNv2EOsWAvqt2x6MWgORV0LHsLDUC/HtpUX8v6dO4ZGNVWxkMSL2oytl6OUqQsdDJDOHChxRzMeeMlNLoio/R1DHYYjlc2extnJO9PSiuDQNPOsHnomf/OkX4znPfT5uuvHZ2Fhcw2WXXSn99bTbgrd6Fj965WX4iUMHUDl7Fl4SwiMplVhq055srtg5yBS17H6Bm1omQi47zIFLAcbK7EFZ+bItVR4GLttBBXDLZ0/BIcmRKIJqt4irUqS9pXP7/7rd+7g7AXgUcAfr1GGiaq/XvGeNmzf/ubVPgJvP75CE4SQNJz/ofEia389SlKbm8NDSMhbiAEdvvAFP+Dc/BjTG8OD7P4Bv/MsdmNgMMKnpmK2Wocch+H9kO7udjkxqVUs19YBGqbRzMzEjIylGRloJCyT6igcWmVoF3DTvszICE7h2wsmdBAFVSTuYwu/a9snBWLDIWwSXQnIB3MHF4TK0kQNd2bZmiMjG2xYi04YzPgnfcrEcpbjrwYfw1RMLONPtoWWa6HGSquQiKbtITB2RjDBmytmDjhFcph2GcChqCQOkcYq1tTX43bZcr5AGd0hxyaUX4YUvfCF+9qdejGufeh1ixAh4eJgl/O3b3o6X/tzL8NTrnoGqC7lfAAAgAElEQVQz6+twOTVybhHXlm289qanY3xhCU67DVeul4tYLjdT5Z2f1b2AK9a1RcTl/kK+1wxwa3WcqDbwqo/c2QfutojLGlfPYhRaZUoeb2iMScQlcCnA2A243w9ySp3uO7eDdstrdwLuoGa0IEMKN77dft6uYgydOl81r6xllN9ReqfaLUVbw9BTqZ1cz5VZWT4/VmMCZ6MAm6GPjdU1jE9NIKX/k2Xg0PQMsl6AoNlBxbYl1V09u4jDl16EzfUNtLu0nWnItvfNjTW4tsPELr9kZNDzMbP8TSlZ5tY7HE6L9wLnXqSUGslTh0UB2FFpcj+qc0zOyIfwLQfdahVJfQyr3R5Otlq449778MhGG2c56taYUBGVe3RNHn4sA1SNTBsezlBVHFNsaYNehMXFRTRbTaGKXLskNe3Bgwfxwz/8w/jpn3kxnnjttXA8WwDOFptp6ogDX8DvlCq4/xsP4BlPeibK1QYqB+cRpz1k6wu4Iovwuuf8IA5tbMA4t4SSbiGkEb1h5DuRzncDGLR73avG3Q24r/zwHVibOyQRtwBuq9OBdoTKqZRuBzrq9HRdWMYNY+MqVV44iXKqwRLSQ9UNZkRLv3xjH5UxIxrxffCwUB+asz0/4m4BtKjBBoEkEyADqadSvRWpiY4sl8ip7xlho8LGf/4axBZ0YNyqAC5//oWk1JQRFr+/mI0VHS5VOjKvmYj3OGctg15A/hS1yjiWzjVRPTyPnt9DzbXQ4eleKyNgXzHsqQjNuVi+nziFa7tokiiZnkAQp/LgRVGMUsVBHEfQyO7LTLSylmEdOWx9Oqggk5FMrXjYCITtwCuuv0gSGSUHmn6SUeSulvw60RrnwwDFAi9FluX3iGmleCerZVaxbiJ1bGgOo2gFC4aJe0+cwme/fA98x8RanMKZnsImhw7qdawHERJhkNW8sG1aQrZHQYSg28TK8hlYeoqeTxYfmJmZwov/j5/Gj/7oj+K6666DTRIwLxOyJBQwc6gjjkNkcQjbMhBFEaqNKUQ+A9g4xmuzqB85iLDXRrK5iMsQ4LdvuhHHOMSxuISq46BHl0tzyL1EpGgslygEz0f9eF/s7TWuOGWSkOPaFpHkJjApQ2UtPpQqsx20mqfKBC4JOAHuwcNXy3KZWq0EL0sQL53DU2tVvOzKy+CeeBQVMdoW3aMAyAxzbWu+lY5RhOCVXlsxzC0ichV1hgUQRYRWQOFhEIjIWqOFiwwp6yJzK9wEZV+NyV9MV0MmNpwQifujW6oPltPxWT4ulg9uyyFBn7PcrYG6Qjrp5RBX0zFM+UiY8H3uMWmkIsr2+MyJFU66qAXX6oOpJyNZcVP4L/2fLTfU6LOqIi1gb1PIGh4EW31X8o3F7xsUQIwS6gy/riL9HRaobIuGJKnyaM2sUBRc3OkjnupqhYgMxvMB5X1gzzdWumCLrhaahcCPUG6U4YcdpIgQahEsz0TE8TiTO18jePVJrDZ9WFNTSOsTWE5TnGpt4vZvfAt3L6wgpCqIz4prw2Sf1fOw0WlLP5vGaFNTUzAcruiIhVBaXTsnhFMcRiiXbAHpv/2Zn8Izn/lMlCoVBdQwUuOSHE7nfScoivFJg8+q2vvLR6fbC+HWGugFCcYrk2iMTWHu0EEE7U3o7SYO+Ov4/ZufhYOdFsxmCJcz72STTY08sJQFssycVy3m4UkppHoemBfIMD5PcH7weZRJKB5oieghZBGJOIHIamVh/hPXw/L4HH75I7djeWoOZr0mKrAoSSGSxyMXPZ7Tn6hUSnCSAPG5FTy9XsErrr4alZMnxCSbLy+1mMvTiZ7A1WGmgUxfZLoCsiimBsb6ZDZywFe3eLCGgZtQq2uwh0fLUOVNK7ViPgBN+p6glRYCLVSyGGk+1iV9VH6PXCNVX+vZ1iloJGrWVYDbbx/F0Oimn0feArjyE/i5IWAOp8rDAFEb7bdURYMZRRGZhuvqwa8pQDjsNll8z+DvK1L8/gFB5nSn9R0Di7wHj5ph4PZF/Dy/GB2KQfo8UnLMTMgtXmveXw5UCHAp49eRRuq9B5kPw9FFXslN89wfZJbKaIcZ9HIdSb2OlUzHXY+ewue++QDW9QwLvRDJ+DTaaYbqWF3IpG63KwcZn0fW8CSWTp48jpWVlf5KTse18Bu/8Rv42Z/9WUyOT6BUzgk+4sL3VQocRpJKE1QEqbp23NQjnj6SKXFAgde/E4Yo1yfRizLUy+OoVOs4eugQol4PTtfHbGcDt77g6TjQbkJbj2QQJEVHaczz547XRNarDI4lirsJD2WuGyk020qaqfrXVLMpeWzBjpBkZGYCt4SzE3N4+Udux9LUHIxaVTbS94F7+Og1AtxytQSbTeelc7hxrIqXX3UlqqdO9YELMxQ53jBwNbiqnhNqn+eLmvxXUY5U/JAEsbBpIXlCqVgepROxRsiZWF5gNur5Xpl1FCca60gO8xPYMYXeJFa2T+KIaVn/Q6Uo6iNPyftpXS5Y4GvIObXvFriFp64yrlNRdzBiFq9lsE2m0tHRpJ6ksLtMNwlT+V0AVx24SgctrSx56HhoUsqXp3pilayusXhJ5Scb035Jh9kHtjgMriGJlBghZC1vOUhqJWTTUzjeC3DP4iI+e/+3sRRn8HUbdrkCo1RBK81gukz5Y0lZJyYmsL65JvVqp9NCkkaiInNdF695za/illtuQZlRVYipUKadmPJSPCF92iQVsKuDn84SZH5VubLlz6UYbX49P+/3ApTHZ5HEGZzSGCqlOg4fPiwTO1m7jbnNVbz+RTfhULuJbDWCIxMhvsr6tvlpqSetOIyF7WeZkGdccv8pNMlZcH6/3PuUenUVn4mxmEMgbglLk/P45Q9/ajRw5w9embERXxurwuMeGKbK1RJedsXlKB0/jjIfHsb3AeAyLdQp+WHETSwVWfPGukAk38szGFkKLA1GXAEuO2HCfrI+yIUL9PIVhQ3TikzSXWXjacDUaBfL2laTC6/J4iy+YfWg9aNfnrmeB9y8sVkMq8tr+D4Cl/XMbhG3YF1Hgff7AVx1jbbS+jSl1Y2qZVWaXBglq9pUPYiK32BmJAdgPoYoKR5TTo2zrCl00wPMEozqODqmjabr4WPf/Aa+8PDDWHJMdBwboe3CHWuI1rhLPywAJQormAavr2N1dRVhRAVTCZ7n4DW//qv4pV96CarVqtznOAhg2LZEQ/6dYDdIdhkWLFMX8KWZmsNlRJMDRsgsPl0qneo/I/mh6Ps9lBuz0sfzSmOw3QoOHDoiGUjWbGJ6YxVveMFNONppQTvH7fG8FpH8T40cqcirLJ22NNd9v7C+NU+OgtyXjH8zOBxBlZ260nQKQ2yZ0LyyAPelH/rEtlSZSi1JlWcPXUmjIYw1aiixNbC8guvLLv6fy49tA25GixHdkIg7CrgSYfLTXyLBCDcMeaEDbgGKeTVVrcG3ThmaTBWpk0gucK4tLiLX1hInXU7NwkmhMCceBgAPJRVvWRfzZxZKHkXO9FOYEanyKEb5/Bp3y7C9+HqOshXihCItLw6u4s/idV4ocPvR+zFG3OHXUaTKksWw9irMz4R4yh/EwgCPDyyziIyRLVGA9QxkrosoMmBWJtCzK9iwHdz+9ftx57cewjp1yLUa0lIZmUurHguhpkkNW62VxRvrzMIpAWCp5EoEfe1vvAa3/PLLBXjq9GYBqUtkDcm4RyE8x5WIymjPelP2IfEZ0s2+AZyAlI+W6KO3nkldRDNsJ9H4zkCr08VYY4oKb5RKDThuDbOHDoss0gp6mFhdwptvfhYuaXehnW3Bof2OHSDNetChDO2pPReaycxnhrclUQSmiFqVYyZTZFpq8+1RmsqkRw5PlpsaEg78uyUsTx3YCbiZdvCiazKKq+sDEZfA/eUrr+inyjojaw5cRU5tRVymygKAnFihdJZkVQG84Yd/mKwq0uz+A50/OP16rv9gbk91C+WNlanf3xccDE0Hye/nvGauf96qR7cDt+gL7/Rzitc3CrhFvbwFyi1yqoi4w33nQeBeSKr8vQPuVikj5U1e4xfkFkX/knLmkUquD1NrjgebGlbol1Stw6ozypbw6W/dj3996CROUE3RmEBkl6WVo7mWyPnoUBgzQPB7l84gCzrC7N544414wxvegMc//vHQec9pE8uBdTLoQnQRluoZYCqcRTEi1oYsu5nysjWTUh2lFo1J6s6WT/4sqmc0z+gkPWVmSNLVQrvrY6w+iQw23HJDIu70kYvUzw18TC4v4g9vfjaO+T3oZ1sScXU7FLFHQaJyjpYxiRJUwWeerhj8nf0RQLpusLwjARVLyWewn57XxkWqzBq3iLg7pMqpdviSJ2T02OHpV6TKBXBrp0+rDW4jgGtooZweWpyfOEyftu37UeAdbMAXN1/eWG5nSm0uT3Flv0vxOOdD2WZTpBN7furBLlI08ngDzKvhCAtdSPukfswRxGgnBJGw1gMEUl7nyusjFyhjsOrfLwS4w6scB3/XIBG29fBspWuPhZwajJbfK+AWQGXGJ3Yv+YUskmnOyyonRZI7eWuI87yGIeqmdGYOJ6MA9y0t4sN334tvd7rIamNozB9Gm9Jb8hKGITUop34YYr717W8I+ZSlId74xt/HL/38L8Bk2yaNVBZlGehuNvukklNyEbRakhIXRBNVY26jpmaQeeAQsJI20/GCUzskKRP53Lb7MfAcqBrXQhgk8BoTYhHklepwSjVMXnSxOgB6PVTPnsIf//AP4PKgB+NcR9azZI6PHg8dkqEp61KWffxQpYbJa8YsQDxYY1kvmtIZxUzFISVm+SEkr75Fasmia/TJKabKw+RUGCdodjqxRFwCt1avSKqcnF3GdSVHalySUyW2JIaAqzFlzjjAnCAL8t7pQI2r0pI8JR1S5RQXsWgHmUxjKANnW0eYaJ6s6nQk4yugyN37pH2UFPUWsx1+/Va/TGUiecjIbVkVcK1+is7aljW41Nq8yfkZcKHAHWSVL4ScUt+vYDKo/S0OuVH95cEs5rGSU4Pgl8MzZ/BlLNBIckdU7stV0ZcPIBn/VLMRawZCw0LIDQelCvxSCfctbuAjd9+NE2EHa46J2iUX42ybZu8ldLs9VCwPZc/D5sYKTp8+LmBlkHjrW/8rfuRHfgS2rWrEbqslWwR93xf2l//NSaEkoBrKkpSZDh6WV0KvtQm3VkPc7fYjLQHL/jZ74GSMWRLJ32mBmz9PRTuoMHhIZdFWhiRK4Y5PgVrDcqkMu1THzEWXSCvHimJUzpzAH9z8LFzJ2d+lJsr8F8tHp7cOx2DtrYQhHPEsPEzog8UaWa4hCda87UbdBmkEAa8QVaqTobgfBjBNHDAyx5Mal9Y1I1jlUJuaP5bxwnglRyKuvrqOp3i2sMr1hQV54QQuySnWuGZE6p2/rKfWM+r0nN362Elp02fa8lS2uHj0DZaZctuWdm1My5AohWGQWCDZkCiRtmkhjVgb0NaULCZJrQRB1oXOAXH2Hou6WupixS7ypLfopshJmrg40U2Y+etmysVVGv1UdkCwMUpWOaodtO0CDP1lFPCKw4t/RoVQYWgvcP+9cHN7figO1mkFsPcyX+hH5iHDbpUWG8g6CRzXQWAnSNwE7agN17MkQkgrpQVUa+NY2YiQNmoIG+M4R28y18E/ff4L+PTCAupThxAkMdx6DU1ev5KrTCxdBw8//DCysIe418EN1z8Z737H3+LIpRchltQmRdwNJN0t2nXq2tD5Q13IlO3IvOWmOI/8AktwYNTK232FyGKgluVXsnZ2GM3JpYh9Lc/rwmEyQ0DpqGbCcysyoFA2bJRrDalxJXhstDG5vow3Pu8mXB4E8DYjuGGITGujG27K6KFZrqDT9mFyZlZ0D4rkY4uHpZLMPBepOrM8pssUMUlrXIMlO5kUz8N2D2tcs1rDo94YXv3Jz+HM+DRQLiG1LHR7AbphEGhzh6/KSLezN+ZkkQCXEfeVj7sajbOL0H06AyrgMnctyClNI6vHQnv7trlh4I6KvIqqV/20lDpVjm6FXEiVwrMcmXck1R/7gUqDDHKDnMNgjkJlEJluU9ljWgmSuIcwCCSN4umu6brIDDmMTfAWnJ2S55EV4EmryboNXlD2JP9XBu5gDT0YbYdLkZ1q5WGeQfEPHATQYScmQhJNdgKjpKGXBmrdI/hAuciCDKldhl6bwobjYrVcwm33fAUfe+Br6NlVuPNHsNajZ1lDmGH2LVnDrjY3sbi0AKvs4mlPfQre+653YoYTUWAk9MH5YX69rRnCqA6uXuHrJXDlz9wpc+tQzu9hbjxPgqk4xOT9F4RmcYjbDj17lKa5EOLwyaWCive+VEWn20O1XEEQRBgr1+E6Hi47dgWiIEFGI4QzJ/EHL3gWLosjVJsJ4s1N1GrsBfcQc7xwcxOliSmYto2VtXU0pifRbXFEszCBV8TfoFe+lB4iuMhLOVG+8aWmwioTuCcrEwLchcYUtIqyrun4PQK3p80cvVqAy5TF41tZWcNTSg7+3dUKuCZNrMDt44GcJBcC3G2Mc9F6yWcyxfaIp2U+3UI5Hul5WBZcz0MYbnlPsQWkiEaSP4AehTDQg8fUPWdyZXOOTH+QcTQF0HGWiwe4OT0/bTmlKoc+6w/xz85r3NzpQx6GUVvoGNkHetM8OS804vL7WA700/SBfm6fod7FnUIi0ggLkkEAF/3kYcCrYXblKEHppeeYiKMAlAWWGzVYrouF5VVo9XEk4+MIauP4/PGTeP+X7sGKbcGYmcYmFWC6CbtUxtraCibGx+TPhYWToGvWs599E/78r/4CRy46LJGJ0S/0e+KMWKvVkfpdTvFJpBl+G8XrFTvXwS5Fv7Qp+n1qYwGZWgVglXozLebnmdFkCR1FrD5xJTwIVXMy+EFnRV2GE1zTRbVURq1Uw/j4JDzLhb/exHSvg9f9yHNwuNtFqash3FxH2U3RXTuLWuagWq9ic2VFJIyVRh3LK+egezZs10EUkwTN02Eho1ie6LDk96b5eCWHUeiUoSOipFV8les4VZ0Ue1ZGXAKXEZdEWjcMfG38QJ4qe/T+TaCtruNJ39GMvvKKKyRV9iT0K+DyKTFST05qRlyyjWm+6Lh4eIcjLi+Q1HGMcvkpKFtoBBSGzEBGiY7A0MVSxRufFLayy9/K5nxeowhdzuVjTN8oiaRGNwqhs85JM8RhD1kYwySBIbtc1QlmCxupTlt5LbIcWJ3SnM+kXQg/9gtckk2DH98tcLdPz2xXYMnr2jYud74V0F6p8k5RWOWMOnoULJi21LJpGKBWrWKz2UaH3MJkA8nEJB7sdPDPX74X31hfR6tURVSto8XH0XVpl5/XZhFOnnhYxvSefO0T8KmPfwxjjTqyKIBmWWi1mpL9UOhhcZl2S03VZEaMmM4fO4hQuOKkuHf9VHlbOpxzKf1wtuVGwQF62tRk1BXn30OLIM3iwa/B74UIhVsh4MbgRyEabhmO5eCyS45B1zk6GWNOS/Hz11+NaVq5ap7M5NZKOsqRD3N1E8l6G5aWyUwviVBOc7VDHxpn1vvnulo+zrltKvqK+5rSwDOJpB1kUjcdpwh0bjKo40xuz7o4MSPA5SYDArcT9LpaY/6yzHXZv+J6ii3gvuJyRU4VAozdgMsoWYxxDQN3mySQLDxtTHMgs7gNekBWLsOamMQaUiwmKb515iwWuj424kQ8ZDkJM+Y4mCx7mK2UMFepYMxxUc4AJ0ikLqFrQRqG0DnmRicE38//O4RFEb5BybMuklue+PxI6IFM3+EB55HBdGZUJO23S4q9r48h4o4C0TDrPvw79xp+2Au4g/5awyQYTTFoB8OyoWKS9PHlEKVrvjU3ixXHwJdXlvHeL34RS6aBuDaGrFwDc68EFsplD1kc4MEHvy1+UXyOPv35T+OKy4+Bbg4cMCdZ2Fxbx+T4FLJmF5rpqPUgYSZrUjL4MmG10wEzuJ5lkB3eAqL63v7O5CJDyXkBDudLoMjtcYRS0BmBHZg63SA5hKD4kma3iYPzB1D2KpiZOYAk4+YAIG6t4lCyDrvbRtmuwTN1zE1W8LRLLsHj3Qom4wxRqyM7mZonF3H06AG0WxsiXGHZsHX2svXDHVN0TMndSvYALiNuAVymys12B62e39EmD10h5BQvOoHLVPlaz5aIO3bmTF/yOCpVltUQYoO5M3ALSV/x4iVC8evZTrAsBNUpbGgaTm408akvfQWPxh10zRISnjibTTi1slx0O83gJDG8OESZWllOdiQJJq0aLj5yABcfPoyJehkVXYcZRrDiCB5Xe9ART1ZzBDDYD8w0ATD5v5i6Z4d6moFe5sCwQZFSFWAShnpIy7wXcIaHBAZ/1k6p7iB4h3/ftoeXyp4RB8cgCGR/cE58DQNXPP49HUGcwDRK6JBvdD14Bw/jVBThg3ffi39dOI21ko3K0SM40+qi0mjA97mfSMPa8hKam8simHnTm96EV9zycvihD8ez0PI5P8whjwi1ah3Y7CpiySshaXZg1MrIWCcRVkOnZZ9Qy90x5D7kgyvb6tlBS5yCORYbWGG75DKKr7KQlTxYXLW5UAYUQpjU2YcWOqsb+LN3vRV/9Td/hUcffgTz8wdRLzfQ7iVomy48I0U9WIGHEBkLyl6AqL2Gyxo1XD81gR88diXGNQNu14e10YTWbmOchxpXrKahtNmK+yRTZIkOm1N28vry3vKIVPl0bUpY5bOTs9CrFYm4FIu0e36rX+MSuKxxmSo/2bVwy5VXCnAHWeVhcmoQuMXDNiyw6Kup8pSBwgnN1GV3S7Nawf1jE3jXZz6HRxeXhAKvzc6jGcbi2N+NM4R5PcK3yZTHyCJQ5WjmqXN7Y1XGusjclaHh0PgYLpufwSVTUzhYLcMNIjR0HSWmI9y10+vCYn83TZDQY0jSpq0edLGRcDj1L0g2Amk/7Zj+9++wLXC4DztMIBXfPxjhh0kqGSEcAO6uafGA1HFrYoiTPomAaCVMkDQmkEzN4ksnTuN9X7wHDwYdlOcOI63UsdbtyBqU2dl5LC8t4tTxR+GaJl78U/873vq3f6VerryWFL12U5j6LAqlziNgg04HDidcWm3Y1bKkkL2uD9cwOEPS/xhcKyqlAn+OiBjO300lKTT/Ka9nVc2ztTmS32c6HnQKNkSVp0qle++9F3//3vfirs/dhfvvexDNqCOGAjNHD8t6lpLhwMy4IdFAEw7KZQeVeB2Z30aqe3LwZ90u3KSLdOUUxpMM//fzfhBX1cZRb3bgrDcxRoa40xTLVZYCCf22CztcttiY5uVLww0q0lgC0qQ93k5OFdNBHDIogNsJepva9JGrMssx4Tk2SvzRqyt4km3jlqsulxrXoewrDZA4nBIyoCee1JgZ95pyZyod8cUsTZECWj6H2r8TrjKy5pZzysIi3UTougg9C2frdfzmh27DacvCzMxh8QfqRrF4x5bHJtDq+Kr1w1SWXrtMg6W+Lhrx/I4YHlOuMEBvswX0fHhxgqqmYVwHjo6P49j8HK6Yn0XDdeElsURqxDF0NtR7HRisj2naJYZlSvXCupkMmGqbSGK9BdhcwCHG2Lmrgxhxjxj74zyyCDzyGq6I0DKOMRTdR6XmcipvE7Zs1cGSBstYmExd9oUnBQ5kzlhIO9VX3xqoV4uq2N4LdQ0damNnZrFiu3jfXXfjS6fOoOmUgclp+CDTrClPp1oNX//a1xAHHcxPz+Izn70dRy49gizifeKl9+V90nAtJf9AfqLrA5YpO550z5HeZZduAoYhINGjhD7y6qMYOCHTmjtmsvaTfyLPnae7rE+3orJ6LgSkpg3LcdRazHySiRH21CMn8N/e/jb83d+9E2cYjJjpkbSMgfHyOOYPH5KNMJHOdbKaZGWJz9aThdQuySsp612xEEo4fhprcOhY2WvCc3w0Tx3HXGTipS96ES7THUz5XTjLZ1DXMwQZt/plSCwSeeptympN0UeyvZmJDZGM9cm2Ta71tKFVazheaeCW2z+HsxPTMLlmU9PRbLU5QbWm1eYvzsbGG+IuOOE5CE6dEXLqV665CmMELvu4WSjAlY+kpMgpQ8m3OL7FdNkNqoqltbgioye7anjJOxptlWqw1vh5B2F1EpvjDdwTd/CXd96BhZIFd/4Q4tAV20ymF5z6KXs16JaJXq8LQ9AUCVmAzBFfNdL7JKO7nU1p6Ic9/juVo9STJbA4uNLrwl9fQ8OxoYdd1AwDB+pVXHP5JTg8M4WDdQ91fw1O6CML1BoIcCA7TOAkpog5CQj1PLH1FSsdrKF6yzANtMMuDPaE2fcMNZiczaVsk8ZnxZ4bEZGIu1O+ojRXa3HLJZVpAzLNYsk1WW+2CgrAsyEmB+PAzl7RePOaJBlc6mHEzkZJ6VM795pkNmrpspeGM69JGsiqzrTtw+cESqUC4/BRnGx18a6P3YEHmx3YB+cRlSs41/GhO7akmFGvi9OnTiAKe/jd3/ld/OZv/UcZLg3Clho2YVorh54iDIoWTxLTLI3D9hwKoVey6uhRaCPz0bzWlQrCTgu6bSl3CoMOrJYw7kkYCeMrwYmCmSCU50RmcasV6BRwsHvQ6cAuc68SDTI7+NM//wv84z+8D/fe9xVZkkZGmz+jUq5gdnYWlQqXdxto8/C2DLR7XYnGbEe6ugOb60tjZY2TpCE2NhbQaNShGw5000WaGIiTAN3gHKbJ0az5sJY3cMuP/Tguho+51VMoh02ETDEdjjqqZWe2ZkNnayoL1YAGB2csE1mUSJYiq1rYAa6VcGJiAi+549NYGJuE61Tg2mTv1zlIsaSNH708qzJ1SRJM2BbiM0t4suviV59wpQDXCjg9QuByrI/tIJ5APP14IEXCymqJDac7BoOyLq8JGB2pXVJTh14dh9/yMWt4aLcTtBvTOFWt4I/+9fN41DIQTpTRy2xEgSkvvFzW4LfXcObMadmIXgivxLwr9wZ3bAvlek0WEo/Vx7jqRAIAACAASURBVEWhY8ryYUWn8+t4UZIoxnipgjTwRTJnc4St2+XSRBm0HjcTPP7ABK46OIujMwdQMQy4EWCzHu5GMIMAWbsFqrvk7NAiYQyJyyDoiluFaZZEraPzgvup8oDi6hFGFNcRuxoOOohQMwdoYU3KIW+L6jDe1LyUkGklaW9IKdT/6K+rHBiGYAQNKR5JIcC1qIchw87mvq1WTYZhhPpEA5vtpoAniALY5ZJ6LZNzODc9i8+fXMS/fP7LWAhDGFMzSMpVLLaaqE2Oy8Kwhx9+CBbtjepVLC4uSNui22zC5upO2rtwSzdj4hBwWc/Ruxg5aChLlB56bnbOe6SbNE7IycI8M+FWvY2NDXiehzQncdhjdSw1hGDRH1khWXYJkwj68G0fxd++4+/w8Y/fLoILklKGbsG0LRkVnJiYFCcRHgytVkv+5EHAwX3BixxoBkwud2+10Flvobu5AaaxAYMXE0e+SxNgiX/Z5VejQ1eTkg6PY4rNDOZyE9cfmsW/veFxOHD2frgbS0itkljNMuoyHXZTT1qQWuqref/MlG2OjEZ8/o2IB6wGrVbG8clxvOR2BVwGMhJq7bUWV6Oe0aYvujIjo0zgjtFK4+w5BdwnPg7VU6dhBz7MfJBepoOiHLiiI2bqQB2mDSeoSUqZ2C1kZkdO4VQzEZquckzoxsgqNSSHLsMHHngQb/v6V+EcuxQt08LyZhPj1UlkiY/FhW9ICjM5Dvzsz/wEJifG4Pc2sdlcwsmTp/HAA2ewfDYgaYy2r1btGJaLyekpsXWp1seYr8sDKw4N1MgaNtxUR5ltiDiSlYZhx5e9PCGZQkODkyaY9zw88dLDeNzBGUzrGsq8mVEAi/Vxr4eA86FJAJNrKm0blm4j6qoUB5wN1TN49PLV1YKtkGpUyxLwUl6nRbrY0diiT+UuoAiRS002o3meRhVLslR4VZ/MSTFJjVlQyN4d1WYL8gJRSey4Rkc5V8iOG5MSRrWZj+0x1+UhqaNnWeiUHXRqDdz58CmZ5OkYJtJ6HaFTwQZN0lmPhj5OPPyAKNP+6A234pZXvkxCaY+GaY6LTrelBP9sv4k/sPog31IY1fL6E2x8SHlYSCqYu4RYho4waoHTOkxzqcNlhON/+0GKOu+lbovXMqWJ4rkMHZ31Jv7xve/Du9/z9/jEnbfDsdU8L382783Bw4cF9DzYk1x84fudviCneD2WZsLvJvDbLaxtLtC5Si1CS6QThsPzJp7/Qz+Am2/+QUzPTUE3bXz7wVO49Y1/ii9+cQkHj07Aqk6AIsJq4sHe6MJZXcF/fPGLcHV3Ac7KWXBEXjfo7cwRwAwOFHDJprOMCZmfcWMhyTIedBmlkxn0ag0npsfxC5+4A6frE6hXx8QMttf0mSqf0CYOXpZxiJ4PA4GbLa3gmu8oNBRwT8GNwn0B1+5VlRO920JqKlWV+AzpJsqVOlpnVmHOzWF9Zh6//08fwoM8rWdmsEmht2mjbBt4+MGvwjOBd77tdXjuD96oLAUozArakNzXKgGxA3QTLC2ewoMPnsTfvOOD+Pjt9wqI8yXtCEJgYroBr1SD51VhcU40gSwwZurFRrtMGdO3ySmBvcKguY6s20JFi1FOAoybKQ7UXDz9cVdjwjUx6XI5tQmQUWz5yHqxzHraHDCRAelAVD6mlSJOeojifKeNTDdROUNzcl1E6U5qiTkgddehx7WcNOreYmhEKjcghu8PPgwAV55+k+k0WVlld8J5WiNlvZTj3QwRc7l24Ivs03TH0EpNRBPj2KhV8I6PfRJfW90UwGqVOjqahpBaX9vG0sYaVhYXURmr4PSjD6Fe92QpNs3VXM+RMiEKqTxTqfF2L3+Rt6gqVSZxlBiCKTJ144y6VLWFUReurSOKQgRBCK9cVqtYdAeWwxldHlQGms027rzzM3j7296Bj370Y/KzbN1CNwpRKtWk9p6cnJSUnpNudNGg1JWEKyePKI1kdsN+KUuv5sYaOm3qEhQvwEesNgY85YbLcfNzb8L11z8Ol118CG7FVi6OYVskmxlr6PIUkqSEX/u1W/EXf30nDl5+AEhLqOk1eL0Y8cJJ/F83PAE/Mm2jdG4JMQdgNNrdcwmcDpsgJXDTABrbkRnFQ7p6nsT7i75cGVCv4tTUOH7xY3dIxB2rNWQdst/podVqP6BNzl2SlGplnSlFld44yyu4MsvwmmufgLFTp+FGfEADsa4ZjLhiDGbEKuKmNuwu2zY6wlIbiRWKnSuTwIz7XQgT20KzXMZnNzt45z33oT0zg45TQpjp4hv0yDe/ytUvuOdf3425ozUEi6ewubKAOOrA0DO4JVeGpdPYQ63eEEtTuexeA8mGj6XlNdx93zfx6S/cjX/+wJ1Y2ZADShhNkgGlakO+z3XVIcUMI+zGskrCtT1YtgHD1pFwqVJ7QwiXiq3BoZl5GONotYYnHb0Y18zNY9JyYUWJpNRxc00GLhhh6QbBB9HkwmOmQpKNMGPJa9XERpbaMj6WJbbUvIlNdwnOIitnBNlMnyu5mMEQ3P02jqnqVuVPlbcRODTOlSIUmrAvmSrXQxGuQ2VEjESWWxPQBvUpNMcaeNM/vB8rXKVBEpC1puuBu4U4K3ty8Qw67RZe89pfxet/77fBNawUnMa9trhVZMwmkhiGxo0AJIKUpG/QNE5QIYWuutbSj6VbSarL9/LvZANc05KDm+N1kvqK8knDQ99+AP/5Lf8Fb/3rv1FlQ+4Vxvc9Pz+PqclJEVdEoYYwVIPzjKq0raEIh7/ftTSsrS6h2VoH5wNIS/DH8NpceomHG659Am5+zg146nVXY+biAwAn3notgLxNGKHb3ECzuQpDzBr4PJvohhYuuuRJdLLDJVc9By3dwfzBK5G0gToP6PUVPNEGXn7dpWisnuONgc1ZXaKOyim+Pw7zcIkb76dmifiEO5TIz5AkpZld2iBwJ/DLH7sTZwjc+rgAt9v20W21v6LNHjzW88quw5TO42jeuVUc+46tx28+9SkYP3sWpu/DSvlwBGpKJ/SkqC+AS/d1K7Vh9irighG6baSOCvtkn6NYWZno9QpaExP4w89/Ad+kTnhmHmtJgpJbwerSCbTWlvCpj7wFT3niDBYeugthax1HZqYQBi0hFhQbxyFpStccZFmEDhnksXGUuPyqPqEiMhdsZRZ66z18/JOfwX9/3wdwz33fxMKi+HQJ+8lnbHJyTEzB7KyEsJeIakaGmx0yk5YyI/N92Jzx9H04nRAeQZwEmEEVTzx2KZ547GJMWjEqbINwyLu5CS3sqR5zHMDmbwy71BnkbQ3Wc7YAjOAVU3BxklPbBPjw20KGEXg0oEvkZrHQZ9unAK3Yocj4YgKTZmjQELi2aFmZ5ZARNzmcwQSNTyy3AdgltEt1dBrTuPUd78ECdHiHDqMdp9CpyjE02QJ38uwZGYX78Idvw3Oe/Qw4XNDOjfdRTwzbmEtycN3wSjJoLlue8w+JbIXcQLyW1IQOa1YCzid3wLKlXIJpyA4UAIrY6/UC/NVfvhVvfvObcXppSUikdqcN23akRp2ankCNe4S6bbGzIX8hG/vg9H2qFMEeyyRSc2MTLKnZKvYs4IrL6/ix/+0FuPn5z8GRw/NwOWLoaUBwDkAPyepZbG6uyVlD1lkPdTm8cj8LjE+MYb3TgW5W2MfA1OwxvPuf7sDPveoteNyTr8PGWgdjPNA3NzDXOofXveDpmFg9C71rwGH5QxscWQBmy3RaZFJZlXdIOC4UhEJ4Mgj6JELHqzg9MYGXfvhTWGlMo1JvyLnYbXYQ+uHt2uHDV25anl0jM+dyfnFlA8e+k+j/ztOux9jZJditDiye3GYg8jYtdlR6JEbaKuKasQUzKIl/VK/kC2mlxpm4n8VD4phoGwbaBw7g33/wQzhZqsKeOYiVbg81z8WjD9yLqy71cPdn/gnt1a9D85cRtjZQk5pUDUlzvw5PpyzOG+q02dFDeYAty0aHKVC7K7rZUq2OytQcUJ8EjLKodEJfx+fuug/ves/78JGP3o2NTRWwgwSoVF3Mzc1JSt/rhehF+SB2EKNeqcoKRFmwxSASJTIDGvVC2FEPc1aG649djCdfdgkOV8sYQwy720HWaiLpkK3u9eeJBZzUHFGAQqUXBeUEMR9A2aSuNuep1gB1xLndJ4X2uS6ZjGNBWhGYdo9xGwg8S3SvTJnFzI3XjVJSZgVjY1gfq2CpUsNbPvJJPNJJMXX0GNbDBGtxB4mlYXZ+DvfefbccIg89/DAuPjQvAO1urKJW8URtlAWq3cOnmzUlo6SZJ8myz1ecJrY8hrnlQVp4uil1rmG7MonDB3dzoyUp8J/88Z/jH//hn7G4uKT2+VgOLNNBvV6XOpXRiFGU0ZTeaKyVhUwNe3Kgb6ytw+91JNshoNlxYBfgmqvL+KEfeAZe9aqXol6zoXtkoDpAbwOd5jqarRUkbAXygM1tylyXcl4TfiuGbbjwnLLiv8AW5YZY98Smg2Y3wsEjVwHOQbizL8LskYuhW1VxxrC6TUyvnsGf/pvnYXJ5GeZGLJv4WI5JFcCskVs1jQBSshctxCCBzR1JqY2OFiMaq+DM1CRe9oFPYH1iTtwr+Uy0VjezNE7eqV105OolyzGn+eqZiWcbLZmC+M2nXaeUU50eHPZx6a8j291cydX4Jqj6oKyL42FmyBSQJ3+A1AzBDeIErssTkUzvdA2nx8fw65+4Hae9GmKvKqN6nqnh9MP34c1v+EW85Oduxpmv3YG6ncgqQ+kBMrWQ3JCydUsICiqeMvRgyq7SFEHYlZYBhxVIAlG00WYrw/UQpgZKtWnUZ47SyJYW8RKRT588gzs/fxf+7C//Bg880uYeLZ5dEpGr1RomJqZhmB6CHk9KDvbTaoG6XlNOZNZSWs+H2dpAKQ5h+R3MmR5uuPwSXHvpJZh2PeY1MCgaoZsDNbshIzhdGSIYtFvh5zS3Xyf2IxfvQ97bJIHBXh/7xMqKL++Xy15ZwPTpVJiIfDOiNtYms63DEpM9bnTVoR2cxwO2if/8Lx/Hcc2EPn4AOkoI0hTraRvjM5P4xr13wSiXsHZuCa5twW+to8zxMpIDjPy9AJrH/izHMLlHVkWmQpIo7pviNJRL+Zh+UyhFiWQYwLYcsT/92Mc+gbe85S/wmc9+XphfHsaaZkuNOj89A9t20W62hFjyOy35+WX+3iwUuarfa6HT2sTKypoEfEZZHnqHD+t40QtfgB994c148pOuhsm9Oa6GZOU04riDzsY5+N1VGNwaYPFea7DEikm5ZtASh4eSpP6xDTOjk4bS6WsW6/E2rO9sNKDcs9ntYfbSawDnKKYOvgg+ajhyydXwKcoI2qgtnsRf/9SLMLO0DHM9hC0GBNQ9aNAtFXFDM4RO91KWSER0lMBiZpJYaGspgvESzkxM4NUfuB2bU/Nq2yA0rC+ttvRE/z3t4NylD5Sq5csIXIoZWNNNr67i95/7A6ifPA2HD2dCsknNMlpaWZCfMG6Lkz9vrAE7UaRD6NCLR9l8upkFI0wR8O/zMzg5Xscrbvsozo5NwiqPw3JsrK2cRnv9NO7/2rsxN53h1FfuwKGJGpKmD4MpMX18NT68rsyQELIZL6bOG5k70ssjnI/8SYXHdJRWIiYiukEKmAE6iZq2C6dSlm0AVGfJEa7Z+PLdX8W73/NBvP+Dd2F1U4KsPJylckMmRcr82kSlaDpXWvL0p5gDGsocVmC6vdYSuaUeRphzXDztqmO45vA8ZmwDk2S/SXCwjRITuJQTdWFT4GKpdJO1X8zNtTb9u3iDE8TSitCRBAlcy5Xyy+WoYlexs3GYwKuXkGQBQt4nsnv8+khHh1G7Ponu7Cz+w7vfjUfp+XToKFqhBi9zxFFiM2zizMKjGJ+ZwtmF08jinkRah2ErChH6Xbj1OhEjEVXj6WYwAvZg25ZEVDLLJISYcZEgMkzF5jseR+VCfOr2O/HqV/8K7v/2I8IYs4frOC7q4xOo1OpyAIjLYxBKdKLpm67xgSax1kGnvYqzi2vka9BsKbAeOWrix3/8+fjxH7sRl146K/pikj6EWuZ30F7//7h78zA57vJc9K3u6q6u3nt6Vs1ondFqW5a8SpYNXsC7jQ2xAbOvIYEESODkgUMSQoCwGjDEBJMQg8E28Y73BbxhwNjGWJZsWYtHGs3S0z29r9VVXX39fr/qkcQhXJKb88/t5+GRGY1muqvq+33bu+RRKZWgdzvy8wwf140yJhQMtayqZNah8AY9h8Xe4cl9NHWiOp0WdCn86oJp5wyg6fiQ6FsGY3Az+pdcAEuLY2z10cjni4igjSXlHK668EyMLixAX2gixFLYR9FaJajHFsmmNzFLuBblXtVb5z7X6fjQjobQ6jOx22/ik3c/Bnt0BSwNsnueemHvnlg08R5txdj6J30B7aRANAyrVYNWb2BVq4nPn3UG0uxxq1UBYXQ5xeEJ3zUFveRK0LKuU4Eb6ASYFOEEVPnaC1zdZpgB3cF+HEjG8eEHfoa5VBp+IyY3uVCYQa0whQO7f4xEpILMzicxEAnBJ76xHg3Px5WD1AOyepC9ob/FVl50fYmqUcRr1jU9lUIRv1JmUByQUCmehlEdFj4MD1Xa+QwTkUQaoWgaiA0AHQOTk/P4j1sfwJ13P4Tnds7JyU64sxHyY3RkTNQZmAn4wHIn2OH7JBpGCyLM5XyrhVa+hITmoj/QRbTewFHLhnDK2tVYHo8h0GpBI3WR8D+rqZBbXEkR9UNlBHJFO+qgDJkRaTucliUyMJ2WI6sY1suCJJKcaMO2G/Ig+Ay/3OSmFgKSaeQjSXzttruxi7Of5SuRocNdu4OBSAKlQg65UgYTq5fhuWeeFmons1wkbKJZLcNkkxgIwqFvUSQKm76sekAI4yxTRY6Gh4hGjIEOvwAllPj4vfc8iKuuugo//dmjShjd7mDVyjVIJFIqS3MI02mj7TKDq+qBPT0PjVq1iFpxAZ02S2+IBSxFHi88byted/EF2HbqyZJk9LALt3YAvoCFRrEou1/NVqgrg5xWjdIwitAu4vIyTvC0u6Ui4OKYScgbrDEReD26CLlJ4DoIhFy0nKYI8zPMWraOOAN3ZBOWrTgXpXYMS1Yfi3KJ6hg2+nMz+MZFZ2JFpQw9U5NVpCAN5XGUhlQCV/c50JmF+SFpIG+EYFkOGpEAmgNx7PYZ+Mx9T6DRvwRuKCjXvDybf2hsJP1ubWJs7Q/aWvdtfSNDaDSqcEoVLK1V8ZlXnYLRcgk6KUtSpqj1BntcXvRuwBO+8houv2dQzMAVFI0TRJCnJxn99GRNxrE/nsLHHn4cc0kOkkIypJif3496cRbz0zfBdGeQn9yFmJ8NvSlpT0JMbEiCcCXTtQG+F40PMicnSRlQ8IQWpUg5dZmRuVtUQnFcSQhOlZmbt8NVkDkCJtmnNdkvcfWg6+jrXwIjRQtMDrkMNApNvPjiFL5//S24467HUChI1S5luRlLYXB0GVoWied+yRpU7zAI9RNYWwduowndthClimG7gVFdx5b1K3H8qlVIah3xvdUaltASqePL0jrAvo5rCp8fLWYNDkv4NTmRFYKI4gP0Z44k+pCbncfQaD/qtYKAQSr8bH1pVNL9+M7PHsczhQrs4WFUiEZiqUzh8WZNVmrnvPbVuP22myQrsfx3rRYChEAKZFD1qOqR98FvhAQU07TUqsWIxKSkF0hn14dnfvMb/O3f/j0eeugh0vBhOzaGh5ZgcHAQZpDcaiKQKlKacnbgdNuSzUrlHMqlvBhzcbrK1n64H1gzPoI3vO4CvPq0EzCxZilg0naghK5Vw0JuDp12HV2bCicq3njwGSLx5AF36PrOoYFHUJA1mcKfeomV7DCfMHhEwJsKMF6P0hN74zSYFVHLUSqnjmai2TEQTy5HaPhYrJ44A/MNE8OrNwoBIEJX+5lJXH3h6VhLCdlMWRB4Lktl2a+H1EyPlZXuyMaTEzSf4xMHh2a7i7rpQ2u0D8+1u/jSfb8Clo6jTcik62LvCzuu3bz2+L/UVi/b8BfFeuWL8YG0SWUCU/NhrF7BJ086HuONBtxsASHiTHUOnDqA5UnVGArY23MfEMlW9tbiNsAdDAEKfuhuWxgajhnHZCyO//X4rzDf1w/HH4QZNTE3cwCN6hzyczcj0J5CYf9uxFhKBeKS5lw/vWOI6QyowKXqRbcNTWsCXRMdJymQS5HqkmysnBc09t6eQiG9kXr4VpbPsjfz1g5dj9PHAVez2RAIJ9kvwWgMwVAcsaFlQCgJBBLy+/ZP5XDTbffg5lvvwEt7c2g5MhBEf38Cw6SCuT5YHRdu1y8Efq6wuOIJUfS6WoFWLsC02+in7Yvr4IItJwkxYiCShL/dhlupICCDL4I+2gj7FeOVN1dEyVkl6ErSlomrbdkiOEAQQ5sDI58fVfZRY2O4d/ce/Pj5nWj2D4pPT0fjdQ2K4HgmP4d3vOMtuOZb30CQWbpGcTZB7MO2VSbVA4ryZjfaAm5hmcvhCodFnL4zHTaaNj7zmc/iqm98S8EVme2MEJYuXYb+/kGUC0UpybvSZnRghoMCgmF2ZN+YL5WY1KWMHRvVcclFF+DNl70OaydWcOSmKjqtjXr2IBbmp+D3dRAxSeMkbZDQyLAEOyfhAZEw6krWDnIK33GhH6aIoQZrhwmj84inSqVkJGWXKcmXZbIH7FaTYA0t2nfyOdbCaDkGYikG7jFYM3E6cg0TA+PHoNFsI+TaiE/vxVXnn4l17YYELiOmy+eYCU031U6b0AxKMon3E7cKjJ8grI6GetRAbTiJR+bmcePz08gG4wilE4SAdid3vnjlK83Dx7RV/atOqDitfxtdt3pjrV5GqNNFMjuHjx59FDaxh5nLI8ST0efxK3veQYcFrsZaw+cqBT4hE/CANuT/+9wGusTGBmN4OZzAJx5/Epn+AVFrNyJhZGdnYDWmkZ2+BcHOAWR2vYBUMALDZ8CxWzIYEDlPjs7Ei6gtZRKVIcWDhyp7BH73TJY8lUdBF4kfC8tJZfMgTi4MfvGScVSJryXQIVyQwG5+BvrVcjTZ6aDa4vKPzmyaMJeMRD9inFbHE7BqLem7brn+Xtz+kwew44WStAS6oSGaHEQ4lpQMz2ws6gtdV7JamBm+WoFVriFCB4lmA4N+PyZGluC4VRNYlUojyh64XEOg2YDesARuSDYU0c5a0CdrBLFh6biw620kkkkhZlQJu6R1x9hS/GTHTty140UU+vvQjvehXG1icHAYU3v2oNGs4I3vuBzf/s63BJtbX8hJBhX/LkIUuwwyXisim+jvayM9PIJWw1JkeL8fd952C972rneiQjCKZDE/JibG0d/XL1m6Ua0p28uAhpDBQHCwkJuVwRJ3qdzwsTDZti2ON73x9bjg/HMR7U8CtLbp2HBKBRQX5tCsFBGkrhNXvBr7e10OFp4xZtCA3SJmXbUNCmxB02lbBEOlZ+Z/eA4CqmRU2Za7fW5EZOIl2orq2dDEwoZrGQJZWKFZMoxr2TVRuHC0IJq2D7HkUoRGNmLtqrOx0I5icGITqrUmzI6N1NwBXHXB6RivlqEtVCVwnaAlcnGEN3KXTbyycvHjPpwgFb/MVLi7aadMLKTD+NFTv8VD0y1EJ45GtlXlftfOvPzyF1tu7W+1NWuO79+7e+c31h1/3BUM3KDdQaqQxftWrMDZS5egNZWBSbV7X1syrq9DyCPjxIPeydpCGbJymMC+gBelGwihy6kZWlKe+swUpswEPv7wk5jv74dtBuEPmViYzcBpHsTcwRthIoPMCzuQDsUQgIGO04Trb0hZ4Xr6zapXoQqhqnYIL1Q2JoeGU1xie3lKlcieqRKPaCWIrt6vII0Q9WT3XHS4q+zpOPspTu3Cb0ZRrZUBPwEKARRrNUHQDI0tQbh/FLC4zwyimC/jP269F//67zdg1762jPppOi1SnwMjbGFQKlbg10OIRKIKAknRsXIRKd64Wh1avYb16UGcvmkjNgwOINRswl+rwnQtQWh1WjVpCTryYFIOxUbEb6DZdtANmagFQ9BGx/CrmRl8/+e/xDxd/waG0PRxEm6ikl9APb+AP/vge/CFK78gmONWoYpQOAJSdGx643DV03VhmGEUSzUBrrDPbjZtcQn4u7//FL7+ta8hSDytriPVN4jB4WEpU6nQWKvUYNLLlgcjd8xuC4X5aZkRsCJNxoHzzj0Wb3vrm7H1tBMVrp3ohUZd6ID1WhHNellK3EQ4jFCAA0oSCzx9ME6yeeZ2lKoJD2EeukRfSbXFHpvlLSGcrkom8rz2OLreAa8g0EoNUlTJF19e0LqeuR2D2d9Gmz1ukGU1EVtANDkCc2gzJlaeh6IdwcjqzShW6gi7NtJzB3HVhadjRbkIf6mBIK1WdVsqJhFQFwUXhZQiDkKJAfJAIqUvCLs/gbmUjq/deR8OBMfgDi1DuWujUq02C/OZv202C1+V4yca6vvHkTXjn6pbNUThQ385j3N9flx+9Ab48xUYFH72e4ErJAMGjPqwAc8JnIMqBi6Dm8WHG4zCJSpIApeeLP04aCbxkQceF2B7O2bKOqg0k4FVm0Z29gaEtXlkvYwb4HBFaIN1KTE6XUq6BaXX83NKx6WlWPE14IpzoApcSrbyRFOT6EN8Tn6NLI9DEp2qV2QZzT8Vfawr2UJKRo8LStgdDwbCJmWWLD0dL7KNEmVzwlGk+oYQHlgC6HSKC6M0vYBrvncj/vmaO1BqKlC6EQlgaHiZ6PZaDpEyio7GAZ3VbIhTIjNwp1CEU1vAmB7EhpFBnHXcRqQ0oJ+SPJU6AqxCapZQGQPEXhE4YgSQZ4s2thK/qdZxzYM/RaV/ADUzjAZ0GKEwyqUSsvMz+PpXv4i/+OiHAKeJJoUKgmTJ+GC164JOY7vE9Ma5hBHi3wWxb98BvPnNb8Vvf/uc6FJFzBDWrR5HjcMq4oS50qD4nPSadIVvVoV6CAAAIABJREFUYnbqgAQFp+C0+jn7zPX46w+/H5uPXyvAB7eUl/fQWMhC63REo5j9tREOwAwSYUKIoiWc3RiJAKwEZEjIWQvliQJSydDNT8gIVOsUWW4drqMc+noIOd4/1acrvyr242LbKYwdRxLB4kvKZFYdHnRU7B06aHWq0Mip1QJiZBZLjCA0tBGrxy9A3glheHyTBG7MddHHwL3gdKyolRYDtxW0JaP7NBOarUFvq20BA5frPgJTbNrqBIOw+mKYifvxjzfei6lgCsbyNSiyCuq6lcy+/R+y7dJ1Xpce+PD4umO+HopG0G03oc9M4dhKEf/rgvNgzudhthrQCNHiB/cb0FwNfoIU+KH9ChXD4OE+6vCMK4Gr2aI4H44O4GA4hQ/f9yhyQ8PoxCIy9S1lC6iX9kuPG+ocRH7vPkQ0HSE28cT76pZM4ajFyIvJHOnvkk3BAqQNBDxamTgDytxQMr5Cdyl2HU9dXhh5/4KbVYeOMm1S/TB3duyRHJLtdb96EBjQmu6JbJNsz5/TMxLzCd+06rTQshXVrOv6keJJPLgUCDCIo9i39yC+cOW38R+3PyUBzARghE0M9I/AjCZRtTVYbVuQThTaDpFXSr2iRh0BqwbTtnDUkkGcsmENVsbjGAwQVleBwfUMvXRDGgrEX49M4OAra7q/vfkmVBNxVMNJWJLZ1YBp5sAk3veed+Ka716tgAfsD0Q4j4LgDoIBn1h7GOEwEDRQq9Zx7wMP4q3veA/aLaJ6TPnsx286BtVyGZ2WJRmOAt/hsLLAzGWmUSk3JCMSznzuazfiYx/+M2zaOAEfWys0UZ/fj1a9gGoljxBleTs+RA2yfkhxa8szReVGtjlkYvWI8h1L3Q/iwQIhYtYVYYH3jsgsq0HQvk/4uDZnIy7XbGoT0QtaQm+58ZB5B3HlYqrWM9xSoatoiWQ69axbxdkdFqf2nOxqGqoWySyjMIeOwbp1FyLXimJ4/ChUaw2E3Q7iM/vxrQvpfFBFJ1cRwE07oBIaKaCin8bDzqOGsiUM0BXR50NLN1Ampe8VnPSnr78HWLkO5VAcTc4w2q3pRq7w9lJp5mEJ3GDQvHxkaNV1ZjgSJMDZtEqS7v/m3LOwrtJAKLOALgMzGkKWk7OAiXRT8ZvsGE2cWXZ6TnuuIgzTQ0UQbaSZaS5CqTRmYn2gUa+sg8Jh0d2dn59HuTCF2txtKnB370JcN8Tciw8G7RuDBoHottCyaEfhJ8PCjcuFdrQSun4Oq7iHViVHb7DAM5XlnUiRerW1CDt6bkUsotVpqzZ5EszKVkZAJYe/FOjfE1/3cMJ8KNRJybJNZWbuVUUKxojCTPRB7xsBwgl0LR033XIXvvi1q7FnUrXR5D70jU0gaCTBtVmAVUFDwUU7roNYxEC1siCWpj5CQKMmLt16MpaHQxgiMKNRhuVWYfQNI2fH8Z1bHsA+NNAdHkJRj6Ds2IjGfZjcuwvhUBDlhQJ0OkU0OIhivdkWcYN6k8bOg1KxuJaLK7/5LXzmHz+PWr0lW/PlE+MCOyws5JVsquvC0PyMbxRLUyhXylxJC4DlVacM4MN//j689pzT1XCpkUenVkC1nBcUGbsa6mczCDlo8rtkqh7KeD2qhdwNr5pT96E3CVbDI1X1cV7B4SXnL0r5gge75FK5X0rxgqho+XGeJLDaKKgZgfTOYp2hHAeZ6UlVZN/JDK7RsJYUUdjokDSjaWh1gghHB2EuORGrVp+DYiuC0ZVrBDLqa7eQmp/CVedtxRpip3MthAhvDXisH1akbEuEIKLWYAZ0GQDTLLvERDg+jptf2oebd+xCc2QVan4T4ViYE+W7NqwZ+9Nnn312Vq7G0qGlR9cq9s3LVk6s7Zo6WuV5BGcn8eGzTsO2potULq80ZFmrR8IwdQOhbBNhgq6DDmy/kjiVy0uLRpapRDVpQIDAdmJq++I4GOvDR+5/FPOpflGkJ2B9OjuDKne5c7fDcGZQ2v0C4rpC04hgNHjad4WVYphB6Xc0LQy3E5F1SMDgzbMkY4oXLnvHRYUMDqhUycwsq5QgPFC/tyLi+ugIvdveScvBFye4cjrzJOY6iZlAKPWH6QCz3FZQPKLJCJqwOCmUvaaJUoNE7SjSo+NAchjUI13IVXD1N6/Bt/7tIRQawvbCypERxKNphAMRNGqkBGrCZzYiJuq1BYRJRCiV4FvIYKkviItO2YI1Y4NwAw10/BH8+qUS7v/1dlhpA81IGC1fFL5wCLt2Py0449nZ/RgZGEKrUhfeadOqwjB0+MyIBEiz1sJXv/INfPlLX5OhXF9qGH39aaSHBpHJzIrONYEPJIRojo1sZh5Vvh+ZBgMf+NO34E/f/TaEUkGgugBYZVQWDoKcN43lPQds3DIQKSXrGUUE4KCxR06QwJF2h8GpDn6lR3zkIdo7UAX8w3ZhMaZZ5h4W5DLDUMLjvWDlf4sTpC8g5JUOWw0xoiIghUL51FFThl5y1rNsZuCS1O/jFJqKIDrCkWEJ3PH1F6HYjGJ0+QrZa3M9lcodxDfO24p1jQZ883UYbggdkuW5muRhqbtoUdKGh4cc2Bqi0FAi+2p4CPmBIVz989/gqXIdgRVrMMNBZjjU2rvzua8DzU8sfsLLLrvMf/tN935/06YT3pKrVzDcF0Vl929xYjCEvz55KxKzGfgbZVW69sXEFcCXbyAcMJT/p8Ae1eUk1JF9RIeGvZRHJeCfk7NUFNPxfgncbN8A9JApoPW5XBbV/AEJ3IBzEJW9OxAnWwRESjFohOYCh3DBAE9Q9ji8kWFRD5Df2QtUPkVcWbE/8hzIdS/zSznP/CFTZ5oKqwA/ZO/Zexx6HFgV8L0bL0MPBq70Sb3AZXne8+NV6hOKxcZxmFrw084iT2B4h6ivIELRAQytmJBzttvVcecDj+BzX/wKdr3QlBkJJ60DQyMIJwdQrLdQ54AlwFGdhhD1iDtAay6LgNXAsngSr962CbliCU/vyqDAkyxtoEbKnRbHLPmgTgk/+uF38YbXXSQ8Wk0m8DwQqO6vnOo+/enP4F+u/ragnyKRGNavXy8lHWGFLC0FxcTVX7uOXO4grDqQigFnvXo1PvmJv8GqlaMIJsJw8hkUF6bRbhbhd5vw+20Ywh22VQ9MjLbIzqhWRtZynuLm4tWXffuR132RuCBP7GH9qORUPiuHKqGez+xitcShhOcdxSmyCmC1fOYgjitLFbjERfNe8ue3hRvOJTUTiJD/+e9IkdS6aLiAGRtBdOQEjK+7BKV6FEu8wGUplcxN4xsXbMXaVgOYb0gMULqGFSQrDCrHtKmAQ7XJLmHBfritNpqBAOyRIex+RfPqs3c8gPbIMpR1E64RRqVSLEzPTX0cdvV7R9QfEcSvWL5q4pqmjkhI70Av57H8FWDC/371mRjILsAs5hEOdFH12TJ1lB0tuYUtr0T2yh0JXK9U5kWmBF2TAyAvcD/6wGMSuFzmU6okl8uhkj+AyuytCLjTqO7dgRhrLgZuV5ffpcyLlRxOxyXYvAt/ICZLfvaWzKrsjVQQ9yzBlUUj1RUkQBc9jEQy/RDCavGJOfKB6MkgHc6LPaJ2luqCD6JaH6hdMXsuTjJV8DOTtkUNIwAjloLjaqjWbdhcQwUjSA0OQgsY0AaGUdo/g298/V9w7XWPolwHml1geFkawdQg2kSH0bun3oLp+NFnRNAlAblRRbtWAMHxlhZGZCCFfLuEBkU6fCnMZOZw3vnbcPPNP4TdrErPZ/OEN2OwWl284bLLcPfd90I3TVmzrJ0Yl2ENh07cgSaTcTidNgq5OWTnc3I4LxkGPvLBN+H977wCeh8JHBZqM9NSCnN/Tt/kUKAL0+AO3xZ5F/Z0vWqnZ9ZEzDnbDMdztFfXVt2rxZe3umPgSkAuBu1hBbV3/ZmpDw2Z2LqpnyIbD/4c2eGqZKK+LjqfUi1JKwV6AAl/UL5fF1QgR+wst8ibteGILpWNpuMiFB1EbHQLVk5cjHIzgbHlK2C1bKlG4gvT+Nq5W7DGaqC70BSsssPZBOGXHJxR8omzNk7E2U/LPt6BnYijMboUt+7aheuf24XY+AaU26TEBjE59fLz6YH42/fv3/PbIwI3HAgfn0wMfH9s7Zqj8gtZJMlB3LcX7914HF7Vl0IsM4+YZqHWLoPGRZpJsoGfyEPlBMCVi2cixd2YS8C7vwPaYKqMG8FMKo2P3veElMoU06YWUS6XRy2/H5WZW6B3D6Cy9znEg1QJ4FQ5IA87h0VS0voJdbTR5nqKJxGHZN4NYmZUH+iwfkmGAAxBpXkkJmFe38RTX26gZ6HCbNpbwqu73rO24H+zVFKDL0WKV/9W+uqe4Bt7IyplcHxC3Sme0iypCYYQt3UXFjm84bhQuyjFYrlUH7YRDEeRHhgFBpZyfoP77n4Yn/jsV7Bzt5KvSQ3E0T+0HB1S6NqcrQdg1W2EOVyxmwibJiocINGr1lC86exMXYEc2gvSa3bdpjwA9Vob73nfB3HTzfdKZRRORLFkdETpFbQackDGwlzBtDA9vQeNelf6wJOOj+Kz//BJbD31JKHBoVpAZv8e4eZyz2qEdPhJhaRIOCswjbpQlqd+cch2lVWICmJWRxT98ygyXuAq2R4vUHv3crGXUa3K4S/NE+SXHnfx3h8W2FICaXAYwAwSEgvI/WV2lcFpVR0WXRMaTdq9fT+HY54+k7r/sBYDt07p39gQ4qMnYcWqS1FpxrB8xRrZW2vtDuK5aXz1gi1Y3arDyVMsXRc5IT6LIYcMq67MgMT0i4QDivfrUTSSccwPDuJzt96B2XACWnKIjGVeQ3vn3hf+dfma4z6+ffsD1IU61PGffvrpocceeeLLK9Zt+BCX7CE255kMNrS7eN+2kzBWKSGwkIGfg6BAB03uoFwNpmbAT7hWj9jNqCZrSER1WVrqsEjxS0cxlUxJ4GaSafhMU6B8C9k8KhK4NyOASZT37UCCUBpwP6qjqzPzqt2cpjnwG100bbKVQmjR1yWoNJIXYW1eJpTsS96NrHrUDr4n49kbZDDwyDhSUUjFDjE59ExeDnnSSIBzhcDxV5dcWo847j1BkmXld6g94iHxZU4C2/Lw8rMqV3ddgpaDEh5c3YCLYqkE45Udd91yMbRkHIFl69CttLHnQA6f+vSX8egvXkQ+T06EgcHB5QLxZMlrhogaUm0BEbosBRt2UVZMzTJRzH5c9+//jNNedQKee/Y3+Mu/+gh+/exv0bI0hJIjOOroTbIGKuSzCGpAJESBcBvzM/vExIrgqLe/9VT85YfegRVL09DcNqxyFtmpSZjBgOxZu92mTE0b9bpUHVGTcjGWgCTMcAR2W7FupCoRSW2FHeehy2k3RcnVAapqnF7l1GMZiVfuorfQkVVRT1nk0N+rgBVgRe/eUMZAfkQPt64E4BnHDvtvD6LbdUPSf8ugV0Tz+RkcBHQOQYlzt4WB5fgd1Gis7QXu8vGLUaknsHzFBDp80DsdxLMH8dXztmK5VQHKBNDQpYNqoTYMcpJlC6NQcKR2+sJRlGlMt3Qp7p/N4AdPPo324BgcPYyIP4SZmZn5XCn7gQYatx/6XIcdXyE99Or48PBNQTM+ENINhBsNDBRLuGTtBM4eTSOYnUbEqspAwSVNq8nehQ71XehScpBcoAJXiN+a8h9tUS2hLy6B++F7HpeMq0cigqvNZbOoLBxAceZmGJhCed9OxIMkC4QETukLGOJoJn2j24bf0CnEiKDZB4fiW2FOnC3xpOGOr+va0DXyOn2KtiWgEPVALD4MniKF9LkdHhJKDJS9q9Iz+d0+yvOjYUnF4ZQAPFTnxaBlwAooXUpn8aBTzg58YFn2EwrIfo5OEX4djXpNAAtk0VBwzqcb4udaqDahBUzULBeRyAAGlq8D/HHZWV/77/+Bz375amTzqoCIJ5NIpEeE2F2ptaQPZpXQbJfE/6bTDKBRqaJRz0kW5HukygkJ2f1DS0TGZi6bQ8DfARV0w5w3TL+MWqkKMiovPG8d/v5TH8b4BKfNVVRzM2hUC7IG5PwmaSbRJikFLVmVxKn9wlK8Ula7dnrntqgCQr6xOjhtTxROelsJXs57vdrVc43/PzLqYZ5Ov2+y3BtcCSJO7hsztvJSlg0CfzFnMqR80sKSwyqiwrzgaXdUheLvmnLvKCTIWxZg8LMicA3lfyuBq1hxNceWUjm+9GSsmLgA5UYMy5auQUd42y5iuUOBq1UseQ5JIuGQLkSxftIkBW7pg8WhaSKJ+UAI5YEhfP2hn+GAL4SGGYfd9aM/HMeuF3c8OL5+9Xue2vHUwd8buMy6jzzx1PeXrVp9OZUDUsQML+Sk1/3w2adhsJZHIDuPYKuBVP8AKqWa6B7LiSfWiETzCC5R9nsyVe4G0GTPkIhhMpHEh+9+DPPpAQSiUcHYzmcyKC2wx70Fwe40Ki8/j5jgYMn15K6O9iFBGWa0iZMLmLB9BuJD6wAzAZBFw1NZdpIEDtfh1IrCMLFbVaHgsb1l+Saer+yjvJiSgtfz0+1NMRfZRYs2VGrwoRBX6tULVBER0EOwebE8wW3uBtUATJVaVDRUHr/0hWkqDivbCgZwtY6QEREjMvZNzMD0S+JhVW9yrmwioEeQ6BsDBpaxwcJzT23Hpz//JTzx6ynUqeoYDmBk+QQMI6KodV1bUeeckAyEbLsCU3SNfWIzQ5ZLo9UULSSS1X1oI3PwZVSLdVnvfPQDr8df/dX7EDG5I28iP/MCSvlZRA0dht8vYuFdMllcrusc6ISkdjjVV1I2lNCVmQJ7SCmJ1epHo4pHr9ft2YGIj21vy6qyZW8dJ4r/h70OTZZ7E2YPUEGrV7k/ihsuABxPVUSOYToZeI0PFUAJK6S4YDjM5y8CH+mAfIZtF+1qGY3KPLp2DabPFVkdt805CZ8alrPUUOugancQjY4gsvQETGy4APl6FCtGV8OxXAlc9rhfOfckjFtVoaeyj2UF6qP4YLMtWuVcw7VZtYYM5EmDXLoMj2UX8N1HnoAzNAbXjKPRchB0nUJ2dvZzBad05RHX44irI//Hf/7Q2Pj3jXCi3+wA4XYTqVYVp6QjuPz4Y6BP7UeiZiFKJ+9aC10zIJKf4mfLxZdUKR0RwmJA+R2/SHEE+xKYTCbx0Xt+LoHLPS6VEvOFLMoLB5DZdyNioTyKL21HzGCGU0AHx2kgFImjWqlDD8XQdHSkV26GVTOx7YxLkF3oktKIZaMx/Mnl5+Otb/0TjE3QpJjAjDqcygKsRhGV8oIgc4J6QAlxc1kvaC/vYeflJeeXfTWns+QSU61AgBhqkMGHo2lVEI4wS1PnyIHt8GdRe0lNSUln9KJb/pAylrA5TzlCviZSNXyc/IsZn+tCfp8CmygTMvbStkWVRrLropIljaUrgGQfci/tw7U33o7Pfe0u+jHDMDWMjo3LIIWyOLWKg2g0DqtVkezeqrkwjQB8OqVsFZhhPnMQpWwdEQO44vJT8dVv/BOg19FeOIBWfR616gJCQc7glV2zzDJEodKzbxZfHCJ/1EdW2bIXWJ6z4mGrnENrm0ODJukrJasqXSqJOc9RUXSXxaFeDQDFsJqAarmIKkG07Sb8QYX5pTOfX9YurMpIjaS2k0+w5r5AGMnUAKJ0ng/HFfOp4eDp3zyHfKGEgVQfTtx0NNxOHvMHd6IvGoDbrHIPoFwUxMuW4hEB1F1O//sQW3EC1m66FPszDjZuOAGVYk163P7SPL587okYtyroFhpyL/l2wxQmaLbg1JsIBE20/Dqq1JIeHsa+V9wCv3DrHViI9sFNDki2pajA3hd3PDM6OPTOffP7dvzBwN22bVvsF09vv3ZkaOXrYyETBlcB5SyW2HW84dijsDXdh9BsDr5MBYlwCHaQi2OipuhWpnxrRRiLe1yBk6keN5CKYzrZh7+87+fI9PVL4AZDOhYWciguTCHLwDVKyO99DjHS2CSzOSDgqVItIZlaglq9g0BkGEZ6DY466lIcLADxWJ8ACGynBp3YaA1IJYBzzjkJb77sQmzbdiz8fOKI3CH2meD1Qk4MtGVd4WvBkAmXH502yzefyLn6fdTW4oKcEcU+0oYvSEc74oW56yO/jstbDtL479Tk9HDghvR0LJ29B1sC1lt38CggT0InJlaECbiPPNRj90pGncOtFgdeQTSdLqqWA82MYGDlBGDE0XUj+PQ/XIlvf/cBAZcVasCm44+FZREYrwj/rDRcKwiDp76/jHYrg/lMTUre97xtGz79qY8hPBhFfWYvysX94kTHMjhA0TteA+GMqqJW5gae6j4DSzG3PLqcOvgPlb8ExBxhHcJ2RD1+MhegsTbXuLxp5P6KToxiIDBIegbU/Dqnv+T0quzqBS9nKaL1owKU+ON2xxU5ooARRSQxCDOcgp+qJyaVT/zYs3MfbrjxZtx82704MA15vggiC4eAzUeFcM8jd6A5/TzK2X1IGH6ZCPeqgF7g0hrHH0whvuIEHH3yn2DvtIU1ExthNWwQ15LMTuPK807GaquMbrEujvR63JS9d9j1IxaLolxpwonH4Q4MYM40cfWjj2N7swm7bwTltoZ4JI623apOz059uVJb+MffTbBH1iO9v/WHzx8aHLs2akYGqIMTYX2fOYClHRsfOOtMLGu7iMxXEek6sAg79DtqeuvQYsAHnSr6IivjwNC5DmojkIhjtm8Af3nfLxaRUzSHyuUyKOankd3LwK0gt3c7EgG1SCcFv6ORYqajxjUKQkgv3QzoI0iNXIREKoL02Dg0kjo562y1UC0WUCrmYZGgTlQY9YfWJ3DJJWfj0ovPwsoJwhEdoFVGu1lCszQPR1TsOwK7Yz8iFDqO6vkccXjALEalB/F2YdYmiF6VeYJdlr2k6qN60jJSLXCVxQHYYuB6lpBeRhWrE4/PzKDlQ6hkBzgb8AYthORxaMJJux5Ao+OgXCf8Lirl7pLRNUBqOZyCg+/8+034/JXfQ7YEHLV5E+qWIuS7bR8iwRSq+XnUSrTCBF575iC+9IW/w8rxQcBtoDK1XyRDfaIPrabCKkjUIEmFJKVGlYA7h4EEJdAfV0ANh/xNFi1LlfrjoQm9lyoPy84MYEUP5PWn+LoI7LN8Fn8pDrRUJhbQC8EbUnJ7MNZAUPDiNimDXR3haArJ9BIlGOgLA3oM9UILT/ziN7j2B7fgkZ//hg41otvNyfLQ0IjgslPxMOZnDqBYqOFr/3QF3vXnb0J5z69haE3lZEEMvge8ISiGnFktlEJ8+fHYdOqbsXuqjqVL16Db0WUvG5nah29evBXjzQq682X0JRLIVkrSCpm+AOqU/4kkUCBNMD2Ina0Wrrz/frQGhuBG02gy7zkuDk5PPrF89ap379r13O4/KnDPPvvsyAMP/PzaNWvW/wkHPulEFE5+Dkmrhc3RKC7ZuAlLWMJl5qC5FuJRGjd10SZShKa9Adb09KhVolt1YjGTccylB/GR+3+JTKIPPmbcSBDZ7BxKuWnMv3wjYsEycvt2IhFQAG8+xOQBtx0LPs2A5QQQH5xAGwMYm7gCvogPyyaOQaHagN0mYD+MSIgCX37hf7ZbLeSzB2FZJXlYKf0UCgCnnjqMd73rLTj7rFPlPcCmiFgDVrOCZrMIp80JKdWabISMgJoCWrYgfwQDy4dVFDAMtFtN6auEmkUa4yJS6/C9hcLI9l4czPSGWbo3B1MiAcrRvUcz64Hk+XkaVlMEAPRwRKxZun4/LIrMt3l4hDA8dhQwshrF2RbWHX+G7HX7l6ygCTJioRh8dgj7XnoW73/7WfjTd1+Ao9eNQNPraGb3oFaeg9t0kE6lRGupXqmKBYhuBGXyq0YpqlpY9LH1Kgzx0jkMDroo0yo+Ixza8fg8fNjnHV6eZQmhrCKqzl0ph48cJBlBTxWyBbo+8D1wkMfP3bY6aHBtxSm/30B6aBnCsTRgRGXFQ3Hy53fuw43/cQfuuudxTB5kG6GcV1n9DY4sRyLWB4eHJrHPDHqnhXTCwO6dT2Pz0QbuvvOHqM/vgtvKI8S+nX26TEdoyaqhTruZQByJ5cdj87Y3Yc90GyOjqwVX4O/6YB7Yg3953alYVS1CLzfQbXfgi4WFIebYXVicZZhRMVjb73bw1VvuQGVwCBUjLNsSvtPS/PxMvVH+VN2uXvu7QSsH6u/7Ir8WN9Mnh2KR7w0Ojmyo1ypIc5jUqMKXmcfJS5fgnHUbMECE0twMEoII4RBIEzqVnJwdQhWJD6JYnHVE4M4n09BME0EziGxuFpWFGcxO3oB4oOQFblA92CyVdU/d3oig3nRgJMegJ5Zj3aY3YjoHjK1YAiOaEnExYeyUCooHahgIG6p/oq0EH45apYKZqYNotFwytKRUXb4EeOMbL8QbL38DVk0sgY91jc+CW8sivzCLVr0MnRPGjotYJCHAdA5nKCIXMemxyh6WZGjlfs7vU6wkKu/7lMohc9VhgueqhGaWVggshd7iSwW3SnDMwEyyFMjzoyGUQ0WUsOgDTJ8kKvw3HYQjSeTqLgLRESTHjsOWMy7CrpfLWDK+AS1xdNAxtfsg4mEbMy//FEbKxuyzDyOst9CoTWEgFYXeYR/swPTHFDiFB7HVEH6xVE9qkqeqC1Gr5BBKHWSCBfYm8ao1UDphnmnHIcnWIx42Zk5mU9q6kPfKTYrn6BDwyxXhMEnTCdJwYQvnW0coEkN6kAqeSeokAVYEUweLuOeee3D9j2/C89vJJhM6uFRDw0Npke8NmQRY+AToQB1mtdNlqxVBu1GVOUh2dg6vfXU/rrvum6jMPI8QEV8C8PH0qSh65NfQ4MBRAvcEbNxyBSYzHYxyquyosjp6cB++fcmpWFlcgF5qyKXR00lUrA6qnCoPDKIZS2Da7eK7Dz6MPfUmjGUr0TZM1Os2dL+v8fKenTefsfFVf/6At7f9ozJu75vCRuIDw0tGv6jBH4+Gw3DKZbHlCJQL2Lp8KS7cuAFLqhUEigXSciyaAAAgAElEQVRY5QpClHglTa1WE6ZHLBGB3/YtlsrTyTQ+8sCvkEv1S8blUCG/kFGBu+96xEIF5PftRCwQlKkllQH4cyilwtKzrflRsroYOu5VeOZXL+Giyz5BDTO5URzsco3RPzQoPjHUlqL8J0/BDtFLGjmpBrjmUlpRdcyTzVIpCJOFIcM1wPGbB3DFZZfg3PNejcGxYaBVlAe2lplCPpeD5rpIxOJw6ZTescXlwU/hcz4FR+wyPMSWl1mk/5XY/B3crbfCkL+SrKzOUmZxBq6SPdWkDaDWFQ8h/m7RTmZZTxcGV0OdCvh6HIObXoP3vevj+OHNT2J8wwZ0fUHJLJmpDNrVGRzYdRuCmEWzcBB+1BExgValAt0XhqEZsJvcRWoIUqWSZaldh+vNDuT9iF4UwfxqenyY5fpiZuV0V0psbzin4KXe9/eOKMF+UzztEKCRMjJU8WArSwwWBRICoRii0TTM5AAQikorVswVcf8DD+GW2+7CTx/PCJ2QKiQk6McTQaQHRmCGlakXA7RhUZNLIduC9HSi1Y7rotWsIpuZkdKZJ8WKEeDJx69DON7B7I4n0B8LK/d4755Jxg10UWOPa0SRXHoyjjv5LXh5roMly9fD8vSuRLrm/K1Y9Yq+sp5vIhIOI++4aBoBdIIRdNMDOOA4uPlXT+KpfBHa0BK0gmG07C7ikQR27vjtzzcfs+bPnt7+9BEDqcOD9z/NuPym17zmNYlfPf7Uv4+Orbi40/X5RWPYqiJo19DMTuLcVSvw+sGlGONeyrKEuUPRMFo9sL+N0JOoYQvJgD3ugVhSArfQPyQZl896uZgTx4LZl3+ISKiI4p4diAVD0F2Kb3MwJB4fslbRzDBqbhu5ho1VW89Bu6XjxZ37cevt9+DWW3+Cg9xyaUrVlX8m+lIies6xv/jRNOuoN2tyo5mRxUOGW2mnLdKatXIeTZoTg2B6IGYCH/nQe3H+2adi2TGrASK3CrPoWiWUijl06dTHIYpn86iyrOq/hN7IKsTbQ6oK4lCRs9gz9bTtenKsZFcJ2EdgJVKmCqTRoisgrSqaoliohJZFIxUtu4WuEUK57cfw5nPx2b/7Fr5w1R1YOrEGVtsVelwxl5fSLzN5K+z6brTyGYSDPrReIRfEwlRIpG6yLcB7wjBpzkSeLa8RJ969oVqvGuC7kxJS7pHHBjisYjhkYubVEgQGy8ujRRKAQbY2BdZZc4hTo1/sVbmfFrkgygqZSTRLLWx/fi9+fOtduOsnDyGXo1qnomyGEjFEE2mlwsnmxia3l3h2nyQRCVapWogDsNGoFpGbz6DZUgcpxT5ff/FxeP+73oFN5AqjgPLLz8LgtoHXGhER6evdi17gakYMfctOxrbT3ocd+ypYuupotCQ7A9G5/fj6a4/DequMcNVFs9FCJ5VEhTJA4Shmu13c9dzz+MXMLHwTqzFj2ehPjcosYc/OF3/7CjPs0+1O/o7/rBr+g6Vy7x9NLJs4KpMtXT2xZv2r2O8StG/VFtBv+uDs34uLRpfgjJXjGI5GYWeL0C0HMU5fqdFjNxHqKsV+9CWxLxbHR376GIr9o9CDygqkUsqiuDCDzGGBmwga3uJbBa7sCHVK13TR6FjohiNYaADJwVH0DY95kMYQupaGZ5/bhX/93g24955fIF9VHl8E55BMzvVINJmQ8pPlNNcFbaoRSDYmgVu5lTcbNdSKBTTrJdFJIh4kGQPOOftYXPHmS3HqaScowxnS1qpluPUyapUyWq26TJyDMuSS4k9QXcLF9oY7i0L/VMoU0IBHXuCpLm4GChAiAAX+Cs9NnoHLfpvTFTVtJWTQhePYYtDVqFfRDsaQnNiKq755I/73Z3+MVWuP8YTdQpjPzKKay2Nh9oeiNFI4uI80U5jBhPgpMWADAU36fD7oUiEItVLJvJDNIxlWCWBB4/SXh5bwpL2glIGWYvXwfwKAkPWUOoz4nsU6U/SyCFPR4Q9EkOwfhY+Bx2tAba9WB79+5nk8/sTT+Nfv3YRiSdxP5cVcH0/SfW9AKTTSc7nTUeCbbhcROaR9kjzYv7LVqdcLKBfJUFI2JCREnX/2iXjve9+CU05YAy2sZDyb+YMozk8iGnSgd5oidqiLux4/C4kbXAf5UCcbLBRHatnJeO2ZH8RTO3JYOrEebWKYeejPTOLzZx2Po/l8VCgkEUTZCMG/ZCmmLBu3/fJJPDefQXdkCBm/DtswEfJHMX3g4J56ufwNF5V//kNB+0cFLr8pFho47ZWV7pdWrFi+hUv+aDgkqwLUiugUZrH2Fa7gW7ecjhVaCPFqHXYmg7DuIMorVW8ILrnd14e9fQl86Gf3I9c3jDCSMkiaL0yLBcnsnuuQDJdR3bcL0SB7J+Uz00M7id2E95DLCU2fXJKaG2XowSCi0QQisRT8ESJ4opTiFsG6n97/GH5w/c14+JE9QmTnAp4ndTyWRGpgEGYiiQqHHYKbpX1kXU5qriuoG0xGUrGQRS4zKwmOqvc8fY8+KoXzzzsTV1xyDlatXapqLSoBNkvIzkzCsZVkCR38xC2I8EZqKPuCAlJpU5DOIEyxLkoffg4lyDSiEZCkK/VAdsmlkxKcQmYEz5OGeGiPKqqP1CVu26g7ASSPOQnfv+FneN8H/xVr1m+QA4plL6Gl9dIspnf/EIlgDrnJF5Ck1E2H2F1lsMx+U8pXkXsRTJ68l6DfkPfL60+PJTKwlOoIG1GKnAVErE3zU7eKihjs+3WZDFfp1hc2BSEmKCHdj3A0guTAAHy8T4FRNIs2yqUmbrvrftxw423Y+QLx1UCVYp7UE06k5NAVH2e6BVLeVuui1mgKi8k0w2rX7jpS/lIqp1F3ZD/NgzseZguUwluuuByvfc2rkOyLe75SbbRmdqNRzQv53iQLK8CfQ2IENwKM2B4unffKLwOmDoPN50ffqlNx1qs/gCe3z2F83TGgBrtWLyI2O4XPnvtqLNdsWPUanFAc7fQy7LE1XPvoE5hqNZEYHEC100Gx00IsmUI+X5iamT74z4Dzpf+3oP2jA5ffGAolz2i1ml/ZtPH44+r1ugwSzDBBCg00Dx7AhGvidccch+PS/Ujz5K0voFPKY8AXFG+eTqoPz5t+fPKZJ5BJpJD2D8ser2QtYCGzDzO7r0c8VBZaXy9wuTfrlWjS8xJSqeyhRQ2DxA16oVqOgjtaHWV+TSHucKQPfiMOELxvU1lQx8u7Z3DTrffjnnsfxu69WVRYUTFOdJ+sBhLJPuWr6g+IDGlPtdA0DaV5LLo/RczNzaLZcKQ/pMRzXx9wwualePe73oZzztpG5VkKIUt/vDB7QKbUfj60TgeGPwjOC2iaTIpit1tXQzhfUHo0P4kbZkJpGZtc+fDEVntPzncV+F0FLtFcVJIkoKRrdVHt+BA/5gT84Kaf4f0f+DesWb9R2gNO22mK1izP4OBLP0QyuID8yzuRCpni0KBULx3JhjJY4n6aWbajiSB9KGCqfbawZSx0qfdEGReCI/zUvFZ7VjlsKMtDxS9/AFWelEED/lAEoVgcZl8/IOQUYDYzh1//eiduuOE+PPXUHhTy4rMlZ5YZNjAwRJmfuGR6kjIazaqocPIt0PfHMNRhRcxAYaGAcqGgnB0EDw2ceOwQLj7/LFx26fkYHIzBF2Gp0AaaRfGlqtdLqJVyGIqZ6AhUVjkzcAAoA0US/BdRXWrmwMOoTTQf3TQA9I2fitNe9X78euc8jt54ojg5Gq0KIgsz+PQFZ2MYDqxOG75EGrvKwHceeBTZSAKNsClVAT8H/34+l5nMZrPXAO4X/pig/S8FLr85nR46s1Sofm7Z8uVbBrg4nptBQHcR1zSEKjXE6m2MGUGcveU4rEhHRUc4lK8haGsIxgfwkt/Fx3/+ILLxBFKhYek7F8pzyM9PYmb3j5AIlVEmH5c7G3aJ3gpFlCaYiTzitShUkGhPlkybfFXlTSOzEgLhbbI+OErQYDkOzFdEwRPpIQTjg4AeFh+iRr6Myak5fPf7t+HeBx/B1JRiwVDaiCVjqm9YhNCatiNTzXabZakjNzcWi6ner9WUsjqbmUat0QIBX5ykH7MugQ+8963SGydGU0CjKIHcquRQWsiKemXA70csQnwsLUk4B+rCbtGqw4TTbEGnBAszC2F3i5OIQ/Q22Y9yhUL9S1ps2hoqjob4xhPxo1sexXvf/x2sXrdRbCWJwFGBqzJuMpBDfvIFCdxe6S7IIBFX8QAR3hPEM5jZlC9qO3GdwWBhlUPnhTZ39wGFHLOdDsqEcYbjoq8FamMniGIjyimOlyfn8N1rb8BP7n0IC/kOymW1qmHVMDY2jD6egPCh0uA6jn2DX8zAqNpBV3nBd3d9yOfzyM4vCMFBtLQBjAwDl158Lt791iuwdt0axWDydeBW5gGngUJ+RspmDW1pOQzDJ4ocfKqUqaBCvimKJrWY/3Dg2t0u0qu24rRzPoRfPjeHozdtQaVYgGFbiNfL+MRF5yHlcJ0FPPb0dvxq1wwqsSQsivcFA6jVixgZGsKevS+9UCqVr3Fd+xt/bND+lwOX/2DNmqNO3Lfn5S8tGR17VSIR47EMu1FHUg+iW60C9QqMdgPDEQNnbT4WR6UGESP/1A1i9hWCwN888BPUh4YQ0GIIBkLILEyhlJvC7J5DgZugk5oXuD3lgsMDV/o+EPMbEKaMGnhwB6pEwvinApYrBgbxzvQTarTa0m/F+/qQ6hsAuPoIDaFr+URm9M6f3Ivrb7gRTz9bkoeJWwPdAFLpNFLJIVFo5D3llJp7YwYysxkfWpa9jtPCgQO7BZ4ZJU/dBTZuiOPNb3493viGCxBLU2jPphsaWtkMFuZnYBJUUSuhLxFBu1lFhLtTuym7DDMWh91seqAOJXCm1kquAkhIm6tKWxpbl9pdJDedjBtv/zne9Z6rMbH2GBEZ5zQ9M59HszyH6d3XIcWMO/kC4qRWkjbp7Z7VvtaTePH684BQ4DQJXpEN5zSYWT5owuIaMBBCjbo10NA/OASNEji8aLYfVqWN+3/6c/zoxlvxxC8yoo7YaCkz8pElS6VdCUVNWHZLriXXjsxyxFQLDqZjIxw05Ou1SgnFYlOg6QyveAxYv24Mf/b+N+GUU47FyIqlSg/IbqFdK6GSz4pKKHEGVG9htRSPGgj6CSNtqNUzYVucccgwkYLwBA0pCiKBJoK59gaPQhKhSCB3sb2Mu2oLTj7rfXh6ZwFHHXsSyjVL1qL9moO3n7IVeqOI+x58QNBurjmIuhFBlXax0bD03dls5hnXsq9sterX/1eC9r8VuPxHZ5111tBPf/rYlWOjS88zg5GUGG6RY9ixEQn5YNfKaOTmMGIYSLe72Di2HMdNHIVuKoXPPXQ3sgRYgMOiKBbysygvTGFu7w2IBYso7dmOOD1uPDaJsDq4zyTrqCd1ItYiipLHklMutKQtpS/lui3ZqYp9hOEnmlbVT7xpHQaci7Zjw7FZrvSLP1B0cFRc/QR1gyCe+uWz+PGP78B1NzwhWbTWELAQBocGBGapBYJCECg1qrBp0tx2JCtwuklNJeoKc9VVq+SkOqSoPb1v3nzZqXjnO9+EDevH4UuEgYUsOu2aDOiCmgV/p4ogXRDblnAnNE7Xxc5d4XVV4FIBT/w4RUdYPr+ro9B00HfcVtx816/wtndctRi4zLhzmYUjAnfh5Z0SuLpA+ijCptZPMiASaKYQBaXUDocjIsfDaCIJ33aJHmJp20U4NYx4/xAtFeSke+bp7bj2+z/Cgw/txHxB4fd57ajvNjQ8hiDN3jiU8nGq70OxklUCeoappG18yo8on80IUYSazqSGhw1gdBR442UXiA7z8uVDEFpTJS9QTytfwEIuIxRDXn+3Q4QbpVZdhIhlJipMpteW4M/Zq4sGs6ypaN/qrboItfDRJV5BWHum3IcHboc6Y90u+lZtwZbXvB/P7ipi9foT0Wh3UanXxM1gQ18SpcxBtGh4Fo3B54uJV1XObnHA2ijkp5+26vW/g+M8+l8N2v924PIfXnzxxbEH73/kPbFQ/IP9g8MT1XYLflH7a8tQJuTrgBoVzbk5hBptrEoMwheP4dlmGVYshnAgJhdmIac0pzL7jgxc8UnzaGCiyHdYjyuzG/roULiEE1aaVBOmKEQAnqCqthSpGRH6oqyqonLxKVBKjR4nlG0Pl+KhsGTjoJFAON4Hf7Qf0KnHZODAZAY333I3brrtTuyfrKFhqQFVIkkDsRRitCyBD/UGTchIOlCMKf4ePjSWVUe5NIdKJeepFgL9aeDE49bgb/76Qzh23SroRhv5gzthoI6uUxJnv4gRgstGvkvCfo9+KJ9MLYrop+llST+CKNTb6Dv+FNx+71O44q1XYtXqo4XyeHjgzuw51OOSzMGpMP10uH5S/GRVvQiLiq4RFO3WXLTaZAKZaCGAeqsj8qSRJasAox8P3/szfOufv41f/npWQA81ejaLBE8/+tJDVBwTeRixahH2kF/55vo1RGNctdho1OrI5jIo57n2UkPAWBh4w6WvxUXnvhqnbduMEPHmPuob23CK86gUc2J7arebos5JfeUol/IkEDhthIjz7lAUnQgpzhG6Yh0jWUEjwIQKnwElIieSOjz41b6Zn58ZWBcHSAa46nHVcCqItusivXILTjrrXdj+Ug3jE5vh+A1hDoX8PqS4+y/mEUvH5fM6Le6oO1hoVOey2YM/m1i18p/27n1h538naP8/BW7vFy4fHj9jLpP7WLQ/vXVgbEmKD4qh0y2OG3FL3NlbhQLSPqVxlKfdhV+HqUfoYIJCfg7Vwiwy+65HPFhAae8OJIn4JuXJczJnJgjIg6vExXqBK5nYM2pS4mOHAA7MvPwSh1ZGUHn3Kk1lNalWZVEHZiQoQxZZDbGX5ZMXNBS8kGycUBSRvmEg1Cc3t1ao4+HHfoEfXX89Hnt8Vso/ni/+oI54sg/JvrQUmfKQkgbm9YfMLmwrZPLZaghXlnabttWR6ec1V38EF5y3FdO7nkAqAoT9HVi1KgJ+E36pNkLKpEodSeL+1mMe8vMwcPM1C+kTtuEn9z+DN13xFaycOGoxcFkqtypzmGFLYuRR2LdDWFhKAICTVGYa5S6v9s98iB203bpUKpwY08Kk4VA3awiR4RVAN4bhpa+R68wMHI0HMcj1nEY/Jr5HUjGVTWmAdMAud9Ih6clZkVBka/rgPvj8ylaUAJi1a2N46xVvwNlnb8Oa1csBuyzVRbfGAVQGzUZdoKiEZBIbz56XmHIi9ohwojA6s6SoSGoKuabw1spChRNxTpDJTONQw+l47KbeusvbM8vB5UE8FaLryMCVjLtyC844+wN47sUSli3fgIbjQ8PrlU2RxaEqCfm8GpJ6pP789u0vNrrt67ZuPea7v/zlL9mg/7dffxCA8cf+1K1bt/Y9+eT297pu9/L+4eH1/f394VqtImWqFdTQrjUQ72owSRYmwZnK+o6GGLmI+VlU8zOY23sjovoCinueR8KkfYlah6jM+Z+UytyDdiyR+RRRL9ESUgt+pXLR85KlvYP6WT1dZJacYi3RKiMUUn5IsntkRW0EUa7WpBy2uz7hRWr+EBLJfsTSwwA5nJw62AE8vz2Db1/zQ9x+58NKN9mQ4SLMaADLVq6WVUmpTPEBtRtlmR7mNLerwaoXkYj6MLnvABIm8PKum+Frz2Bh7gVEfQ5CBNk7ZOMQiM/3qDxypU9WekGLHFcdQeSqLQwwcB98Fpe/iYG7XlVA3nCKgTsnlc0Cil7gUgdJeLIuaY0MXBIoGLi8pty1NmVQRjED2nMa0UGEB1bivrsfwQc+8i/CRhocW4JYPCkHFoeFnAEwSHjwcphnBHUZCBUXMshl6XjfEj4Ke9W+JHDB+afhnW9/E048+RhoPIgNG3ZpDlY9j0o5Czg1dKymCAQw6CkFJEKFjhLvEyUNKmtwKu4oF0UmCYcWLqQECi9amAlqgs7nw+eDQ7B/UKAySjzOI1QIHp1e6qJ1RvrmocAlusvlyosV14otOOfsP8dvd+SxatUxqNDtIRRBo2Mj5HMRMHS0tU57enL/VLvSfHi4b+ja2cK+X/yxcfWHvu9/JHB7v+DYY7eOPv/cM+/twn9pLBxZHoxHk1o6LHxKgq3DoTCq7bZA96xKA4OpJOYyB1Ccn0VuvyqVa5MvwtB4YrJsOySrqYjbLI5VbyfDKQHscPrHPs+TQFlUXVTauodjhA9diENiYvI1D2d7CBChyuweLYBLfs4uuf+1bEUh44Q1EuuH0bcS8FP8PID8TAbf/Pb38IPrf4pyA7A8YkP/SAojw0slC3PdxODlAdJq1DE6lEKrOofczAJe+O0NCHQyaFb2I9RtIcRdOX1mmHEFP+wBGWSHqpQeetpZumag1HSQPPYk3P2z7Xj9n3wRE2uPksDlamYhX5Z1UO7AzQhhFqXJFxCh8qjgj5l2uaahNaV3iBFHDAuW1YIZCQtnqdU1EAwPIZRegQ3r34BsGRhc2Q8E+2QPTsMzEvrpKM/PSAmbYjGHVj0Pu92QYR1jat1aH95xxZvwxstfh3iSv7cFtFtoNctoVauwWlV0iXUXBRWlwxygHcyiGobCdiuEqUfx65EafkcPW5W/PekcKrQolU71Na6/1HptUUXOy7ji8sdDQczEqOJB3SpxrZJSme8gNb4NZ57+Xjy3s4D1E8ciX2kAsYjQXBvVomuEA3sPHtz/Cz0c+4FTKz38PxGwvZ/xPxq4vR96+umn9z/1yFMX1dF+LXTfmD+dXrUs2T/ktG09EDZlzRHm4twIIFuYRSEzjezkDYgF8qjtfwkhH7mYuifw5WXB31kH9QJXlTQSfR5go/eReqLYh0OIvYA9XJqGGlJyACjCu8q8qhyX4OVaSczDdDmB+Sd7FclSfh2Vqo1INIlwNI6glNR0Dwxgcu807rjzQXznezchsyAIQhnUDI8MwjR7D7eDJUNp7PzNkzLg3L39RoR8RZTmdyNuuOgQXqqH4BPqnzrI1BOr/G7EK1gjoIOiYwEUmw5Sm7fg3oefx6Vv+CesWr1BBoa9wG2UGLg3wcQsipMvIBpkL+dJ+kgroou8rgxrOKWnoxxd0t0OKk1LbGSabhipFRtw0uZLsGcGOPbE9ai2VCnKzM7WZHZ2FqVSWYgc7E5WrQzhknPPwGWXn4tjj1snGRX0Y3LrKM/vV857BNywTZF2hnNGYqQ0aWPEHPWwnWrve9S16HlGeZfmcFKWd/Arbyn1UluHQysvfk5BYy4qbqiKrRe4hNqKyqgXuMy4veFUavwUXPC6j+Pnv3gZa1etF4qiHdRRqlU7Xde+f3pm8iuOGj4dkk/5H4re/yuBe/h7IzF/8uDsluzU3Jka8PqlKybWMNuEuXsN+DCfz6CQPYjs5I8R8WVR3f8SIgGlxsd97OFT5cMzrkyVOVPgTZfT0dPWXeTHqo8m+r2e56lMS+XG9u4uM3IErmhFeV668q/U3pJgeSJy2KfK2kXngp43VvVOImci1p5dWNwdGbpk5WAsicToKoDZS4+juFDDXXc+iqu/+wNsf74hnappsh/jfJWwQyAZAZ5//k7Y+ZdhVedg6DSuonkdPZsU5E59Hqop8LxXukqszaXsd3UVuMdtxf2P7MAlr/8cVoyvV1q+/gByCyXUizPI7v8xItocivtf9AKXYANmb4aJWsPJ75HeVwUMFSmoYU2pHOhJJMePwo+++0N88h9uFY1hQQaTE0CIg6UmyGedsRIXX3Q2Xn/xOQgEbAQ49SdqvZxFIT8vGmEUMAj6qWGlDL34u0QnzNunCp6bIA+vmVcKnUr3S+4i5xaLIn9e4P5OYMgBe5jkay9we9eSB7Zk3/8kcLkOUgAV4gpo6E7nDgInOgLAOO5UDqfyOGnTSSjky6g7FppW/cWVK5a/5emnn372fyhO/48f8389cI8I4mO2feiFfXv/YeXEeJ/dagpyZDpzEJUCS2Vmggwqk7skcJlxGbjKL0ZpHP2+4RRNxQ4daGqB3rsph27G4hzniMBVyFrCnxg+6mlQ2ry9A5LibuT2qgkjX70CmsFAt7ue05vF3StNnGhgxeFIIIym7SLZvwQmNaOMFGDrsC0dzzyzA9ffcAvuf+BxVMrA+HLg3tt/iFiCJmgvQqM8jkGpGMIMvWmnVyYrv6PDyOl+5QzAwC00bFkH3f/oziMCl/1mNldErcDAvRFRX0YCV67z4qGmrDt6LxW4qqQkYycUp3E2fZUi0IJxmEuW4+7b78NffOw7Uq2uXNWPC849ExdeeAbWrF2mFEfQEBnXerWAWjEnboNc+dAOhQglCgwKw8mjQ6ry1at6ODykeZun5dWTxl1kV5FoQScCMc3y/o3HwFI/R71Y8B/x/z1Qj4B4iAfrldJe4PZaj17GZXbvMZ04VWbgco8rgbtqG067+KN48pkpbNywUbHRdL+7b3LPPVtOPPmKJ554ovr/i8B941lvXHPrT++8cfNxJ2wul8vo60ti7/5dqBfnkZ9i75VBeR97Lx90+tKSEeTR235/4FKpgWbKHYHVHhIUU7tf5donZ/niKd3jqKi+jlKhPY0o9WdPVJsTSrnxnp0jDxI55T21hq6PZmAaarUSIlFCArmeUg86RcVY9VHwrSnABZl4IZkeRKSf4HiWdxpZEkCV/R3NYn3Iv7QDBloIEt8c9KFazCMSVfK0PdD+4kPoqSLK5NOTjZV10OYtuO/Rnbj0DZ9fzLi9wOUQMMtZgn/+UOC6qqVQWWmxq/cw4tyr+uHQC4nGU0RPUM9aCyKcTEJLD1HjlOWDkvEhOoKDpwpVSLJoNaoygzACutL58pQkDmGh2bcSysq9fk8llC3AYZVR78D02iFVDXguCPRqItlhkRJ52AH9Oymphz7rofEOZVyv3/2dwO1NlX9f4NqaLoGbnjgVJ57953j6/+HuPcDkLu9r4TO9zxatVnXVhaTVrgoCDAbRDDYCBEhCpoTMa5oAACAASURBVJjqQux8cXJ9c5MvubEdO2659yY3N7Hj+NoGg+kgmiiiCCHAgJBEUV91abXavtN7/Xx+7/vOzC4Skm0g/rTPo0egnZ2dmf//vL92fuds7ca8uaSXphGJJ/MDPb3PoVy85uMCrbz2j/PJRz73bZevHPvwS2tXzTt94blDA4PwB7zo7jmE+FAvhjofhcc6gNj+HfCQeminGLqKciO7yrJ9otffuOxgfIGq1ECbEvbiCSxpVw1wawyw5YJT8EwW2zVw9b1r0jH9EhSoSS2Ug0Q9N5NlSsyyOykqDbqxoUYPdticLmTpLu92IF3MSWdb5s2cg9ms8PsapckWD8dEPrbe60c6HoelkIHP7YWVcqCUVtWbNrWRQ167GHaXZbm/MsfVwF1+LYHbKj61BC5T5dhgFwYOPwS/rQ+RQ7vgpd5zUdW0qkmj5U2Nm6F0Yy1weH0oZ/Iy76YfEmV0IjSotlkQGN0ocCf9k/Ut+2ksH+gZz6YOCRFKmoaG0yJAUwGaEhngyh2TYekPC29b0ntGQ6N2b2pV6SepQ0ze/7AUWP28XEcjzjfiBjTNTnW99TdNo+o4wFXSOzoHIzmEO8OwCXCbTjsfZ332T/Huzn7Mb20XAfp4KlMY6O5/GMjf9HFi6xMF7he/+MXAXXc99OKUObPPpreejAgGjiLUyxpXjYPiBzsEuIxwBnwjgWuWDNhjNnKo5kNSjQhNtqih74kXqllml7ER09yiaB1XlRqqADbyoFJjU/OIzSs5CBQDS6JxuSwjK6bznCPyfufNSSVJ3qwyLyRRvpBBii6DHpfyBbQDGZqXSaqtb9KyDbl4EkF3HWzBeuQGBxQVjwdTDXBNo0UZZykigRJwc2AomcOoRZ/GS6/vwrIV38Okqao5RcojgRunthdTZXs/ogQu0/0iXYkohaMWzYukiwoAdANHR2QjIs/3Hk/F4K8LSD3HmS0/B5bdPFjo4kf6YrliU2pM2NT3zUqfCMJz3KVTVVFCFD6p/pyNTrU2ppbPmz1daS4pMKna1MyieX35upWySPWQq5ZOTJtNjWuUOlSvoGrFaVJlE3FNKi2gpyMB+e9U3yyX0XTaBZi3+Dbs2B3CwoWLhOpqc7kLu7buegLIfP7UAu49D66dPrf9LC5tO+xWZFMx9HfuRQ8JGOwqH94nrCsCV+aeMgLSKgQSEbh4TUsQjmhY3/HiKXaUnNy82Y1lhTSOlKyqJMyiOqlPaw1ci5WCdDzp1Y6rkRg1wFVNKZWaCQlfVt/0c0gUdggR3uVwKuHrAlVpNTunVJLGFud5cqBbLbLhQn9cMeum6bdERKaktP1Q+62pWBq++nqU2IrmwSGHi4owpnSQ+rOkblDJKUhmSeXRtOg8vPybPbhm+XcxcfIcpZFFsfXBKCJDRyTi+hz9qpdAFlMNcGU8Us5pV0KVXTASynKFy4dsOi6vnbGe4OV6XjanrhXHVnw96iBV5l5KZpVRO6PqZZ5nXGmknxCf28HMiM4RcgRXSh0lFaP1mak0osslAzKVhemfIXFE9oV1hmUaapVoXAUuX1d1yKeOAuG168PPTCYqz28+Wy3obphTBC7bg02zz8c5F35VIm57+3yk0sxKCqXerqOPZDLRG2tqj48cw59oxP3ajV9r+I8Hfrl21tx5p5PyxlloZKgPyaHDOLDtfjQ6hxDv2oeA244C0y6bDbkCSfIOWTHjuhk/aDYI0rSR4M1uscmuJlfJ6M+TyaSRSyl/Fm77cA/WYWNkpkypDOak2cTGBOl8hVJaxAEUe4ihjaQHBkwLHHRbF+/b6syP6alqhijbD+lymk6sdKcVkBQJpNrgUc9hOte6BCBJU0Bu0nQlg6r+6MNBbEFVOl+rRVWJOFShZLPXbkNfLIWxpy/G+jf34fLl/4DJU9okfaW3UHhgEIlYNzr334c61yCi+/YhSEkgvVYrB4NQKFUSPrKKkuhuskv9XipsNL0/rARczdGoHkz5IVLkTG9AyhY5XFmf0p+XIOZnrIArS088BMTjlnYtysJFDgGLynAk87GVZRWSIuQsBZhZUClELh6P91RKfk5KGI9XegrFXAHsTRhnDFlCKSfgcXJX2oIig4mb9q3KKtXtcymjc+kjKLkbjgCzVrvYkIybezHOWXwb3t02hLnzTkc6Q4qos7yjY9dDKCYJ3I/t6xMF7h133NH0i5//am1rW9t8qvU5PE4kI2FEB/bj8M6HEXSFkDjUAb+LjvB5WGX0Qg8XCtE5BbjcvS04HEgXbPAExyIwrQ35gTAcFLomAV/4hzaAqhTxEOKRftjoSVrMyvjB73QqmOU4vyMgtPWisG8cAlYJj2TayDYMo6xOvSn6TrkbjgQk+vKPZmSZE17XSsOaYDoiKrCpaynxW36N6eQa8KqflANAA9+MPUwkUH/raEtZFe58OmwYTKUwdv55WP/6Xly2/AeYNnO+pOsE7lBfL+LRHhzafzcanCGE9uxB0EGTKw0w/cIqU5ERt5wB7gfqbDNO0d48w4Gr7FzMezadedN3UGuEPGT5uej3LSbTWi+EB6FIIXFhRLGXxBWBKbcsi3DNUkyx5IASHUb+m24k2l1uESMjEKU04nPxgCb3nT0ImtMVU8Lk4qzczkVqNtuowmihQB0X6pUsrUM7RxrgxvI5TGi/AOcz4m4bQHvbIsTSOVhtLmzftf1eFJO3fGyo/aSbU3fccce4X/78nrVz2lpbCVyn14VkdAhD3QdwdM8jCLhCQsULUlhd24SI0nCeomxO2OhIT+FwbpH46mFvno1/+cf78Mt7nkAsDowda8ei0xfg0ksvwllntaOFyhTpCGDNoRTtRzTULZGcPr+cWHKvVrZw9CYIF8SZCksKSpcDmlMLGYGK+qxHFUFedjZJzKdyhb2AMmeRlYBk8uhaUbiqkoe5mJT7lEiqbSArF3lEk8yMZEx6bkYfUpdRwRJOUfNnvRzOZjFm/nlYt74Dly3/EWbOXoBsOg2P2y3ATcT6cPiAAm54714B7vEAaV7PyO9XjPMkdVdjqaqqI9ldxi/YiN9xWUHHcWl6aWKM9skl0BnN1BcdHsxv1u4P0l+oRnuWJjUSzuIez4xM5r2GjMEDnsZq3POihG5RWcPKIcwUgzK75byULU31DbDkSiK+57S6xMaF5QA/ZzYSRWeb2ZsWFijykLDaES3kMLHtYpy7+It4f8fQMODu6NhxD4rJ204Z4H75y1+eeNcv713b2j53lom4icgg+rsOomff/ahzRhE6sANeneJKmiPWHk7kUqQ60r0PSBVKaGiZjn0Hojj3c3+LeI5K9Kq2TaXpqADRiSJN9babP4Nl11yKRae3Ko0oykwUM4j09yA8NAC/W7n9OSl3SjVDK9lVaqWNwOSMkdpLHFvIL+cQXuRJOcZgkM9KY2cYa26YkmO1i1qZkwqPWrkZlimhMYzJNby7raKrasSoxooRX1INFWYJBrihTEYi7iuv7cGSFT/EjFkLkUlRq8qlgduPwwd+hUYXRfn2os6phN1VJvDB5GtkeiyjLp0F8GeqwOX/jQSkavqog6d2lkpwm9LEDrtwsPX74+P0QaYOCG3AJq+NB6jKcLgTrNLtEgrFtGQb8gp4fzAVLtlklm61O5FIpISX7Pb6UDdqFCyBgFJE5x+nBeHDe2AvFOGnuVwuL81Fh9uFTD4Nh5u70Xnd/CPphspCBrhFTGy7AOece5sAd177GZWIu3P3zrtRTN5+ygD3jjvumPTLn9/z4py21ln5XElS5USkH/1dh9F34AEEbIOIdu4T4HKbJK/1g6kCQdlQ/s31PMq01s2Yiz/9yjfwwJp+zG5vRz5Xlp1OmgvTjDkWCSM82Cc2hpyp8tqec/Zo/MkXb8Uln7kAfqq/UbUxziWHHqTiEZQKyt+Wq3jccGKaxYV1pkpc75IvOtPzptDcYUP8r3YpVeQwX5VGlnS7TehRtDrpXApLqxpRakcc8hz6EFDECxPF1LMLmLVBMyNufyKB8fPPw6tvHsCSFd/HlOnz5cYjcAd6uhGPMuL+qpIqB2j7oetN83pHpvjVf9dicfofzGxZ/V2NspX3LqDljF15IlGMXLIVpvb8I5xyK+za2kR/uOz9q89PoqxykzelijS0xOmP9SYBXFACBmVa0JSFisqYnmGD0BWEP9CIwNjJtHYUr+VsJI1tW3dh4zvvYGzzRFx99SWw5I9g8GgH6l1eIXuIcAAoup6Ak+J8mgDCLSQFXJeMgyLFIia2X4BzF9+GLTtDEnGj3Pe0OLBr985foZT64ikD3C996UuT77rz1y/PmTt3OoHr9DkQoQVJ31EMHHoY3lIP4t2HBLg2CpSRP8emEx9rc8Ph8ohqod3nh2PyLLROvRbdaWDGXMVacbp8Ig7GOsfj5LyRdWJeVgfDkQG5D3JUYACwaH4zPr/8CnzxlqvhsueoHC1SJ5nuIxgcOAJ7md6obPwwCmQlhWNKTSIBQSyRpMhTn5s7mm4pt43alTUeuWqbx0QUu6ThsvuqxzlKvUg9RmmzDY98cmzo/dBjAZder+IY4LChNxbDhAWL8dpbB3HZ8u9h8rR5FeAO9vYIcDsP3o0GRtw9e0Dgjvx9H6jNK8T+msOiJnUtCbdZvWY1H6U2Frv3KjvgeqBJddVnZUDLXWALLNzs0n2C2hud0wBDaKmUCcZuVRNdZKBQpumbWsvyBuoRGDOBnFPA5gPsbhzZfxQvvPgK7n/wcXR0JISklc6qXd/5bXV4bv2vEdu7EcVUBh5md5w8iPZWUVb+aDvDURUlWtk5z1udyFLfm8CdexHOPu8WbN01KBE3kswIX7ljz667UEp96ZQB7m23fXXKPXf/8vXZrXMnGuD2H+1EJjaIwcOrYM8eRrKnEx4rm0AELtUPLbLT6eCFoPMaZ4cul+yD/sV//Q5+uaoLDp8D48dNhMPjlW4kT+V0NgeuFnJWXDMK5LmPRCKBaDiGQi4jgBw7Glh6+UW48cblOOOM2UCQUoIRFCO9GOrvlItpKbNRQUkToeILgKnYWMyr1Fqp/FdJDMaWs5pu6rGESL8YkW0ZbI0AbjX2mAtvgFHbra4cBqy3y3kBLiPuuAWLK82pKdPbpTnFiBvq70Mi1o+uw79GnSuM6J69CJDhpUn3lchqmlUanKZjPvImrKTWQkXll2KrqcxDgVG43sLxNem46qCr3WleJ5YmGZQp4iZHnpadlRk5j0xu53FvVnWZRaFTmGglaVZysd9PryAKHlAsvegQN4ZX33gHT6xei1ff3Iiu7rwomDDZ4RSjqaFRGlNDQ/0ID6Sx6fXvYvbMRoQPd8l4jPuG4p3k4E55VjKwyhYS3SqsHg1cYGL7+Tjr7C9gW0doGHB37+24E6XUl08Z4H755i9PvfPeu38za07reIqOsTnV3bkPhVwEkcNPAsn9Alw3my66lc+GAjdkqATBCOz2ukRhxjNxBvJZJ771wzvxH/esF04EhdBZ1wbqvPAHGlBfX49cUdVZmUyuosDgdnnFka9YLiAZG0Q41Ct7nHL7WanYWI87br8RV139Wbg9hEtOhOCz0SFEwn3iF8SmBfdMvfTu5axYhvsqehr6noBLzxdpiiWdTSFL8Aa1q9qWdbQx+Krhupul+draU6KhtjJRG39MHZ3IFVSdxxq3ecF5WLduFz637EeYMUtFXBftTHVz6sghBdxwRwe87L5rMkktcGuJKpxJ19a6Iw+TarPKcJ31+9S1uEy7SpyVa7eHGncDOQVp98LPTjQOLCKBWuYGDoFbtiHL9JckEKtTXA24ieXxBdUmAw/zlB3vvb8Lq59+Do+tfh5HesXsjwxTFApWjBk/CV5/QFZJM6k0ciLF40Yum8bRzgO4/bqx+N///F2EDu6Hk6aOPFJE8ZIOFSxlVBbBPWUh1Vg9SNlsiOcVcM9dfDu2dajmFD2smCp37Nn1C5RSd5wywL155c1T73/0kY2t7XObUsksvEEfjhzci0ImjGjXUyjHDyDRfwQ+2kFq5ozholq5fieEjILQzmzeOjh8jbA3TpAl8yOHe/HII6tx74Or0dWlTliWHLw3m8cp6VVmlVRs5OiAZtRcuCa5IhgMIp/Nicsf3f5SdMPTn/qEZuCrX7sZt9+8AvX1rAlzgD2HeO8RpJMh5BMRkE9DmRSfz6vGFHluvvDELkgXm+QMRodyvoQSswg61Im/IxtTXK7nzqwNFqcDmazqkpLuaZa+VTzTqaqOiASu4WeLobMVGEqnpTm17tXduGLlj9AyZS4KuRz8Pp8eB/Wi8+A9qPdEEd29B16+RqbpPAAM+1UbfTNSmmaUioYj57jcwCvCUkiKJ63oQdsp2ai8jXPUdaLwvHhIcYyjnAhzxbRaF6RChd2FTInzdOXxxEM6W8giQ466zQm3l2JyDXCRTeYbJVrZpYID/b1RPPHU87j/gVXYsiUMj9cuM1QGApvbg8amRvj8dTJGjKcyEgSYaeWyWfg8XngokJDLoXPPVlxyIfDQqrsQP3gAtnwBVvYEnFQHzYgv1DDgcjxo9SBBPe880DKPzalbJVWurXE79u7+vygmvnrKAHflypunPvboIxta2+c2E7i+Or8GbgjRrtUC3Fjv4Qpw1aiBRAa1/cIIRSZVnq19Wmva3ULot7rcCPgpWDYGcARRCOWw7rWNeOaZl/HYk6+ImFiSwolF2pIE0TCqSZa9hchBbV6LTUTJqAAY8NfDTuJHOoVYZBDhcK+cwGxG19fRIOw83Hb7DZg+dTzcfiuQS8ifoaOHEY2EQf1yl8MmxHrCgh7DXGFjK1pYRcYUmo0aNqxYlLO7y8xA5E5KcFBAPputKDgeC7jmphDCI43HrFBz3AWL8cqru3H5tT/EpKltAlzOcZkqx6MauK4wInsIXC5ZKOcBEznNWKtCo9C1OGfoav7KUafemRULzBRNqoTIYbH6UGazyU4ZV3XwUDo3X0jKgSsWuMQ4D1/OV+FAruxCqeSQ5XNaXzY2j4V79GjA4VUqI0U79uzrwmuvbcIza9Zhw4b9iMYgkwN6Ro1qnAin2y+/yxcMoFDKIyG8aRJrrGhoaEA2RQ8plbbnkil0Hzkq75f7whvf+BGmTfRg4FAn6pwe+Te6Obj8PGipEJmvpsqi8EjdLSvChbIAlxH3/R39FeAyM9i1p+OnKCb+n1MKuKseffjNue1tY9OpXA1whxDtehql2P4KcElPlC89UjARmAJmnNDlSxRE58odmTdUb+RKnQ0ebyPqmycCgWaljOgK4OCOvVi1ajUee2oN9h9II2sauTagbtxE1DeMkjUzsrmybEkCkl6yyeXzOlHMpZDJJATEmRRVLICAHzjnrCn42peuxXnnLESAwr7ZJJBLIZsIIxbuRzo2BI+T2kcFuHkTS2pMu07Viy5wHc/iEYlTzh3FqUFHWj7ORR3jnKr/DLAqBAnTbWZkrAEu57jrX9uDy6/9AVqmtInnEt+LqnHZnLoH9SRg7N4NP+e4esl8JGCHzWu1hrPQPkV+R7HJuNbI92ahFWaWYn28DhaJtFyokL/pxsZmHnsVBVWyUB2Djux00LMH6uHzjwJoPu0IirbWod1H8MQTL+DZF17Bu1sOy/VilcGRqs3pRF1dHRoa68RWJkZlFR+jK+eyyoaEaTFHecGAB4c794udDO2EXORgaLmcL956Nb7y5ZUYM8mBgZ2b4CgBPtZZhZzM9t0BL5KJKNwOzQeTUSBX+pwauAW0tF2M8y/+MjZv6ZYal11lEjB27t7xYxRTf36KAffB38xtnzeewOVIpvPAHhSzBO4zKEb31URctQNrZR3EcEcaHF3MKXLNWZ2FusoWFLJJaTrwQ6XeEQGcZZpN+U9xNKiHi+tzlF0tupAIpfD6b97GIw8/gXWvvY9QGkhTP9nKlLoZDVRsFKK6Q3SK6NrA5+dNmKZ/j52/J42urk5YSjl5aaTvzprhwc03Xo/ly67E6NF1QDlLoSxk+o4gnRpCKRcTMW6qPTCzpLYhoxLTfNqPEAx+D3Wb+W8FkRA1893hpAd9O5wkcMWQ2+GQVDkZ7xfg1tkHhTnFOS5BJd1bXTvXjr3UUoWKskx0DTfCdHkJXqXWSBXFIpxul8y8WTcnswm16F62SJ+BxtMEamP9BFjovMdSgUMDh4+eOVjz/Ct48vE12LK9DylK4XIaV6L9yGj4A7SXqZPXki8xtHOeW9BCfEpjiq+VYvjsVVD4vLs3rOxiikBzE3DWwmm47tqluOTi81AXcMLCk8pRRN/uDUAuieZAg3wGmUQCbq8bhWIWvzXfUvxzKmIIH9qKApfoy4y4BO4FuPizX8Vbm7uwYP5Z0lWm9vaOXTv+FaXkfzllgLt8+Y3Tnnj80fWtbW0tmXRegHt4/y6UchEBbiGyF/G+TvipgCGStoxOequHoz328i15MXoqaD1cO6+MKC9wBOOCxx9EsVRGkj1/qwVZdoS5IljmEN6L+orYGwtHL44eDeHff/5r3HvfWoQigEOJSSJQF0Cwrhleb1AOBN6kPNVlsZ50uHweoxuDopN0tPswouGsmGYzwDTVA59f8VmsXLkUZ5zVDhSTAGVXM2GEBrsQjw1It9wrguQ2uB1uJXjGR0V5w1nhc3uEEFC72sb3aSKuUcSQeCBbTjpV1gQMpsqscZmi1zanyJyqdwxVmFMSDXUDjc9P4BqShWlKKQUInSLbrFLT8oBhBLXY2ehzIUO1RJSRSiXkICBoff4APEEqZQZgoUqm3Yd8Ati6dS8eW/Us1qx5BfuPqK4vzykeDB6vBQ2jRiMQqIODTLm8GK/IhIH/7bDRfoSHHemanN8mRYAuStVMSuXwvLMCMyZR2vWzuOXm6zFhbD3EL5qjtzSVQPoRj0eQ56HvsEukpQ+uSOWwNne7kOL3/F7liURpoJKaBhgCRjiXR8vcC3DZld/Aq2/uHwHcbf+CUvq/nvLALeYjiB2pAjfgVMLfxgqCnU1pnsiRr5bmixZ1ynLsQFobkyASzXkqUjmDNxpJ4qlsSlHihKDOqKFEv1wuN+oax8LiaVD1lNWLgZ4hrFr1LB56+DHs2Z9DJq+61BabB03N4+GgzrFwAyzS4LK7KeNaEiUPrvIVcxnx3I1HwxJVeaZ4ncCVl5+OG264Wthb/nqPSKsWYxTw7oatmIGlkEM2nUFjfR2s1DjiyoTNgXImJR1r86U9uHQErDKsFOe6PKw5dfm1P8KkqXNlocJQHmORXsWcckeOOcc1W0a1N5x8xlzu0OofsgutucIUwys5PCJMz4PY6XbD469D/Wj2GrxqwT5Txo6O3Xhq9Ut4+umXsGsP61vl8UP9AB60wboGBIP1cDhoqsXmYVrV+mL+puK800pfWzaVMujv75fdV5kRkwDlBKZOcuGqpUtw7dWXoa19FmDJAj4LEB2Q7CfZf0SUOCgbTENyJ5fwqezhpGFZUWxfSHlkI4tURyF+UBZYhAJJieT9Z0XJ4UTGYkU4l0HL3IuxdNlf46X1HVgw/0yJuA6nF9u3v/8vQPbUAe7KlTfNWPXoQ6+0trVPlFS5wYfO/R0o5mOIScTtQKznMIIulyLYF4qS/lCFwUpqnERXpfJYsrjVHqiWmpEdUOhOMSVkSjmlCskVIZIds3nRSnbw1CcDpmCDlUsOuaREUZ+/EcHR44BAozREBo5GsGX7XvzbT36Bd7Z2i8QMW7tcRfQHG+Fy+mTBnNeTjZV8OiPzUkYDMrCYQ+eySfR194vhtjD5SkD73ABuuuUGXHXFZRgzNgCkjgD2LIYOHECJG1M2G1wc+hdKMmfmyKnS8B02LlLwIoPreMBtmdIqwGVXmQSMaKgHhw7chVG+uMxxvdIy1eR+jdbatFxqa3aeKd3D/+F/l1mOKCoq31jZ4YOvYQwsdN5j57fkwmDnIJ586gW8sO4NvPzybsUU1dQUehUH6pvgcQdU+s3Vx0JB6l6KJ7ipgc20l6m3zYre/qPSY8hmkmpkRCKMDZg1241zPjUfX7p9JebMngYXPUl4cEdCKOWyiEcGxO+Y5YzXTRG8srhMUqiQhAo+EcXSWYpxnszMR+R82TTk+3XZhT3FiQBzdntJSShR6Z3AjWQzQnlctvJbWLN2uwA3nEgLCWj79vf/D5D9xikTcW9ccePMBx97ZJ0BbrDOi0MHd8OSjyGkgZvoJnC5HG1Te5vSUKD2kKafEai8gSiYLpKdHC3obqdYi6ubSvQpijnkSkWpUbkyVqBGMfms4BoY90HJhEkjz3qJfq3FMjI5q+gnN0ycCVjcgCuIbLKIvfuP4mc/uwf3P/i6aALTrCqeBuqb6jBuYossI7DxwhuRhwQzBIKYzBtRisynEYkOIhJKCIhpnE1bjVuuPRPf+LPb0Dh+HPL9nUiFe0Xl0sXzppRVjliCJi2lU+M9K1jS82CmyqFECs0L1TiIEZfAZXOKyxRDvT0ID3bj0IE70RRIIr53H9yibKnGPkb6VJQWNdNL6NTssOdoTU4XdhcK5EaXrPAGgnDSgNoTQCySxpo16/HQ/auw4e2YsBW5XMW+WiAYhMtfB2+gDk4X95BZZhRkPiv70TbO6WkapsZ9nLVGhgYQj0cF7cxc2OmdMtmDKy6/BCuuvhTTZ7bA47IpB75MSPyJe492ymcum1JlwC0jIMDtZHMxI+MfjuvymZxEezoYcBeYwgH8/WVqZ3OBgbW+1YoMqa4Oxc0mcHk/SulgdyNjQQW4117/HTz7whbM18BlxN2xY9u//jYnP3Vq3JUrb5q16tFHXmmb1z5OIm7AjQP7d8GJBAY6X0R+YAdSPZ2gpQ4J5Vnq7QpdiFQ0BT57mWmwWhXj35kirRf1Aj2jT0W/RmspaQaQeArpI7DCH2aqxSX1ymoPI7VFG35ZRAzd5gyikYJv9eMVOycDdOzcjwcefBQPPf4SurqV3YbUZx4HmsdMgNsXQC7LGrCIDH1lrarT6XJxdmmRm7Kvr0fc+Vz89XngFz/9JqMLVwAAIABJREFUSyy7bgmG9m6Ex8oRUwxuRwlW3ki8eRi2ZDPJyKho7rJ2l7PZyxhIJDHm9MV49Tf78Nlrvo/J0+hkkIPH5UY8NIRQiPu4d2GUP41IRwfqHNQHVl1r1ha1e8BiZ2rlmlwaTo8bOR58dg/CyTIc3tFontqGB+59DN/4u7tk1MbmNF+Ry2lB85gW+Lxs0CnLDiZK7DKTDClZAg9jGqU5bEjHwohGQhgcioGi/0a7bs50K6668jIsu+YyTGlphjfgBmxcDsignE4inYghHuoXjSunrSzOBmbljyuRwo+uWYiQS8yuvpa2MX9zQsHvcS6u+OdKFbLIubN2v2B/lKkyd3ZLpOJaLAgXspjQehGWrfgbvLB+J2bObAO4H1yyYmfHjp8A6a+fMhF3xYobZj/+2GPrDHADQQ/279sJVzmB/s61KA1sR6q3C37O8ZFGETkUeK/SM7bokw/WRgF0pst05pNUr8qVlQumPWBU1FBpnvkSJQX5Rk2HVPsNGYaSEAE4gmLNzE51nhpRbB7ZZXc2EByF+tHjAZ9PnAxyWTvuuXcV7vzlL7Fjr9pKV2bTQOOoURg9diLSmZyo+2c4k7CUdHPFpiRusln0Ht4La76ErsPPw5rpRqx/DzyONOzsQguji12X4cDl8oMcQBa1LM6n6o8nMGbhYrz6xj4sueb7aJneJiQJOieEhmjxeQSH9t4jqXJ4F9f6qK6ha2hNQ2RKqEy01WdMHaFCJitjkBQzFUcTRs88A+vWvI7rb/kBrG4HStYAxo0bB6/Hj2QyLe+VHXn2AWjsRmRI2UKySTGDUGgQkSiXOgA7+wBeoGW8E0suuwQrV1yOhfNnK6ILTzXWqJY8MpFBJKlzledMvAy3wyXG085KuTR8AcNkDSPBU8sCk8xbU8OdRTX2+SBwlVuCWesjcPNW1VUeP2cxrr/x7/Hcy9sw67R25Ahs2LF957afAulTaY77hdZVjz78Utu8+TIOGg7cF1Aa2IVk/1H4nSXkyynAVpTUiqMfW9EDO/WFLBlFI2SYIpuKgOZwhSthjMYUGxPdJLWiZ76EqCDAVTxZ5YKg+EIq4BplC9WVFJ6s1hQWPi872SW1Z80ml3gTWV1oHDsJdm89EBgljZgNr7+NO3/9MNat24qhKJClfayLQugT4PfVy0oaDxe6qheyaUwcMwrIh9Hb1Ymf/POf43OXnYXBvZvRQAfTPE2vFb+XAuGmkyycYBFDZwKtOryMuCOBO2lGeyXihgmWwaM4vO9uNPkTJwFcpuhUjCiIYkQOdmTKHlg9YxBonIwrl1+Ht98vo2X6TNgcTdKNVSbabjW2yWXg9/uQiodkwSMWjaiFeX2wTZ7ixqfPPh233XgNWlunon4UXRIZUVMo5xNiQZrPRFEi0Z9nVpmNJDfcDqWOorKDIuwMh5QT0mIHcs1q/pjmlsKkYn+Zv0VHSs+xK8DVzPGCsNGog6WIG8cEbuv5uP6Gb+OZl7Zgzuz54pdkc3iwdfuWUwu4K1bcMPfxx1Y91zZv3iQD3H17d8BjSaLv0PMoDuxCerAHPkcRuVIGVge9bakjo1NltSuko4Ha0UTJrwFIrjA7QErsjJs+AlTdlVRjFGXcJMZfqnJWek3CDmJkZjqnIpDRyCb7JkMGDWd5TofUQcoplrRUuq7nkaf/r8ODYD3tOVoAmxepSBaRSBY//F//hpfXvoHObnXTkGLrdvuk7qQ8LQrkPSfRsW0Qv/jJrbjqus8itPsdNHgtiMfC4g8rQm1aAF79Yr1kLu9IAZe1oqTKC7jWt18iLoErFiIut9A5I4NMlavAraOKpHxeZs6k9JvIzSXTSHJ0hkSbU9hluZIXWVsD6ibPxYSmz4mz5oQZZ2AoIiadIqRXLmSRTEQQCg2ISDw/9oAHGNPkwNmfOh2fv245zjn7TLj9nCHngFSv8JWjQwMIR0Ky0OGw00lAMdAoO8TrQx1u2cyigXaW65ZqxY+vlU1JIzhgZHEMQEfyrEdG3D8UuNdd/y0BbuucBUikSZoJYMu2934GZL52yqTK1y27ru2RJx5/tha4e/duhc+WQe+BZ5Hv34VcqA8+Rxl5Ic6Tv6oYObYS3dvFfFMsQlSKQ0FU2WbXJ2n1o1I8W71uR8K6dBloZmGWxhmBlfO46P0KIAh8rQ1l0KvdAcWeURPkTfpdoish5U9kOE+TMtbIdjjcQfiCzXAyEtOSpGjDka5+rHrsSTy86nF0dnL+qGaXbqeUbeJk8N7GnyLgKcp+aNBFVhg3P3nQsKBnlsDXoAYzJrXn90VwQEfcsUyVa4BbKOQFuCriduHwvg9PlUcCl9Kz9oBfFAzL9jr4GibBFhyPaVOuERcDNvutLtI60/J+SEXMZ4ExDcD557fjhutXYNHCOagf2wQUU2IwTYZZMkI/oQTy6RBgIYlQybk6XaSbZiS14ZybCh7SYCLbinxutpS5ZSK7yNSAqip6mvRYBAd0BDYEkmOByKTK/CxdLEWMFCu72jZVijAYjIy4rHG51je+9Xzc+IXvCHDnti5ELJkV+uX7W9/9OZD5k1MGuCtXfqF91aMPP9c2b76Mg5gqd3S8h3p3Ht371yDbsw35cL+oUohJFIHBCMimlDHzsqjOMQkYkg7zokvEVDe3IrWp/+a/ie9LDcFApcTcABm+mC6q9hq0aiSiih/K2RjQsoutxM7UY9kAMXKjNP1S/jLk/zrF/DmTK8Hq9MLrb0BwTIt0YMnfSyeS2Lt7Hzr27cfbGzZJin/d8iU486x5iB7dhUI6JCMhj4vKj0SHAa1K6QW40rRTDaXaGrcWuKxx2ZxijWtS5c79VeAOj7hqGZ7AlSNR3iszFx5M9ElyoUyCfd6F+qltuPvff4n//g9PwxFQmu5MHs5aNANXLb0MF134aYwZP4r+4LJVRRpoKtQraTNpn0x/meZSV9tGWZmCUn3kl8NO1Uw6ySsgy2HtcKKczcrclcsCvAaKCKMtWUj4qLnGtRtVtRF2pMqHmU1XgKvCtLxfkyqrba/hNa5qThUwofV8XPv5v8Pzr+wQ4CYzBVjtbmzbseVuIHPqKGDcsOKGeQ899tgLbfPahatM4O7cuQmjA2Uc2bcGia73UKYZsJfqepQcUeR5uaE0cLlhQuCJWTIXta2qrlWGEiT2K2V8lf7qeodiYYzUfJzIcXK/luJjHBuRUqNuEH3d1AhAVvBIilfSKrygXHCg5hFnfzztCQo+A5fm+TgZBRXyOqW2I0EBcSelZahfVBRzaH+gHs3jJgJUJGSn2B5QvpyuMrJH96OUjqjFfdbrdBAQjebjAFd/LqbGlVS5pjnFVJm6SgQuU+XoUM8HUmWmmUpaXZUQShieipgauMILL8qKndXpRyJjQf3oFliaWtC9bz+ShRymzJgMR0MdkEko36VMHAN9R1DKpVAqpOEVUbqCmE177HYhzFD3q5jj+1PeR+wZkD7JuanRj5L5MZlfnL2RW0pwS+bD+luN2cRWVS/UmwhnlDL4d21zcmQEPBFwlWSQGmxUNKe4RqmBO7H1fFx59X/D2tf3Ym7rfGlOsaG5a/fO+4H0qSOIroC76pW2efMazTiIwG2uB47sexaxQ5uBaBhBnw+FDGmCcvRLRcoldhEG5wiH9EO4RJI1l49JiisXiyqNBBZpeyTwy8aacjoQc6cySRlKnkbMujRwyfxRHWl1uvIAkINAc3F5c3HUwK0Y3kim+cFakxS8fDohv9PmYtrKRokifkhTS0ChiPcipp3PKzJIsSy7pfmyT8mwpGPwua3wWrh4UJBIL1ajpEvJqyJ4TYecu6L6NmTty80jB6TGbV64GK9JV/l7aJnejpGp8qG9d6PJF0dId5VNA4+fgYq4CriqziXZpTp2slg94gGcKznhCoyCe1SjsJMKiTAyyRhSyaiKnpSsKeeF8MCZKUFqL1uki85IqhQZqQ3mFWNvyhTJhlRGzb9LlAwStU1dfzO65tKyqEBZVkZeVblYhVRjHCZM1DX1buU6mY+qRrlD0ukaPS9JlUdEXGkCyspjdRxUHAHcpdf8Fda9sVdqXGZZ2XyZ+7gPAulTR551xVUr5j2x+tlX5rTNaeQWTl29D++9twFTxgP7tzyFRM9WlGMReCiDauFAvqCYUy4nSrzZyyU4/H7EkxkUrH7Y3F4EmxsVGa9YRCIaRiadlIE7/99L0jsJeZx/Ur2R8zo53TlHdAq1js0qJUinRkeMcmLoRdCUjCOfaoQwheJKmiLfawI+dzhN6qy/x+svjTEj+GgEuylZQ9VIrcfMbm1RNI64j1CQGTWPJLJ8qtFf+Rspk24jFMf3og4FtRVII+eCak7NPxdvbDqCS674e0ye2S5pZ8Dnl4hLV0TTVY50KF1lkvXVa1UZi4aDavowMyGpX25x9gloeuVCEdwX5pJHGelCXLZ2OJrhjJoHIhu1/JtRW1PJK0Lz4smktaNHRsCRmsw8qPh4JX7OtJ0/of18jRwkN8A+xEnneGkzn+mY46CarrJkdsUCXOQy0/+XQ2mHR8ZBg9ksTMR9+Td7MX/eGYgmMtJV3rFr24NA5lQD7jMvz2lrbSJwyZzavn0TZkx0Ycf7q5Do3AwkIqKAodTpFeWRH57H7UUimUCJ4tcOPxqmtwPwofNwl9zO45qbZRWL9RS3a/LpGDLxCDLJiNRTjLh+t5va3MjoCKk0kglYdbILgMVnt6qlrOQ8jUOCZi9Jba3BqVfc5HQvVbubUgNXAFhZg69Ec7Hq1B67zBj4GnmX2+SPWVo3IyBjTqYiofLx1SLjZXa0SahWwB294DxsEOB+E5NmzJdU2e/1SY0bHmBzqnYcxPqf2YchdlTVJ03EVVxpHXXZNaahuEgHKKVGUXCsOOJVX5fyAOLhZiK56UFoqRtjRE23PUrFaC8oRnxjMWKATflX2WGSD52cOKULVU3tP6hQWZs2q0OwKgRQed5jzXFHAJeHN0X1a4HLVHkolxPgMuKufX2PUB4JXNa4O3Ztuw/I3PzBg+mj+5fjv+OP7ndUnokR96nVz748q21OBbjbtmzC7GlebN30ECKH3oY9E4OHR7akiICNKzfkGLIbY7GLo31g3AyUbfX44p/8N7ywthc5rrkWgZZJNtx03edx/fXL0NJCVzzmdTEZuQz2H0Q6EYLLbgHF+5jCKddz6voyB1c3JzuIInRO6RIdidUlNx1qdRtXbgShW2pBOO2DI2m7bDdpI22xc1SNMxUB1EaOcF+1sZUZwYhPrwkHwkZSP1ep9TVw+TjhvXPGKxTPPAaTpDwuFuB+5nICd55EXKo+MOJWgFtJlUkttQzTKa7u5yrFCjUWUgeLfM84AYjBGZ3inRXDtNpZuFlJlM+pIlfL/KemgUgAWtLiTsGDWmlWqRl7rUWq0bIyr41SN9XFf5XKHu+r9gAd+ZiTibgnAu5VXDJ4bXcFuBbu43Zs/zWQufVjgFDlKT9R4F599cr2Z596eu2stjnNKuL6sPW9TZg7M4j3N9+HwX2vw51Lwy2rIwx0Vt4nSKeSss2TzOVh9dTBN3kOvvf3/4Kf3vkego1BuL1NSCUS6B/oF9YSL+TYJgs+ffY8/PmffQVzZ0+Be5QXyMdRjvVhcIDD/bjUcF6rTeRYyUelegJlWe0OegAx0ld9V6u+u1yIV1IryolAR0CtFEGVC6mxNVFeebAykisGmDRVGDhE7bHqFshIK2mqsQeUB6nxVcUKVOsM86Y1wOV8V7jbpSxC6YwA962NnfjM5d+SOS55xrVdZYm4I4Cr3os6MFR6T6CqeTG7wMpMSwFXzcP16yrbYSsQuAY6iiYoYzbp6pDIP/z2lZGWAbI0Clmu1LDbakBufs8H7FBGKHZ8GHA/DDwnA1yOgziGIjNWtB0cHmlOScSdewGuWf7/Ys26XVi44AwZB2ng3gNkTh1B9GXLlrU99cRz1FUex/1ZAnfnti2YOzOATZt+jfDe1+DMxIQgXs4q5pMSwS7ByT3bogV5mwvupumYMutm7mBjwuQ2ROLKkY43KBsXoYE+9PT2iuYTgxpX6+a1NeH2227EtddeAWeDF0hHgVIGqf5OFLIxZFJJaaK4HFYBr3SLy2qBQZha3ErRTStZe6Dmk5YgFSqxMZ0iy0bkV9U+cS2VkjeoPE7keFRQMaJwxlGy6ixpQFutlXkTMgUV4ohEXJFE1wvrOQyl0mg+/XxsEOCqiEvgVue4RyHjIG8MQzu5SM+mnDZu1ke4RPGKDSXpfkrBUn27pEjJ2mSNn4NDqzzWjmMEiMJIMssR1TR1WDSVw6LGvOgDKDOQ1ApgehmZZJCqYseIk+F3CHO/L3C5/0/gtrRdiOXX/i2eWbsDC+cvQjzFaOPErt07Tq1x0NKlK+Y++/QzL9UCd/uWLZg9zYf337kHkYNvwpaNwsNuLxebhbpGUBSQpLSLzYOisx510xagtW0ZBuLAmPEtcLjrRb6TsqtWqx0+n0/5tFrLGBqk8kMYiSg1iNSiTV0dsGzZxbjlhuVY8Kk2IMNNFDLh04gOHkU02id+Q9xMEckZfXOTrWM8cI2fLmmZ5ku51KnaV5oqohdc7UKLqJvW7K3+kGkIVeVpFEZU6shoWm1ysbZTGYW6pVlzaipnOaci7oLz8Mbbh6U5NeW0eTKycjtdwlWOyZLBr9HojSEkwLXBVuIygdk80rVujX8s593Spa1xcpcxiy4PdC5R8a2tdXRQ105SjcrbVe/FfGa1Ni21iKv9TI1HEg8ylRYz3TY9kFpa6++AWXmo9Bg+hPKoXitZXBaJuFwyYMStALf9Iqz8/N9h9QtbsWD+ImFOsf7v2NNx12/3NU8dXeWrr17ZuvqpJ19pbWtrZsStq/djy6ZNmN7ixK4tDyBydBMs6ZCoD1bmtkV+TIDV4UKqYIEzOB7O0adh+fVfx5qXOxFsqkN9wxitM0S/H5v4v1Bypr6eUVrR8cQnlnLJ6SSGhga4VCL3EwF+1pljcMsXPo8ll12MUc0BSd+QjyEfHUAs3CONEStnq+Lyp5pYNJaSEVGOipDKFrJEBhfHUKLary1DJGtUNwi7o1W3v6q/K0ck8h5r+icm8pH8IXWijtaSJiu4KuBS0oe/C3mJuOwqvy7A/S6mzVbA5WyUzSkC98iBe9HgjSGsgWst0jHPAFfHVd2s4qYVqxY5Igw7TTv6Vep87R+k9JRVJKS8qsk0SnL3q8+t+lVtvqHsrkmdFe20Yj0imYw++PQ40BwMbGaJ5E4NH/13Aa4ZB/0+wM2Uywjl82hpvwhfuOm7eOK5zZg/70yJuMWyrbxnX8edpVLqK7/L6/ldH/uJ1rjLrlg258lnn3m1ta1tNAXRCdxtm9/B5PFWdGx7CPGed1BIDsAjLrFKf4lC5MZmkhzgaNqG5pmLkEy7cfNX/gteXn8AaSpVKDcNuLx2jBk3AV5PUOal5MuKqkGOygtqV9doSCXi9IztETlWBlz+/JTJNtx8wwrccO1VmDixCbDlRcWxlBwU979cMoZSMSPSM047XdxIdFc3LG9SVd5ZpEsqpzoPDgKrBrg86cWjSFJvw1hSl86soingFtUiu1lN1JFPTXUVcGW0QnBr4I5ecC5ef/MgLrnqu5gxa4FwlQ1w42FG3Cpw612cEyvWUlUSR6Xm5jCh6LvMweVwUXVuNeKqg+gDEbSyoWWacbUO8CaaEuGkGZIAUxlKa52tGvDq8d3IOldZcpLRVV0kOdmbf+SSgVlnNAcnMyOTRuudIWHnibC7w4VMmYv0RbTMvwS33vJ9PPbMBsybdyZiqTRbJaU9e/f8vFQ6hbjKK5aumP3406vfWHD66Y2RcByjmuqxddNGzJjswvZ370eoZzOQCcMvHnR1orlUsqaVDIloAHO1zi3Uu2BDI9A4FulYCe9u2Y1Vjz+NF1/YjK4e5fjO2SJ3wkeNHotgY7OIv6VzyuuUS9xiOE2PIJdNZpBcIA+FBzDYPyj3IZfc2TC+/LOLcPtN1+LiC88S3SiU04Ati3DPIcRCPTJ79bidUtc6rUoAQDxoxORa3aQWlwOFjNobZpjPFfKy2kd50XyB5AzKsypSASMbTbxspPs5SPqobdyQwaOWuwXgQsrglhIjcgHhZBqjFy3G+vVcpFcqj2YflxE3OtSNns4HELQNILrvELwcs1SL6mo6W6PjLBHdHDIix6oXLIzJthBSDP9b00SPMXoZCapKV14biqsIXQNC3bBSIyUVr00dbYgV5jlMdK8d+VRHcbrjr19v7fPwvyXtrlkNLVDkTx+M4gxYUL+froC0ZM2KyJwPQ9ECpi68Eitv+O949sV3MHt2q2Qc2XyhtGfP7p+VSsVTZ63vykuvnPnC2pffNOOg+roAtm5+G6dxHLT5XoT63oE1E4GzYIOz6Jc0tmRJiPkxb07OEIsFOhDQdLokhsWOIBfc60WZgGJkpXgBb218H/c98BiefeEdRONqssQ+FbmxzRMmwuXxisKixWFHODwEN+egXJq3OWTmyZtzcKAP0VC/NKyYjZHb/qlFo/C1P7kZn7nkbAQCLoDL3UO9KCQiGOrtRj6XFn6xz2OHo1xGIh6Bx+WspJlCTeSGCzOAgrIP5ekg5I48G2HciOGcU9V16VwWVhbm+suYZivg6ohOgQDOUq3Fiq5yrTzrcObUUXQfvl9UHivAldPi92/wmNd2LPCcTAQcCb6RP2PkaqXz/SHOgiPHPuZ5jaj8SC6zAT+ZaSqLoJUL1zepKCpwlmak1aIor6USlyxKyFqLKNrdCEetmLTwCqxY8dd4ft27mN3GDn6OKiqFffv2/aRQKJw60jVLliyZ/tKaV946be7s0axxBbjvvIW504N4d/O9GOrZBEc+DgdpcAW/siEpKeDy5gQF4kpucY4vldMi+ZksOIRDK3WnywlfXRD2YD1zZvGhSAzE8fzaV/HAA09i4zuHkUioHVkWXeRKjx07Hh6/H9lsEbFoQrOmlJqCyL4Ws7LwEBrsRiSkaJg8w2fOsmL50itwx603oLnRCwtBjDwK/QfR33cItnIKDqbS3CnOF1DvD4K2R7lcHg4bu9+UtnHAYsvJJhSjs8vuRCGfE8VKkdux25AvKAPsKnhVY4rglXRRTLbV7qxxMqDN5hUrqfKoFulNc4r7uASuibg+w/76EOAaQNQCYWT0qwXb8aJgLYNpODmlGhGPBfSKznRt574mAtc+77FeRy1wa79fjdoyFa7saMtOsJQsWhGE9xu4k5zi0FqAm7M4EE86Mbn9Mlx97V/jpVe3oW3BfMRipN/a8vv37ydwTx2xuMsvXz55zXOr35i3YOGEeCyFxoYAtryzAQtnN+Dtt+9Ff+ebcOcTcFIFMO8VkbgS4kK9481JPq3N4lOnIzKiEVUqe2CxURE/Jw7iQlO0WWDnipgngIYxEwGrT7SjkHOiY+dBrHrsaTy5+jnsO0AapQKiL2jFuLETRQgulcwhmaaoGJlF3DCyKid6WSEron+gGwMDMXF8K6QA2pScd247brrpWpx//pmAj/SsCJCNIJ0YQmSgW9J+vh+P0wuPxytSo6U8Obs5FAuqwUWiBCM/V+loU1IoFGGVXVh1y6kxjZ736ruQlE3VvCpIxKXpF4FrnAxqgRseIHDvq0Tc3xW4w0ZbxhOpxl1w5CaOiZLHA5c5AD7s+ycbcY+biutvGKAOT5WVd6/M02WrS42w2Em3lLgDzhqdjgocWaXFTzdvKyJZsCOT82Ls3EuwZOlf4JU3dmD+otNFedJqc+T27NnzL6VS6W9OJuP4fR/ziTanlixZPvHFNc+tb184bzqB28Dm1LsbcGb7WLy+4W707HlFgOu12GAvuNVoxZYT4IqbuHRsPKrmsZDMX52TilUJNX9tNtFSzlL70+pAOk/tJ8Dtqsfo5omw092NDaFUBtmcDT+760GsWbMWG98ZEjc41sZcRmloHAOvr1EErhOZrDCUpNFktUt9KvVYOY94qBvZdBTJeF7Wgtkka53jxW233oDPL1uChkY3RE4xOYRUqAfhUDcKuaQoD1INkrumHrtTJGqYLkt9LAp5LhSzOVi5dSTpsEC3smgg81XZfvpw4JpUWUnXdA8Drl/4IEqX+XhftYT92rpxZJ1pAFGbOo9MX48HrhMBu7bG5XPUPv5YVEbze0bWxLXpvPoea3zViBLPXv1ZyJTAALdMb13eSxkFXEsJKfIJyvVomnE+LvzcV7Hh3QNom79QJhkWmzW3a9eu//Hbi/Xt3xeUJ/NznyhwL7300vGvv/LWK1NPm34a3fr8Phf27nwXp7c24dW370NfxytwZCPw2xxwFlwoi95TXhEx5Lalt6pLRxhuktBAi2ASVTC9iWNT0YydaadXxNAJSHaVab3JbRLKq9Q3NsAeHAP4xwIFBzKxFF5a9xruuuvX2Phuv9TE7FY7vQ4x7Goaw3mxF6lkHrmC8sVxUI2ymIHXoxQK85mUjJpisbBs77C5NWoUcPMNV+KaKy5Ge/sMWPzUc42inAqjv+8osokYPJSQLeTgs7vhddhQogg3UwHepGyQSBOKhAutM1Wx5uRcuQrcY6XKHyVw5egY0ZwaCZzj1azHq0FHgnZkrWyaUyNr3JEp/Ilu9mPVuJJrWTLaPI0cbK1VrVNlSraiwKVijhzSslyftwJpNuxso1E/+WwsWnwLdh+M4rQ5c6RnUSgVsx0dHd/7LcfqByd6TX/I9z9R4F544YUz3nh9w0vTZs6Ywpmn3+fGvp3vY/aMADZufBRDhzbAlhqEx1KGq+REmTcwjb64pWJVGzscHwgV0ZKBjYAuMJUuig0nGwlWJ310WRsrah1lVzkLtdPvVCRbMyiVc5Ja5/IWlKz1cPma0DCqGRZvAHDXAXkLNm/ciieeeQm/um+N+M7QUojLIY0NjWhgl9qqm0x5urrZKtKsTodbCbCX8oiEBxAe7IfbpXYfAkHgovNm48olF2PxeWdj0syJQGoQKKUQ6z6CdCKCOhfyI1KLAAAgAElEQVTZSIojbKV8ZD6ngatSZUNgUOwrVYcpgB+7OSULGjUKGN2HR3SV/5ObUyPrztpoaaL47xtxTXSuBe3wjIBj96yWqGXTszqOI+nCVuJqoRg9CXA5civYLMiUnXC6x8E17kxMa70cQ0kXpk2bpuRlM5nM7r17/gYo/esfAswT/ewnCtwrrriiYc2zL77Z2t42O5vNoa7Ojx3vvy0EjK3vPIVIz1ZYM/1wFXNwseoThcMy8rLfSWlTtfQu+5iWrOyglvNp6Q6Ls5vMTvnfdvFXldU82R9grUhSP0HA5YGSWHtwLFS0+pDN0TCbEjkO2Jxe+BtGw0f7Tm+dTH8GQ3E8vvp5/PxX92D3bjbF1ODC57Ng1OjxCPgbxBeVkT6dyQspwu72SNrL+pic6EwmilBfF7KZvHBeKX54xukTcev1V2PJpYsRbPIj3bMfxfgQaCvF/Rs6xYm8spmzagJ+LftIxk+S4qnmFBfpa8dBTAcJXKPy2H34QQSs/SfdVT5Rc8qA43jp64m6xscDrgFtbY17vHHQh93ktan+sVJlzqiVxYpbHYpaV9ohZQh1eErKWMqWQbGUQsFmRxYuuH0tcI5egDHTLkXRPgotLS1yHRKJRPrA/oNfLyJ/54nA94d8/xMF7sqVKz2PrXrq9da2uYsymawAd/t7GzFhrBX7dq7FwOF34S2FYc1G4SYLh9GgQONjJUfDlFE8M4U7qziuVh1Z5UJLc8GwdtRMUDZ9TA1XqeUMoV4WxFDigja3U6w25AoW5FlvEiQ2N4KNYxAQ07B6AWekP4wXX1qH+x5+AG+/HQFtOChg4XBaMbFlCty+OpTF0suOWCwh2QG7x0ynHU4ynTJiSjUU7kMyQhE6wGcH/vkfv4KbbrwaoYNb4LYkYackTzGnIq/MEcnEUg7t5gZWwmjKekXmuNksxrR/Gr/ZcBifWfodTJneJov0RgGD8qxHDz0gwI3tPwzWuCpc/+HjoD/kJjwR8I4FbgPCYcIGJ5HKj/xdipklW9tVzWXeZaKuqZRP4KK5UUSytLLXi3jGiqaWBUikGjFh9jVoHD8dDQ11AtyhoaFUf1/fTelc+omP6zORS/ZxPvnI5/7Od75j/e53vv90+/z5lw8NhTBuXDN6jh5EqK8fychbKMYOof/AJjR4IBInqUgYXur2CuVfqVJUUh1DTi969dtQ2zbsCKrFa+OlqX6iYk854i0rmW61TC5MJrqii9s7/WtdSCTTsDg94v7n8gZR19gEMB0XTxEvNm8+iHsfeAJPrV6HoYgaJvBHG0c1C4gDwXqJxFR9yOUy0pkOBnxCtqCoN+v8HVv2YkwdcHDfyygnOjHUswseSwY+nwPFTFJWDxkIuP9qtTiVqZYmJkiHXZyuFHCb286pAHfqjHbZZeY4SBEwuirA5Rw3UOEz/vEC93j35+8SyU94j3OsZmEtSzaWckmsAJeHQT4Ja50TuXwKWYsNiYIH46Z9Cm+93YlLr/orzJh7umSBwaAfPT09kXQitaQv1LfhhL/3D3jAJwpciZCw/ey0Oa1fdrlcNt68gwM9GOg+io6tT2LyGBu692xAnasAayYOj8eJEpdtJdrqBWwVR5WsClnIpVrgkhPLuadqXBlJm8rnI+tnVTE5eT02moGprR1Z+dXjDfJtxandrpph1BOiGRRnyGQ1cc3Q5vbD0ThOGVxlrejYfRD3P/g4HnviVXT1a4I9Rw1cMxw3AWPHTpQMIKF9XLl473HbUcyG0dfVhXXP/Qcmj3ciF+tEOd0vguiUe5FUjmtlGrgmkxB7SzmIeIgo4I6ee7YA95KrvoOpM+ZJ55Q1OFNlUh6ZKvvQK6kyBdH/2CPuiaLxh3WkTwYXaoGfqbIiWgwDLptSwgIrAq4SkvkM8k4v4jkvWqZ/Gl/62rfx1PM7MWXmQiQTCdTX12Pjxrd2nH/h+ZesX7++92R+/+/7mE8cuF6X/6veYOCfxo4d67M6bcil0jh4YAd+8M078PUvLUMxdgCZaCe8ljR5UhJlFCeXwFV6SAa4ai3OCZQVn1alfEwb1YfNmatdCKhmLawGuHKV1BK6SNbUEPkNsZ2pNzuFfIyd+sbUoCoo8W2mrLzg4VQObl89vMF6+Oity+ZWwYZoKIGDh3rxT//0Y2zesh/dlA/mdpIFcLo94sPrdNqlfMpnQjhyMII1j38b55xzGnr2bUKTzwILecQ6spYLanGdTTr5KpaEoME5s2FOscY1EZfAnTK9XWsmWTA02I94uAc9nQq4kb0HZTvojx24I2fDkibWzI4V2FQGIgfxCHrkiYChtLXpj6hqXHMfMcfjrSPKkm4bkvkk4HIjVXbC3zgdnqY2TG5ZjJytHuNaZsl2GacVG95+Y80FF16wfP369Vxj+di+PnHgBoOjzszmsqtnzpw5li531Es6ergDLU12bNv0PBK9W5AKHUCdsygubQ52Vgk8Aa6px3RElcYNv2dWWGou4AeVSjTojcWG4vqyAy16S8JlVQbPZMrw/8WRzuymyR4qo7Nm1ojQnBNso+VpUFbICEnD5mBjygVvQ71KqYNNQCSF3Xu68dTTL2LV42vQeaQsoyJ2qzn79bmAeXMseHb1I8hFDyGX7EU5R4KHR5zeyZktFdWWEHm1PK7YuLLabSImJ5Q93VUe03YO3th4BJ9Z+veYPK1NgMuISwongcuust/SJ8BlxD3RHPdju/NO8on/UOAeLyJXgK5leZXapwj/KiEBrV3N8on/Rv9feP0Ipe2Y1L4YL7+4E1ct+0tMnz0LDlq1FkuIJ2P5gwcP/EOhlPv+Sb693/thnzhwFy1a6n3nnTXrZsyc+Sk3LSrSGViKKXTtPYCHf/VNXH3d+QjteAO2/BB8oprIDSETbRl7VVQ1qbCWMq98AFIHCmiP/dbMXqkxgCrofVajgE/gyhYR6YBc25ORlHouEYUT7jAX68U1FYBXnOmyhYwIyHG8kC1mROCOkq2snYKNo2FpJPHDA+TsyGUtePe9bVj70noMDYQwaUITvvFntwPWJNKDB5BLDsDrsqCYyYgtKOtaltQkoPAsEdcFbuyIb62Jmoo5Nbb903hzUxc+s/TbYmwtEd7ukIjLJQNDeSRw2ZxSZJY/3hr3RCSOE935I0dJtY+X8sjsGeseitBHZQ1R7wGTZuuwIZZKoOD0wT96OnL2sVhy5Vexe38Es9vOQDyRkaWSgwcP9qVT8RXpQvqNE72uP/T7nzhw1Qu2fm/mabP/MpMvejw+P0rFNAY7d2Lcb53cd777FIqJw1LjZRMh2Lm5IcBlk0pZkNAbiFRBgWeFyFtpkVZ4vMf6cGr3QosUNNezUYmwWntKRhBkzmiROKKFpAjaMop+Mu0ZaVjlUDq/Nrre5ZRNCXWQ2fDif3M0ZHf6kKQka6GMst0BX7ARjeMmQPw76JxtJc2xBES6kI33IZvogw1ZuMX53YNihhQ8txJaVzIcCmglrhayqaIyEc6mhYAx71xs2HwUF1/5TUyY1CqjMFIpWeNSc+roIUV5ZFdZtoP+fwBcvr8PY0h9GAiOlVZXH69UTuRwIHDJjuMYriJ+B6Wi6fUhks3CFWxGYPJc/PjHj+Cv/vZ+TJ89V3S8jcPEzl07Xl669LKrnn766dQfCswT/fx/CnDHj586q7e/a/X4iVNPg8MNJ+equQj6jnThr//0InzrH76BcugwhnoOwqu3Y6o6iewWc4ij7TbFzq+qpKBsvKpvy9iQVDSfKp+I2qop2vLIMy3S4ukE77DHFksiWFcuUAu5KJGUKpCsfRxuF7KpOFxuuppzhMRTWukcc1WPlEvyqdkFLuqZMveDufXD1rOT3eqCHTZGctZQSMHvdoqNB42t6Hhns7o+ANwyciKYLlkCHQZEfV8Dd/55eHvzUVx0xd8JcDkOMvKsQ32d6Dp4NxqcUQGum9I81eWjE90rH+H3ayVtPvwWHNk9HglEal0b+qUcYDx0dR38gWitxQCqB0HNIj5dD4W3zqUD/SWHmleYUmWnF6MmzcbR/ixmz7sJ7mAdRo+ZAofNIQshu3bt6IvFo98Aig9+hB/UcZ/qPwW4+tV8zVvX+MNxLTPrCQiHhbIx+5EKZ/Dj//kl3Hb755Hs3Ydw3yE0BJ0o5lNwavEy1iC5bEpUL/JZqwQsXjCP1y1kfqasSjSbelEa1ELmMCQOzodZ3hICalFf6RZXF77F9a9cFqEwI4WqXrfRNlaXVwS8uQZGOVkWrjy1K1YlXIJXR05JmkjVxooZ6VA/WqX2NbPpGqkXzhirKok68tSktrLGrr2DQpksxsw7F29v7sIFS74tzSmjOUWVx1iImlN3o8ETRbhjr/jjivxsTcPnWDXlh92IRjBg5GMqcjt628asKlY/Q9VrkNJG5tFKMUREIWvUMpUgfM2XNjwzhtzs9BvgKlDTI1k1ltTlooMe5WuLKJO/zhRYVieBUi6HLJtKPq+s5NGrKs/7xuXQlFcOFT3w1U9CffM0hNN2zFl4KfoGgdPmLoDXU4ciLVbKxez27dvfPvPMC5dv3Pjy0CkN3AsvvND/1tub7xvVPPlqttGzmRhcjhyG+vYjHSvgh9+9FXfcthIOew6RvgPIRHphRRbWQhZ1AZ/oAMViUThtTmkKsVOb1e4HXD7wON2yRE5ASpNJH6MWuJRZFFNXawklO8dHIl+hm1yKiVR7iguopBZS3WrZ0tFPKLJyWoK0QgrQV66WqWNq0ZHsHeNh9PtebDFhLqld3qF0Zhhw2ZxiqmyYU5zjHt73KzR6ohjatUeAa+rb2tdlXsvJjFqOBdzaNURlcaK+RjSDDbLU/F2bm5F1pr5Mw5BNOVV6SG2vNaUFeLSgsZGqqEy+5Kd05mTX3WUeetK3qDmgVFamDKwtTjdS2UxF1aNkt2MwEkWgYQxGT20V7W44G/D06ldx463fRqYEtM8/XdwcbFYHLMU0try/efeYMWNu6+v7eGe3w86v3/eG+Sh+btGiRbN3bNn76xkzZpxJQf9SOYNSPo6BUBfi4TIWnzsGP//p/0HLuDpY3TYgPIBspB+hgV4h5TcE3LDbC8hmk0r/ia177vAWS2LJyFOU/y61oJFL1RdUlgScXGiPqy0R4rZErSgHLBwx8aKYzRtTY1GnWW/oKPVDsQCrNDjMjW6ibO2NT3XG2v+vpe992Gc5srb7AJiEVaWAO0jNqXnnYuM7R3H+Zd+SrnLtWh8jrgFuqGMv6p2qXh/5un4X4H7gtVfkVRWv2mhVyWd1DH0oJiQEnjgcSKOQ3TeKD1SfWa6PbkqKapu2UmUyQhc/ef1axYKdCnWtVRbm4oGey0ljT7r+7FeUqEHG6YFiNNL+hL2CUCyJsROmwc1V0JITuZwNd92/Cj/56V041KkWXVrntqJccojBV0NDA3bs2r43nU7+KJ/P/+qjwMTJPsd/Zqosr7E50PzpVDr176fNmr4gX8yJhpDbY8dQqAdHj4RkTe7cMyfiS7dej0sWn4PGMY1Cg0Q2hczAESSjh1CkfSOo3lgnTSNRlGDq7HIhnU4I6V8E22SvsizuCAQ5t3o5RzU3rgC2ZkQkp3WNIwF/h0is1t5VJj5ISnx8/SMzXpDnqDFYPlFUO2HqKtYojDzAQDI1DLiTps4dAdxuHN53l8izfpTAVU1D/aWBa6LuMOAOC7lauYN9BmGCqQirjFNp2qauoTodtZeR+D1x4UQUodR1k7UxlS2xraQOCPLUnTImy7B0sjll5i2tTZqTF6g/Ru/lMhzOIBzeAPzNLQA551krujoH8b/+7We476H1SKXUVZ0+bRJ8voAQcKhlZrM5yt3d3fsGYqH//Vt+zc9OFnAf1eP+04HLN9Lk9l9UsFj+56TJk+dzAz5XoM+oAw6HDT3dnQgPDspBSweC9lmNuPKyS3DtimswZfo4wBIWY+Ti4ABCoRDi0TDcLreksk4aI4tCJJ0RODTNwkYTMRvrSXZrbShl7dJBFp5zJQ3ThAy+OJuanyo3OxpMGxJHVQRcedwYcoi+10aAWEUM9VU7htDuVb/T9RwWISnp8iHA5Z1NyqMaBx3Fob13oskTxcCuPRJxRU/qGMvwJzpQzAuWdUOdog5/E3prqdIQqio/qscpEzMx5kZBiKfiN6T7AGSVVdUv+LkrEpO1RMKNis7yOYpyvq3iCMFnZmzkCh7Fx9Iy73YiXywjmVZNwWB9I4LBRraLgfqJQKKI3p4QHnpkNf79Fw+jt1+9Qrffj3HjWtBQPxqDgyEpOUghRaGYOtx5oCOZy/yPHIqP/E4X7yN68B8FcPle5kybNrPzSN+36xpGL5nQMnlUb2+vgNfv84mgWzw+iP6ewyjks+JIwj5Q0APccO2nsHLZlThz8bnSbeafcjyEWGQIsWgvbKW8dGmtVDUoZ+EiC4rrgPT5KVGUjoN3PQaQGoraxXrHl2uAFW6HmiVTKUG1pDijVXUXa2UCV9l9KodAA1CJACJcXuuKIN9V0UGMbk/+aySg1P4UtayA/kQCY+edh43vdkuq3DKlVcqAKleZqfJdGMUaVzenat3thx0sxy5Ih71QiYcauKaTXysxK9+u1Kx8rx/UURZ3BMlAFG1TXBDEYqS2NuaohiUJN7+4DKCMvsgaU40s9itUzcv/55yAwgsF6UHapRnl9DQgWN8MKxdGYEeyP4ye/ij+76/uwxNP/AY9fSqysm/l9XkxZuwUBANNCIfisAsJCEink0jGoj3ZfPaVpubGf+w40LHt5K/cR/vIPxrg8m0tXbrUu+75168tFvD102bOmuF0OuvpN8vOKJlBZPtRn8nh4hpeGqHBfpTS3IdlrQPMnOnHX3z9K/jcJZ/GqEaPROJyfACWYgaJSBiJcFhc/NwWO9wcQ2lbTOluyg2jTKsUlEyENOmvsu40XGeVpiltX958RqBbYskI0+zaRlctPe9ko9qHXXIDnlrgbnqvB+df9k1MnNyqDNP0Pi65ylLjUldZ17gsG0a+DtPVPdGtZj6ZqvNB9Se0LuOw6oHUwpFfJasCqAKsFDKVh/B1kUdOwEuTUaiv6jmUlQlJLl7xH07nkxK5bU4LbG4nrBzbydx8NOAMArZ69B+NY+1Lb2PVY89j87s7EU6UYfPJBUPL+IkI+htkLptO5eG0uEUfLOhvRDQahd3tHNi1Z/c+WK13nnfRGY+uWbMmdqLP5+P8/h8VcM0bnTV13qyDBw/c2OhvXOoJ+Kc0jm5q4A2YLmSQY7rLpfhSHoFAAMU09ZmAo10HpDMtxnslYM5M4MbrrsAt1y3HqDovrB6nkiDJ5sTKMx6OIJ2Ow+3nTVNQVpHSyeRpr+RaZY+XJIyK3jE96vSXrn8lTdQNr0pnk3NZWmgaMW/dpTagFV1l07k+CSnT2htgZLPKANdut6AvHse4eedh0/u9FeCaVFkZWyubTY6DQiO6yiN/x8keKseq6iuNOz3aMc89/DnVJ6nkY9TnoebRirYq/08t6poZvUjL6FKDDUDK9SYzzH5dQjP1BwNwUa2AVFOO6QpWbNi8FU8+uRbPPP+WRFUmVdy08gWbZPHD4rbD7XEik0oLNVQoprJET08pZ7K/dzDaM9C7pYDSo1PntK7dvn3TkY8TkCf73H+UwDUvfsHsBVO2dew+02ax3jK6uXlesLGh3un1BDN0D6C2FNv4KMk8l+ktiQahwSFRkhjq71a+yCVgTANw0UXt+MJ11+CcT82Hg95BybC4wMe69yOdiaOQzYE3v5OL73Q4sJRFJ5n/7uRBwRkgFRNdSsC7TI1mNoa4oKAlVs1NJc2UorWSZqtFbX1j8kYUhz81f6Wmc4WGeYyr9mHRz0QkmpQxQ5Cu8tyz8d6OIZx76d8IAYMHHiVn1ZIBU+W70eAKI7rvIIJ2yuKoiHe87rXZd619zLAxV1F5B8ss1nSNOW4j+KQZqJpFqkDlQrr6zLjpZCf7Q0v0lDg/ZU1jsyCX5WzdAosww3iFmdxwwUPpivE9ZQsl2D1euINNMrqBI4B8soy+3jiefuYVPPrYc9j87qDEb4dNjX2C9Q0YN3aC/B5OHGiqlqGiKP1vZRmsjGI2k00lU+FEJNQbi0XfgNV+7+fO/dSOR9evT5wsqD6Jx/1RA9d8AEuWLHG99tpbc5LJxMUWi/2zo0Y3zgn46kc1NAZ9jIoEcTQak2ZTIFAnw3cKlKeSMRSzMQz2H5WbgTpSjKyzZkAUGZdfcwXGT2qCdL6yGWRiYcRjQyjlUuKqTi9dXnSCi6vxDOcEmXgaMZowjXO7UMwpZz+HlTcWFxOkVa0AoUOSJOKaWSU3L+uzAl0Q+FzVem7kRR/JHBoZvZQrghwDIAGjee7ZeHfbAM699G8lVWZE4yL9QH8vEpEeRcBwRxDdewABG9/VsX+3yQiME8PxgGuzerQxm2omqcV/i3C95YXxvYmNigIzv0SowML9dDfKeQtsNHnjiEYSZVV6OJxOZFFEJsfGFUHsQrZYhtvl/f/au9YgKaos/VXlu7IeXY+ufnfzahEaWgR7kBYQFZ1xREZ3plfZkR1nYhdnN8LY/T3+GDdiY/7t353YWd1xxhl1xFF84gsVWDBEQUEBRemGflRXdde7MrMys7KqNs7NbmlZBZRAQbsiiAC6ujLr5j33nnvO90Ak3gwoKnMVIJOt948M4o+/fwwvvboPkykwCV46OsWb2xEON6Ne5xAIhVCpkbNFGV7erU0QYUOR/NCLum3bZik5nkia5dLbHk/9OTUc3J1KpSY/LUZ8HdH4Ja5xSQTuzO+zbt06efjj4c6RsZEbIsHYBkUNLJUkJRiPx0LlcplZg5AzOgmdU9GCtKaoOk3FKIro0dFhRmg37RpIEac1Atx267XYtOnHWH7lYnB+L2CXUCmmYBTTKGtp5g9ExH5Z8KBmV9gElAXRbTtNGVszL10G9KgxYsL0hGem01NBS8FLZzWi5jEebdVN888UuKcrPMwMXAouZk8yRWPMWTbj4+4/mEL/+l+ha14Pm3dUnEolE9DyKRfyKOeRP3YcfnK6/5ze6qftMfr8KQuVmW2x6b/TOHD1GTxWVrZz6wSsQk9n1KnjBis/EdCC+u2ki00Ma05AjYS84O7YvCSj4tgwHJuxvsjSg+RywfsQiXbAo4QA0Y+6VsHzL76KR554Bi/v+ghFA1BkgPTlKeuKxlvRFO9AJltkUkGuKidA7UZ/QMFENg1NK+oVw8yZJW1U8kr7RIF/fsHclv37Pvzwa0E+fYkY/dy3XnKB+5kgXrau4dDho5cXK8Y6DljbFIt0OzUn2jmnw89xnFCpEFPHcdX3qkQA4CH7fGAB7hVhmRryySE4Nkm1AooAXLN6Dn76t7fhhuv7EW2PAo4OWAVUCmnoxQyqdpktDNQDph1TFEi+k3R4pxzYPa4u7zSMj3qGLF2cSvkYqGOq/EUTn9Kz89lxWSrJtJarKFQcxBavxDvvJdG//j7Mme8GLhWnKHBLuSRGBn+PCAXux4NnDVy675kLx8zd/1MASXUa4eT64bovF8lE7+FFQmdR0JCouMsnpl2VGFVMxF4goAM9oyoq1RojZsiBMJraugApAPgjILhSMWfj2edfwQP//RDeP0LC40DVSy2bBijBKOvh025sGMTS8rJdnaxXXUBOlQK1ls/nS8VSbsKpOKlqtfK/sYbYS9etWnN46/attLNeUq9LOnBnjvTmmzar7x17r+Pk2MnvlSvl9R54Lg81hJoD4XAk5A+pdtUNpmkTMIIuyyKVo2z4JA62WUZifBT5TI451JHYuSwDd925ARs2XIerVvQAIhmAFWBpGZTyk0zX2SyS47sfMrkSUGPfsVkPeVpcolZ1sdMMdsnOkqeABQxwMGVjebZZM3PH+8y5dwqA8UWBOzNVJrc+agdFpBzyU2fc03fc08+6bHGZQU6fXoSmg/r0wpz7c3ehIhURw7AYGcPLCaiQBA8r2hEIxsN0/Up6ibVrQsEYwgSCUCJMydPK2jg2mMB//e4P2PH6mxhLul0F2szVoIpwtBGyosKwCAHlZUB/cmmUJIUFqmtK7tXHxsYKJa2k85w07lTtp1etWvtMLNaVePbZ311wBs/Znun5/PxbE7gzB4G0rXbv3t148qOTi5ITyXWW7azxKcpl0cZ4RBQlHykV0EMmNA2pPbLJSY0A6veR0ZalIzWeYIAOsghix1sH6Fvhxz33/Bw3XH8NQg0qoIqAQbtxDrnJCZSJKeStuyZgNYft5GSSTbuqy8l3CQnupKJ+8qlq6pke4sxikBv8p2w7XBFvF0P9eanyNK2PiPQEeTzx8anAnYlVnnn9mS0r+v8zBa57by7bZ7r1y7xzGamCjg7kKSux+oJBCxv1u3kegqyywAs0NQOEd/XK0PMmXty+E48+/jT2vzOEiaybAhsm0NjUhObWNjgU+FNwRbov0j+idg2lw6TrVa1W7Uwmk9U1bUQQxSOcwL28omfZm3JD18TLLz/sesh8C17fysA9/blsGRgIvbZz7+LExNgtnMe7AagFWlpaYmpDOFCXVLLLY+0bSqmr1DOu1xlVTxJ46MU8aNcs5CahF0ufuhX09MzFjTeuxE8H1iPS4EUwGnZbvJkJ5NNJVEwNMqWClD5SUYtUFWjnZdVldto9pW91Di2hL9px2SedoThFQTVdnHJtNt2qMqXKVJz6IgDGzAXiTIFL3GNqoZFKx/QCQ1BCWpuo7WKYVXCkoysqENUgAqRJrTZM4U8k7HrzIzzx1HY8te1VZHPkOOF+H0UNwK82QBBleAWFpb26YbK+LvNVonGk3JucHzjOOP7JJ7myaZQ9Hs+HkUjof9b137D70WcfTX8LYvRzv8J3InBnfvO/u+WW8NDoUPfBg0d+AGCVAW9XIBKNRiONIZ8qkzcB69/WyGyrVmPet2wnnvKFpZ06NTHOfGI4gk5WgfkLgA3r+3H7bRtx1fJeV87TyAG2iUJylHkDgYAjvAeS4O7AbCdjTUUCX565qlm2KcEAAA02SURBVPxFPVW3HUSQTgIlOMgaGpqW9OHdD7JYs/5XaCEABnkSySImSUkzN4aRoT+hgarKx45BJckedi51d373dapXyhaF6TbOVJo/M1V2SFhA4BmfmdhWBOR3NbCEKYK/hHC8jQ6i7nlVUuDky9i1Zy8ee/wveOW148hodP+uUXgs3ohotJF5NplO1dWgZjcxLWrAQ1IktsCOjIzohWwh56k6+WrdGZw/d/6DPZf3HHhy+5Oj39Zgnfm9vnOB+5mUemBAPGBZsbfe2r88l87dXqlavZIoN8bj8XAsFgvSBKF+HwUuFTkoaKlnrKoqS1cLhQyK+THYdgn5fI11lcjgb+3VC3D3XXdg/Q1roTbIAJEgzCxsLYeynoVtagwJJvMcOMuCIghua4nZfdZZe4kjg15yMfCQfYrtir4RE2iqykv3RG4QTlUEeBF1roJcuYDmRUtw+FgRK1ffh7a5vdAdm92zns8gmzqJxOAjCPMZZE8cR4gux/isU5Q46sWSY6DjwKEVgSO0mBec6IrQC5yESs1hBSUC2hPUUyPJWYk0sUgHR4RPDSPQ2g2Q545XAhweHx0Zwp//8lc8+cwLGB5z2HeiK8biIchyGPGWNkg8z/yLacxN04bE8VMFPo6JsGmaZiaTyWIunyvaFbvEebkdV/Vd9XT3ou5PHnrooQuqqHgxLgTf6cA9/YFs3rw5fnD/wYWfHDt2s+04fT7Z19nc3hYXBCEoiqLXNf3yssml62VEo2FWdMpkJ9HW1sLkYcZHTzDHelsnzKsL/vjHn9+JO+74EZpbwwCB4j0VVLUcCpkkUMpCFtwdzzRNVuSi81opn4csi58iiphvLvFnSSK24vZMyTfbw8msulrj68gaeXQsXoIPjuZx9Zr70T7vClTIaVDwopBOoZAeRXbkCSgiATAOQ645rh8vtX0YY4agn+6UoPM/KXQQsZxdi+EnvAz44J6BPahzHER/GHVRQjAQdYXxahISg0k8ue1F7Nj5JvbuGWSpb94AU9toa++CqKgIhaKwSUGThHosCw5xqKdSYHYDTpWq/yadV+nl1KyhUDD0xJprVu0JxGLJhx/+9pxXv8rCMBu4XzBqW7Zs8aXT6cbt219eYZWNH3CcuCwUCrU1NzdT9Cm0i5U0A3pZZ3q6FHQSCcQR5qBmg4OD5PgICjkdzNOrAjTHgY23rsadm36CK69YDIFc/MxxWIVxlEpF2KaOillGpCEIp2zBJ8vM/IuZn5HlJtmqwDX6YtUugfSWLdiooCZ4kNGKaF96JY6+n0P/db9G+9xlIB8IXhbYubswMYbU0KPw8ylkT34IlTDAtgiec6VnGRWPI9ghtc+mdlyeY0Rz1yXCVXuXZQVqpBFQGgAhgrLNY2hoGH9+5HFse+p1DI+w7JYVq3jRg5bWORAFP9RgA4ol8uBxC4EMOcZ5GHHEJ0rkduecOHEib5hUjqonPagfWX7FlQ91ts77oGdlT+b+++//Yt7kV5n9l/DvzAbuOTw8qlKPjo42vv767sXDJ4Z/7FQrfcFAMMZxXDTe3O4TfapgasQi4aH6ZRRyOVbcEnm3OGXZOrL5CRRyBei6y0qLNgALF4bwz7/chJtvXougSkbcQE3Lo1TMIpsag+SpgSdtaJLQoYDxkj6Vl/HIadcnNpIY4GFXLQb+mNRKaO29CocPTmL1un9D25ylsLx1yD4RmYkkSmSzOfgn+LgUiqMfw0dGalUZvEdhtDqqBnt5D+x6DVaVnOdc/SVZ8TMrFgZZDMcZIKI4dAKv7HwTf3jqVbx1gCrwbnE56AfUgA+N0VbmT8xI5wbBSSkFJ10uN7MQRZllFOnkWLmoFQplTcvXUR/qntv9aO8VvXvFgPid31XPNDVnA/ccAvf/Vam3bAklhhLxN/bsvl437A0czy3kIKgdnR2her2usjMwcwZ0RdnJIoSsR3w+mYE30ukJpFLjKJukteVWUeMR4O6f/QS33roey3sXwEs943IWdjENW8+hYpZcKKZdhUhAEpHABRyqNZORGcgyJasbaF3Sh48+yGDVmvvQ3LUYtN1zIoeJxDCMUhaZ0b9C5JLIDh8F55DVhux68NZqMGwTNlXABQmhcCN80WbWpgHnB3gV7711GI89tg3PPfs6JjOASUVd4m7wHnS1d7EeKsEIp6mPZBDO+qoOgV9ElEolOlpUstls0TCMrGUblqqKry29rPuZ+T0Lj1iWNbF169aLVyv2K8yVC/Urs4F7/iPrGdgw0PrWgXeWjyYS6xRJuYrnpFZRkWPxeJwCmaDrqBKSiNQpvV7IssRcDOisSCguIgBkMyTL6oqlUV2qt0fBPf/w9/ibjd8HqjpEiSrRJqx8GqaeQ5XQXqYOlUQDvExlGprpoH3xChw/rmPlqn9FE8mzer0QFZEFrl5MIzG8DVI1gUziOLiajSpZktZJvUVBNNYEbyOJE4ioFSrQrTqefuYlPLJ1G/buzbBWGIluGjYQCYbQ3NkJgYgdxQJk3k23STaIvI8pM+A5kRX0SsWibVtW3rat0Vq1dlxSpB19y/t2dXU3px588EHaq2dfX3IEZgP3Sw7Y2d7+i42/CIymR7v2Hdi/wjD167wez2KfL9DS1tkRaWxs9BHBm7DSlOoahsY4wdR6IkcHmuRaIcec6rUcQWbrREjCst4ofrb5dvzwR9eipYXaKoRF1FDJTkKbyMAniNAsG8VyBe3zFmJozMbyvl+iqW0OBJ/KquBjoydQyk9gZHA7hFqGnatlhYM/HHabp1wAFa2KQ4cGse2ZHXjh+TdwbFBnwUrtGtXfgEhTM/ssXnTVJ6htY5N2NO8K9rFqtMWKXPV0akLL5XO5SqUy5vf5jqiK8lzftX1v9fb2pmbPqmebRWf/+Wzgnn2Mzucdnk2bNsUP7z+85Pgnx2+yavYq3svHW1paY9FoNFCtVkTyz6V0ljC2Ii9BlQOs/UOkfUPLo1jKIp0ZZ4UeTgT8QeDGmxbj7rvvxNVXLmUxDJGHk88hW9IQbWnH8JiBxVfcicbmToRjjSyoBj85zggTqfF9CCoV1M0ivKpMuyFeeu0NbN36HN7e9zEmJwFiMNL5M9zQgsamNsi+IEvHCapo2BqjP1IBixwSRIioWTa1a6xCoaAlU8ksUJuQRd+uOZ3zXlq2dMnRh596+KJl2ZzPw/0mf3c2cL/G0d+8ebNq5vPxvXve7pvITq7lPN6losi3R2LRSCwaD1L1hwAHJPtJKbTf72c7s08VoeslpDNJ9oeopKJMpt5A32IR/3LvP2FVfz/iHa3wSjKSGQsLulejIdwBfzjC5HESo2No8At4/+Au1O08/v3X9+GNN3big4/KkPyAVQZ8PgmRWBsDQZAXMPMpqnuhlw1mHs70mzkPRJn1tG29VCwY6VwmX8hNqpJvf3tn56tLFi159/Lllydnd9ULO7FmA/fCju8ZP31gYCBy6MChReOJsRW6aV7Lcdy8lpbWjramNr9tORKlo4ZF0qI1lqJSkYuCmf49ODgIkaugkB6HIgEkhdU5J4j/fOAB+ENN6Ft5E5RAI+LNbSgVDbYrkmBeLKbg2NGjIC01Am61dMyBYdfQFGtiQA0CP9BZtagZ7FrUUz7Fza1Y48lxLZVMDpm2McQBz9984/f3djR2pH/7yG9z3+BQfucuPRu4F8kj37Jli5BIJOKvvLJrWcUyl9eB/ni0cUFzrDkmiIK/Uqnw05agtbqDSEMYuq5BkaowzBJyxRxOjmaYcKGi+pAr2ljY04uyYUOR/bBLFsqWAbtcYH3Tue1tTPqHFgHdNJlkC52zqWXj8/kh8BJyuZxp6nrBsq3JxOTEcQC7/LK6f+01/R9KESk9WwH+5ibPbOB+c2N/xitv3LgxMDIyMu/Qu4eWeOHt8yvqilgs3h1QgyFJkmTBI6Co5UEew6Q1bDoW/EGVrB6RK2kQJAW8V4IkqQzzq4gKYwFTe4oYUATOdxzyICJfV4IwWgwUYVuWWSgUioVC8YBjWzt5Udy38LJ5Q10LF45t3brVdVqbfX3jIzAbuN/4Izi3G7ipvz++78ChHsfEIs4rrvYroSsJVF2XahGzYrIeseVY4AlXzNpKU2R2Qlh6OCiSD8Vi0U21iTPsBfz+IMm21Kp2pVAq5VKZ7OQuu6rtmDNnzqGFS5cOfx2uc+f27WffdfoIzAbuJTgnSINr8lih+8T4ya5INHQ7eO918CDGiUKQCOsk2WPZBiTBrVIzvipPxSZX3N2yLNPL1YyxkfGjnCA9b5ft3Qu620fePfru8MWqsXQJPqYLesuzgXtBh/fCf/jAwAD36gs7e3J6aWFQDQ441fr3WlqaIvFYJGCbBmTeR2fXul4qlNITk5nR9PgelRNf8IfVj5csWnBy++7dl5xsy4Uf1Yv/CrOBe/E/o3O+Q3JAfPftY/0FPX+1APywLdo8z9StomYW9vEc/1I0Hvxg+eqV78+eVc95SC/aN84G7kX7aM7vxu696941iZHEXfPnzy/wXv4/fvPAb1Ln94mzv30xjcD/AfDg9Z2pevjcAAAAAElFTkSuQmCC"
     st.markdown(f'''
     <div style="text-align: center;">
-        <img src="{logo_url}" alt="LearnTube Logo" 
+        <img src="{LOGO_URL}" alt="LearnTube Logo" 
              width="90" height="90" 
              style="margin-bottom: 0.2em; margin-right: 10px; transform: translateX(-10px);" />
         <h1 id="learnyt-title" style="color: #8B0000; font-size: 2.5em; font-weight: 900; margin-top: 0;">
             LearnTube
         </h1>
     </div>
-''', unsafe_allow_html=True)
\ No newline at end of file
+''', unsafe_allow_html=True)
@@ -1,86 +1,53 @@
-from utils.youtube_api import search_videos, get_video_details
-import pandas as pd
-import isodate
+from utils.metrics import configure_logging, start_exporters
+from utils.youtube_api import CANDIDATE_POOL, cache_stats, scheduler_stats, normalize_query
+from utils.pipeline import fetch_videos_frame, rank_videos, SHORTS_MAX_MINUTES
+from utils.export import export_chunks, iter_chunks, FORMATS
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import argparse
+import json
+import sys
 from datetime import datetime
 import openai
 from dotenv import load_dotenv
 import os
 
-def parse_duration(duration_str):
-    return isodate.parse_duration(duration_str).total_seconds() / 60  # in minutes
+def build_summary(topic, top3):
+    manual_summary = f"# Top 3 YouTube Videos for '{topic}'\n\n"
+    top_score = top3['final_score'].max()
+
+    for position, row in enumerate(top3.to_dict(orient="records"), start=1):
+        stars = round((row['final_score'] / top_score) * 5, 2)
+        manual_summary += f"{position}. **{row['title']}** by *{row['channel']}*\n"
+        manual_summary += f"🔗 [Watch here]({row['url']})\n"
+        manual_summary += f"⭐ Score: {stars} / 5\n\n"
+    return manual_summary
 
-def main():
+def print_stats():
+    stats = cache_stats()
+    print(f"\n🗄️ Cache: {stats['entries']} entries, hits {stats['hits']}, misses {stats['misses']}")
+    api = scheduler_stats()
+    print(f"📊 API: {api['requests']} requests, {api['units']} units, {api['retries']} retries, {api['available_units']} units left")
+
+def main(export_path="top_videos_scored.xlsx", export_format=None, append=False):
     # use_gpt = False  # Set to True if you want to use OpenAI to generate the summary
     topic = input("Enter topic to search on YouTube: ")
-    video_ids = search_videos(topic)
-    video_data = get_video_details(video_ids)
-
-    records = []
-    for item in video_data:
-        stats = item.get('statistics', {})
-        snippet = item['snippet']
-        duration = parse_duration(item['contentDetails']['duration'])
-
-        records.append({
-            'title': snippet['title'],
-            'channel': snippet['channelTitle'],
-            'published': snippet['publishedAt'],
-            'views': int(stats.get('viewCount', 0)),
-            'likes': int(stats.get('likeCount', 0)),
-            'comments': int(stats.get('commentCount', 0)),
-            'duration_minutes': round(duration, 2),
-            'video_id': item['id'],
-            'url': f"https://www.youtube.com/watch?v={item['id']}",
-        })
-
-    df = pd.DataFrame(records)
-
-    # Convert published column to datetime and remove timezone info
-    df['published'] = pd.to_datetime(df['published']).dt.tz_localize(None)
-
-    # Derived metrics
-    df['likes_per_view'] = df['likes'] / df['views']
-    df['comments_per_minute'] = df['comments'] / (df['duration_minutes'] + 0.1)  # avoid divide-by-zero
-    now = pd.Timestamp.now(tz=None)  # Ensure timezone-naive
-    df['views_per_day'] = df['views'] / ((now - df['published']).dt.days + 1)
-
-    # Normalize each metric
-    for col in ['likes_per_view', 'comments_per_minute', 'views_per_day', 'views']:
-        min_val = df[col].min()
-        max_val = df[col].max()
-        df[f'norm_{col}'] = (df[col] - min_val) / (max_val - min_val + 1e-9)
-
-    # Final score (scale 1–10)
-    df['final_score'] = (
-        df['norm_likes_per_view'] * 0.3 +
-        df['norm_comments_per_minute'] * 0.2 +
-        df['norm_views_per_day'] * 0.3 +
-        df['norm_views'] * 0.2
-    ) * 10
-
-    # Ranking
-    df['rank'] = df['final_score'].rank(ascending=False, method='min').astype(int)
+    # Typed columns straight from the API items; published is already naive UTC datetime64
+    # Shorts (under a minute) are dropped as soon as their details arrive, before scoring
+    df = fetch_videos_frame(topic, max_results=CANDIDATE_POOL, min_duration_minutes=SHORTS_MAX_MINUTES)
+
+    # Derived metrics, normalization, final score (scale 1–10) and ranking
+    df = rank_videos(df)
 
     df = df.sort_values(by='views', ascending=False)
     print("\n📺 Top Videos:\n")
     print(df[['title', 'views', 'likes', 'comments', 'duration_minutes', 'channel', 'url']])
 
-    # Export table to Excel
-    output_path = "top_videos_scored.xlsx"
-    df.to_excel(output_path, index=False)
-    print(f"\n📁 Table exported to: {output_path}")
+    # Stream the table to the export file; the top 3 for the summary are picked in the same pass
+    top3 = export_chunks(iter_chunks(df), export_path, export_format, append=append, top_n=3)
+    print(f"\n📁 Table exported to: {export_path}")
 
     # Generate top 3 video summary (manually)
-    top3 = df.sort_values(by="rank").head(3)
-
-    manual_summary = f"# Top 3 YouTube Videos for '{topic}'\n\n"
-    top_score = top3['final_score'].max()
-
-    for i, row in top3.iterrows():
-        stars = round((row['final_score'] / top_score) * 5, 2)
-        manual_summary += f"{i+1}. **{row['title']}** by *{row['channel']}*\n"
-        manual_summary += f"🔗 [Watch here]({row['url']})\n"
-        manual_summary += f"⭐ Score: {stars} / 5\n\n"
+    manual_summary = build_summary(topic, top3)
 
     print("\n📄 Manual Summary of Top 3 Videos:\n")
     print(manual_summary)
@@ -90,5 +57,98 @@ def main():
 
     print("\n📝 Manual summary saved to top_3_summary.md")
 
+    print_stats()
+
+# --- Batch mode: rank many topics concurrently, streaming one JSON line per topic ---
+
+BATCH_COLUMNS = ['rank', 'title', 'channel', 'published', 'views', 'likes', 'comments',
+                 'duration_minutes', 'final_score', 'video_id', 'url']
+
+def read_topics(source):
+    lines = sys.stdin if source == "-" else open(source, encoding="utf-8")
+    with lines:
+        for line in lines:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                yield line
+
+def completed_topics(output_path):
+    # Topics already in the output are skipped, so a crashed batch can simply be rerun
+    done = set()
+    if not os.path.exists(output_path):
+        return done
+    with open(output_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                result = json.loads(line)
+            except ValueError:
+                continue  # a line cut short by a crash; that topic is redone
+            # Lines without videos (written before empty results counted as failures) are redone too
+            if result.get("topic_key") and result.get("videos"):
+                done.add(result["topic_key"])
+    return done
+
+def rank_topic(topic, top_n):
+    # Only the top_n is kept, so search paging can stop once it has settled
+    df = fetch_videos_frame(topic, max_results=CANDIDATE_POOL, min_duration_minutes=SHORTS_MAX_MINUTES, top_n=top_n)
+    top = rank_videos(df, top_n=top_n)
+    if top.empty:
+        # Quota-shed or failed searches come back empty; failing keeps the topic out of the
+        # output, so a rerun retries it
+        raise RuntimeError(f"no videos ranked from {len(df)} candidates (search shed for quota or failed)")
+    return {
+        'topic': topic,
+        'topic_key': normalize_query(topic),
+        'ranked_at': datetime.now().isoformat(timespec='seconds'),
+        'candidates': len(df),
+        'videos': json.loads(top[BATCH_COLUMNS].to_json(orient="records", date_format="iso")),
+        'summary': build_summary(topic, top.head(3)),
+    }
+
+def run_batch(source, output_path, workers, top_n):
+    done = completed_topics(output_path)
+    topics = {}
+    for topic in read_topics(source):
+        topics.setdefault(normalize_query(topic), topic)
+    pending = [topic for key, topic in topics.items() if key not in done]
+    print(f"📚 {len(topics)} topics, {len(topics) - len(pending)} already in {output_path}, {len(pending)} to rank")
+
+    failed = 0
+    with open(output_path, "a", encoding="utf-8") as out, ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(rank_topic, topic, top_n): topic for topic in pending}
+        for i, future in enumerate(as_completed(futures), start=1):
+            topic = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"❌ [{i}/{len(pending)}] {topic}: {e}")
+                continue
+            out.write(json.dumps(result, ensure_ascii=False) + "\n")
+            out.flush()
+            print(f"✅ [{i}/{len(pending)}] {topic}: {len(result['videos'])} videos from {result['candidates']} candidates")
+
+    print(f"\n📁 Rankings appended to: {output_path} ({failed} failed; rerun to retry them)")
+    print_stats()
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Find and rank educational YouTube videos for a topic.")
+    parser.add_argument("--batch", metavar="FILE", help="rank every topic in FILE (one per line, '-' for stdin)")
+    parser.add_argument("--output", default="rankings.jsonl", help="append-only JSONL output for --batch")
+    parser.add_argument("--workers", type=int, default=4, help="topics ranked concurrently in --batch")
+    parser.add_argument("--top", type=int, default=10, help="videos kept per topic in --batch")
+    parser.add_argument("--export", default="top_videos_scored.xlsx",
+                        help="scored table of the interactive search (.csv, .jsonl, .xlsx, or a .parquet directory)")
+    parser.add_argument("--format", choices=FORMATS, help="export format, if not implied by the --export extension")
+    parser.add_argument("--append", action="store_true",
+                        help="append to an existing CSV/JSONL/Parquet export instead of replacing it")
+    return parser.parse_args()
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    args = parse_args()
+    configure_logging()
+    start_exporters()
+    if args.batch:
+        run_batch(args.batch, args.output, args.workers, args.top)
+    else:
+        main(args.export, args.format, args.append)
@@ -0,0 +1,30 @@
+from utils.refresher import (
+    refresh_popular_topics, REFRESH_INTERVAL, REFRESH_MIN_AGE, REFRESH_TOPICS, REFRESH_UNIT_BUDGET,
+)
+from utils.metrics import configure_logging, start_exporters
+from utils.youtube_api import scheduler_stats
+import argparse
+import time
+
+def main():
+    parser = argparse.ArgumentParser(description="Keep precomputed rankings of popular topics fresh.")
+    parser.add_argument("--once", action="store_true", help="run a single refresh cycle and exit")
+    parser.add_argument("--interval", type=int, default=REFRESH_INTERVAL, help="seconds between cycles")
+    parser.add_argument("--topics", type=int, default=REFRESH_TOPICS, help="most popular topics considered per cycle")
+    parser.add_argument("--budget", type=int, default=REFRESH_UNIT_BUDGET, help="quota units per cycle")
+    parser.add_argument("--min-age", type=int, default=REFRESH_MIN_AGE, help="skip rankings younger than this (seconds)")
+    args = parser.parse_args()
+    configure_logging()
+    start_exporters()
+
+    while True:
+        refreshed, spent = refresh_popular_topics(args.topics, args.budget, args.min_age)
+        print(f"🔄 Refreshed {len(refreshed)} topics for {spent} quota units: {', '.join(refreshed) or '-'}")
+        api = scheduler_stats()
+        print(f"📊 API: {api['requests']} requests, {api['units']} units, {api['available_units']} units left")
+        if args.once:
+            break
+        time.sleep(args.interval)
+
+if __name__ == "__main__":
+    main()
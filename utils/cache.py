@@ -0,0 +1,123 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+CACHE_PATH = os.getenv("LEARNYT_CACHE_PATH", os.path.join(".cache", "youtube_cache.sqlite3"))
+
+# Search results are expensive (100 quota units) and change slowly; stats drift faster.
+SEARCH_TTL = int(os.getenv("LEARNYT_SEARCH_TTL", 6 * 60 * 60))
+DETAILS_TTL = int(os.getenv("LEARNYT_DETAILS_TTL", 60 * 60))
+# ETags outlive the details they validate: an expired entry can still be revalidated with a 304
+ETAG_TTL = int(os.getenv("LEARNYT_ETAG_TTL", 7 * 24 * 60 * 60))
+# Channel subscriber and video counts barely move within a week
+CHANNEL_TTL = int(os.getenv("LEARNYT_CHANNEL_TTL", 7 * 24 * 60 * 60))
+MAX_ENTRIES = int(os.getenv("LEARNYT_CACHE_MAX_ENTRIES", 50_000))
+
+
+class ResponseCache:
+    """Disk-backed TTL cache for API responses, bounded by entry count (LRU eviction)."""
+
+    def __init__(self, path=CACHE_PATH, max_entries=MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = {}
+        self.misses = {}
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (namespace, key)
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at)")
+        self._conn.commit()
+
+    def get(self, namespace, key, include_expired=False):
+        return self.get_many(namespace, [key], include_expired=include_expired).get(key)
+
+    def get_many(self, namespace, keys, include_expired=False):
+        # include_expired serves stale entries, e.g. when the API quota is exhausted
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+        now = time.time()
+        expires_after = float("-inf") if include_expired else now
+        found = {}
+        with self._lock:
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, value FROM entries WHERE namespace = ? AND expires_at > ? AND key IN ({placeholders})",
+                    [namespace, expires_after, *chunk],
+                ).fetchall()
+                found.update((k, json.loads(v)) for k, v in rows)
+            if found:
+                self._conn.executemany(
+                    "UPDATE entries SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                    [(now, namespace, k) for k in found],
+                )
+                self._conn.commit()
+            self.hits[namespace] = self.hits.get(namespace, 0) + len(found)
+            self.misses[namespace] = self.misses.get(namespace, 0) + len(keys) - len(found)
+        return found
+
+    def set(self, namespace, key, value, ttl):
+        self.set_many(namespace, {key: value}, ttl)
+
+    def set_many(self, namespace, mapping, ttl):
+        if not mapping:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO entries (namespace, key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                [(namespace, k, json.dumps(v), now + ttl, now) for k, v in mapping.items()],
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def _evict(self, now):
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()
+        if count <= self.max_entries:
+            return
+        self._conn.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM entries WHERE rowid IN (SELECT rowid FROM entries ORDER BY accessed_at LIMIT ?)",
+                (overflow,),
+            )
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
+
+    def stats(self):
+        with self._lock:
+            (size,) = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()
+            namespaces = sorted(set(self.hits) | set(self.misses))
+            return {
+                "entries": size,
+                "max_entries": self.max_entries,
+                "hits": dict(self.hits),
+                "misses": dict(self.misses),
+                "hit_rate": {
+                    ns: self.hits.get(ns, 0) / max(self.hits.get(ns, 0) + self.misses.get(ns, 0), 1)
+                    for ns in namespaces
+                },
+            }
@@ -0,0 +1,132 @@
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+
+CORPUS_PATH = os.getenv("LEARNYT_CORPUS_PATH", os.path.join(".cache", "corpus.sqlite3"))
+
+# Column weights for bm25: a topic word in the title counts far more than in the description
+TITLE_WEIGHT, CHANNEL_WEIGHT, DESCRIPTION_WEIGHT = 10.0, 2.0, 1.0
+
+# Question and filler words that say nothing about the topic itself
+STOPWORDS = {
+    "a", "an", "and", "are", "about", "does", "do", "explained", "for", "how", "in", "intro",
+    "introduction", "is", "learn", "of", "on", "the", "to", "tutorial", "what", "why", "with",
+}
+
+
+def topic_terms(topic):
+    words = re.findall(r"\w+", topic.lower())
+    terms = [w for w in words if w not in STOPWORDS]
+    return list(dict.fromkeys(terms or words))
+
+
+class VideoCorpus:
+    """Every fetched video's metadata and latest stats, with an FTS5 index over title, channel and description."""
+
+    def __init__(self, path=CORPUS_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS videos (
+                id INTEGER PRIMARY KEY,
+                video_id TEXT NOT NULL UNIQUE,
+                item TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            );
+            -- rowid = videos.id, so re-indexing a video is a rowid lookup, not a scan
+            CREATE VIRTUAL TABLE IF NOT EXISTS videos_fts USING fts5(
+                title, channel, description,
+                tokenize = 'porter unicode61 remove_diacritics 2'
+            );
+        """)
+        self._conn.commit()
+
+    def add_items(self, items):
+        items = {item['id']: item for item in items}
+        if not items:
+            return
+        now = time.time()
+        video_ids = list(items)
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO videos (video_id, item, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT (video_id) DO UPDATE SET item = excluded.item, updated_at = excluded.updated_at",
+                [(video_id, json.dumps(item), now) for video_id, item in items.items()],
+            )
+            rows = []
+            for start in range(0, len(video_ids), 500):
+                chunk = video_ids[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows += self._conn.execute(
+                    f"SELECT id, video_id FROM videos WHERE video_id IN ({placeholders})", chunk
+                ).fetchall()
+            self._conn.executemany("DELETE FROM videos_fts WHERE rowid = ?", [(rowid,) for rowid, _ in rows])
+            self._conn.executemany(
+                "INSERT INTO videos_fts (rowid, title, channel, description) VALUES (?, ?, ?, ?)",
+                [
+                    (rowid, items[video_id]['snippet'].get('title', ''),
+                     items[video_id]['snippet'].get('channelTitle', ''),
+                     items[video_id]['snippet'].get('description', ''))
+                    for rowid, video_id in rows
+                ],
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def _match_query(topic):
+        # Quoting each term keeps FTS5 operators in user input from being interpreted
+        return " ".join('"' + term.replace('"', '""') + '"' for term in topic_terms(topic))
+
+    def search(self, topic, limit=200):
+        """IDs of videos matching every topic term, best bm25 match first."""
+        query = self._match_query(topic)
+        if not query:
+            return []
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT v.video_id FROM videos_fts JOIN videos v ON v.id = videos_fts.rowid "
+                "WHERE videos_fts MATCH ? ORDER BY bm25(videos_fts, ?, ?, ?) LIMIT ?",
+                (query, TITLE_WEIGHT, CHANNEL_WEIGHT, DESCRIPTION_WEIGHT, limit),
+            ).fetchall()
+        return [video_id for (video_id,) in rows]
+
+    def count_title_matches(self, topic, limit):
+        """Videos with every topic term in their title or channel name, counted up to `limit`.
+
+        A term that only turns up in descriptions is a weak match, so this is the
+        confidence measure for answering locally, not search()'s result count.
+        """
+        query = self._match_query(topic)
+        if not query:
+            return 0
+        with self._lock:
+            (n,) = self._conn.execute(
+                "SELECT COUNT(*) FROM (SELECT 1 FROM videos_fts WHERE videos_fts MATCH ? LIMIT ?)",
+                ("{title channel} : (" + query + ")", limit),
+            ).fetchone()
+        return n
+
+    def get_items(self, video_ids):
+        found = {}
+        with self._lock:
+            for start in range(0, len(video_ids), 500):
+                chunk = video_ids[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT video_id, item FROM videos WHERE video_id IN ({placeholders})", chunk
+                ).fetchall()
+                found.update((video_id, json.loads(item)) for video_id, item in rows)
+        return [found[video_id] for video_id in video_ids if video_id in found]
+
+    def count(self):
+        with self._lock:
+            (n,) = self._conn.execute("SELECT COUNT(*) FROM videos").fetchone()
+        return n
@@ -0,0 +1,180 @@
+import glob
+import os
+import uuid
+from datetime import datetime
+
+import pandas as pd
+
+from utils.scoring import top_k
+
+FORMATS = ("csv", "jsonl", "parquet", "xlsx")
+CHUNK_ROWS = int(os.getenv("LEARNYT_EXPORT_CHUNK_ROWS", 10_000))
+
+
+def infer_format(path):
+    ext = os.path.splitext(path.rstrip("/"))[1].lstrip(".").lower()
+    fmt = {"json": "jsonl", "ndjson": "jsonl", "pq": "parquet"}.get(ext, ext)
+    if fmt not in FORMATS:
+        raise ValueError(f"Cannot infer an export format from '{path}'; use one of {', '.join(FORMATS)}")
+    return fmt
+
+
+def iter_chunks(df, chunk_rows=CHUNK_ROWS):
+    # An empty frame still yields one (empty) chunk, so CSV and XLSX exports still get a header row
+    for start in range(0, max(len(df), 1), chunk_rows):
+        yield df.iloc[start:start + chunk_rows]
+
+
+class _Writer:
+    """Writes DataFrame chunks as they arrive; use as a context manager or call close()."""
+
+    def __init__(self, path, append=False):
+        self.path = path
+        self.append = append
+        self.rows = 0
+
+    def write(self, chunk):
+        if len(chunk):
+            self._write(chunk)
+            self.rows += len(chunk)
+        else:
+            self._write_header(chunk)
+
+    def _write_header(self, chunk):
+        # An empty chunk only carries columns; formats with a header row write it once
+        pass
+
+    def _write(self, chunk):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class CsvWriter(_Writer):
+    def __init__(self, path, append=False):
+        super().__init__(path, append)
+        # The header is written once per file, so appended runs continue the same table
+        self._header = not (append and os.path.exists(path) and os.path.getsize(path) > 0)
+        self._file = open(path, "a" if append else "w", encoding="utf-8", newline="")
+
+    def _write(self, chunk):
+        chunk.to_csv(self._file, header=self._header, index=False, date_format="%Y-%m-%dT%H:%M:%S")
+        self._header = False
+
+    def _write_header(self, chunk):
+        if self._header and len(chunk.columns):
+            self._write(chunk)
+
+    def close(self):
+        self._file.close()
+
+
+class JsonlWriter(_Writer):
+    def __init__(self, path, append=False):
+        super().__init__(path, append)
+        self._file = open(path, "a" if append else "w", encoding="utf-8")
+
+    def _write(self, chunk):
+        text = chunk.to_json(orient="records", lines=True, date_format="iso", force_ascii=False)
+        # Older pandas leave off the final newline; newer ones already end with one
+        self._file.write(text if text.endswith("\n") else text + "\n")
+
+    def close(self):
+        self._file.close()
+
+
+class ParquetWriter(_Writer):
+    """A directory of part files (one per run, one row group per chunk); read back with pd.read_parquet(path).
+
+    Parquet files can't be appended to in place, so appending adds a part file
+    instead of rewriting the existing ones.
+    """
+
+    def __init__(self, path, append=False):
+        super().__init__(path, append)
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as e:
+            raise ImportError("Parquet export needs pyarrow: pip install pyarrow") from e
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        os.makedirs(path, exist_ok=True)
+        if not append:
+            for part in glob.glob(os.path.join(path, "part-*.parquet")):
+                os.remove(part)
+        stamp = datetime.now().strftime("%Y%m%dT%H%M%S")
+        self._part = os.path.join(path, f"part-{stamp}-{uuid.uuid4().hex[:8]}.parquet")
+        self._writer = None
+
+    def _write(self, chunk):
+        if self._writer is None:
+            table = self._pa.Table.from_pandas(chunk, preserve_index=False)
+            self._writer = self._pq.ParquetWriter(self._part, table.schema, compression="zstd")
+        else:
+            table = self._pa.Table.from_pandas(chunk, schema=self._writer.schema, preserve_index=False)
+        self._writer.write_table(table)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+
+class XlsxWriter(_Writer):
+    """openpyxl write-only workbook: rows stream to disk instead of building a cell tree.
+
+    An .xlsx file is a zip archive written once on close, so it can't be appended to;
+    append=True raises instead of silently rewriting the workbook.
+    """
+
+    def __init__(self, path, append=False):
+        if append and os.path.exists(path):
+            raise ValueError(f"Cannot append to an existing .xlsx file ({path}); export CSV, JSONL or Parquet instead")
+        super().__init__(path, append)
+        from openpyxl import Workbook
+        self._workbook = Workbook(write_only=True)
+        self._sheet = self._workbook.create_sheet("videos")
+        self._header = True
+
+    def _write(self, chunk):
+        self._write_header(chunk)
+        for row in chunk.itertuples(index=False, name=None):
+            self._sheet.append(row)
+
+    def _write_header(self, chunk):
+        if self._header and len(chunk.columns):
+            self._sheet.append(list(chunk.columns))
+            self._header = False
+
+    def close(self):
+        self._workbook.save(self.path)
+
+
+WRITERS = {"csv": CsvWriter, "jsonl": JsonlWriter, "parquet": ParquetWriter, "xlsx": XlsxWriter}
+
+
+def open_writer(path, fmt=None, append=False):
+    return WRITERS[fmt or infer_format(path)](path, append=append)
+
+
+def export_chunks(chunks, path, fmt=None, append=False, top_n=3):
+    """Write every chunk to `path` and return the top_n rows by final_score seen along the way.
+
+    The summary rows come from the same pass, so callers never re-scan the export.
+    """
+    best = None
+    with open_writer(path, fmt, append) as writer:
+        for chunk in chunks:
+            writer.write(chunk)
+            if top_n and 'final_score' in chunk.columns:
+                chunk_best = chunk.iloc[top_k(chunk['final_score'].to_numpy(), top_n)]
+                best = chunk_best if best is None else pd.concat([best, chunk_best], ignore_index=True)
+                best = best.iloc[top_k(best['final_score'].to_numpy(), top_n)].reset_index(drop=True)
+    return best if best is not None else pd.DataFrame()
@@ -0,0 +1,76 @@
+import sys
+import numpy as np
+import pandas as pd
+
+# ISO-8601 durations as returned in contentDetails.duration, e.g. PT1H2M3S, P1DT4M, P0D
+_DURATION_PATTERN = (
+    r'^P(?:(?P<weeks>\d+)W)?(?:(?P<days>\d+)D)?'
+    r'(?:T(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?(?:(?P<seconds>\d+(?:\.\d+)?)S)?)?$'
+)
+_DURATION_UNITS = np.array([604800, 86400, 3600, 60, 1], dtype=np.float64)
+
+
+def parse_durations(durations):
+    """ISO-8601 duration strings -> float64 seconds; unparseable values become 0."""
+    # Durations repeat a lot across a pool, so only distinct strings go through the regex
+    codes, uniques = pd.factorize(pd.Series(durations, dtype=object))
+    if len(uniques) == 0:
+        return np.zeros(len(codes))
+    parts = pd.Series(uniques, dtype=object).str.extract(_DURATION_PATTERN)
+    seconds = parts.to_numpy(dtype=np.float64, na_value=0.0) @ _DURATION_UNITS
+    return seconds[codes]
+
+
+def format_durations(seconds):
+    """Seconds -> 'H:MM:SS' for videos of an hour or more, 'M:SS' otherwise."""
+    codes, uniques = pd.factorize(np.asarray(seconds, dtype=np.float64).astype(np.int64))
+    total = pd.Series(uniques)
+    hours = total // 3600
+    minutes = (total % 3600 // 60).astype(str).str.zfill(2)
+    secs = (total % 60).astype(str).str.zfill(2)
+    long_form = hours.astype(str) + ':' + minutes + ':' + secs
+    short_form = (total // 60).astype(str) + ':' + secs
+    return np.where(hours > 0, long_form, short_form).astype(object)[codes]
+
+
+def parse_timestamps(values):
+    """RFC 3339 'YYYY-MM-DDTHH:MM:SSZ' strings -> naive UTC datetime64[ns]."""
+    values = np.asarray(values, dtype=str)
+    try:
+        # Truncating the fixed-width strings drops the trailing 'Z' without a Python loop
+        return values.astype('U19').astype('datetime64[s]').astype('datetime64[ns]')
+    except ValueError:
+        return pd.to_datetime(values, utc=True).tz_localize(None).to_numpy()
+
+
+def _count(stats, key):
+    return int(stats.get(key, 0))
+
+
+def items_to_columns(items):
+    """Turn videos().list items into a dict of typed column arrays."""
+    n = len(items)
+    snippets = [item['snippet'] for item in items]
+    stats = [item.get('statistics', {}) for item in items]
+    video_ids = np.array([item['id'] for item in items], dtype=object)
+    duration_seconds = parse_durations([item['contentDetails']['duration'] for item in items])
+
+    return {
+        'title': np.array([s['title'] for s in snippets], dtype=object),
+        # Channels repeat heavily across a candidate pool, so share one string per channel
+        'channel': np.array([sys.intern(s['channelTitle']) for s in snippets], dtype=object),
+        # Missing from items stored before channel IDs were requested
+        'channel_id': np.array([sys.intern(s.get('channelId', '')) for s in snippets], dtype=object),
+        'published': parse_timestamps([s['publishedAt'] for s in snippets]),
+        'views': np.fromiter((_count(s, 'viewCount') for s in stats), dtype=np.int64, count=n),
+        'likes': np.fromiter((_count(s, 'likeCount') for s in stats), dtype=np.int64, count=n),
+        'comments': np.fromiter((_count(s, 'commentCount') for s in stats), dtype=np.int64, count=n),
+        'duration_minutes': np.round(duration_seconds / 60, 2),
+        'duration_str': format_durations(duration_seconds),
+        'video_id': video_ids,
+        'url': 'https://www.youtube.com/watch?v=' + video_ids,
+    }
+
+
+def items_to_frame(items):
+    return pd.DataFrame(items_to_columns(items))
@@ -0,0 +1,188 @@
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger("learnyt")
+
+LOG_LEVEL = os.getenv("LEARNYT_LOG_LEVEL", "INFO").upper()
+# Prometheus text endpoint (http://host:port/metrics) and/or periodic JSON metrics log line
+METRICS_PORT = int(os.getenv("LEARNYT_METRICS_PORT", 0))
+METRICS_LOG_INTERVAL = int(os.getenv("LEARNYT_METRICS_LOG_INTERVAL", 0))
+
+PREFIX = "learnyt_"
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+SIZE_BUCKETS = (1, 5, 10, 25, 50, 100, 200, 500, 1000, 5000)
+
+
+def configure_logging(level=LOG_LEVEL):
+    # DEBUG additionally logs raw API payloads and intermediate frames.
+    # Only our loggers follow the switch; third-party libraries stay at WARNING.
+    logging.basicConfig(format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    logger.setLevel(level)
+
+
+def _label_key(labels):
+    return tuple(sorted(labels.items()))
+
+
+def _format_labels(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ""
+    escaped = (str(v).replace("\\", "\\\\").replace('"', '\\"') for _, v in pairs)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(pairs, escaped)) + "}"
+
+
+class _Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.sum += value
+        self.count += 1
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+
+class Metrics:
+    """In-process counters and histograms, exportable as Prometheus text or JSON."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+        self._collectors = []
+
+    def inc(self, name, amount=1, **labels):
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, name, value, buckets=LATENCY_BUCKETS, **labels):
+        key = (name, _label_key(labels))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _Histogram(buckets)
+            histogram.observe(value)
+
+    @contextmanager
+    def timer(self, stage):
+        """Time a pipeline stage into the stage_seconds histogram; also usable as a decorator."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe("stage_seconds", time.perf_counter() - start, stage=stage)
+
+    def register_collector(self, fn):
+        # fn() -> {name: value} gauges read at export time (e.g. scheduler budget, cache size)
+        self._collectors.append(fn)
+
+    def _gauges(self):
+        gauges = {}
+        for fn in self._collectors:
+            try:
+                gauges.update(fn())
+            except Exception as e:
+                logger.warning("Metrics collector failed: %s", e)
+        return gauges
+
+    def snapshot(self):
+        with self._lock:
+            counters = [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self._counters.items())
+            ]
+            histograms = [
+                {"name": name, "labels": dict(labels), "count": h.count, "sum": round(h.sum, 6),
+                 "buckets": dict(zip(map(str, h.buckets), h.counts))}
+                for (name, labels), h in sorted(self._histograms.items())
+            ]
+        return {"time": time.time(), "counters": counters, "histograms": histograms, "gauges": self._gauges()}
+
+    def render_prometheus(self):
+        lines = []
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted((k, (h.buckets, list(h.counts), h.sum, h.count)) for k, h in self._histograms.items())
+        seen = set()
+        for (name, labels), value in counters:
+            if name not in seen:
+                lines.append(f"# TYPE {PREFIX}{name} counter")
+                seen.add(name)
+            lines.append(f"{PREFIX}{name}{_format_labels(labels)} {value}")
+        for (name, labels), (buckets, counts, total, count) in histograms:
+            if name not in seen:
+                lines.append(f"# TYPE {PREFIX}{name} histogram")
+                seen.add(name)
+            cumulative = 0
+            for bound, n in zip(buckets, counts):
+                cumulative += n
+                lines.append(f"{PREFIX}{name}_bucket{_format_labels(labels, [('le', bound)])} {cumulative}")
+            lines.append(f"{PREFIX}{name}_bucket{_format_labels(labels, [('le', '+Inf')])} {count}")
+            lines.append(f"{PREFIX}{name}_sum{_format_labels(labels)} {total}")
+            lines.append(f"{PREFIX}{name}_count{_format_labels(labels)} {count}")
+        for name, value in sorted(self._gauges().items()):
+            lines.append(f"# TYPE {PREFIX}{name} gauge")
+            lines.append(f"{PREFIX}{name} {value}")
+        return "\n".join(lines) + "\n"
+
+
+metrics = Metrics()
+
+
+def start_http_server(port=METRICS_PORT, host="0.0.0.0"):
+    """Serve metrics.render_prometheus() at /metrics from a daemon thread."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            if self.path.split("?")[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            payload = metrics.render_prometheus().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="learnyt-metrics", daemon=True).start()
+    logger.info("Serving metrics at http://%s:%s/metrics", host, server.server_address[1])
+    return server
+
+
+def start_json_log(interval=METRICS_LOG_INTERVAL):
+    """Log one JSON metrics snapshot every `interval` seconds from a daemon thread."""
+    json_logger = logging.getLogger("learnyt.metrics")
+
+    def run():
+        while True:
+            time.sleep(interval)
+            json_logger.info(json.dumps(metrics.snapshot()))
+
+    thread = threading.Thread(target=run, name="learnyt-metrics-log", daemon=True)
+    thread.start()
+    return thread
+
+
+def start_exporters():
+    """Start whichever exporters LEARNYT_METRICS_PORT / LEARNYT_METRICS_LOG_INTERVAL enable."""
+    if METRICS_PORT:
+        start_http_server(METRICS_PORT)
+    if METRICS_LOG_INTERVAL:
+        start_json_log(METRICS_LOG_INTERVAL)
@@ -0,0 +1,200 @@
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from utils.youtube_api import (
+    search_pages, search_filters, get_video_details, get_channel_details, corpus, normalize_query, CANDIDATE_POOL,
+)
+from utils.ingest import items_to_frame
+from utils.metrics import metrics, SIZE_BUCKETS
+from utils.rankings import RankingStore
+from utils.scoring import score, score_frame, top_k, CHANNEL_WEIGHTS, DEFAULT_WEIGHTS
+
+SHORTS_MAX_MINUTES = 1.01
+# Videos kept in a stored ranking; the app shows the first five
+RANKING_TOP_N = int(os.getenv("LEARNYT_RANKING_TOP_N", 10))
+
+# Precomputed podiums, kept fresh for popular topics by utils/refresher.py
+rankings = RankingStore()
+
+# Confidence threshold for answering from the local corpus: at least this many stored videos
+# must have every topic term in their title or channel name (description-only matches don't
+# count), otherwise we fall back to a (100-unit) API search.
+# 0 disables local answers.
+LOCAL_MIN_MATCHES = int(os.getenv("LEARNYT_LOCAL_MIN_MATCHES", 30))
+
+# Channel stats cost one channels().list unit per 50 uncached channels; 0 ranks on video stats only
+CHANNEL_STATS = os.getenv("LEARNYT_CHANNEL_STATS", "1") != "0"
+
+# When ranking a top-N, stop paging search results (100 units a page) once this many pages
+# in a row left the top-N unchanged. Relevance-ordered pages rarely overturn a settled top-N.
+# 0 always fetches the whole candidate pool.
+PAGING_PATIENCE = int(os.getenv("LEARNYT_PAGING_PATIENCE", 2))
+
+# Search filters the local corpus can check; relevanceLanguage isn't stored, so it sends topics to the API
+LOCAL_FILTERS = {"videoDuration", "publishedAfter"}
+
+logger = logging.getLogger("learnyt.pipeline")
+
+
+def find_local_videos(topic, max_results=CANDIDATE_POOL, min_matches=None):
+    """Items for `topic` from the local corpus, or None when local recall is too low."""
+    min_matches = LOCAL_MIN_MATCHES if min_matches is None else min_matches
+    if min_matches <= 0 or corpus.count_title_matches(topic, min_matches) < min_matches:
+        return None
+    # Stored stats can be arbitrarily old, and views_per_day divides by today's age, so the
+    # items come from the details cache (refetched at 1 unit per 50 once past DETAILS_TTL)
+    return get_video_details(corpus.search(topic, limit=max_results))
+
+
+def attach_channel_stats(df):
+    """Add channel_subscribers and channel_videos columns, looked up once per distinct channel."""
+    codes, channel_ids = pd.factorize(df['channel_id'])
+    channels = get_channel_details(list(channel_ids))
+    subscribers = np.zeros(len(channel_ids), dtype=np.int64)
+    videos = np.zeros(len(channel_ids), dtype=np.int64)
+    for i, channel_id in enumerate(channel_ids):
+        # Unknown channels and hidden subscriber counts both count as 0
+        stats = channels.get(channel_id, {}).get('statistics', {})
+        subscribers[i] = int(stats.get('subscriberCount', 0))
+        videos[i] = int(stats.get('videoCount', 0))
+    df['channel_subscribers'] = subscribers[codes]
+    df['channel_videos'] = videos[codes]
+    return df
+
+
+def drop_short_videos(df, min_duration_minutes=SHORTS_MAX_MINUTES):
+    if min_duration_minutes is None:
+        return df
+    return df[df['duration_minutes'] >= min_duration_minutes].reset_index(drop=True)
+
+
+def apply_search_filters(df, filters):
+    """Keep the rows the search.list filters (see search_filters()) would have let through."""
+    keep = np.ones(len(df), dtype=bool)
+    if filters.get('videoDuration'):
+        # search.list buckets: short is under 4 minutes, medium 4-20, long over 20
+        minutes = df['duration_minutes'].to_numpy()
+        keep &= {
+            'short': minutes < 4,
+            'medium': (minutes >= 4) & (minutes <= 20),
+            'long': minutes > 20,
+        }.get(filters['videoDuration'], True)
+    if filters.get('publishedAfter'):
+        since = pd.Timestamp(filters['publishedAfter']).tz_convert(None)
+        keep &= (df['published'] >= since).to_numpy()
+    return df[keep].reset_index(drop=True)
+
+
+def _candidate_frame(items, min_duration_minutes):
+    # Shorts are dropped before their channels are looked up or anything is scored
+    with metrics.timer("parse"):
+        df = drop_short_videos(items_to_frame(items), min_duration_minutes)
+    if CHANNEL_STATS:
+        df = attach_channel_stats(df)
+    return df
+
+
+def _local_candidates(topic, max_results, min_duration_minutes, filters):
+    # Local answers must match what the filtered API search would return
+    if not LOCAL_FILTERS.issuperset(filters):
+        return None
+    with metrics.timer("local_search"):
+        items = find_local_videos(topic, max_results)
+    if items is None:
+        return None
+    with metrics.timer("parse"):
+        df = apply_search_filters(items_to_frame(items), filters)
+    # The filters can leave too few matches to trust, as find_local_videos' threshold would
+    if filters and len(df) < LOCAL_MIN_MATCHES:
+        return None
+    df = drop_short_videos(df, min_duration_minutes)
+    if CHANNEL_STATS:
+        df = attach_channel_stats(df)
+    return df
+
+
+def _weights_for(df):
+    return CHANNEL_WEIGHTS if 'channel_subscribers' in df.columns else DEFAULT_WEIGHTS
+
+
+def _stream_api_candidates(topic, max_results, min_duration_minutes, top_n, filters):
+    pages = search_pages(topic, max_results=max_results, filters=filters)
+    if top_n is None or PAGING_PATIENCE <= 0:
+        # No early stop: collect every page, then one details call fetches the 50-ID chunks concurrently
+        video_ids = [video_id for page in pages for video_id in page]
+        return _candidate_frame(get_video_details(video_ids), min_duration_minutes)
+    frames = []
+    top = None
+    unchanged = 0
+    with ThreadPoolExecutor(max_workers=1) as details_pool:
+        video_ids = next(pages, None)
+        while video_ids is not None:
+            page_frame = details_pool.submit(
+                lambda ids: _candidate_frame(get_video_details(ids), min_duration_minutes), video_ids)
+            # Search the next page while this one's details load, unless this page can end paging:
+            # a page searched ahead and then dropped would waste 100 units
+            may_stop = unchanged + 1 >= PAGING_PATIENCE
+            next_ids = None if may_stop else next(pages, None)
+            frames.append(page_frame.result())
+            pool = pd.concat(frames, ignore_index=True)
+            scores = score(pool, weights=_weights_for(pool))['final_score']
+            page_top = set(pool['video_id'].to_numpy()[top_k(scores, top_n)])
+            unchanged = unchanged + 1 if page_top == top else 0
+            top = page_top
+            if unchanged >= PAGING_PATIENCE:
+                metrics.inc("paging_stopped_early_total")
+                break
+            video_ids = next(pages, None) if may_stop else next_ids
+    if not frames:
+        return _candidate_frame([], min_duration_minutes)
+    return pd.concat(frames, ignore_index=True)
+
+
+def fetch_videos_frame(topic, max_results=CANDIDATE_POOL, allow_local=True, min_duration_minutes=None, top_n=None):
+    """Candidate videos for a topic; videos shorter than min_duration_minutes are dropped as their details arrive.
+
+    With top_n, search pages are consumed one at a time, and paging stops early
+    once the top_n has settled (see PAGING_PATIENCE). The search filters from search_filters()
+    apply to local corpus answers too.
+    """
+    filters = search_filters()
+    df = _local_candidates(topic, max_results, min_duration_minutes, filters) if allow_local else None
+    if df is not None:
+        logger.info("'%s' answered from the local corpus (%d matches)", topic, len(df))
+        metrics.inc("topics_total", source="local")
+    else:
+        metrics.inc("topics_total", source="api")
+        df = _stream_api_candidates(topic, max_results, min_duration_minutes, top_n, filters)
+    metrics.observe("candidate_pool_size", len(df), buckets=SIZE_BUCKETS)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("'%s' frame: %d rows, columns %s", topic, len(df), list(df.columns))
+    return df
+
+
+def rank_videos(df, top_n=None, min_duration_minutes=None, weights=None):
+    """Score a frame of videos; optionally drop short videos and keep only the top_n, ranked 1..n."""
+    # Shorts go before scoring, so they don't stretch the min-max normalization of the rest
+    df = drop_short_videos(df, min_duration_minutes)
+    with metrics.timer("scoring"):
+        df = score_frame(df, weights=_weights_for(df) if weights is None else weights)
+        if top_n is not None:
+            df = df.iloc[top_k(df['final_score'].to_numpy(), top_n)].reset_index(drop=True)
+            df['rank'] = df.index + 1
+    metrics.observe("result_size", len(df), buckets=SIZE_BUCKETS)
+    return df
+
+
+def compute_ranking(topic, top_n=RANKING_TOP_N, topic_key=None):
+    """Rank a topic live (shorts dropped) and store the result under topic_key for later requests.
+
+    `topic` is what gets searched, so pass the user's phrasing; the key only identifies the ranking.
+    """
+    df = fetch_videos_frame(topic, min_duration_minutes=SHORTS_MAX_MINUTES, top_n=top_n)
+    ranked = rank_videos(df, top_n=top_n)
+    if not ranked.empty:
+        rankings.put(topic_key or normalize_query(topic), ranked, df['video_id'])
+    return ranked
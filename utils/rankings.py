@@ -0,0 +1,96 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+import pandas as pd
+
+RANKINGS_PATH = os.getenv("LEARNYT_RANKINGS_PATH", os.path.join(".cache", "rankings.sqlite3"))
+
+# Only topics requested within this window count as popular
+POPULARITY_WINDOW = int(os.getenv("LEARNYT_POPULARITY_WINDOW", 7 * 24 * 60 * 60))
+
+# What a stored podium needs to be rendered without re-scoring
+RANKING_COLUMNS = ['rank', 'title', 'channel', 'published', 'views', 'likes', 'comments',
+                   'duration_minutes', 'duration_str', 'final_score', 'video_id', 'url']
+
+
+class RankingStore:
+    """Topic popularity counters and the latest precomputed top-N ranking per topic."""
+
+    def __init__(self, path=RANKINGS_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS topics (
+                topic_key TEXT PRIMARY KEY,
+                topic TEXT NOT NULL,
+                requests INTEGER NOT NULL DEFAULT 0,
+                last_requested REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS rankings (
+                topic_key TEXT PRIMARY KEY,
+                ranked_at REAL NOT NULL,
+                videos TEXT NOT NULL,
+                candidate_ids TEXT NOT NULL
+            );
+        """)
+        self._conn.commit()
+
+    def record_request(self, topic_key, topic):
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO topics (topic_key, topic, requests, last_requested) VALUES (?, ?, 1, ?) "
+                "ON CONFLICT (topic_key) DO UPDATE SET requests = requests + 1, last_requested = excluded.last_requested",
+                (topic_key, topic, time.time()),
+            )
+            self._conn.commit()
+
+    def topic(self, topic_key):
+        """The phrasing a topic was first requested with, or None for an unknown key."""
+        with self._lock:
+            row = self._conn.execute("SELECT topic FROM topics WHERE topic_key = ?", (topic_key,)).fetchone()
+        return row[0] if row else None
+
+    def popular_topics(self, limit):
+        """(topic_key, topic) pairs, most requested first, among recently requested topics."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT topic_key, topic FROM topics WHERE last_requested > ? "
+                "ORDER BY requests DESC, last_requested DESC LIMIT ?",
+                (time.time() - POPULARITY_WINDOW, limit),
+            ).fetchall()
+
+    def topic_counts(self):
+        """(topic_key, requests) for every topic ever requested."""
+        with self._lock:
+            return self._conn.execute("SELECT topic_key, requests FROM topics").fetchall()
+
+    def put(self, topic_key, ranked, candidate_ids, ranked_at=None):
+        videos = ranked[[c for c in RANKING_COLUMNS if c in ranked.columns]].to_json(orient="records", date_format="iso")
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO rankings (topic_key, ranked_at, videos, candidate_ids) VALUES (?, ?, ?, ?)",
+                (topic_key, ranked_at or time.time(), videos, json.dumps(list(candidate_ids))),
+            )
+            self._conn.commit()
+
+    def get(self, topic_key, max_age=None):
+        """{'ranked_at', 'videos' (DataFrame), 'candidate_ids'} or None if missing or older than max_age."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT ranked_at, videos, candidate_ids FROM rankings WHERE topic_key = ?", (topic_key,)
+            ).fetchone()
+        if row is None or (max_age is not None and time.time() - row[0] > max_age):
+            return None
+        ranked_at, videos, candidate_ids = row
+        df = pd.DataFrame(json.loads(videos))
+        if 'published' in df.columns:
+            df['published'] = pd.to_datetime(df['published'])
+        return {'ranked_at': ranked_at, 'videos': df, 'candidate_ids': json.loads(candidate_ids)}
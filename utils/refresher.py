@@ -0,0 +1,103 @@
+import logging
+import math
+import os
+import threading
+import time
+
+from utils.youtube_api import (
+    refresh_video_details, scheduler, CANDIDATE_POOL, DETAILS_CHUNK_SIZE, SEARCH_COST,
+    SEARCH_PAGE_SIZE, SEARCH_RESERVE, VIDEOS_COST,
+)
+from utils.ingest import items_to_frame
+from utils.metrics import metrics
+from utils.pipeline import (
+    rankings, attach_channel_stats, drop_short_videos, fetch_videos_frame, rank_videos, CHANNEL_STATS, RANKING_TOP_N, SHORTS_MAX_MINUTES,
+)
+
+REFRESH_TOPICS = int(os.getenv("LEARNYT_REFRESH_TOPICS", 50))
+# Quota units one refresh cycle may spend; a stats refresh costs 1 unit per 50 candidates
+REFRESH_UNIT_BUDGET = int(os.getenv("LEARNYT_REFRESH_UNIT_BUDGET", 200))
+# Rankings younger than this are left alone
+REFRESH_MIN_AGE = int(os.getenv("LEARNYT_REFRESH_MIN_AGE", 30 * 60))
+REFRESH_INTERVAL = int(os.getenv("LEARNYT_REFRESH_INTERVAL", 15 * 60))
+
+logger = logging.getLogger("learnyt.refresher")
+
+
+def _refresh_cost(candidate_ids):
+    if candidate_ids:
+        return math.ceil(len(candidate_ids) / DETAILS_CHUNK_SIZE) * VIDEOS_COST
+    # No candidates yet: a full search plus its details (less if the local corpus answers)
+    return (math.ceil(CANDIDATE_POOL / SEARCH_PAGE_SIZE) * SEARCH_COST
+            + math.ceil(CANDIDATE_POOL / DETAILS_CHUNK_SIZE) * VIDEOS_COST)
+
+
+def refresh_popular_topics(max_topics=REFRESH_TOPICS, unit_budget=REFRESH_UNIT_BUDGET,
+                           min_age=REFRESH_MIN_AGE, top_n=RANKING_TOP_N):
+    """Refresh candidate stats and re-rank the most requested topics, within unit_budget."""
+    spent = 0
+    refreshed = []
+    over_budget = 0
+    for topic_key, topic in rankings.popular_topics(max_topics):
+        stored = rankings.get(topic_key)
+        if stored and time.time() - stored['ranked_at'] < min_age:
+            continue
+        candidate_ids = stored['candidate_ids'] if stored else None
+        cost = _refresh_cost(candidate_ids)
+        if spent + cost > unit_budget:
+            if not candidate_ids:
+                # Never ranked (or its first ranking came back empty): needs a full search
+                logger.info("Skipping '%s': a first ranking costs ~%d units, more than the %d left in "
+                            "this cycle's budget (LEARNYT_REFRESH_UNIT_BUDGET)", topic, cost, unit_budget - spent)
+            over_budget += 1
+            continue
+        if scheduler.quota.available() - cost < SEARCH_RESERVE:
+            logger.warning("Daily quota running low, stopping the refresh cycle")
+            break
+        spent += cost
+        if candidate_ids:
+            # Batched 50-ID videos().list calls; unchanged chunks come back as 304s
+            items = refresh_video_details(candidate_ids)
+            with metrics.timer("parse"):
+                df = drop_short_videos(items_to_frame(items), SHORTS_MAX_MINUTES)
+            if CHANNEL_STATS:
+                df = attach_channel_stats(df)
+        else:
+            # The app searches with the topic's first recorded phrasing, so the refresh does too (same cached search)
+            df = fetch_videos_frame(topic, min_duration_minutes=SHORTS_MAX_MINUTES, top_n=top_n)
+            candidate_ids = list(df['video_id'])
+        ranked = rank_videos(df, top_n=top_n)
+        if ranked.empty:
+            # Failed detail chunks or a shed search: keep serving the previous ranking
+            logger.warning("Refresh of '%s' returned no videos; keeping the stored ranking", topic)
+            metrics.inc("topic_refresh_failures_total")
+            continue
+        rankings.put(topic_key, ranked, candidate_ids)
+        refreshed.append(topic)
+        metrics.inc("topics_refreshed_total")
+    if over_budget:
+        logger.info("%d topics left for later cycles: over the %d-unit cycle budget", over_budget, unit_budget)
+    return refreshed, spent
+
+
+class BackgroundRefresher(threading.Thread):
+    """Runs refresh_popular_topics every `interval` seconds in a daemon thread."""
+
+    def __init__(self, interval=REFRESH_INTERVAL, **options):
+        super().__init__(name="learnyt-refresher", daemon=True)
+        self.interval = interval
+        self.options = options
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.is_set():
+            try:
+                refreshed, spent = refresh_popular_topics(**self.options)
+                if refreshed:
+                    logger.info("Refreshed %d topic rankings for %d quota units", len(refreshed), spent)
+            except Exception as e:
+                logger.error("Error during background refresh: %s", e)
+            self._stop_event.wait(self.interval)
+
+    def stop(self):
+        self._stop_event.set()
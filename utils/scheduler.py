@@ -0,0 +1,188 @@
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+# Reasons YouTube attaches to 403s that clear up if we slow down
+RATE_LIMIT_REASONS = {"rateLimitExceeded", "userRateLimitExceeded"}
+# The daily quota is spent; retrying before the reset only burns time
+QUOTA_REASONS = {"quotaExceeded", "dailyLimitExceeded"}
+
+
+class QuotaExhausted(Exception):
+    """Raised instead of calling the API when the unit budget can't cover a request."""
+
+
+def quota_day(now=None):
+    """The YouTube quota day an instant falls in; quotas reset at midnight Pacific Time."""
+    now = now or datetime.now(timezone.utc)
+    try:
+        pacific = ZoneInfo("America/Los_Angeles")
+    except ZoneInfoNotFoundError:
+        # No tz database (e.g. Windows without tzdata): PST, off by an hour during DST
+        pacific = timezone(timedelta(hours=-8))
+    return now.astimezone(pacific).date().isoformat()
+
+
+class DailyQuota:
+    """Units spent per quota day, kept in SQLite so every process on the key shares one budget.
+
+    The app, refresh.py and main.py --batch all draw from the same row, and a restart
+    doesn't hand out a fresh day's quota. Spent units reset when the quota day changes.
+    """
+
+    def __init__(self, daily_units, path, day=quota_day):
+        self.capacity = float(daily_units)
+        self._day = day
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # Autocommit mode, so BEGIN IMMEDIATE below takes the write lock across processes
+        self._conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS quota_usage (
+                day TEXT PRIMARY KEY,
+                spent REAL NOT NULL
+            )
+        """)
+
+    def _spent(self, day):
+        row = self._conn.execute("SELECT spent FROM quota_usage WHERE day = ?", (day,)).fetchone()
+        return row[0] if row else 0.0
+
+    def _set_spent(self, day, spent):
+        self._conn.execute("INSERT OR REPLACE INTO quota_usage (day, spent) VALUES (?, ?)", (day, spent))
+        self._conn.execute("DELETE FROM quota_usage WHERE day < ?", (day,))
+
+    def available(self):
+        with self._lock:
+            return max(0.0, self.capacity - self._spent(self._day()))
+
+    def try_acquire(self, units, reserve=0):
+        # `reserve` keeps that many units untouched, so expensive calls can't starve cheap ones
+        day = self._day()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                spent = self._spent(day)
+                if self.capacity - spent - units < reserve:
+                    return False
+                self._set_spent(day, spent + units)
+                return True
+            finally:
+                self._conn.execute("COMMIT")
+
+    def drain(self):
+        # Google reported the quota spent: nothing more until the next quota day
+        day = self._day()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._set_spent(day, max(self.capacity, self._spent(day)))
+            finally:
+                self._conn.execute("COMMIT")
+
+
+class SingleFlight:
+    """Coalesce identical concurrent calls: one caller runs fn, the others wait for its result."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight = {}
+
+    def do(self, key, fn):
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = self._in_flight[key] = Future()
+        if not leader:
+            return future.result(), True
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+        return future.result(), False
+
+
+def _error_reasons(error):
+    try:
+        payload = json.loads(error.content)
+        return {detail.get("reason") for detail in payload["error"].get("errors", [])}
+    except Exception:
+        return set()
+
+
+def http_status(error):
+    resp = getattr(error, "resp", None)
+    return getattr(resp, "status", None)
+
+
+class Scheduler:
+    """Runs API requests within the quota budget, with retries and single-flight coalescing."""
+
+    def __init__(self, quota, retries=4, backoff_base=0.5, backoff_cap=16.0, sleep=time.sleep):
+        self.quota = quota
+        self.retries = retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self._sleep = sleep
+        self._flights = SingleFlight()
+        self._lock = threading.Lock()
+        self.counters = {"requests": 0, "units": 0, "retries": 0, "coalesced": 0, "shed": 0, "quota_errors": 0}
+
+    def _count(self, name, amount=1):
+        with self._lock:
+            self.counters[name] += amount
+
+    def _backoff(self, attempt):
+        # Full jitter: spreads retries from concurrent sessions instead of synchronizing them
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempt))
+
+    def _is_retryable(self, error):
+        status = http_status(error)
+        if status is None:
+            return False
+        status = int(status)
+        return status >= 500 or status == 429 or (status == 403 and bool(_error_reasons(error) & RATE_LIMIT_REASONS))
+
+    def call(self, make_request, cost, reserve=0):
+        """Execute make_request() (an API request object) after reserving `cost` units."""
+        for attempt in range(self.retries + 1):
+            if not self.quota.try_acquire(cost, reserve=reserve):
+                self._count("shed")
+                raise QuotaExhausted(f"{cost} units requested, {self.quota.available():.0f} available")
+            self._count("requests")
+            self._count("units", cost)
+            try:
+                return make_request()
+            except Exception as e:
+                if http_status(e) is not None and int(http_status(e)) == 403 and _error_reasons(e) & QUOTA_REASONS:
+                    # Google says the day's quota is gone: stop spending until the quota day turns over
+                    self._count("quota_errors")
+                    self.quota.drain()
+                    raise QuotaExhausted("daily quota exceeded") from e
+                if attempt == self.retries or not self._is_retryable(e):
+                    raise
+                self._count("retries")
+                self._sleep(self._backoff(attempt))
+
+    def coalesce(self, key, fn):
+        """Run fn() once for all concurrent callers using the same key."""
+        result, shared = self._flights.do(key, fn)
+        if shared:
+            self._count("coalesced")
+        return result
+
+    def stats(self):
+        with self._lock:
+            return dict(self.counters, available_units=round(self.quota.available()))
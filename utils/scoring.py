@@ -0,0 +1,128 @@
+from datetime import datetime
+import numpy as np
+
+# Weights of the normalized features in the final score (scale 1–10)
+DEFAULT_WEIGHTS = {
+    'likes_per_view': 0.3,
+    'comments_per_minute': 0.2,
+    'views_per_day': 0.3,
+    'views': 0.2,
+}
+# Used instead when the frame carries channel stats (utils.pipeline.attach_channel_stats)
+CHANNEL_WEIGHTS = {
+    'likes_per_view': 0.25,
+    'comments_per_minute': 0.15,
+    'views_per_day': 0.25,
+    'views': 0.2,
+    'channel_authority': 0.15,
+}
+SCORE_SCALE = 10
+
+
+def _column(columns, name, dtype=np.float64):
+    values = columns[name]
+    if hasattr(values, "to_numpy"):
+        values = values.to_numpy()
+    return np.asarray(values, dtype=dtype)
+
+
+def _safe_divide(numerator, denominator):
+    # Zero-view videos get a ratio of 0 instead of NaN/inf poisoning the normalization
+    out = np.zeros(np.broadcast(numerator, denominator).shape, dtype=np.float64)
+    np.divide(numerator, denominator, out=out, where=denominator != 0)
+    return out
+
+
+def likes_per_view(columns, now):
+    return _safe_divide(_column(columns, 'likes'), _column(columns, 'views'))
+
+
+def comments_per_minute(columns, now):
+    # +0.1 avoids divide-by-zero for zero-length durations
+    return _column(columns, 'comments') / (_column(columns, 'duration_minutes') + 0.1)
+
+
+def views_per_day(columns, now):
+    published = _column(columns, 'published', dtype='datetime64[ns]')
+    days = (now - published) // np.timedelta64(1, 'D')
+    return _column(columns, 'views') / (days + 1)
+
+
+def views(columns, now):
+    return _column(columns, 'views')
+
+
+def channel_authority(columns, now):
+    # Subscriber counts span six orders of magnitude; log scale keeps giants from flattening everyone else
+    return np.log1p(_column(columns, 'channel_subscribers'))
+
+
+# Feature name -> function(columns, now) returning a float64 array; extend to add signals
+FEATURES = {
+    'likes_per_view': likes_per_view,
+    'comments_per_minute': comments_per_minute,
+    'views_per_day': views_per_day,
+    'views': views,
+    'channel_authority': channel_authority,
+}
+
+# Features that are input columns as-is; score_frame leaves those columns untouched
+RAW_FEATURES = {'views'}
+
+
+def normalize(values):
+    # Min–max scaling; a constant column maps to all zeros
+    if values.size == 0:
+        return values.astype(np.float64)
+    min_val = values.min()
+    max_val = values.max()
+    return (values - min_val) / (max_val - min_val + 1e-9)
+
+
+def score(columns, weights=None, features=None, now=None):
+    """Compute features, normalized features and final_score as a dict of arrays."""
+    weights = DEFAULT_WEIGHTS if weights is None else weights
+    features = FEATURES if features is None else features
+    now = np.datetime64(datetime.now() if now is None else now, 'ns')
+
+    result = {}
+    final_score = None
+    for name, weight in weights.items():
+        values = np.nan_to_num(features[name](columns, now), nan=0.0, posinf=0.0, neginf=0.0)
+        normalized = normalize(values)
+        result[name] = values
+        result[f'norm_{name}'] = normalized
+        final_score = normalized * weight if final_score is None else final_score + normalized * weight
+    if final_score is None:
+        final_score = np.zeros(len(_column(columns, 'views')))
+    result['final_score'] = final_score * SCORE_SCALE
+    return result
+
+
+def rank(scores):
+    # Descending rank with ties sharing the best position (pandas method='min')
+    ascending = np.sort(scores)
+    return len(scores) - np.searchsorted(ascending, scores, side='right') + 1
+
+
+def top_k(scores, k):
+    """Indices of the k highest scores, best first, without sorting the whole array."""
+    scores = np.asarray(scores)
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k < len(scores):
+        candidates = np.argpartition(-scores, k - 1)[:k]
+    else:
+        candidates = np.arange(len(scores))
+    return candidates[np.argsort(-scores[candidates], kind='stable')]
+
+
+def score_frame(df, weights=None, features=None, now=None):
+    """Add the derived, norm_*, final_score and rank columns to a DataFrame of videos."""
+    for name, values in score(df, weights=weights, features=features, now=now).items():
+        # Raw columns used directly as features keep their original dtype
+        if name not in RAW_FEATURES:
+            df[name] = values
+    df['rank'] = rank(df['final_score'].to_numpy())
+    return df
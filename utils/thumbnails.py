@@ -0,0 +1,129 @@
+import base64
+import io
+import logging
+import os
+import threading
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.metrics import metrics
+
+# Overrides https://img.youtube.com/, e.g. to point at benchmarks/fake_youtube.py
+THUMBNAIL_BASE_URL = os.getenv("LEARNYT_THUMBNAIL_BASE_URL", "https://img.youtube.com/")
+THUMBNAIL_DIR = os.getenv("LEARNYT_THUMBNAIL_DIR", os.path.join(".cache", "thumbnails"))
+THUMBNAIL_CACHE_BYTES = int(os.getenv("LEARNYT_THUMBNAIL_CACHE_BYTES", 50 * 1024 * 1024))
+# Cards are at most ~300 px wide; the source 0.jpg is 480x360
+CARD_WIDTH = int(os.getenv("LEARNYT_THUMBNAIL_WIDTH", 320))
+WEBP_QUALITY = 70
+# 0 links the full-size YouTube thumbnails directly, as before
+INLINE_THUMBNAILS = os.getenv("LEARNYT_INLINE_THUMBNAILS", "1") != "0"
+FETCH_TIMEOUT = 5
+
+logger = logging.getLogger("learnyt.thumbnails")
+
+
+def source_url(video_id):
+    return f"{THUMBNAIL_BASE_URL}vi/{video_id}/0.jpg"
+
+
+def resize_to_webp(data, width=CARD_WIDTH):
+    from PIL import Image
+    with Image.open(io.BytesIO(data)) as image:
+        image = image.convert("RGB")
+        if image.width > width:
+            image = image.resize((width, round(image.height * width / image.width)), Image.LANCZOS)
+        out = io.BytesIO()
+        image.save(out, "WEBP", quality=WEBP_QUALITY, method=4)
+    return out.getvalue()
+
+
+class ThumbnailCache:
+    """Card-sized WebP thumbnails on disk, evicted least recently used once over max_bytes.
+
+    A file's mtime is its last use, so recency survives restarts without an index.
+    """
+
+    def __init__(self, directory=THUMBNAIL_DIR, max_bytes=THUMBNAIL_CACHE_BYTES, width=CARD_WIDTH):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.width = width
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._size = sum(entry.stat().st_size for entry in os.scandir(directory) if entry.is_file())
+
+    def _path(self, video_id):
+        return os.path.join(self.directory, f"{video_id}-{self.width}.webp")
+
+    def get(self, video_id):
+        """WebP bytes for a video's thumbnail, fetched and resized on first use; None if unavailable."""
+        path = self._path(video_id)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)
+            metrics.inc("thumbnail_lookups_total", result="hit")
+            return data
+        except FileNotFoundError:
+            pass
+        metrics.inc("thumbnail_lookups_total", result="miss")
+        try:
+            with urllib.request.urlopen(source_url(video_id), timeout=FETCH_TIMEOUT) as response:
+                data = resize_to_webp(response.read(), self.width)
+        except Exception as e:
+            metrics.inc("thumbnail_errors_total")
+            logger.warning("Could not fetch thumbnail for %s: %s", video_id, e)
+            return None
+        self._store(path, data)
+        return data
+
+    def _store(self, path, data):
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        with self._lock:
+            existed = os.path.exists(path)
+            os.replace(tmp, path)
+            if not existed:
+                self._size += len(data)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        # Oldest use first, down to 90% of the budget so eviction doesn't run on every store
+        entries = sorted((e for e in os.scandir(self.directory) if e.name.endswith(".webp")),
+                         key=lambda e: e.stat().st_mtime)
+        self._size = sum(e.stat().st_size for e in entries)
+        for entry in entries:
+            if self._size <= self.max_bytes * 0.9:
+                break
+            size = entry.stat().st_size
+            try:
+                os.remove(entry.path)
+                self._size -= size
+            except FileNotFoundError:
+                pass
+
+    def data_uris(self, video_ids):
+        """{video_id: data URI} for every thumbnail available; fetched concurrently."""
+        video_ids = list(dict.fromkeys(video_ids))
+        if not video_ids:
+            return {}
+        with metrics.timer("thumbnails"), ThreadPoolExecutor(max_workers=min(8, len(video_ids))) as pool:
+            results = pool.map(self.get, video_ids)
+            return {
+                video_id: "data:image/webp;base64," + base64.b64encode(data).decode("ascii")
+                for video_id, data in zip(video_ids, results) if data is not None
+            }
+
+    def stats(self):
+        with self._lock:
+            return {"bytes": self._size, "max_bytes": self.max_bytes}
+
+
+thumbnails = ThumbnailCache()
+
+
+def thumbnail_sources(video_ids):
+    """<img> src per video: an inlined card-sized WebP, or the full-size YouTube URL as a fallback."""
+    inlined = thumbnails.data_uris(video_ids) if INLINE_THUMBNAILS else {}
+    return {video_id: inlined.get(video_id, source_url(video_id)) for video_id in video_ids}
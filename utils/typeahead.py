@@ -0,0 +1,108 @@
+import bisect
+import re
+import threading
+
+import numpy as np
+
+from utils.corpus import STOPWORDS
+
+# Like corpus.topic_terms, but '+' and '#' stay part of a word, so C++, C# and C don't collide
+_KEY_WORD = re.compile(r"\w[\w+#]*")
+
+
+def canonical_topic(topic):
+    """Cache and ranking key shared by phrasings of one topic: 'What is private equity?' -> 'private equity'.
+
+    Only a key: searches still use the phrasing the topic was first requested with.
+    """
+    words = _KEY_WORD.findall(topic.lower())
+    terms = [w for w in words if w not in STOPWORDS]
+    return " ".join(terms or words)
+
+
+class TopicIndex:
+    """Past topics ranked by request count, with prefix lookups over a sorted array.
+
+    Every word suffix of a topic is indexed, so 'equ' suggests 'private equity' too.
+    A prefix selects a contiguous slice of the array (two bisects); the most requested
+    topics in it are picked with argpartition, so short prefixes stay cheap.
+    """
+
+    def __init__(self, counts=()):
+        self._lock = threading.Lock()
+        self._ids = {}  # topic_key -> topic id
+        self._topics = []
+        self._counts = np.zeros(0, dtype=np.int64)
+        self._unindexed_counts = {}  # counts of topics added since the last _index()
+        self._indexed = 0
+        self._suffixes = []  # sorted word suffixes of every indexed topic
+        self._suffix_topics = np.zeros(0, dtype=np.int64)
+        # Keys recorded before canonicalization merge into their canonical form
+        for topic_key, count in counts:
+            self._add(canonical_topic(topic_key), count)
+
+    @classmethod
+    def from_store(cls, store):
+        """Rebuild from the request counts persisted in a RankingStore."""
+        return cls(store.topic_counts())
+
+    def _add(self, topic_key, count):
+        if not topic_key:
+            return
+        topic_id = self._ids.get(topic_key)
+        if topic_id is None:
+            topic_id = self._ids[topic_key] = len(self._topics)
+            self._topics.append(topic_key)
+        if topic_id < len(self._counts):
+            self._counts[topic_id] += count
+        else:
+            self._unindexed_counts[topic_id] = self._unindexed_counts.get(topic_id, 0) + count
+
+    def _index(self):
+        # Merge topics added since the last lookup into the sorted arrays; no full re-sort
+        counts = np.zeros(len(self._topics), dtype=np.int64)
+        counts[:len(self._counts)] = self._counts
+        for topic_id, count in self._unindexed_counts.items():
+            counts[topic_id] += count
+        new = sorted(
+            (" ".join(words[i:]), topic_id)
+            for topic_id in range(self._indexed, len(self._topics))
+            for words in [self._topics[topic_id].split(" ")]
+            for i in range(len(words))
+        )
+        positions = [bisect.bisect_left(self._suffixes, suffix) for suffix, _ in new]
+        self._suffix_topics = np.insert(self._suffix_topics, positions, [topic_id for _, topic_id in new])
+        for offset, (position, (suffix, _)) in enumerate(zip(positions, new)):
+            self._suffixes.insert(position + offset, suffix)
+        self._counts = counts
+        self._unindexed_counts = {}
+        self._indexed = len(self._topics)
+
+    def add(self, topic_key, count=1):
+        with self._lock:
+            self._add(topic_key, count)
+
+    def suggest(self, prefix, limit=8):
+        """Most requested topics with a word starting with the (canonicalized) prefix."""
+        prefix = canonical_topic(prefix)
+        with self._lock:
+            if self._indexed < len(self._topics):
+                self._index()
+            lo = bisect.bisect_left(self._suffixes, prefix)
+            hi = bisect.bisect_left(self._suffixes, prefix + "\U0010ffff", lo)
+            matches = self._suffix_topics[lo:hi]
+            # A topic can match through several of its words, so over-select before deduplicating
+            topic_ids = None
+            if len(matches) > limit * 4:
+                best = np.argpartition(-self._counts[matches], limit * 4 - 1)[:limit * 4]
+                topic_ids = np.unique(matches[best])
+            if topic_ids is None or len(topic_ids) < limit:
+                topic_ids = np.unique(matches)
+            order = np.lexsort((topic_ids, -self._counts[topic_ids]))[:limit]
+            return [self._topics[topic_id] for topic_id in topic_ids[order]]
+
+    def top(self, limit=200):
+        return self.suggest("", limit)
+
+    def __len__(self):
+        return len(self._topics)
@@ -1,6 +1,17 @@
-from googleapiclient.discovery import build
-import streamlit as st
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+import logging
 import os
+import sys
+import threading
+from urllib.parse import urlencode
+
+from utils.corpus import VideoCorpus
+from utils.cache import ResponseCache, SEARCH_TTL, DETAILS_TTL, ETAG_TTL, CHANNEL_TTL
+from utils.metrics import metrics
+from utils.scheduler import DailyQuota, QuotaExhausted, Scheduler, http_status
+
+logger = logging.getLogger("learnyt.api")
 
 # Load .env locally, use st.secrets on Streamlit Cloud
 if os.path.exists('.env'):
@@ -9,33 +20,327 @@ if os.path.exists('.env'):
         load_dotenv()
     except ImportError:
         pass
-API_KEY = os.getenv("YOUTUBE_API_KEY") or st.secrets.get("YOUTUBE_API_KEY")
 
-youtube = build('youtube', 'v3', developerKey=API_KEY)
+def _load_api_key():
+    api_key = os.getenv("YOUTUBE_API_KEY")
+    if api_key:
+        return api_key
+    # st.secrets only matters inside the app; the CLI never imports Streamlit
+    st = sys.modules.get("streamlit")
+    if st is None:
+        return None
+    try:
+        return st.secrets.get("YOUTUBE_API_KEY")
+    except Exception:
+        return None
+
+# Overrides https://youtube.googleapis.com/, e.g. to point at benchmarks/fake_youtube.py
+API_ROOT_URL = os.getenv("YOUTUBE_API_ROOT_URL")
+
+_client = None
+_client_lock = threading.Lock()
+
+def get_client():
+    # Built on first use from the discovery document bundled with google-api-python-client,
+    # so importing this module costs neither a network round trip nor the JSON parse
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                from googleapiclient.discovery import build
+                client_options = {'api_endpoint': API_ROOT_URL} if API_ROOT_URL else None
+                _client = build('youtube', 'v3', developerKey=_load_api_key(),
+                                static_discovery=True, cache_discovery=False,
+                                client_options=client_options)
+    return _client
+
+# Up to 500 candidates can be paged through; every search page costs 100 quota units
+CANDIDATE_POOL = int(os.getenv("LEARNYT_CANDIDATE_POOL", 200))
+MAX_WORKERS = int(os.getenv("LEARNYT_MAX_WORKERS", 8))
+SEARCH_PAGE_SIZE = 50
+DETAILS_CHUNK_SIZE = 50  # videos().list and channels().list accept at most 50 IDs per call
+
+# Partial-response field masks: only what ingestion, scoring and the local corpus read.
+# Tags, thumbnails and localized text are most of a full videos().list payload.
+# (The client already sends Accept-Encoding: gzip and a "(gzip)" user agent.)
+# Descriptions are the largest field left; they only feed the corpus full-text index.
+INDEX_DESCRIPTIONS = os.getenv("LEARNYT_INDEX_DESCRIPTIONS", "1") != "0"
+SEARCH_FIELDS = "nextPageToken,items(id(videoId))"
+VIDEO_FIELDS = (
+    "etag,items(id,snippet(title,channelId,channelTitle,publishedAt"
+    + (",description" if INDEX_DESCRIPTIONS else "")
+    + "),contentDetails(duration),statistics(viewCount,likeCount,commentCount))"
+)
+CHANNEL_FIELDS = "items(id,statistics(subscriberCount,hiddenSubscriberCount,videoCount))"
+
+# search.list filters, unset by default. videoDuration is any|short (<4 min)|medium (4-20)|long (>20);
+# it can't express "no shorts under a minute" without losing 1-4 minute videos, so that cut
+# happens after the details fetch (utils/pipeline.py).
+VIDEO_DURATION = os.getenv("LEARNYT_VIDEO_DURATION")
+RELEVANCE_LANGUAGE = os.getenv("LEARNYT_RELEVANCE_LANGUAGE")  # ISO 639-1, e.g. "en"
+PUBLISHED_WITHIN_DAYS = int(os.getenv("LEARNYT_PUBLISHED_WITHIN_DAYS", 0))
+
+# httplib2.Http is not thread-safe, so every worker thread gets its own connection
+_local = threading.local()
+
+def _thread_http():
+    if not hasattr(_local, "http"):
+        import httplib2
+        _local.http = httplib2.Http()
+    return _local.http
 
-def search_videos(query, max_results=10):
+# Shared across reruns and sessions so repeat topics cost no quota
+cache = ResponseCache()
+# Everything ever fetched, searchable offline (see utils/pipeline.py)
+corpus = VideoCorpus()
+
+DAILY_QUOTA = int(os.getenv("LEARNYT_DAILY_QUOTA", 10_000))
+SEARCH_COST = 100
+VIDEOS_COST = 1
+CHANNELS_COST = 1
+# Searches stop while this many units remain, so cheap details calls keep working
+SEARCH_RESERVE = int(os.getenv("LEARNYT_SEARCH_RESERVE", 500))
+
+# Spent units live next to the cache, so every process on this key shares one daily budget
+scheduler = Scheduler(DailyQuota(DAILY_QUOTA, cache.path))
+
+# video/channel ID -> Future for IDs some thread is already fetching, so overlapping
+# concurrent queries (app sessions, batch topics) fetch each shared video or channel once
+_pending_videos = {}
+_pending_channels = {}
+_pending_lock = threading.Lock()
+
+metrics.register_collector(lambda: {
+    "quota_available_units": round(scheduler.quota.available()),
+    "cache_entries": cache.stats()["entries"],
+})
+
+def _execute(request, endpoint, cost):
+    # One attempt of one API call; the scheduler may retry it
+    metrics.inc("api_calls_total", endpoint=endpoint)
+    metrics.inc("quota_units_total", cost, endpoint=endpoint)
     try:
-        request = youtube.search().list(
-            q=query,
-            part='id',
-            type='video',
-            maxResults=max_results
-        )
-        response = request.execute()
-        video_ids = [item['id']['videoId'] for item in response['items']]
-        return video_ids
+        response = request.execute(http=_thread_http())
     except Exception as e:
-        print(f"❌ Error during search: {e}")
+        # A 304 is a successful ETag revalidation (counted as not_modified_total), not an error
+        if http_status(e) != 304:
+            metrics.inc("api_errors_total", endpoint=endpoint, status=http_status(e) or "none")
+        raise
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s response: %s", endpoint, response)
+    return response
+
+def normalize_query(query):
+    return " ".join(query.lower().split())
+
+def search_filters():
+    """search.list filters pushed down to the API, from LEARNYT_VIDEO_DURATION and friends."""
+    filters = {}
+    if VIDEO_DURATION:
+        filters['videoDuration'] = VIDEO_DURATION
+    if RELEVANCE_LANGUAGE:
+        filters['relevanceLanguage'] = RELEVANCE_LANGUAGE
+    if PUBLISHED_WITHIN_DAYS:
+        # Day granularity keeps the search cache key stable for a whole day
+        since = datetime.now(timezone.utc).date() - timedelta(days=PUBLISHED_WITHIN_DAYS)
+        filters['publishedAfter'] = f"{since.isoformat()}T00:00:00Z"
+    return filters
+
+def _search_cache_key(query, max_results, filters):
+    cache_key = f"{normalize_query(query)}|{max_results}"
+    if filters:
+        cache_key += "|" + urlencode(sorted(filters.items()))
+    return cache_key
+
+def search_pages(query, max_results=10, filters=None):
+    """Yield search result IDs page by page (up to max_results in total).
+
+    Pages are paid for only as they are consumed: a caller that stops iterating stops paging.
+    Fetched pages are cached with the next page token, so a later, hungrier caller resumes
+    where this one stopped instead of paying for the first pages again.
+    """
+    filters = search_filters() if filters is None else filters
+    cache_key = _search_cache_key(query, max_results, filters)
+    cached = cache.get("search", cache_key)
+    metrics.inc("cache_lookups_total", namespace="search", result="hit" if cached is not None else "miss")
+    # A complete result is a plain list; a partial one also carries the token of the next page
+    if isinstance(cached, list):
+        cached = {'ids': cached, 'page_token': None}
+    video_ids = cached['ids'] if cached else []
+    page_token = cached['page_token'] if cached else None
+    for start in range(0, len(video_ids), SEARCH_PAGE_SIZE):
+        yield video_ids[start:start + SEARCH_PAGE_SIZE]
+    if cached and not page_token:
+        return
+
+    seen = set(video_ids)
+    while len(video_ids) < max_results:
+        try:
+            with metrics.timer("search"):
+                page, page_token = _search_page(query, max_results - len(video_ids), page_token, filters)
+        except QuotaExhausted as e:
+            logger.warning("Search quota low, serving cached results only: %s", e)
+            stale = cache.get("search", cache_key, include_expired=True)
+            stale_ids = stale if isinstance(stale, list) else (stale or {}).get('ids', [])
+            page, page_token = [v for v in stale_ids if v not in seen][:max_results - len(video_ids)], None
+            if page:
+                yield page
+            return
+        except Exception as e:
+            # Keep the pages we already paid for, but don't cache past a failed page
+            logger.error("Error during search: %s", e)
+            return
+        page = [video_id for video_id in dict.fromkeys(page) if video_id not in seen]
+        seen.update(page)
+        video_ids = video_ids + page
+        done = not page_token or len(video_ids) >= max_results
+        cache.set("search", cache_key, video_ids if done else {'ids': video_ids, 'page_token': page_token},
+                  SEARCH_TTL)
+        if page:
+            yield page
+        if done:
+            return
+
+def _search_page(query, page_size, page_token, filters):
+    # Sessions paging the same topic at the same moment share one call per page
+    key = ("search", normalize_query(query), page_token, tuple(sorted(filters.items())))
+    return scheduler.coalesce(key, lambda: _request_search_page(query, page_size, page_token, filters))
+
+def _request_search_page(query, page_size, page_token, filters):
+    request = get_client().search().list(
+        q=query,
+        part='id',
+        type='video',
+        maxResults=min(SEARCH_PAGE_SIZE, page_size),
+        pageToken=page_token,
+        fields=SEARCH_FIELDS,
+        **filters
+    )
+    response = scheduler.call(lambda: _execute(request, "search", SEARCH_COST), SEARCH_COST, reserve=SEARCH_RESERVE)
+    items = response.get('items', [])
+    return [item['id']['videoId'] for item in items], (response.get('nextPageToken') if items else None)
+
+def search_videos(query, max_results=10, filters=None):
+    return [video_id for page in search_pages(query, max_results, filters) for video_id in page]
+
+def _request_details(chunk):
+    chunk_key = ','.join(chunk)
+    request = get_client().videos().list(
+        part='snippet,contentDetails,statistics',
+        id=chunk_key,
+        fields=VIDEO_FIELDS
+    )
+    # Revalidate a chunk we already hold in full: unchanged stats come back as an empty 304
+    held = cache.get_many("video", chunk, include_expired=True)
+    etag = cache.get("etag", chunk_key) if len(held) == len(chunk) else None
+    if etag:
+        request.headers['if-none-match'] = etag
+    try:
+        response = scheduler.call(lambda: _execute(request, "videos", VIDEOS_COST), VIDEOS_COST)
+    except Exception as e:
+        if etag and http_status(e) == 304:
+            metrics.inc("not_modified_total", endpoint="videos")
+            return [held[video_id] for video_id in chunk]
+        raise
+    if response.get('etag'):
+        cache.set("etag", chunk_key, response['etag'], ETAG_TTL)
+    return response['items']
+
+def _fetch_details_chunk(chunk):
+    try:
+        return scheduler.coalesce(("videos", ','.join(chunk)), lambda: _request_details(chunk))
+    except QuotaExhausted as e:
+        logger.warning("Quota low, serving cached details only: %s", e)
+        return list(cache.get_many("video", chunk, include_expired=True).values())
+    except Exception as e:
+        logger.error("Error fetching video details for %d videos: %s", len(chunk), e)
         return []
 
+def _fetch_chunks(ids, fetch_chunk):
+    chunks = [ids[i:i + DETAILS_CHUNK_SIZE] for i in range(0, len(ids), DETAILS_CHUNK_SIZE)]
+    if len(chunks) <= 1:
+        return [fetch_chunk(chunk) for chunk in chunks]
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(chunks))) as pool:
+        return list(pool.map(fetch_chunk, chunks))
+
+def _fetch_and_store(video_ids):
+    results = _fetch_chunks(video_ids, _fetch_details_chunk)
+    # A failed chunk only loses its own videos
+    fetched = {item['id']: item for items in results for item in items}
+    cache.set_many("video", fetched, DETAILS_TTL)
+    corpus.add_items(fetched.values())
+    return fetched
+
+def refresh_video_details(video_ids):
+    """Re-fetch details for videos regardless of cache freshness (unchanged chunks revalidate as 304s)."""
+    with metrics.timer("details"):
+        fetched = _fetch_and_store(list(dict.fromkeys(video_ids)))
+    return [fetched[video_id] for video_id in video_ids if video_id in fetched]
+
+def _get_deduplicated(namespace, ids, pending, fetch_and_store, stage):
+    """Cached items by ID; missing IDs are fetched once even when concurrent callers want them too."""
+    found = cache.get_many(namespace, ids)
+    missing = [item_id for item_id in dict.fromkeys(ids) if item_id not in found]
+    metrics.inc("cache_lookups_total", len(found), namespace=namespace, result="hit")
+    metrics.inc("cache_lookups_total", len(missing), namespace=namespace, result="miss")
+    if not missing:
+        return found
+    with metrics.timer(stage):
+        with _pending_lock:
+            waiting = {item_id: pending[item_id] for item_id in missing if item_id in pending}
+            claimed = [item_id for item_id in missing if item_id not in waiting]
+            for item_id in claimed:
+                pending[item_id] = Future()
+        fetched = {}
+        try:
+            fetched = fetch_and_store(claimed)
+        finally:
+            with _pending_lock:
+                for item_id in claimed:
+                    pending.pop(item_id).set_result(fetched.get(item_id))
+        found.update(fetched)
+        for item_id, future in waiting.items():
+            item = future.result()
+            if item is not None:
+                found[item_id] = item
+    return found
+
 def get_video_details(video_ids):
+    found = _get_deduplicated("video", video_ids, _pending_videos, _fetch_and_store, "details")
+    return [found[video_id] for video_id in video_ids if video_id in found]
+
+def _request_channels(chunk):
+    request = get_client().channels().list(
+        part='statistics',
+        id=','.join(chunk),
+        fields=CHANNEL_FIELDS
+    )
+    response = scheduler.call(lambda: _execute(request, "channels", CHANNELS_COST), CHANNELS_COST)
+    return response.get('items', [])
+
+def _fetch_channels_chunk(chunk):
     try:
-        request = youtube.videos().list(
-            part='snippet,contentDetails,statistics',
-            id=','.join(video_ids)
-        )
-        response = request.execute()
-        return response['items']
+        return scheduler.coalesce(("channels", ','.join(chunk)), lambda: _request_channels(chunk))
+    except QuotaExhausted as e:
+        logger.warning("Quota low, serving cached channel stats only: %s", e)
+        return list(cache.get_many("channel", chunk, include_expired=True).values())
     except Exception as e:
-        print(f"❌ Error fetching video details: {e}")
-        return []
\ No newline at end of file
+        logger.error("Error fetching channel stats for %d channels: %s", len(chunk), e)
+        return []
+
+def _fetch_and_store_channels(channel_ids):
+    fetched = {item['id']: item for items in _fetch_chunks(channel_ids, _fetch_channels_chunk) for item in items}
+    cache.set_many("channel", fetched, CHANNEL_TTL)
+    return fetched
+
+def get_channel_details(channel_ids):
+    """{channel_id: channels().list item} for the distinct, non-empty IDs; one call per 50 uncached channels."""
+    channel_ids = [channel_id for channel_id in dict.fromkeys(channel_ids) if channel_id]
+    return _get_deduplicated("channel", channel_ids, _pending_channels, _fetch_and_store_channels, "channels")
+
+def cache_stats():
+    return cache.stats()
+
+def scheduler_stats():
+    return scheduler.stats()
+